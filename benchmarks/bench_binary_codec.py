@@ -0,0 +1,125 @@
+"""Benchmark the binary event encoding against model_dump_json.
+
+Reports encoded size and per-event encode/decode time for representative
+events, plus the size of a full round encoded as one batch.
+
+Usage:
+    uv run python benchmarks/bench_binary_codec.py [--iterations N]
+"""
+
+import argparse
+import timeit
+from collections.abc import Callable
+from uuid import uuid4
+
+from slop.domain import (
+    GameEvent,
+    GuessSubmitted,
+    PlayerJoined,
+    RoleAssigned,
+    RoundCompleted,
+    RoundStarted,
+    ScoresUpdated,
+    ScriptGenerated,
+    binary_codec,
+)
+from slop.domain.event_codec import decode_event, decode_events, encode_events
+
+GAME_ID = str(uuid4())
+TEAMS = [str(uuid4()) for _ in range(6)]
+PLAYERS = [str(uuid4()) for _ in range(18)]
+
+
+def sample_events() -> list[GameEvent]:
+    return [
+        PlayerJoined(game_id=GAME_ID, player_id=PLAYERS[0], player_name="Alice", socket_id="sid-1"),
+        GuessSubmitted(game_id=GAME_ID, round_number=2, team_id=TEAMS[1], guess="art heist"),
+        ScoresUpdated(
+            game_id=GAME_ID,
+            round_number=2,
+            score_changes={team: i for i, team in enumerate(TEAMS)},
+        ),
+        ScriptGenerated(
+            game_id=GAME_ID,
+            round_number=2,
+            script_content="DETECTIVE: Not again. " * 30,
+            personality_id="noir",
+            roles=[
+                {"name": f"Role {i}", "description": "A character", "lines": ["A line."] * 5}
+                for i in range(3)
+            ],
+            word_count=150,
+            estimated_duration=60,
+        ),
+    ]
+
+
+def sample_round() -> list[GameEvent]:
+    events: list[GameEvent] = [
+        RoundStarted(game_id=GAME_ID, round_number=2, acting_team_id=TEAMS[0])
+    ]
+    events += [
+        RoleAssigned(
+            game_id=GAME_ID,
+            round_number=2,
+            player_id=player,
+            role_name=f"Role {i}",
+            character_description="A character",
+        )
+        for i, player in enumerate(PLAYERS[:3])
+    ]
+    events += [
+        GuessSubmitted(game_id=GAME_ID, round_number=2, team_id=team, guess=f"guess {i}")
+        for i in range(20)
+        for team in TEAMS[1:]
+    ]
+    events.append(
+        ScoresUpdated(game_id=GAME_ID, round_number=2, score_changes={t: 1 for t in TEAMS})
+    )
+    events.append(
+        RoundCompleted(game_id=GAME_ID, round_number=2, final_scores={t: 5 for t in TEAMS})
+    )
+    return events
+
+
+def per_call_us(fn: Callable[[], object], iterations: int) -> float:
+    return timeit.timeit(fn, number=iterations) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    n = args.iterations
+
+    header = f"{'event':<18}{'json B':>8}{'bin B':>8}{'ratio':>7}"
+    header += f"{'json enc':>10}{'bin enc':>9}{'json dec':>10}{'bin dec':>9}  (µs)"
+    print(header)
+    for event in sample_events():
+        json_data = event.model_dump_json().encode()
+        bin_data = binary_codec.encode_event(event)
+        print(
+            f"{event.event_type:<18}{len(json_data):>8}{len(bin_data):>8}"
+            f"{len(json_data) / len(bin_data):>7.1f}"
+            f"{per_call_us(event.model_dump_json, n):>10.2f}"
+            f"{per_call_us(lambda: binary_codec.encode_event(event), n):>9.2f}"
+            f"{per_call_us(lambda: decode_event(json_data), n):>10.2f}"
+            f"{per_call_us(lambda: binary_codec.decode_event(bin_data), n):>9.2f}"
+        )
+
+    round_events = sample_round()
+    json_batch = encode_events(round_events)
+    bin_batch = binary_codec.encode_events(round_events)
+    batch_n = max(1, n // 100)
+    print(
+        f"\nround of {len(round_events)} events: json {len(json_batch)} B, "
+        f"binary batch {len(bin_batch)} B ({len(json_batch) / len(bin_batch):.1f}x smaller)"
+    )
+    print(
+        f"decode batch: json {per_call_us(lambda: decode_events(json_batch), batch_n):.0f} µs, "
+        f"binary {per_call_us(lambda: binary_codec.decode_events(bin_batch), batch_n):.0f} µs"
+    )
+
+
+if __name__ == "__main__":
+    main()
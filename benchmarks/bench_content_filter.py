@@ -0,0 +1,60 @@
+"""Benchmark content filtering of generated scripts.
+
+Compares checking a ~150-word script with one regular expression per
+blocked term against the precompiled per-tone trie pattern, for the
+default blocklist and for a blocklist of 2,000 terms.
+
+Usage:
+    uv run python benchmarks/bench_content_filter.py [--iterations N]
+"""
+
+import argparse
+import re
+import timeit
+
+from slop.adapters.llm.fake import script_text
+from slop.application.content_filter import DEFAULT_BLOCKLISTS, ContentFilter
+from slop.domain import AIPersonality, ContentTone
+from slop.domain.script_stream import ScriptStreamParser
+
+
+def naive_is_clean(patterns: list[re.Pattern[str]], texts: list[str]) -> bool:
+    return not any(pattern.search(text) for pattern in patterns for text in texts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+    n = args.iterations
+
+    personality = AIPersonality(id="noir", name="Noir", description="Noir", system_prompt="Noir.")
+    stream = ScriptStreamParser()
+    stream.feed(script_text("Detective solves art heist", personality, 4, ContentTone.FAMILY))
+    stream.finish()
+    script = stream.to_script(personality.id)
+    texts = [script.content] + [line for role in script.roles for line in role.lines]
+
+    large = list(DEFAULT_BLOCKLISTS[ContentTone.FAMILY]) + [f"blocked{i}" for i in range(2_000)]
+    for name, terms in (
+        ("default", DEFAULT_BLOCKLISTS[ContentTone.FAMILY]),
+        ("2,000 terms", large),
+    ):
+        naive = [re.compile(rf"(?<!\w){re.escape(t)}(?!\w)", re.IGNORECASE) for t in terms]
+        content_filter = ContentFilter({ContentTone.FAMILY: terms})
+        results = {
+            "regex per term": timeit.timeit(lambda: naive_is_clean(naive, texts), number=n),
+            "trie is_clean": timeit.timeit(
+                lambda: content_filter.is_clean(script, ContentTone.FAMILY), number=n
+            ),
+            "trie check_script": timeit.timeit(
+                lambda: content_filter.check_script(script, ContentTone.FAMILY), number=n
+            ),
+        }
+        print(f"{name} ({len(terms)} terms, {script.word_count} words)")
+        for label, seconds in results.items():
+            print(f"  {label:<20}{seconds / n * 1e6:>10.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Micro-benchmarks for hot Game and Team operations.
+
+Times the lookups and membership changes every command handler performs,
+for a normal lobby and for a large, spectator-heavy room.
+
+Usage:
+    uv run python benchmarks/bench_domain.py [--players N ...] [--iterations N]
+"""
+
+import argparse
+import timeit
+from collections.abc import Callable
+
+from slop.domain import Game, Player, Team
+
+
+def build_game(players: int) -> Game:
+    game = Game(id="bench-game", room_code="BENCH")
+    for t in range(6):
+        game.add_team(Team(id=f"team-{t}", name=f"Team {t}", color="#000", max_players=players))
+    for p in range(players):
+        game.add_player(Player(id=f"player-{p}", name=f"P{p}", socket_id=f"s{p}"))
+        game.get_team(f"team-{p % 6}").add_player(f"player-{p}")
+    return game
+
+
+def per_call_us(fn: Callable[[], object], iterations: int) -> float:
+    return timeit.timeit(fn, number=iterations) / iterations * 1e6
+
+
+def bench(players: int, iterations: int) -> dict[str, float]:
+    game = build_game(players)
+    last_player = f"player-{players - 1}"
+    last_team = game.teams[-1]
+    last_team_member = last_team.player_ids[-1]
+
+    def churn_player() -> None:
+        player = game.get_player(last_player)
+        game.remove_player(last_player)
+        game.add_player(player)
+
+    def churn_team_member() -> None:
+        last_team.remove_player(last_team_member)
+        last_team.add_player(last_team_member)
+
+    return {
+        "get_player": per_call_us(lambda: game.get_player(last_player), iterations),
+        "get_team": per_call_us(lambda: game.get_team("team-5"), iterations),
+        "remove+add player": per_call_us(churn_player, iterations),
+        "team remove+add": per_call_us(churn_team_member, iterations),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, nargs="+", default=[18, 1000])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'operation':<20}" + "".join(f"{f'{n} players':>14}" for n in args.players) + "  (µs)")
+    results = [bench(n, args.iterations) for n in args.players]
+    for name in results[0]:
+        print(f"{name:<20}" + "".join(f"{r[name]:>14.3f}" for r in results))
+
+
+if __name__ == "__main__":
+    main()
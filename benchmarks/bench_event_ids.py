@@ -0,0 +1,54 @@
+"""Benchmark event ID generation and timestamping.
+
+Compares the previous defaults (``uuid4`` and ``datetime.now``) with the
+in-process UUIDv7 generator and a per-tick cached clock, on their own and
+as part of creating a GuessSubmitted event.
+
+Usage:
+    uv run python benchmarks/bench_event_ids.py [--iterations N]
+"""
+
+import argparse
+import timeit
+from collections.abc import Callable
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from slop.domain import GuessSubmitted
+from slop.domain.ids import MonotonicIdGenerator, TickClock, event_stamps
+
+
+def per_call_us(fn: Callable[[], object], iterations: int) -> float:
+    return timeit.timeit(fn, number=iterations) / iterations * 1e6
+
+
+def make_event() -> GuessSubmitted:
+    return GuessSubmitted(game_id="game-1", round_number=0, team_id="team-1", guess="a guess")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200_000)
+    args = parser.parse_args()
+    n = args.iterations
+
+    generator = MonotonicIdGenerator()
+    clock = TickClock()
+    results = {
+        "str(uuid4())": per_call_us(lambda: str(uuid4()), n),
+        "UUIDv7 generator": per_call_us(generator, n),
+        "datetime.now(UTC)": per_call_us(lambda: datetime.now(UTC), n),
+        "TickClock.now": per_call_us(clock.now, n),
+    }
+    with event_stamps(new_id=lambda: str(uuid4()), now=lambda: datetime.now(UTC)):
+        results["event, uuid4 + now"] = per_call_us(make_event, n)
+    results["event, UUIDv7 + now"] = per_call_us(make_event, n)
+    with event_stamps(now=clock.now):
+        results["event, UUIDv7 + tick"] = per_call_us(make_event, n)
+
+    for name, us in results.items():
+        print(f"{name:<24}{us:>8.3f} µs")
+
+
+if __name__ == "__main__":
+    main()
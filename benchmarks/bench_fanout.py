@@ -0,0 +1,68 @@
+"""Benchmark broadcasting events to rooms of different sizes.
+
+Compares serializing the event once per socket (what a naive adapter
+does) with the fan-out of one pre-serialized frame, for a full room of
+18 players and a room with 1,000 spectators.
+
+Usage:
+    uv run python benchmarks/bench_fanout.py [--iterations N]
+"""
+
+import argparse
+import asyncio
+import time
+from uuid import uuid4
+
+from slop.adapters.websocket import FanOut, Frame, InMemoryRealtime
+from slop.domain import ScoresUpdated
+
+
+class NullConnection:
+    """Connection that discards frames, so only the fan-out is measured."""
+
+    def send(self, frame: Frame) -> None:
+        pass
+
+
+def per_socket(fanout: FanOut, room_code: str, event: ScoresUpdated) -> None:
+    for socket_id in fanout.members(room_code):
+        fanout.send(socket_id, Frame.from_event(event))
+
+
+async def run(room_size: int, iterations: int) -> None:
+    realtime = InMemoryRealtime()
+    for i in range(room_size):
+        realtime.fanout.connect(f"sid-{i}", NullConnection())
+        await realtime.join_room(f"sid-{i}", "ROOM")
+    event = ScoresUpdated(
+        game_id=str(uuid4()),
+        round_number=3,
+        score_changes={str(uuid4()): i for i in range(6)},
+    )
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        per_socket(realtime.fanout, "ROOM", event)
+    naive = (time.perf_counter() - start) / iterations
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await realtime.broadcast_to_room("ROOM", event)
+    shared = (time.perf_counter() - start) / iterations
+
+    print(f"room of {room_size}")
+    print(f"  {'serialize per socket':<24}{naive * 1e6:>10.1f} µs")
+    print(f"  {'serialize once':<24}{shared * 1e6:>10.1f} µs")
+    print(f"  {'frames encoded':<24}{realtime.frames_encoded // iterations:>10}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=1_000)
+    args = parser.parse_args()
+    for room_size in (18, 1_000):
+        asyncio.run(run(room_size, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmark script generation round latency against the fake provider.
+
+Runs many concurrent rounds, drawing prompts from a small pool so that
+repeats occur, through different LLMPort stacks: the bare provider, the
+cache plus coalescing, and hedging across a heavy-tailed primary and a
+backup. Reports latency percentiles and provider calls. All delays are
+scaled by ``--time-scale`` so the run stays short.
+
+Usage:
+    uv run python benchmarks/bench_llm.py [--rounds N] [--concurrency N] [--time-scale F]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from slop.adapters.llm import CachingLLM, CoalescingLLM, FakeLLM, FakeLLMProfile, HedgingLLM
+from slop.domain import AIPersonality
+from slop.ports import LLMError, LLMPort
+
+PERSONALITIES = [
+    AIPersonality(id=name, name=name.title(), description=name, system_prompt=f"Be {name}.")
+    for name in ("noir", "sitcom", "shakespeare")
+]
+PROMPTS = [f"Prompt number {i} about a heist" for i in range(10)]
+TYPICAL = FakeLLMProfile(first_token_median=0.8, first_token_sigma=0.3, tokens_per_second=150)
+HEAVY_TAIL = FakeLLMProfile(
+    first_token_median=0.8, first_token_sigma=1.0, tokens_per_second=150, error_rate=0.02
+)
+
+
+async def run(llm: LLMPort, rounds: int, concurrency: int, seed: int) -> list[float]:
+    rng = random.Random(seed)
+    requests = [
+        (rng.choice(PROMPTS), rng.choice(PERSONALITIES), rng.randint(2, 4)) for _ in range(rounds)
+    ]
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one_round(prompt: str, personality: AIPersonality, num_roles: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await llm.generate_script(prompt, personality, num_roles)
+            except LLMError:
+                return
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(one_round(*request) for request in requests))
+    return latencies
+
+
+def report(name: str, latencies: list[float], calls: int, scale: float) -> None:
+    ordered = sorted(latency / scale for latency in latencies)
+    p50 = statistics.median(ordered)
+    p99 = ordered[int(0.99 * (len(ordered) - 1))]
+    print(f"{name:<22}{p50:>8.2f}{p99:>8.2f}{calls:>8}{len(ordered):>8}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--time-scale", type=float, default=0.2)
+    args = parser.parse_args()
+    scale = args.time_scale
+
+    print(f"{'stack':<22}{'p50 s':>8}{'p99 s':>8}{'calls':>8}{'ok':>8}  (unscaled seconds)")
+
+    bare = FakeLLM(TYPICAL, time_scale=scale)
+    report("bare", await run(bare, args.rounds, args.concurrency, 1), bare.calls, scale)
+
+    provider = FakeLLM(TYPICAL, time_scale=scale)
+    cached = CachingLLM(CoalescingLLM(provider))
+    latencies = await run(cached, args.rounds, args.concurrency, 1)
+    report("cache + coalescing", latencies, provider.calls, scale)
+
+    lone = FakeLLM(HEAVY_TAIL, seed=2, time_scale=scale)
+    latencies = await run(lone, args.rounds, args.concurrency, 1)
+    report("heavy tail, no hedge", latencies, lone.calls, scale)
+
+    primary = FakeLLM(HEAVY_TAIL, seed=2, time_scale=scale)
+    backup = FakeLLM(TYPICAL, seed=3, time_scale=scale)
+    hedged = HedgingLLM(
+        [("primary", primary), ("backup", backup)],
+        default_hedge_delay=2.0 * scale,
+        timeout=10.0 * scale,
+    )
+    latencies = await run(hedged, args.rounds, args.concurrency, 1)
+    report("heavy tail, hedged", latencies, primary.calls + backup.calls, scale)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
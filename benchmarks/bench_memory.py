@@ -0,0 +1,95 @@
+"""Measure the memory held by many concurrent Games with full histories.
+
+Each game has six teams, eighteen players and a complete round history
+(script, roles, role assignments, guesses and scores). Games are loaded
+the way a server holds them after a restart: decoded from their stored
+snapshot, so ids and timestamps are separate objects per occurrence.
+Every game gets its own ids; nothing is shared between games.
+
+Usage:
+    uv run python benchmarks/bench_memory.py [--games N] [--rounds N] [--guesses N]
+"""
+
+import argparse
+import gc
+import resource
+import tracemalloc
+from uuid import uuid4
+
+from slop.adapters.storage.serialization import decode_game, encode_game
+from slop.domain import Game, Guess, Player, Role, Round, Script, Team
+
+
+def build_snapshot(rounds: int, guesses: int) -> tuple[bytes, list[str]]:
+    game = Game(id=str(uuid4()), room_code="BENCH")
+    teams = [str(uuid4()) for _ in range(6)]
+    players = [str(uuid4()) for _ in range(18)]
+    for i, team_id in enumerate(teams):
+        game.add_team(Team(id=team_id, name=f"Team {i}", color="#000000"))
+    for i, player_id in enumerate(players):
+        team = game.teams[i % 6]
+        game.add_player(Player(id=player_id, name=f"Player {i}", socket_id=str(uuid4())))
+        game.get_player(player_id).assign_to_team(team.id)
+        team.add_player(player_id)
+
+    for n in range(rounds):
+        acting = game.teams[n % 6]
+        script = Script(
+            content="NARRATOR: Once upon a time. " * 20,
+            roles=[
+                Role(name=f"Role {r}", description="A character", lines=["A line."] * 4)
+                for r in range(3)
+            ],
+            personality="noir",
+        )
+        round_obj = Round(
+            id=str(uuid4()),
+            round_number=n,
+            acting_team_id=acting.id,
+            prompt="A detective solves an art heist",
+            submitted_by=acting.player_ids[0],
+            script=script,
+            role_assignments={player_id: r for r, player_id in enumerate(acting.player_ids)},
+        )
+        for g in range(guesses):
+            guesser = teams[(n + 1 + g) % 6]
+            round_obj.add_guess(Guess(team_id=guesser, guess=f"guess {g}", timestamp=1e9 + g))
+            round_obj.add_score_to_team(guesser, 1)
+        game.rounds.append(round_obj)
+        game.next_round()
+    ids = [game.id, *teams, *players, *(p.socket_id for p in game.players)]
+    ids += [r.id for r in game.rounds]
+    return encode_game(game), ids
+
+
+def with_fresh_ids(snapshot: bytes, ids: list[str]) -> bytes:
+    for old in ids:
+        snapshot = snapshot.replace(old.encode(), str(uuid4()).encode())
+    return snapshot
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=6)
+    parser.add_argument("--guesses", type=int, default=10)
+    args = parser.parse_args()
+
+    snapshot, ids = build_snapshot(args.rounds, args.guesses)
+    snapshots = [with_fresh_ids(snapshot, ids) for _ in range(args.games)]
+    gc.collect()
+    tracemalloc.start()
+    games = [decode_game(s) for s in snapshots]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del snapshots
+
+    rss_mib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{len(games)} games, {args.rounds} rounds, {args.guesses} guesses per round")
+    print(f"  traced: {current / 2**20:.1f} MiB ({current / len(games) / 1024:.1f} KiB per game)")
+    print(f"  peak RSS: {rss_mib:.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Benchmark replaying a game's event stream through GameProjection.
+
+Builds one synthetic game of roughly the requested size (six teams,
+eighteen players, rounds full of guesses) and reports full replay time
+and the cost of resuming from the last round checkpoint.
+
+Usage:
+    uv run python benchmarks/bench_projection.py [--events N] [--iterations N]
+"""
+
+import argparse
+import copy
+import timeit
+
+from slop.domain import (
+    GameCreated,
+    GameEvent,
+    GameProjection,
+    GuessAccepted,
+    GuessSubmitted,
+    PlayerJoined,
+    PlayerJoinedTeam,
+    PromptSubmitted,
+    RoleAssigned,
+    RoundCompleted,
+    RoundStarted,
+    ScoresUpdated,
+    ScriptGenerated,
+    TeamFormed,
+)
+
+GAME_ID = "bench-game"
+TEAMS = [f"team-{i}" for i in range(6)]
+PLAYERS = [f"player-{i}" for i in range(18)]
+
+
+def build_events(target: int) -> list[GameEvent]:
+    events: list[GameEvent] = [
+        GameCreated(
+            game_id=GAME_ID,
+            room_code="BENCH",
+            content_tone="family",
+            max_players=18,
+            rounds_per_team=100,
+        )
+    ]
+    events += [TeamFormed(game_id=GAME_ID, team_id=t, team_name=t, color="#000") for t in TEAMS]
+    for i, player in enumerate(PLAYERS):
+        events.append(
+            PlayerJoined(game_id=GAME_ID, player_id=player, player_name=player, socket_id=player)
+        )
+        events.append(PlayerJoinedTeam(game_id=GAME_ID, player_id=player, team_id=TEAMS[i % 6]))
+
+    round_number = 0
+    while len(events) < target:
+        acting = TEAMS[round_number % 6]
+        events += [
+            RoundStarted(game_id=GAME_ID, round_number=round_number, acting_team_id=acting),
+            PromptSubmitted(
+                game_id=GAME_ID, round_number=round_number, prompt="p", submitted_by=PLAYERS[0]
+            ),
+            ScriptGenerated(
+                game_id=GAME_ID,
+                round_number=round_number,
+                script_content="A: line",
+                personality_id="noir",
+                roles=[{"name": "A", "description": "a", "lines": ["line"]}],
+                word_count=2,
+                estimated_duration=1,
+            ),
+            RoleAssigned(
+                game_id=GAME_ID,
+                round_number=round_number,
+                player_id=PLAYERS[0],
+                role_name="A",
+                character_description="a",
+            ),
+        ]
+        events += [
+            GuessSubmitted(game_id=GAME_ID, round_number=round_number, team_id=t, guess="g")
+            for _ in range(8)
+            for t in TEAMS
+            if t != acting
+        ]
+        events += [
+            GuessAccepted(game_id=GAME_ID, round_number=round_number, team_id=TEAMS[1]),
+            ScoresUpdated(game_id=GAME_ID, round_number=round_number, score_changes={TEAMS[1]: 2}),
+            RoundCompleted(
+                game_id=GAME_ID,
+                round_number=round_number,
+                final_scores={t: round_number for t in TEAMS},
+            ),
+        ]
+        round_number += 1
+    return events
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    events = build_events(args.events)
+    checkpoints = [i for i, e in enumerate(events) if isinstance(e, RoundCompleted)]
+    base = checkpoints[-2] if len(checkpoints) > 1 else checkpoints[-1]
+    snapshot = GameProjection.replay(events[: base + 1])
+    tail = events[base + 1 :]
+    snapshots = iter([copy.deepcopy(snapshot) for _ in range(args.iterations)])
+
+    replay = timeit.timeit(lambda: GameProjection.replay(events), number=args.iterations)
+    replay_ms = replay / args.iterations * 1e3
+    resume = timeit.timeit(
+        lambda: GameProjection.resume(next(snapshots), tail), number=args.iterations
+    )
+    resume_ms = resume / args.iterations * 1e3
+
+    print(f"full replay of {len(events)} events: {replay_ms:.2f} ms")
+    print(f"  per event: {replay_ms * 1e3 / len(events):.2f} µs")
+    print(f"resume from last checkpoint ({len(tail)} events): {resume_ms:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
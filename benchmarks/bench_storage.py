@@ -0,0 +1,75 @@
+"""Benchmark event appends through the storage adapters.
+
+Each simulated game appends events one at a time, waiting for durability
+before the next append, as a room does when it broadcasts after persisting.
+Reports events/sec and p50/p99 append latency for 1, 10 and 100 games on
+the SQLite and segmented log backends.
+
+Usage:
+    uv run python benchmarks/bench_storage.py [--events-per-game N] [--backend NAME]
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from slop.adapters.storage import SegmentedLogStorageAdapter, SQLiteStorageAdapter
+from slop.domain import GuessSubmitted
+
+Storage = SQLiteStorageAdapter | SegmentedLogStorageAdapter
+
+
+def make_storage(backend: str, directory: Path) -> Storage:
+    if backend == "sqlite":
+        return SQLiteStorageAdapter(directory / "bench.db")
+    return SegmentedLogStorageAdapter(directory / "log")
+
+
+async def run_game(storage: Storage, game_id: str, count: int) -> list[float]:
+    latencies = []
+    for i in range(count):
+        event = GuessSubmitted(game_id=game_id, round_number=0, team_id="team-1", guess=f"g{i}")
+        start = time.perf_counter()
+        await storage.save_event(event)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def run_scenario(backend: str, directory: Path, games: int, events_per_game: int) -> None:
+    async with make_storage(backend, directory) as storage:
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(run_game(storage, f"game-{g}", events_per_game) for g in range(games))
+        )
+        elapsed = time.perf_counter() - start
+        commits = storage.commit_count
+
+    latencies = sorted(lat for game in results for lat in game)
+    total = len(latencies)
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[min(total - 1, int(total * 0.99))] * 1000
+    print(
+        f"{backend:>7} {games:>5} games  {total / elapsed:>10.0f} events/s  "
+        f"p50 {p50:>7.2f} ms  p99 {p99:>7.2f} ms  "
+        f"avg batch {total / commits:>6.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events-per-game", type=int, default=200)
+    parser.add_argument("--backend", choices=["sqlite", "log"], action="append")
+    args = parser.parse_args()
+
+    print(f"{args.events_per_game} events per game, fsync on every commit")
+    for backend in args.backend or ["sqlite", "log"]:
+        for games in (1, 10, 100):
+            with tempfile.TemporaryDirectory() as tmp:
+                asyncio.run(run_scenario(backend, Path(tmp), games, args.events_per_game))
+
+
+if __name__ == "__main__":
+    main()
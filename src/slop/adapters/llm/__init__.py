@@ -3,3 +3,61 @@
 Implementations for various LLM providers (OpenAI, Anthropic, etc.)
 that implement the LLMPort interface.
 """
+
+from slop.adapters.llm.cache import (
+    CachingLLM,
+    ScriptCacheKey,
+    ScriptCacheStats,
+    ScriptStore,
+    SQLiteScriptStore,
+    StoredScript,
+)
+from slop.adapters.llm.coalescing import CoalescingLLM
+from slop.adapters.llm.fake import INSTANT, FakeLLM, FakeLLMProfile
+from slop.adapters.llm.hedging import (
+    BreakerState,
+    CircuitBreaker,
+    HedgingLLM,
+    LatencyHistogram,
+    ProviderStats,
+)
+from slop.adapters.llm.prompts import (
+    AssembledPrompt,
+    PromptPrefix,
+    PromptTemplates,
+    compile_prefix,
+)
+from slop.adapters.llm.scheduler import (
+    BudgetExceededError,
+    LLMScheduler,
+    Priority,
+    SchedulerStats,
+    estimate_tokens,
+)
+
+__all__ = [
+    "INSTANT",
+    "AssembledPrompt",
+    "BreakerState",
+    "BudgetExceededError",
+    "CachingLLM",
+    "CircuitBreaker",
+    "CoalescingLLM",
+    "FakeLLM",
+    "FakeLLMProfile",
+    "HedgingLLM",
+    "LatencyHistogram",
+    "LLMScheduler",
+    "Priority",
+    "PromptPrefix",
+    "PromptTemplates",
+    "ProviderStats",
+    "ScriptCacheKey",
+    "ScriptCacheStats",
+    "SchedulerStats",
+    "ScriptStore",
+    "SQLiteScriptStore",
+    "StoredScript",
+    "compile_prefix",
+    "estimate_tokens",
+]
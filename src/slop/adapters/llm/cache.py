@@ -0,0 +1,334 @@
+"""Caching LLMPort wrapper for generated scripts.
+
+Script generation is the slowest and most expensive call in a round, and
+many rooms submit the same few prompts. ``CachingLLM`` keys scripts on the
+normalized prompt, the personality, the digest of its compiled prompt
+prefix (so editing a personality's prompt retires its cached scripts),
+the number of roles and the content tone, and serves repeats from an
+in-memory LRU tier, falling back to an optional persistent ``ScriptStore``
+(shared across restarts and processes) before calling the provider.
+Entries expire after a TTL. The store is only an optimization: if it
+fails, the request falls back to the provider and the failure is logged.
+"""
+
+import asyncio
+import logging
+import re
+import sqlite3
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+from pydantic import TypeAdapter
+
+from slop.adapters.llm.prompts import PromptTemplates, compile_prefix
+from slop.domain.ai_personality import AIPersonality
+from slop.domain.game import ContentTone
+from slop.domain.script import Script
+from slop.ports.llm import LLMPort
+
+_SCRIPT_ADAPTER: TypeAdapter[Script] = TypeAdapter(Script)
+
+logger = logging.getLogger(__name__)
+
+_PUNCTUATION = re.compile(r"[^\w\s]+")
+# Only articles and conjunctions: possessives, demonstratives, prepositions
+# and verbs change what a prompt means ("her revenge on his boss").
+_STOPWORDS = frozenset("a an the and or but".split())
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Reduce a prompt to the words that matter for script generation.
+
+    Lowercases, strips punctuation and drops articles and conjunctions,
+    keeping word order, so "The detective solves an art heist!" and
+    "detective solves art heist" share a cache entry.
+
+    Args:
+        prompt: The prompt as the player typed it
+
+    Returns:
+        The normalized prompt
+    """
+    words = _PUNCTUATION.sub(" ", prompt.casefold()).split()
+    return " ".join(word for word in words if word not in _STOPWORDS)
+
+
+@dataclass(frozen=True, slots=True)
+class ScriptCacheKey:
+    """Identifies a cached script.
+
+    Attributes:
+        prompt: The normalized prompt
+        personality_id: ID of the AI personality
+        prefix_digest: Digest of the personality's compiled prompt prefix
+        num_roles: Number of roles in the script
+        tone: The game's content tone
+    """
+
+    prompt: str
+    personality_id: str
+    prefix_digest: str
+    num_roles: int
+    tone: ContentTone
+
+    @classmethod
+    def for_request(
+        cls,
+        prompt: str,
+        personality: AIPersonality,
+        num_roles: int,
+        tone: ContentTone,
+        templates: PromptTemplates | None = None,
+    ) -> "ScriptCacheKey":
+        """Build the key for a ``generate_script`` call.
+
+        Args:
+            prompt: The prompt as the player typed it
+            personality: The AI personality
+            num_roles: Number of roles in the script
+            tone: The game's content tone
+            templates: Compiled prefixes to reuse (compiled afresh if None)
+        """
+        if templates is None:
+            prefix = compile_prefix(personality, tone)
+        else:
+            prefix = templates.prefix(personality, tone)
+        return cls(normalize_prompt(prompt), personality.id, prefix.digest, num_roles, tone)
+
+    def as_string(self) -> str:
+        """Return a stable string form for persistent stores."""
+        return "\x1f".join(
+            (
+                self.tone.value,
+                self.personality_id,
+                self.prefix_digest,
+                str(self.num_roles),
+                self.prompt,
+            )
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class StoredScript:
+    """A script read from a persistent store.
+
+    Attributes:
+        script: The script
+        expires_in: Seconds until the entry expires (None if it never does)
+    """
+
+    script: Script
+    expires_in: float | None
+
+
+class ScriptStore(Protocol):
+    """Persistent tier of the script cache."""
+
+    async def get(self, key: str) -> StoredScript | None:
+        """Return the unexpired script stored under ``key``, if any."""
+        ...
+
+    async def put(self, key: str, script: Script, ttl: float | None) -> None:
+        """Store a script, expiring after ``ttl`` seconds (never if None)."""
+        ...
+
+
+class SQLiteScriptStore:
+    """ScriptStore backed by a table in a SQLite database file."""
+
+    def __init__(self, path: str | Path, *, clock: Callable[[], float] = time.time) -> None:
+        """Open (creating if needed) the script table.
+
+        Args:
+            path: Path to the database file
+            clock: Returns the current Unix time, used for expiry
+        """
+        self._clock = clock
+        self._lock = asyncio.Lock()
+        self._conn = sqlite3.connect(Path(path), isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS scripts ("
+            "key TEXT PRIMARY KEY, script BLOB NOT NULL, expires_at REAL)"
+        )
+
+    async def get(self, key: str) -> StoredScript | None:
+        """Return the unexpired script stored under ``key``, if any."""
+        now = self._clock()
+        async with self._lock:
+            rows = await asyncio.to_thread(
+                lambda: self._conn.execute(
+                    "SELECT script, expires_at FROM scripts WHERE key = ? "
+                    "AND (expires_at IS NULL OR expires_at > ?)",
+                    (key, now),
+                ).fetchall()
+            )
+        if not rows:
+            return None
+        data, expires_at = rows[0]
+        return StoredScript(
+            _SCRIPT_ADAPTER.validate_json(data),
+            None if expires_at is None else expires_at - now,
+        )
+
+    async def put(self, key: str, script: Script, ttl: float | None) -> None:
+        """Store a script, expiring after ``ttl`` seconds (never if None)."""
+        expires_at = None if ttl is None else self._clock() + ttl
+        data = _SCRIPT_ADAPTER.dump_json(script)
+        async with self._lock:
+            await asyncio.to_thread(
+                self._conn.execute,
+                "INSERT OR REPLACE INTO scripts (key, script, expires_at) VALUES (?, ?, ?)",
+                (key, data, expires_at),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+@dataclass(frozen=True)
+class ScriptCacheStats:
+    """Counters for sizing the script cache.
+
+    Attributes:
+        hits: Requests served from the in-memory tier
+        store_hits: Requests served from the persistent tier
+        misses: Requests that called the provider
+        evictions: Entries dropped to stay within ``max_entries``
+        entries: Scripts currently held in memory
+        store_errors: Persistent tier reads and writes that failed
+    """
+
+    hits: int
+    store_hits: int
+    misses: int
+    evictions: int
+    entries: int
+    store_errors: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of requests that did not call the provider."""
+        requests = self.hits + self.store_hits + self.misses
+        return (self.hits + self.store_hits) / requests if requests else 0.0
+
+
+@dataclass(slots=True)
+class _Entry:
+    script: Script
+    expires_at: float | None
+
+
+class CachingLLM:
+    """LLMPort decorator that caches generated scripts.
+
+    Each call returns a fresh copy of the cached script. Provider errors
+    are not cached, and store errors never fail a request.
+    """
+
+    def __init__(
+        self,
+        llm: LLMPort,
+        *,
+        max_entries: int = 1024,
+        ttl: float | None = 24 * 60 * 60,
+        store: ScriptStore | None = None,
+        templates: PromptTemplates | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Wrap an LLM provider.
+
+        Args:
+            llm: The provider to call on a miss
+            max_entries: Maximum number of scripts held in memory
+            ttl: Seconds a script stays cached (None to never expire)
+            store: Optional persistent tier consulted on a memory miss
+            templates: Prompt templates, shared with the provider if it has them
+            clock: Monotonic clock used for in-memory expiry
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self._llm = llm
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._store = store
+        self._templates = templates or PromptTemplates()
+        self._clock = clock
+        self._entries: OrderedDict[ScriptCacheKey, _Entry] = OrderedDict()
+        self._hits = 0
+        self._store_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._store_errors = 0
+
+    @property
+    def stats(self) -> ScriptCacheStats:
+        """Current cache counters."""
+        return ScriptCacheStats(
+            hits=self._hits,
+            store_hits=self._store_hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+            store_errors=self._store_errors,
+        )
+
+    async def generate_script(
+        self,
+        prompt: str,
+        personality: AIPersonality,
+        num_roles: int,
+        *,
+        tone: ContentTone = ContentTone.FAMILY,
+    ) -> Script:
+        """Return a cached script for the request, generating it on a miss."""
+        key = ScriptCacheKey.for_request(prompt, personality, num_roles, tone, self._templates)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at is None or entry.expires_at > self._clock():
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return entry.script.copy()
+            del self._entries[key]
+
+        if self._store is not None:
+            try:
+                stored = await self._store.get(key.as_string())
+            except Exception:
+                logger.warning("Script store read failed; calling the provider", exc_info=True)
+                self._store_errors += 1
+                stored = None
+            if stored is not None:
+                self._store_hits += 1
+                self._put(key, stored.script, stored.expires_in)
+                return stored.script.copy()
+
+        self._misses += 1
+        script = await self._llm.generate_script(prompt, personality, num_roles, tone=tone)
+        self._put(key, script.copy(), self._ttl)
+        if self._store is not None:
+            try:
+                await self._store.put(key.as_string(), script, self._ttl)
+            except Exception:
+                logger.warning("Script store write failed; cached in memory only", exc_info=True)
+                self._store_errors += 1
+        return script
+
+    def clear(self) -> None:
+        """Drop every in-memory entry (counters are kept)."""
+        self._entries.clear()
+
+    def _put(self, key: ScriptCacheKey, script: Script, ttl: float | None) -> None:
+        expires_at = None if ttl is None else self._clock() + ttl
+        self._entries[key] = _Entry(script, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
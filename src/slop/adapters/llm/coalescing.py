@@ -0,0 +1,111 @@
+"""Single-flight coalescing of identical concurrent script generations.
+
+When several rooms (or retries within one room) ask for the same script
+at the same time, ``CoalescingLLM`` sends one request upstream and hands
+its result, or its error, to every caller. The upstream call runs in its
+own task: a caller that is cancelled (for example because its player
+disconnected) stops waiting without cancelling the call the others are
+still waiting on. Only when every caller has gone is the call cancelled.
+"""
+
+import asyncio
+from dataclasses import dataclass
+
+from slop.domain.ai_personality import AIPersonality
+from slop.domain.game import ContentTone
+from slop.domain.script import Script
+from slop.ports.llm import LLMPort
+
+type _RequestKey = tuple[str, str, int, ContentTone]
+
+
+@dataclass(slots=True)
+class _Flight:
+    task: asyncio.Task[Script]
+    waiters: int = 0
+
+
+class CoalescingLLM:
+    """LLMPort decorator that shares identical in-flight generations.
+
+    Requests are identical when prompt, personality ID, role count and
+    tone all match. Nothing is kept once a call completes; combine with
+    ``CachingLLM`` to also reuse finished scripts.
+    """
+
+    def __init__(self, llm: LLMPort) -> None:
+        """Wrap an LLM provider.
+
+        Args:
+            llm: The provider to call once per distinct in-flight request
+        """
+        self._llm = llm
+        self._flights: dict[_RequestKey, _Flight] = {}
+        self._upstream_calls = 0
+        self._coalesced = 0
+
+    @property
+    def upstream_calls(self) -> int:
+        """Number of calls sent to the wrapped provider."""
+        return self._upstream_calls
+
+    @property
+    def coalesced(self) -> int:
+        """Number of calls that joined a request already in flight."""
+        return self._coalesced
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct requests currently in flight."""
+        return len(self._flights)
+
+    async def generate_script(
+        self,
+        prompt: str,
+        personality: AIPersonality,
+        num_roles: int,
+        *,
+        tone: ContentTone = ContentTone.FAMILY,
+    ) -> Script:
+        """Generate a script, joining an identical request if one is in flight.
+
+        Every caller gets its own copy of the script.
+        """
+        key = (prompt, personality.id, num_roles, tone)
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._start(key, prompt, personality, num_roles, tone)
+        else:
+            self._coalesced += 1
+
+        flight.waiters += 1
+        try:
+            script = await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Every caller has gone; nobody wants the result any more.
+                flight.task.cancel()
+                self._discard(key, flight)
+        return script.copy()
+
+    def _start(
+        self,
+        key: _RequestKey,
+        prompt: str,
+        personality: AIPersonality,
+        num_roles: int,
+        tone: ContentTone,
+    ) -> _Flight:
+        task = asyncio.create_task(
+            self._llm.generate_script(prompt, personality, num_roles, tone=tone)
+        )
+        flight = _Flight(task)
+        self._flights[key] = flight
+        self._upstream_calls += 1
+        task.add_done_callback(lambda _: self._discard(key, flight))
+        return flight
+
+    def _discard(self, key: _RequestKey, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
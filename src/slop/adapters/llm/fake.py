@@ -0,0 +1,249 @@
+"""Deterministic local stand-in for an LLM provider.
+
+``FakeLLM`` implements ``LLMPort`` and ``StreamingLLMPort`` without any
+network access, for load tests, benchmarks and CI. Like a real provider,
+it assembles each prompt from ``PromptTemplates``; scripts are derived
+from the request and the prompt prefix's digest, so the same request
+always gets the same script (until the personality's prompt changes).
+Latency, failures and timeouts are drawn from a ``FakeLLMProfile`` using a
+seeded random generator, so a run is repeatable for a given seed and call
+order.
+
+Latency is modelled as a log-normal time to first token followed by
+streaming at a fixed token rate (one token per word). ``time_scale``
+shrinks every delay, so a test can exercise realistic profiles quickly.
+"""
+
+import asyncio
+import hashlib
+import math
+import random
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+
+from slop.adapters.llm.prompts import AssembledPrompt, PromptPrefix, PromptTemplates, compile_prefix
+from slop.domain.ai_personality import AIPersonality
+from slop.domain.game import ContentTone
+from slop.domain.script import Script
+from slop.domain.script_stream import ScriptStreamParser
+from slop.ports.llm import LLMError
+
+_NAMES = (
+    "Detective Sam",
+    "Captain Vega",
+    "Grandma Rose",
+    "Professor Quill",
+    "Chef Marco",
+    "Agent Nova",
+    "Sir Reginald",
+    "Dr. Juniper",
+)
+_TRAITS = (
+    "suspicious of everyone",
+    "hopelessly optimistic",
+    "secretly terrified",
+    "far too confident",
+    "always hungry",
+    "speaks only in whispers",
+)
+_LINES = (
+    "I knew {topic} would come back to haunt us.",
+    "Nobody move. This is about {topic}.",
+    "Is it just me, or is {topic} getting worse?",
+    "I have a plan, and it involves {topic}.",
+    "Stand back! I am an expert in {topic}.",
+    "We don't talk about {topic} in this house.",
+    "Fine. But {topic} was your idea.",
+)
+
+_TARGET_WORDS = 150
+
+
+@dataclass(frozen=True)
+class FakeLLMProfile:
+    """Latency and failure behaviour of a FakeLLM.
+
+    Attributes:
+        first_token_median: Median seconds until the first token
+        first_token_sigma: Log-normal spread of the first-token latency
+        tokens_per_second: Streaming rate after the first token
+        error_rate: Probability that a request fails with LLMError
+        timeout_rate: Probability that a request hangs, then fails
+        hang_seconds: How long a hanging request waits before failing
+    """
+
+    first_token_median: float = 0.8
+    first_token_sigma: float = 0.4
+    tokens_per_second: float = 60.0
+    error_rate: float = 0.0
+    timeout_rate: float = 0.0
+    hang_seconds: float = 30.0
+
+    def __post_init__(self) -> None:
+        """Validate the profile."""
+        if self.first_token_median < 0 or self.first_token_sigma < 0:
+            raise ValueError("Latency parameters must not be negative")
+        if self.tokens_per_second <= 0:
+            raise ValueError("tokens_per_second must be positive")
+        if not 0 <= self.error_rate + self.timeout_rate <= 1:
+            raise ValueError("error_rate and timeout_rate must sum to between 0 and 1")
+
+
+INSTANT = FakeLLMProfile(first_token_median=0.0, first_token_sigma=0.0, tokens_per_second=1e9)
+
+
+class FakeLLM:
+    """Local LLM provider producing deterministic scripts."""
+
+    def __init__(
+        self,
+        profile: FakeLLMProfile = FakeLLMProfile(),
+        *,
+        seed: int = 0,
+        time_scale: float = 1.0,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        templates: PromptTemplates | None = None,
+    ) -> None:
+        """Create a provider.
+
+        Args:
+            profile: Latency and failure behaviour
+            seed: Seed for latencies and failures
+            time_scale: Factor applied to every delay (e.g. 0.01 for tests)
+            sleep: Coroutine used to wait
+            templates: Prompt templates to assemble prompts with
+        """
+        self._profile = profile
+        self._templates = templates or PromptTemplates()
+        self._last_prompt: AssembledPrompt | None = None
+        self._rng = random.Random(seed)
+        self._time_scale = time_scale
+        self._sleep = sleep
+        self._calls = 0
+        self._failures = 0
+
+    @property
+    def calls(self) -> int:
+        """Number of requests received."""
+        return self._calls
+
+    @property
+    def last_prompt(self) -> AssembledPrompt | None:
+        """The prompt assembled for the most recent request."""
+        return self._last_prompt
+
+    @property
+    def failures(self) -> int:
+        """Number of requests that failed or timed out."""
+        return self._failures
+
+    async def generate_script(
+        self,
+        prompt: str,
+        personality: AIPersonality,
+        num_roles: int,
+        *,
+        tone: ContentTone = ContentTone.FAMILY,
+    ) -> Script:
+        """Generate a script after the modelled latency."""
+        parser = ScriptStreamParser()
+        async for chunk in self.stream_script(prompt, personality, num_roles, tone=tone):
+            parser.feed(chunk)
+        return parser.to_script(personality.id)
+
+    async def stream_script(
+        self,
+        prompt: str,
+        personality: AIPersonality,
+        num_roles: int,
+        *,
+        tone: ContentTone = ContentTone.FAMILY,
+    ) -> AsyncIterator[str]:
+        """Stream a script word by word at the modelled rate."""
+        self._calls += 1
+        assembled = self._templates.assemble(prompt, personality, num_roles, tone)
+        self._last_prompt = assembled
+        profile = self._profile
+        outcome = self._rng.random()
+        first_token = profile.first_token_median * math.exp(
+            self._rng.gauss(0.0, profile.first_token_sigma)
+        )
+        if outcome < profile.timeout_rate:
+            self._failures += 1
+            await self._wait(profile.hang_seconds)
+            raise LLMError("Fake provider timed out")
+        await self._wait(first_token)
+        if outcome < profile.timeout_rate + profile.error_rate:
+            self._failures += 1
+            raise LLMError("Fake provider error")
+
+        per_token = 1.0 / profile.tokens_per_second
+        text = script_text(prompt, personality, num_roles, tone, prefix=assembled.prefix)
+        for token in _tokens(text):
+            yield token
+            await self._wait(per_token)
+
+    async def _wait(self, seconds: float) -> None:
+        scaled = seconds * self._time_scale
+        if scaled > 0:
+            await self._sleep(scaled)
+
+
+def script_text(
+    prompt: str,
+    personality: AIPersonality,
+    num_roles: int,
+    tone: ContentTone,
+    *,
+    prefix: PromptPrefix | None = None,
+) -> str:
+    """Return the fake script for a request, in the streamed script format.
+
+    The text depends only on the arguments and the personality's prompt
+    prefix, so identical requests always produce identical scripts.
+
+    Args:
+        prompt: The player's prompt
+        personality: The AI personality
+        num_roles: Number of roles
+        tone: The content tone
+        prefix: The compiled prefix, if already known
+    """
+    if num_roles < 1:
+        raise LLMError("A script needs at least one role")
+    if prefix is None:
+        prefix = compile_prefix(personality, tone)
+    digest = hashlib.blake2b(
+        f"{prefix.digest}\x1f{prompt}\x1f{num_roles}".encode(), digest_size=8
+    ).digest()
+    rng = random.Random(int.from_bytes(digest))
+    names = [
+        _NAMES[i % len(_NAMES)] + ("" if i < len(_NAMES) else f" {i // len(_NAMES) + 1}")
+        for i in rng.sample(range(max(num_roles, len(_NAMES))), num_roles)
+    ]
+    topic = prompt.strip().rstrip(".!?").lower() or "the plan"
+
+    lines = [f"ROLE: {name} | {rng.choice(_TRAITS)}" for name in names]
+    lines += ["", f"({personality.name} presents: {prompt.strip()})"]
+    words = 0
+    turn = 0
+    # Aim for ~150 words (about a minute spoken), but give every role a line.
+    while words < _TARGET_WORDS or turn < num_roles:
+        line = f"{names[turn % num_roles].upper()}: {rng.choice(_LINES).format(topic=topic)}"
+        lines.append(line)
+        words += len(line.split())
+        turn += 1
+    return "\n".join(lines) + "\n"
+
+
+def _tokens(text: str) -> list[str]:
+    """Split text into word tokens that join back into the original."""
+    tokens = []
+    start = 0
+    for index, char in enumerate(text):
+        if char in " \n":
+            tokens.append(text[start : index + 1])
+            start = index + 1
+    if start < len(text):
+        tokens.append(text[start:])
+    return tokens
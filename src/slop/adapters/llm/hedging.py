@@ -0,0 +1,366 @@
+"""Hedged script generation across several LLM providers.
+
+Sequential retries (1 s, 2 s, 4 s) push the slowest rounds past any
+latency target. ``HedgingLLM`` instead sends each request to the first
+healthy provider and, if no script has arrived by that provider's observed
+p90 latency, sends the same request to the next provider as well. The
+first script to arrive wins and the other requests are cancelled. A
+provider that fails hands over to the next one at once.
+
+Each provider has a latency histogram (feeding the hedge delay) and a
+circuit breaker: after ``failure_threshold`` consecutive failures it is
+skipped for ``reset_timeout`` seconds, then one trial request decides
+whether it is healthy again. Requests still running at the overall
+timeout count as failures, and cancelled requests that outlasted the
+hedge delay record how long they ran, since the provider would have
+taken at least that long.
+"""
+
+import asyncio
+import bisect
+import enum
+import math
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from slop.domain.ai_personality import AIPersonality
+from slop.domain.game import ContentTone
+from slop.domain.script import Script
+from slop.ports.llm import LLMError, LLMPort
+
+
+class LatencyHistogram:
+    """Latency histogram with logarithmic buckets.
+
+    Buckets grow by ``growth`` from ``minimum`` seconds, so quantiles are
+    accurate to within one bucket width (about 10% by default) at any scale.
+    """
+
+    def __init__(
+        self, *, minimum: float = 0.001, maximum: float = 120.0, growth: float = 1.1
+    ) -> None:
+        """Create an empty histogram.
+
+        Args:
+            minimum: Upper bound of the first bucket, in seconds
+            maximum: Latencies above this land in the last bucket
+            growth: Ratio between consecutive bucket bounds
+        """
+        count = math.ceil(math.log(maximum / minimum, growth)) + 1
+        self._bounds = [minimum * growth**i for i in range(count)]
+        self._counts = [0] * (count + 1)
+        self._total = 0
+        self._sum = 0.0
+
+    @property
+    def count(self) -> int:
+        """Number of recorded latencies."""
+        return self._total
+
+    @property
+    def mean(self) -> float:
+        """Mean recorded latency in seconds (0.0 if empty)."""
+        return self._sum / self._total if self._total else 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record one latency."""
+        self._counts[bisect.bisect_left(self._bounds, seconds)] += 1
+        self._total += 1
+        self._sum += seconds
+
+    def quantile(self, q: float) -> float | None:
+        """Return the upper bound of the bucket holding quantile ``q``.
+
+        Returns:
+            Latency in seconds, or None if nothing has been recorded
+        """
+        if not self._total:
+            return None
+        rank = max(1, math.ceil(q * self._total))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return self._bounds[min(index, len(self._bounds) - 1)]
+        return self._bounds[-1]
+
+
+class BreakerState(enum.Enum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a half-open trial."""
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a closed breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds to stay open before allowing a trial
+            clock: Monotonic clock
+        """
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_owner: object | None = None
+        self._trial_running = False
+
+    @property
+    def state(self) -> BreakerState:
+        """Current state of the breaker."""
+        if self._opened_at is None:
+            return BreakerState.CLOSED
+        if self._clock() - self._opened_at >= self._reset_timeout:
+            return BreakerState.HALF_OPEN
+        return BreakerState.OPEN
+
+    def allow(self, owner: object | None = None) -> bool:
+        """Return True if a request may be sent, claiming the trial if half-open.
+
+        Args:
+            owner: Identifies the request, so only it can ``release`` the trial
+        """
+        state = self.state
+        if state is BreakerState.CLOSED:
+            return True
+        if state is BreakerState.HALF_OPEN and not self._trial_running:
+            self._trial_running = True
+            self._trial_owner = owner
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the breaker."""
+        self._failures = 0
+        self._opened_at = None
+        self._trial_running = False
+        self._trial_owner = None
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the breaker at the threshold or on a failed trial."""
+        self._failures += 1
+        if self._trial_running or self._failures >= self._failure_threshold:
+            self._opened_at = self._clock()
+        self._trial_running = False
+        self._trial_owner = None
+
+    def release(self, owner: object | None = None) -> None:
+        """Give back the trial if ``owner`` claimed it and ended without a verdict."""
+        if self._trial_running and self._trial_owner is owner:
+            self._trial_running = False
+            self._trial_owner = None
+
+
+@dataclass(frozen=True)
+class ProviderStats:
+    """Counters for one provider.
+
+    Attributes:
+        name: The provider's name
+        wins: Requests this provider answered first
+        failures: Requests that failed or timed out on this provider
+        cancelled: Requests cancelled because another provider won
+        p50: Median latency in seconds, if known
+        p90: 90th percentile latency in seconds, if known
+        breaker: Current circuit breaker state
+    """
+
+    name: str
+    wins: int
+    failures: int
+    cancelled: int
+    p50: float | None
+    p90: float | None
+    breaker: BreakerState
+
+
+class _Provider:
+    def __init__(self, name: str, llm: LLMPort, breaker: CircuitBreaker) -> None:
+        self.name = name
+        self.llm = llm
+        self.breaker = breaker
+        self.histogram = LatencyHistogram()
+        self.wins = 0
+        self.failures = 0
+        self.cancelled = 0
+
+
+class HedgingLLM:
+    """LLMPort composite that hedges requests across providers in order."""
+
+    def __init__(
+        self,
+        providers: Sequence[tuple[str, LLMPort]],
+        *,
+        hedge_quantile: float = 0.9,
+        default_hedge_delay: float = 2.0,
+        min_samples: int = 20,
+        timeout: float = 10.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a composite over named providers.
+
+        Args:
+            providers: (name, provider) pairs, most preferred first
+            hedge_quantile: Latency quantile of a provider after which the
+                next provider is also asked
+            default_hedge_delay: Hedge delay until a provider has ``min_samples``
+            min_samples: Latencies needed before the observed quantile is used
+            timeout: Overall seconds to wait for a script
+            failure_threshold: Consecutive failures that open a provider's breaker
+            reset_timeout: Seconds a breaker stays open before a trial request
+            clock: Monotonic clock for latencies and breakers
+        """
+        if not providers:
+            raise ValueError("At least one provider is required")
+        names = [name for name, _ in providers]
+        if len(set(names)) != len(names):
+            raise ValueError("Provider names must be unique")
+        self._providers = [
+            _Provider(
+                name,
+                llm,
+                CircuitBreaker(
+                    failure_threshold=failure_threshold,
+                    reset_timeout=reset_timeout,
+                    clock=clock,
+                ),
+            )
+            for name, llm in providers
+        ]
+        self._hedge_quantile = hedge_quantile
+        self._default_hedge_delay = default_hedge_delay
+        self._min_samples = min_samples
+        self._timeout = timeout
+        self._clock = clock
+        self._hedges = 0
+
+    @property
+    def hedges(self) -> int:
+        """Number of backup requests sent because a provider was slow."""
+        return self._hedges
+
+    def stats(self) -> list[ProviderStats]:
+        """Per-provider counters, in preference order."""
+        return [
+            ProviderStats(
+                name=p.name,
+                wins=p.wins,
+                failures=p.failures,
+                cancelled=p.cancelled,
+                p50=p.histogram.quantile(0.5),
+                p90=p.histogram.quantile(0.9),
+                breaker=p.breaker.state,
+            )
+            for p in self._providers
+        ]
+
+    def hedge_delay(self, name: str) -> float:
+        """Seconds to wait for a provider before also asking the next one."""
+        provider = next(p for p in self._providers if p.name == name)
+        return self._delay(provider)
+
+    async def generate_script(
+        self,
+        prompt: str,
+        personality: AIPersonality,
+        num_roles: int,
+        *,
+        tone: ContentTone = ContentTone.FAMILY,
+    ) -> Script:
+        """Generate a script from whichever provider answers first.
+
+        Raises:
+            LLMError: If every provider failed, all breakers are open, or
+                no script arrived within the timeout
+        """
+        candidates = iter(self._providers)
+        running: dict[asyncio.Task[Script], tuple[_Provider, float]] = {}
+        errors: list[str] = []
+        deadline = self._clock() + self._timeout
+        attempt = object()  # owns any half-open trial this request claims
+        timed_out = False
+
+        def launch_next() -> _Provider | None:
+            for provider in candidates:
+                if provider.breaker.allow(attempt):
+                    task = asyncio.create_task(
+                        provider.llm.generate_script(prompt, personality, num_roles, tone=tone)
+                    )
+                    running[task] = (provider, self._clock())
+                    return provider
+                errors.append(f"{provider.name}: circuit open")
+            return None
+
+        try:
+            # The most recently asked provider, while there are others left to ask.
+            newest = launch_next()
+            while running:
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    timed_out = True
+                    raise LLMError(f"No script within {self._timeout}s")
+                wait = remaining if newest is None else min(remaining, self._delay(newest))
+                done, _ = await asyncio.wait(
+                    running, timeout=wait, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    if newest is not None:
+                        newest = launch_next()
+                        self._hedges += newest is not None
+                    continue
+                for task in done:
+                    provider, started_at = running.pop(task)
+                    try:
+                        script = task.result()
+                    except Exception as exc:
+                        provider.failures += 1
+                        provider.breaker.record_failure()
+                        errors.append(f"{provider.name}: {exc}")
+                        newest = launch_next()
+                        continue
+                    provider.wins += 1
+                    provider.breaker.record_success()
+                    provider.histogram.record(self._clock() - started_at)
+                    return script
+            raise LLMError("All providers failed: " + "; ".join(errors))
+        finally:
+            now = self._clock()
+            for task, (provider, started_at) in running.items():
+                task.cancel()
+                if timed_out:
+                    provider.failures += 1
+                    provider.breaker.record_failure()
+                else:
+                    provider.cancelled += 1
+                    provider.breaker.release(attempt)
+                # Censored sample: the provider would have taken at least this
+                # long. Only outlasting the hedge delay says anything about the
+                # tail; shorter runs would just drag the quantiles down.
+                elapsed = now - started_at
+                if elapsed >= self._delay(provider):
+                    provider.histogram.record(elapsed)
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+    def _delay(self, provider: _Provider) -> float:
+        if provider.histogram.count < self._min_samples:
+            return self._default_hedge_delay
+        delay = provider.histogram.quantile(self._hedge_quantile)
+        return self._default_hedge_delay if delay is None else delay
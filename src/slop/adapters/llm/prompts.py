@@ -0,0 +1,133 @@
+"""Prompt assembly with precompiled, cacheable prefixes.
+
+Everything in a script-generation prompt except the player's prompt and
+the role count depends only on the personality and the content tone.
+``PromptTemplates`` compiles that part once per personality and tone into
+a ``PromptPrefix`` whose text is byte-identical on every call, so that
+provider-side prompt caching can reuse it, and appends only the variable
+part per request. Each prefix carries a digest of its text for caches to
+key on.
+"""
+
+import hashlib
+from dataclasses import dataclass
+
+from slop.domain.ai_personality import AIPersonality
+from slop.domain.game import ContentTone
+
+_FORMAT_INSTRUCTIONS = """\
+Write a short comedy sketch of about 150 words (roughly one minute when performed).
+Start by declaring the cast, one role per line, as:
+ROLE: <character name> | <one-line description>
+Then leave a blank line and write the script. Each line of dialogue starts
+with the character's name in capitals followed by a colon. Put stage
+directions in parentheses on their own lines. Give every role at least one line.
+Write only the script, with no introduction or commentary."""
+
+_TONE_INSTRUCTIONS = {
+    ContentTone.FAMILY: (
+        "Keep it family friendly: no profanity, sexual content, drugs or graphic violence."
+    ),
+    ContentTone.ADULT: (
+        "Mature humour and mild profanity are allowed, but no slurs, hate speech or sexual content."
+    ),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class PromptPrefix:
+    """The fixed part of the prompts for one personality and tone.
+
+    Attributes:
+        personality_id: The personality the prefix was compiled for
+        tone: The content tone the prefix was compiled for
+        text: The prefix, identical for every request
+        digest: Hex SHA-256 digest of the UTF-8 encoded text
+    """
+
+    personality_id: str
+    tone: ContentTone
+    text: str
+    digest: str
+
+
+@dataclass(frozen=True, slots=True)
+class AssembledPrompt:
+    """A complete prompt, split into its fixed and variable parts.
+
+    Attributes:
+        prefix: The cacheable prefix (e.g. the system message)
+        request: The part specific to this request (e.g. the user message)
+    """
+
+    prefix: PromptPrefix
+    request: str
+
+    @property
+    def text(self) -> str:
+        """The prompt as one string."""
+        return self.prefix.text + self.request
+
+
+def compile_prefix(personality: AIPersonality, tone: ContentTone) -> PromptPrefix:
+    """Build the fixed prompt prefix for a personality and tone."""
+    parts = [personality.system_prompt.strip(), _FORMAT_INSTRUCTIONS, _TONE_INSTRUCTIONS[tone]]
+    if personality.example_script:
+        parts.append("Example script:\n" + personality.example_script.strip())
+    text = "\n\n".join(parts) + "\n\n"
+    return PromptPrefix(
+        personality_id=personality.id,
+        tone=tone,
+        text=text,
+        digest=hashlib.sha256(text.encode()).hexdigest(),
+    )
+
+
+def request_text(prompt: str, num_roles: int) -> str:
+    """Build the variable part of a prompt."""
+    return f"Number of roles: {num_roles}\nPrompt: {prompt.strip()}\n"
+
+
+class PromptTemplates:
+    """Compiles prompt prefixes once and assembles prompts from them."""
+
+    def __init__(self) -> None:
+        """Create an empty set of templates."""
+        # (personality ID, tone) -> (system prompt, example script, prefix)
+        self._prefixes: dict[tuple[str, ContentTone], tuple[str, str | None, PromptPrefix]] = {}
+
+    def __len__(self) -> int:
+        """Number of compiled prefixes."""
+        return len(self._prefixes)
+
+    def prefix(self, personality: AIPersonality, tone: ContentTone) -> PromptPrefix:
+        """Return the compiled prefix for a personality and tone.
+
+        The prefix is compiled on first use and recompiled only if the
+        personality's system prompt or example script has changed.
+        """
+        key = (personality.id, tone)
+        cached = self._prefixes.get(key)
+        if (
+            cached is not None
+            and cached[0] == personality.system_prompt
+            and cached[1] == personality.example_script
+        ):
+            return cached[2]
+        compiled = compile_prefix(personality, tone)
+        self._prefixes[key] = (personality.system_prompt, personality.example_script, compiled)
+        return compiled
+
+    def assemble(
+        self,
+        prompt: str,
+        personality: AIPersonality,
+        num_roles: int,
+        tone: ContentTone = ContentTone.FAMILY,
+    ) -> AssembledPrompt:
+        """Assemble the prompt for one script generation."""
+        return AssembledPrompt(self.prefix(personality, tone), request_text(prompt, num_roles))
+
+    def digests(self) -> dict[tuple[str, ContentTone], str]:
+        """Digests of every compiled prefix, by personality ID and tone."""
+        return {key: prefix.digest for key, (_, _, prefix) in self._prefixes.items()}
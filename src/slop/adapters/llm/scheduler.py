@@ -0,0 +1,346 @@
+"""Priority-aware scheduling of LLM requests under budgets.
+
+Live rounds waiting on a script, retries and warm-pool pre-generation all
+share one provider's rate limits and one monthly budget. ``LLMScheduler``
+puts every request through one priority queue:
+
+- the highest-priority waiting request is always dispatched next
+  (``LIVE`` before ``RETRY`` before ``WARMUP``), and lower priorities
+  never use the concurrency slots reserved for live rounds;
+- a global concurrency cap and a per-minute token limit hold requests in
+  the queue until capacity frees up;
+- per-game token budgets and a spend limit per period (e.g. $20 a month)
+  reject requests outright with ``BudgetExceededError``.
+
+Requests are charged an estimated token count when they are dispatched.
+Callers pick a priority through ``client()``, which returns an
+``LLMPort`` for that priority and game.
+
+All accounting is in memory. Spend periods are measured on the
+monotonic clock from when the scheduler was created, so a restart starts
+a new period with nothing spent. Enforce a hard monthly cap at the
+provider as well, or pass the spend already incurred (e.g. from the
+provider's billing data) as ``initial_spend``.
+"""
+
+import asyncio
+import enum
+import heapq
+import itertools
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from slop.adapters.llm.hedging import LatencyHistogram
+from slop.domain.ai_personality import AIPersonality
+from slop.domain.game import ContentTone
+from slop.domain.script import Script
+from slop.ports.llm import LLMError, LLMPort
+
+_WINDOW = 60.0  # seconds in the per-minute token window
+
+
+class Priority(enum.IntEnum):
+    """Request priority classes, most urgent first."""
+
+    LIVE = 0
+    RETRY = 1
+    WARMUP = 2
+
+
+class BudgetExceededError(LLMError):
+    """Raised when a request would exceed a game or spend budget."""
+
+
+def estimate_tokens(prompt: str, personality: AIPersonality, num_roles: int) -> int:
+    """Roughly estimate the tokens a script generation consumes.
+
+    Counts about four characters per input token for the system prompt,
+    example script and prompt, plus ~250 output tokens for a ~150-word
+    script and ~15 per role description.
+    """
+    characters = len(personality.system_prompt) + len(personality.example_script or "")
+    characters += len(prompt)
+    return characters // 4 + 250 + 15 * num_roles
+
+
+@dataclass(frozen=True)
+class SchedulerStats:
+    """Counters for the scheduler.
+
+    Attributes:
+        queued: Requests waiting to be dispatched
+        running: Requests currently calling the provider
+        dispatched: Requests dispatched, by priority
+        rejected: Requests rejected for exceeding a budget
+        tokens_last_minute: Tokens charged in the last 60 seconds
+        spend: Cost charged in the current spend period
+    """
+
+    queued: int
+    running: int
+    dispatched: dict[Priority, int]
+    rejected: int
+    tokens_last_minute: int
+    spend: float
+
+
+@dataclass(order=True)
+class _Request:
+    priority: Priority
+    seq: int
+    game_id: str | None = field(compare=False)
+    tokens: int = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    granted: asyncio.Future[None] = field(compare=False)
+
+
+class LLMScheduler:
+    """Schedules requests to one LLM provider by priority within budgets."""
+
+    def __init__(
+        self,
+        llm: LLMPort,
+        *,
+        max_concurrency: int = 4,
+        reserved_live_slots: int = 1,
+        tokens_per_minute: int | None = None,
+        game_token_budget: int | None = None,
+        cost_per_1k_tokens: float = 0.0,
+        spend_limit: float | None = None,
+        spend_period: float = 30 * 24 * 60 * 60,
+        initial_spend: float = 0.0,
+        estimate: Callable[[str, AIPersonality, int], int] = estimate_tokens,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Wrap a provider.
+
+        Args:
+            llm: The provider all requests go to
+            max_concurrency: Maximum requests calling the provider at once
+            reserved_live_slots: Slots only ``LIVE`` requests may use
+            tokens_per_minute: Provider rate limit in tokens (None for no limit)
+            game_token_budget: Maximum tokens charged to one game (None for no limit)
+            cost_per_1k_tokens: Price used to convert tokens into spend
+            spend_limit: Maximum spend per ``spend_period`` (None for no limit)
+            spend_period: Length of a spend period in seconds (30 days by default),
+                starting when the scheduler is created
+            initial_spend: Spend already incurred in the first period, e.g.
+                before a restart
+            estimate: Estimates the tokens a request will consume
+            clock: Monotonic clock for windows, periods and queue times
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if not 0 <= reserved_live_slots < max_concurrency:
+            raise ValueError("reserved_live_slots must be less than max_concurrency")
+        self._llm = llm
+        self._max_concurrency = max_concurrency
+        self._reserved_live_slots = reserved_live_slots
+        self._tokens_per_minute = tokens_per_minute
+        self._game_token_budget = game_token_budget
+        self._cost_per_1k_tokens = cost_per_1k_tokens
+        self._spend_limit = spend_limit
+        self._spend_period = spend_period
+        self._estimate = estimate
+        self._clock = clock
+        self._queue: list[_Request] = []
+        self._seq = itertools.count()
+        self._running = 0
+        self._window: deque[tuple[float, int]] = deque()  # (charged at, tokens)
+        self._window_tokens = 0
+        self._game_tokens: dict[str, int] = {}
+        self._period_started = clock()
+        self._spend = initial_spend
+        self._timer: asyncio.TimerHandle | None = None
+        self._dispatched = dict.fromkeys(Priority, 0)
+        self._rejected = 0
+        self._queue_times = {priority: LatencyHistogram() for priority in Priority}
+
+    @property
+    def stats(self) -> SchedulerStats:
+        """Current scheduler counters."""
+        self._prune_window(self._clock())
+        return SchedulerStats(
+            queued=sum(not r.granted.done() for r in self._queue),
+            running=self._running,
+            dispatched=dict(self._dispatched),
+            rejected=self._rejected,
+            tokens_last_minute=self._window_tokens,
+            spend=self._spend,
+        )
+
+    def queue_time(self, priority: Priority) -> LatencyHistogram:
+        """Histogram of seconds requests of a priority waited before dispatch."""
+        return self._queue_times[priority]
+
+    def game_tokens(self, game_id: str) -> int:
+        """Tokens charged to a game so far."""
+        return self._game_tokens.get(game_id, 0)
+
+    def client(self, priority: Priority, game_id: str | None = None) -> LLMPort:
+        """Return an LLMPort whose requests are scheduled at ``priority``.
+
+        Args:
+            priority: Priority class of every request made through the client
+            game_id: Game charged for the requests, if any
+        """
+        return _ScheduledClient(self, priority, game_id)
+
+    async def generate_script(
+        self,
+        prompt: str,
+        personality: AIPersonality,
+        num_roles: int,
+        *,
+        tone: ContentTone = ContentTone.FAMILY,
+    ) -> Script:
+        """Generate a script at ``LIVE`` priority, charged to no game."""
+        return await self.submit(Priority.LIVE, None, prompt, personality, num_roles, tone=tone)
+
+    async def submit(
+        self,
+        priority: Priority,
+        game_id: str | None,
+        prompt: str,
+        personality: AIPersonality,
+        num_roles: int,
+        *,
+        tone: ContentTone = ContentTone.FAMILY,
+    ) -> Script:
+        """Queue a request and generate the script once it is dispatched.
+
+        Raises:
+            BudgetExceededError: If the request would exceed a budget
+            LLMError: If the provider fails
+        """
+        tokens = self._estimate(prompt, personality, num_roles)
+        self._check_budgets(game_id, tokens)
+        request = _Request(
+            priority=priority,
+            seq=next(self._seq),
+            game_id=game_id,
+            tokens=tokens,
+            enqueued_at=self._clock(),
+            granted=asyncio.get_running_loop().create_future(),
+        )
+        heapq.heappush(self._queue, request)
+        self._dispatch()
+        try:
+            await request.granted
+        except asyncio.CancelledError:
+            granted = request.granted
+            if not granted.done():
+                granted.cancel()  # skipped by _dispatch
+            elif not granted.cancelled() and granted.exception() is None:
+                self._finish()  # dispatched just as the caller gave up
+            raise
+        try:
+            return await self._llm.generate_script(prompt, personality, num_roles, tone=tone)
+        finally:
+            self._finish()
+
+    def _finish(self) -> None:
+        self._running -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        now = self._clock()
+        self._prune_window(now)
+        while self._queue:
+            request = self._queue[0]
+            if request.granted.done():
+                heapq.heappop(self._queue)
+                continue
+            limit = self._max_concurrency
+            if request.priority is not Priority.LIVE:
+                limit -= self._reserved_live_slots
+            if self._running >= limit:
+                return  # strict priority: nothing lower may overtake it
+            try:
+                self._check_budgets(request.game_id, request.tokens)
+            except BudgetExceededError as exc:
+                heapq.heappop(self._queue)
+                request.granted.set_exception(exc)
+                continue
+            if (
+                self._tokens_per_minute is not None
+                and self._window
+                and self._window_tokens + request.tokens > self._tokens_per_minute
+            ):
+                self._wake_at(self._window[0][0] + _WINDOW - now)
+                return
+            heapq.heappop(self._queue)
+            self._charge(request, now)
+            self._running += 1
+            self._dispatched[request.priority] += 1
+            self._queue_times[request.priority].record(now - request.enqueued_at)
+            request.granted.set_result(None)
+
+    def _check_budgets(self, game_id: str | None, tokens: int) -> None:
+        if (
+            game_id is not None
+            and self._game_token_budget is not None
+            and self._game_tokens.get(game_id, 0) + tokens > self._game_token_budget
+        ):
+            self._rejected += 1
+            raise BudgetExceededError(f"Game {game_id} has used its token budget")
+        if self._spend_limit is not None:
+            self._roll_period()
+            if self._spend + tokens / 1000 * self._cost_per_1k_tokens > self._spend_limit:
+                self._rejected += 1
+                raise BudgetExceededError("Spend limit reached for this period")
+
+    def _charge(self, request: _Request, now: float) -> None:
+        self._window.append((now, request.tokens))
+        self._window_tokens += request.tokens
+        if request.game_id is not None:
+            self._game_tokens[request.game_id] = (
+                self._game_tokens.get(request.game_id, 0) + request.tokens
+            )
+        self._roll_period()
+        self._spend += request.tokens / 1000 * self._cost_per_1k_tokens
+
+    def _roll_period(self) -> None:
+        now = self._clock()
+        if now - self._period_started >= self._spend_period:
+            self._period_started = now
+            self._spend = 0.0
+
+    def _prune_window(self, now: float) -> None:
+        while self._window and self._window[0][0] <= now - _WINDOW:
+            _, tokens = self._window.popleft()
+            self._window_tokens -= tokens
+
+    def _wake_at(self, delay: float) -> None:
+        if self._timer is not None:
+            return
+
+        def wake() -> None:
+            self._timer = None
+            self._dispatch()
+
+        self._timer = asyncio.get_running_loop().call_later(max(delay, 0.0), wake)
+
+
+class _ScheduledClient:
+    """LLMPort view of a scheduler at one priority, charged to one game."""
+
+    def __init__(self, scheduler: LLMScheduler, priority: Priority, game_id: str | None) -> None:
+        self._scheduler = scheduler
+        self._priority = priority
+        self._game_id = game_id
+
+    async def generate_script(
+        self,
+        prompt: str,
+        personality: AIPersonality,
+        num_roles: int,
+        *,
+        tone: ContentTone = ContentTone.FAMILY,
+    ) -> Script:
+        """Generate a script through the scheduler."""
+        return await self._scheduler.submit(
+            self._priority, self._game_id, prompt, personality, num_roles, tone=tone
+        )
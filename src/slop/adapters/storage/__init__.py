@@ -3,3 +3,17 @@
 Implementations for game state persistence (in-memory, database, etc.)
 that implement the StoragePort interface.
 """
+
+from slop.adapters.storage.cache import CacheStats, CachingStorage
+from slop.adapters.storage.segmented_log import SegmentedLogStorageAdapter
+from slop.adapters.storage.snapshot_policy import SnapshotPolicy, SnapshotPolicyStorage
+from slop.adapters.storage.sqlite import SQLiteStorageAdapter
+
+__all__ = [
+    "CacheStats",
+    "CachingStorage",
+    "SegmentedLogStorageAdapter",
+    "SnapshotPolicy",
+    "SnapshotPolicyStorage",
+    "SQLiteStorageAdapter",
+]
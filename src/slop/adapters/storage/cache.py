@@ -0,0 +1,258 @@
+"""Read-through LRU cache of Game aggregates in front of a StoragePort.
+
+``get_snapshot`` and ``get_game_by_room_code`` run on nearly every command
+and reconnect. ``CachingStorage`` keeps the live ``Game`` objects of
+recently used games in memory, so an active room costs no storage
+round-trips at all. Snapshots are written through, deletes invalidate,
+and the least recently used games are evicted once either the entry
+limit or the (estimated) memory cap is exceeded.
+"""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from slop.domain.events import GameEvent
+from slop.domain.game import Game
+from slop.ports.storage import Checkpoint, StoragePort
+
+# Rough per-object costs used by estimate_game_size, in bytes.
+_GAME_OVERHEAD = 1024
+_PLAYER_OVERHEAD = 400
+_TEAM_OVERHEAD = 400
+_ROUND_OVERHEAD = 1200
+_GUESS_OVERHEAD = 200
+
+
+def estimate_game_size(game: Game) -> int:
+    """Cheaply estimate the memory held by a Game.
+
+    Counts a fixed overhead per object plus the length of the large text
+    fields (scripts, prompts and guesses). It does not serialize anything,
+    so it is cheap enough to run on every cache insert.
+
+    Args:
+        game: The game to measure
+
+    Returns:
+        Approximate size in bytes
+    """
+    size = _GAME_OVERHEAD
+    size += _PLAYER_OVERHEAD * len(game.players)
+    size += _TEAM_OVERHEAD * len(game.teams)
+    for round_obj in game.rounds:
+        size += _ROUND_OVERHEAD + len(round_obj.prompt) + len(round_obj.script.content)
+        for role in round_obj.script.roles:
+            size += len(role.description) + sum(len(line) for line in role.lines)
+        for guess in round_obj.prompt_guesses:
+            size += _GUESS_OVERHEAD + len(guess.guess)
+    return size
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters for sizing the cache.
+
+    Attributes:
+        hits: Lookups served from memory
+        misses: Lookups that went to the underlying storage
+        evictions: Games dropped to stay within the limits
+        entries: Games currently cached
+        memory_bytes: Estimated size of the cached games
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    memory_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from memory."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _Entry:
+    game: Game
+    size: int
+
+
+class CachingStorage:
+    """StoragePort decorator caching live Game objects with LRU eviction.
+
+    Cached games are returned by reference: the object handed out is the
+    one the next lookup returns, and the one ``save_snapshot`` last wrote.
+    """
+
+    def __init__(
+        self,
+        storage: StoragePort,
+        *,
+        max_games: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        size_of: Callable[[Game], int] = estimate_game_size,
+    ) -> None:
+        """Wrap a storage adapter.
+
+        Args:
+            storage: The storage to read through to and write through to
+            max_games: Maximum number of cached games
+            max_bytes: Memory cap for cached games, as measured by ``size_of``
+            size_of: Function estimating the memory held by a game
+        """
+        if max_games < 1:
+            raise ValueError("max_games must be at least 1")
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self._storage = storage
+        self._max_games = max_games
+        self._max_bytes = max_bytes
+        self._size_of = size_of
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._room_codes: dict[str, str] = {}  # room_code -> game_id
+        self._loading: dict[str, asyncio.Task[Game | None]] = {}
+        self._memory_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Current cache counters."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+            memory_bytes=self._memory_bytes,
+        )
+
+    async def save_event(self, event: GameEvent) -> None:
+        """Append an event to the underlying storage."""
+        await self._storage.save_event(event)
+
+    async def get_events(self, game_id: str) -> list[GameEvent]:
+        """Retrieve a game's events from the underlying storage."""
+        return await self._storage.get_events(game_id)
+
+    async def get_checkpoint(self, game_id: str) -> Checkpoint | None:
+        """Retrieve a game's checkpoint from the underlying storage."""
+        return await self._storage.get_checkpoint(game_id)
+
+    async def save_snapshot(self, game: Game) -> None:
+        """Write the snapshot through, then cache the game.
+
+        If the write fails, the game is dropped from the cache so memory
+        never holds state the storage does not.
+        """
+        try:
+            await self._storage.save_snapshot(game)
+        except Exception:
+            self._invalidate(game.id)
+            raise
+        self._put(game)
+
+    async def get_snapshot(self, game_id: str) -> Game | None:
+        """Return the cached game, loading it on a miss."""
+        entry = self._entries.get(game_id)
+        if entry is not None:
+            self._hits += 1
+            self._entries.move_to_end(game_id)
+            return entry.game
+        self._misses += 1
+        return await self._load(game_id)
+
+    async def get_game_by_room_code(self, room_code: str) -> Game | None:
+        """Return the cached game for a room code, loading it on a miss."""
+        game_id = self._room_codes.get(room_code)
+        if game_id is not None:
+            return await self.get_snapshot(game_id)
+        self._misses += 1
+        game = await self._storage.get_game_by_room_code(room_code)
+        if game is None:
+            return None
+        entry = self._entries.get(game.id)
+        if entry is not None:
+            return entry.game
+        self._put(game)
+        return game
+
+    async def list_active_games(self) -> list[str]:
+        """List active games from the underlying storage."""
+        return await self._storage.list_active_games()
+
+    async def delete_game(self, game_id: str) -> None:
+        """Invalidate the cached game and delete it from storage."""
+        self._invalidate(game_id)
+        await self._storage.delete_game(game_id)
+
+    def clear(self) -> None:
+        """Drop every cached game (counters are kept)."""
+        self._entries.clear()
+        self._room_codes.clear()
+        self._memory_bytes = 0
+
+    async def _load(self, game_id: str) -> Game | None:
+        """Load a game once, however many callers miss on it at the same time.
+
+        The read runs in its own task, so a caller that is cancelled while
+        waiting (even the one that started it) never strands the others.
+        """
+        loading = self._loading.get(game_id)
+        if loading is None:
+            loading = asyncio.create_task(self._read_through(game_id))
+            self._loading[game_id] = loading
+            loading.add_done_callback(lambda task: self._loaded(game_id, task))
+        return await asyncio.shield(loading)
+
+    async def _read_through(self, game_id: str) -> Game | None:
+        game = await self._storage.get_snapshot(game_id)
+        entry = self._entries.get(game_id)
+        if entry is not None:
+            # A snapshot saved while loading is newer than what was read.
+            return entry.game
+        if game is not None and self._loading.get(game_id) is asyncio.current_task():
+            self._put(game)
+        return game
+
+    def _loaded(self, game_id: str, task: asyncio.Task[Game | None]) -> None:
+        if self._loading.get(game_id) is task:
+            del self._loading[game_id]
+        if not task.cancelled():
+            task.exception()  # mark retrieved even if every caller gave up
+
+    def _put(self, game: Game) -> None:
+        old = self._entries.pop(game.id, None)
+        if old is not None:
+            self._memory_bytes -= old.size
+            if old.game.room_code != game.room_code:
+                self._room_codes.pop(old.game.room_code, None)
+        entry = _Entry(game, self._size_of(game))
+        self._entries[game.id] = entry
+        self._room_codes[game.room_code] = game.id
+        self._memory_bytes += entry.size
+        self._evict()
+
+    def _evict(self) -> None:
+        # Always keep the most recent entry, even if it alone exceeds max_bytes.
+        while len(self._entries) > 1 and (
+            len(self._entries) > self._max_games or self._memory_bytes > self._max_bytes
+        ):
+            game_id, entry = self._entries.popitem(last=False)
+            self._forget(game_id, entry)
+            self._evictions += 1
+
+    def _invalidate(self, game_id: str) -> None:
+        self._loading.pop(game_id, None)  # an in-flight load must not repopulate
+        entry = self._entries.pop(game_id, None)
+        if entry is not None:
+            self._forget(game_id, entry)
+
+    def _forget(self, game_id: str, entry: _Entry) -> None:
+        self._memory_bytes -= entry.size
+        if self._room_codes.get(entry.game.room_code) == game_id:
+            del self._room_codes[entry.game.room_code]
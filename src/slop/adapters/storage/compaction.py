@@ -0,0 +1,82 @@
+"""Checkpoint compaction shared by storage adapters.
+
+``RoundCompleted`` is the recovery checkpoint. When one is appended, the
+adapter projects the game as of that event, stores it as the game's
+checkpoint, and drops every event up to and including it. Replay and
+``get_events`` then only ever cover the round in progress, however long
+the game runs.
+"""
+
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass
+
+from slop.domain.events import GameEvent, RoundCompleted
+from slop.domain.game import Game
+from slop.domain.projection import GameProjection
+from slop.ports.storage import StoragePort
+
+
+@dataclass(frozen=True)
+class CompactionPlan:
+    """A checkpoint ready to be written.
+
+    Attributes:
+        game: Game state as of the checkpoint event
+        event_id: ID of the checkpoint event
+        compacted: Number of leading stored events the checkpoint replaces
+    """
+
+    game: Game
+    event_id: str
+    compacted: int
+
+
+def is_checkpoint_event(event: GameEvent) -> bool:
+    """Whether appending ``event`` should trigger compaction."""
+    return isinstance(event, RoundCompleted)
+
+
+class CheckpointLocks:
+    """Serializes compaction per game so checkpoints never interleave."""
+
+    def __init__(self) -> None:
+        self._locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    def __call__(self, game_id: str) -> asyncio.Lock:
+        """Return the lock guarding compaction of ``game_id``."""
+        return self._locks[game_id]
+
+    def discard(self, game_id: str) -> None:
+        """Forget the lock of a deleted game."""
+        self._locks.pop(game_id, None)
+
+
+async def plan_compaction(storage: StoragePort, event: GameEvent) -> CompactionPlan | None:
+    """Project the game up to ``event`` on top of its previous checkpoint.
+
+    Args:
+        storage: The adapter the event was appended to
+        event: The stored checkpoint event
+
+    Returns:
+        The plan, or None if the event is no longer stored or the stored
+        events can't be projected (the log is then left uncompacted)
+    """
+    checkpoint = await storage.get_checkpoint(event.game_id)
+    events = await storage.get_events(event.game_id)
+    for index, stored in enumerate(events):
+        if stored.event_id == event.event_id:
+            break
+    else:
+        return None
+
+    projection = GameProjection(
+        checkpoint.game if checkpoint else None,
+        last_event_id=checkpoint.event_id if checkpoint else None,
+    )
+    try:
+        projection.apply_all(events[: index + 1])
+    except ValueError:
+        return None
+    return CompactionPlan(projection.game, event.event_id, index + 1)
@@ -0,0 +1,127 @@
+"""Group commit writer shared by storage adapters.
+
+Callers submit writes to a queue drained by a single writer task. Every
+write that arrives while the previous batch is being committed is grouped
+into the next batch, so concurrent games share one fsync instead of
+paying for one each.
+"""
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+
+@dataclass
+class _Pending[T]:
+    item: T
+    future: asyncio.Future[None] = field(repr=False)
+
+
+class GroupCommitWriter[T]:
+    """Single writer task that commits queued writes in batches.
+
+    ``commit`` runs in a worker thread with the whole batch and returns
+    one entry per item: ``None`` on success or the exception for that
+    item. ``on_commit`` then runs on the event loop, before any caller is
+    resumed, so in-memory state can be updated in commit order. If it
+    raises, every caller in the batch gets that exception (the batch is
+    durable, but the in-memory state may not reflect it) and the writer
+    carries on with the next batch.
+    """
+
+    def __init__(
+        self,
+        commit: Callable[[list[T]], list[Exception | None]],
+        *,
+        max_batch_size: int = 256,
+        on_commit: Callable[[list[T], list[Exception | None]], None] | None = None,
+    ) -> None:
+        """Configure the writer.
+
+        Args:
+            commit: Blocking function that durably writes a batch
+            max_batch_size: Maximum items grouped into one commit
+            on_commit: Optional hook run on the event loop after each commit
+        """
+        if max_batch_size < 1:
+            raise ValueError("Max batch size must be at least 1")
+        self._commit = commit
+        self._on_commit = on_commit
+        self._max_batch_size = max_batch_size
+        self._queue: asyncio.Queue[_Pending[T] | None] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+        self.commit_count = 0
+        self.write_count = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the writer task has been started and not stopped."""
+        return self._task is not None
+
+    def start(self) -> None:
+        """Start the writer task on the running event loop."""
+        if self._task is not None:
+            raise RuntimeError("Writer is already running")
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Commit everything already submitted, then stop the writer task."""
+        if self._task is None:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+
+    async def submit(self, item: T) -> None:
+        """Queue a write and wait until the batch containing it is committed.
+
+        Raises:
+            RuntimeError: If the writer is not running
+            Exception: Whatever ``commit`` reported for this item
+        """
+        if self._task is None:
+            raise RuntimeError("Storage is not open")
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        await self._queue.put(_Pending(item, future))
+        await future
+
+    async def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            pending = await self._queue.get()
+            if pending is None:
+                break
+            batch = [pending]
+            while len(batch) < self._max_batch_size and not self._queue.empty():
+                next_pending = self._queue.get_nowait()
+                if next_pending is None:
+                    stopping = True
+                    break
+                batch.append(next_pending)
+
+            items = [p.item for p in batch]
+            try:
+                errors = await asyncio.to_thread(self._commit, items)
+            except Exception as exc:  # the commit itself failed, nothing is durable
+                for p in batch:
+                    if not p.future.done():
+                        p.future.set_exception(exc)
+                continue
+
+            self.commit_count += 1
+            self.write_count += len(batch)
+            if self._on_commit is not None:
+                try:
+                    self._on_commit(items, errors)
+                except Exception as exc:
+                    for p in batch:
+                        if not p.future.done():
+                            p.future.set_exception(exc)
+                    continue
+            for p, error in zip(batch, errors, strict=True):
+                if p.future.done():
+                    continue
+                if error is None:
+                    p.future.set_result(None)
+                else:
+                    p.future.set_exception(error)
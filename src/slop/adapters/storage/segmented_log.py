@@ -0,0 +1,506 @@
+"""Append-only segmented log storage adapter.
+
+Implements the StoragePort as a sequence of fixed-size segment files in a
+directory. Every write is appended as a length-prefixed, checksummed
+record; writes are grouped and fsynced once per batch. An in-memory index
+maps each game to the offsets of its records, so reads touch only that
+game's data and never scan the log.
+
+On open, the segments are scanned once to rebuild the index, which keeps
+recovery time proportional to the live log size. A torn record at the end
+of the last segment (a crash mid-write) is truncated away.
+"""
+
+import asyncio
+import os
+import struct
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import IntEnum
+from pathlib import Path
+
+from slop.adapters.storage.compaction import (
+    CheckpointLocks,
+    is_checkpoint_event,
+    plan_compaction,
+)
+from slop.adapters.storage.group_commit import GroupCommitWriter
+from slop.adapters.storage.serialization import (
+    decode_game,
+    decode_stored_events,
+    encode_game,
+    encode_stored_event,
+)
+from slop.domain.events import GameEvent
+from slop.domain.game import Game
+from slop.ports.storage import Checkpoint
+
+# Record layout: length and CRC32 of the body, then the body itself.
+# Body layout: kind, game_id length, key length, game_id, key, data.
+_HEADER = struct.Struct("<II")
+_BODY_PREFIX = struct.Struct("<BHH")
+# Checkpoint data starts with the position (segment, data offset) of the
+# checkpointed event; every event of the game at or before it is dropped.
+_CHECKPOINT_PREFIX = struct.Struct("<IQ")
+_SEGMENT_SUFFIX = ".seg"
+_READ_RETRIES = 3
+
+
+class _RecordKind(IntEnum):
+    """Kinds of records stored in the log."""
+
+    EVENT = 1
+    SNAPSHOT = 2  # key holds the room code
+    DELETE = 3
+    CHECKPOINT = 4  # key holds the checkpointed event ID
+
+
+@dataclass(frozen=True)
+class _Location:
+    """Position of a record's data within a segment file."""
+
+    segment: int
+    offset: int
+    length: int
+
+
+@dataclass
+class _Record:
+    """A record waiting to be appended; location is set when written."""
+
+    kind: _RecordKind
+    game_id: str
+    key: str
+    data: bytes
+    location: _Location | None = None
+
+
+@dataclass
+class _GameIndex:
+    """Offsets of the live records of one game."""
+
+    events: list[_Location] = field(default_factory=list)
+    snapshot: _Location | None = None
+    room_code: str | None = None
+    checkpoint: _Location | None = None
+    checkpoint_event_id: str | None = None
+
+
+class SegmentedLogStorageAdapter:
+    """StoragePort implementation backed by an append-only segmented log.
+
+    Use as an async context manager, or call ``open()`` and ``close()``
+    explicitly. Writes resolve only after the batch containing them has
+    been fsynced.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        segment_size: int = 16 * 1024 * 1024,
+        max_batch_size: int = 256,
+        fsync: bool = True,
+        binary_events: bool = False,
+        compact: bool = True,
+    ) -> None:
+        """Configure the adapter without touching the filesystem.
+
+        Args:
+            directory: Directory holding the segment files (created if missing)
+            segment_size: Size at which a new segment is started, in bytes
+            max_batch_size: Maximum writes grouped into one fsync
+            fsync: Whether to fsync each batch (disable only for tests/benchmarks)
+            binary_events: Store events in the compact binary format
+            compact: Checkpoint and drop old events at each RoundCompleted
+        """
+        if segment_size < 1:
+            raise ValueError("Segment size must be positive")
+        self._directory = Path(directory)
+        self._segment_size = segment_size
+        self._fsync = fsync
+        self._binary_events = binary_events
+        self._compact = compact
+        self._checkpoint_locks = CheckpointLocks()
+        self._segments: list[int] = []
+        self._live: dict[int, int] = {}  # segment -> live record count
+        self._games: dict[str, _GameIndex] = {}
+        self._room_codes: dict[str, str] = {}  # room_code -> game_id
+        self._active_fd: int | None = None
+        self._active_size = 0
+        self._group_commit: GroupCommitWriter[_Record] = GroupCommitWriter(
+            self._commit_batch, max_batch_size=max_batch_size, on_commit=self._apply_batch
+        )
+
+    async def __aenter__(self) -> "SegmentedLogStorageAdapter":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    @property
+    def commit_count(self) -> int:
+        """Number of fsynced batches written by the writer task."""
+        return self._group_commit.commit_count
+
+    @property
+    def write_count(self) -> int:
+        """Number of records written by the writer task."""
+        return self._group_commit.write_count
+
+    @property
+    def segment_count(self) -> int:
+        """Number of segment files currently on disk."""
+        return len(self._segments)
+
+    async def open(self) -> None:
+        """Rebuild the index from disk and start the writer task."""
+        if self._group_commit.running:
+            raise RuntimeError("Storage is already open")
+        await asyncio.to_thread(self._recover)
+        self._group_commit.start()
+
+    async def close(self) -> None:
+        """Flush pending writes and close the active segment."""
+        if not self._group_commit.running:
+            return
+        await self._group_commit.stop()
+        if self._active_fd is not None:
+            os.close(self._active_fd)
+            self._active_fd = None
+
+    async def save_event(self, event: GameEvent) -> None:
+        """Append an event and wait until its batch is durable."""
+        data = encode_stored_event(event, binary=self._binary_events)
+        record = _Record(_RecordKind.EVENT, event.game_id, "", data)
+        await self._group_commit.submit(record)
+        if self._compact and is_checkpoint_event(event):
+            await self._write_checkpoint(event)
+
+    async def get_events(self, game_id: str) -> list[GameEvent]:
+        """Retrieve a game's events since its checkpoint, reading only its records."""
+        chunks = await self._read(lambda: self._event_locations(game_id))
+        return decode_stored_events(chunks)
+
+    async def get_checkpoint(self, game_id: str) -> Checkpoint | None:
+        """Retrieve the latest RoundCompleted checkpoint of a game."""
+        event_id: str | None = None
+
+        def resolve() -> list[_Location]:
+            nonlocal event_id
+            index = self._games.get(game_id)
+            if index is None or index.checkpoint is None:
+                return []
+            event_id = index.checkpoint_event_id
+            return [index.checkpoint]
+
+        chunks = await self._read(resolve)
+        if not chunks or event_id is None:
+            return None
+        return Checkpoint(decode_game(chunks[0]), event_id)
+
+    async def save_snapshot(self, game: Game) -> None:
+        """Append a snapshot that supersedes the game's previous one."""
+        record = _Record(_RecordKind.SNAPSHOT, game.id, game.room_code, encode_game(game))
+        await self._group_commit.submit(record)
+
+    async def get_snapshot(self, game_id: str) -> Game | None:
+        """Retrieve the latest snapshot of a game."""
+        chunks = await self._read(lambda: self._snapshot_locations(game_id))
+        return decode_game(chunks[0]) if chunks else None
+
+    async def get_game_by_room_code(self, room_code: str) -> Game | None:
+        """Retrieve the snapshot of the game using this room code."""
+        game_id = self._room_codes.get(room_code)
+        if game_id is None:
+            return None
+        return await self.get_snapshot(game_id)
+
+    async def list_active_games(self) -> list[str]:
+        """List games that have live records in the index."""
+        if not self._group_commit.running:
+            raise RuntimeError("Storage is not open")
+        return list(self._games)
+
+    async def delete_game(self, game_id: str) -> None:
+        """Append a tombstone that drops the game's events and snapshot."""
+        await self._group_commit.submit(_Record(_RecordKind.DELETE, game_id, "", b""))
+        self._checkpoint_locks.discard(game_id)
+
+    async def _write_checkpoint(self, event: GameEvent) -> None:
+        """Append a checkpoint that supersedes the events it covers."""
+        async with self._checkpoint_locks(event.game_id):
+            plan = await plan_compaction(self, event)
+            index = self._games.get(event.game_id)
+            if plan is None or index is None:
+                return
+            # Only appends happen while the lock is held, so the planned
+            # prefix is still at the front of the index.
+            through = index.events[plan.compacted - 1]
+            data = _CHECKPOINT_PREFIX.pack(through.segment, through.offset) + encode_game(plan.game)
+            record = _Record(_RecordKind.CHECKPOINT, event.game_id, plan.event_id, data)
+            await self._group_commit.submit(record)
+
+    def _event_locations(self, game_id: str) -> list[_Location]:
+        index = self._games.get(game_id)
+        return list(index.events) if index else []
+
+    def _snapshot_locations(self, game_id: str) -> list[_Location]:
+        index = self._games.get(game_id)
+        return [index.snapshot] if index and index.snapshot else []
+
+    async def _read(self, resolve: Callable[[], list[_Location]]) -> list[bytes]:
+        if not self._group_commit.running:
+            raise RuntimeError("Storage is not open")
+        for attempt in range(_READ_RETRIES):
+            locations = resolve()
+            if not locations:
+                return []
+            try:
+                return await asyncio.to_thread(self._read_locations, locations)
+            except FileNotFoundError:
+                # The segment was reclaimed after its records were superseded
+                # by a concurrent write; the index now points elsewhere.
+                if attempt == _READ_RETRIES - 1:
+                    raise
+        return []
+
+    def _read_locations(self, locations: list[_Location]) -> list[bytes]:
+        fds: dict[int, int] = {}
+        try:
+            chunks = []
+            for location in locations:
+                fd = fds.get(location.segment)
+                if fd is None:
+                    fd = os.open(self._segment_path(location.segment), os.O_RDONLY)
+                    fds[location.segment] = fd
+                chunks.append(os.pread(fd, location.length, location.offset))
+            return chunks
+        finally:
+            for fd in fds.values():
+                os.close(fd)
+
+    def _segment_path(self, segment: int) -> Path:
+        return self._directory / f"{segment:010d}{_SEGMENT_SUFFIX}"
+
+    def _recover(self) -> None:
+        """Scan every segment in order and rebuild the in-memory index."""
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._segments = sorted(
+            int(path.stem) for path in self._directory.glob(f"*{_SEGMENT_SUFFIX}")
+        )
+        self._live = {}
+        self._games = {}
+        self._room_codes = {}
+        # Nothing is reclaimed until the scan ends: a segment that turns out
+        # dead (e.g. only a deleted game's records) must not vanish mid-scan.
+        segments = list(self._segments)
+        for position, segment in enumerate(segments):
+            is_last = position == len(segments) - 1
+            self._recover_segment(segment, truncate_torn_tail=is_last)
+
+        if not self._segments:
+            self._segments.append(0)
+        active = self._segments[-1]
+        path = self._segment_path(active)
+        self._active_fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._active_size = os.fstat(self._active_fd).st_size
+        self._reclaim()
+
+    def _recover_segment(self, segment: int, *, truncate_torn_tail: bool) -> None:
+        path = self._segment_path(segment)
+        data = path.read_bytes()
+        records: list[_Record] = []
+        offset = 0
+        while offset < len(data):
+            record = _decode_record(data, offset, segment)
+            if record is None:
+                if not truncate_torn_tail:
+                    raise ValueError(f"Corrupt record in segment {path.name} at offset {offset}")
+                with path.open("r+b") as f:
+                    f.truncate(offset)
+                break
+            assert record.location is not None
+            records.append(record)
+            offset = record.location.offset + record.location.length
+        for record in records:
+            self._apply(record)
+
+    def _commit_batch(self, batch: list[_Record]) -> list[Exception | None]:
+        """Append a batch to the active segment(s) and fsync once.
+
+        If any write or fsync fails, the log is rolled back to where the
+        batch started, so no part of a failed batch is left behind.
+        """
+        start_segment, start_size = self._segments[-1], self._active_size
+        try:
+            self._append_batch(batch)
+        except BaseException:
+            self._roll_back(start_segment, start_size)
+            raise
+        return [None] * len(batch)
+
+    def _append_batch(self, batch: list[_Record]) -> None:
+        buffer = bytearray()
+        for record in batch:
+            frame = _encode_record(record)
+            pending = self._active_size + len(buffer)
+            if pending > 0 and pending + len(frame) > self._segment_size:
+                self._write_active(buffer)
+                buffer.clear()
+                self._rotate()
+                pending = 0
+            data_offset = pending + len(frame) - len(record.data)
+            record.location = _Location(self._segments[-1], data_offset, len(record.data))
+            buffer += frame
+        self._write_active(buffer)
+        if self._fsync:
+            assert self._active_fd is not None
+            os.fsync(self._active_fd)
+
+    def _write_active(self, buffer: bytearray) -> None:
+        assert self._active_fd is not None
+        view = memoryview(buffer)
+        while view:
+            written = os.write(self._active_fd, view)
+            view = view[written:]
+        self._active_size += len(buffer)  # only once every byte is written
+
+    def _roll_back(self, segment: int, size: int) -> None:
+        """Drop everything appended after ``size`` bytes of ``segment``."""
+        if self._active_fd is None or self._segments[-1] != segment:
+            if self._active_fd is not None:
+                os.close(self._active_fd)
+            while self._segments[-1] != segment:
+                self._segment_path(self._segments.pop()).unlink(missing_ok=True)
+            path = self._segment_path(segment)
+            self._active_fd = os.open(path, os.O_WRONLY | os.O_APPEND)
+        os.ftruncate(self._active_fd, size)
+        self._active_size = size
+
+    def _rotate(self) -> None:
+        """Seal the active segment and start the next one."""
+        assert self._active_fd is not None
+        if self._fsync:
+            os.fsync(self._active_fd)
+        os.close(self._active_fd)
+        self._active_fd = None
+        segment = self._segments[-1] + 1
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_APPEND
+        self._active_fd = os.open(self._segment_path(segment), flags, 0o644)
+        self._active_size = 0
+        self._segments.append(segment)
+        if self._fsync:
+            dir_fd = os.open(self._directory, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+    def _apply_batch(self, batch: list[_Record], errors: list[Exception | None]) -> None:
+        """Update the index for written records, then drop dead segments."""
+        for record, error in zip(batch, errors, strict=True):
+            if error is None:
+                self._apply(record)
+        self._reclaim()
+
+    def _apply(self, record: _Record) -> None:
+        location = record.location
+        assert location is not None
+        if record.kind is _RecordKind.DELETE:
+            index = self._games.pop(record.game_id, None)
+            if index is None:
+                return
+            for dead in [*index.events, index.snapshot, index.checkpoint]:
+                if dead is not None:
+                    self._live[dead.segment] -= 1
+            if index.room_code is not None:
+                self._room_codes.pop(index.room_code, None)
+            return
+        if record.kind is _RecordKind.CHECKPOINT:
+            self._apply_checkpoint(record, location)
+            return
+
+        index = self._games.setdefault(record.game_id, _GameIndex())
+        self._live[location.segment] = self._live.get(location.segment, 0) + 1
+        if record.kind is _RecordKind.EVENT:
+            index.events.append(location)
+            return
+
+        if index.snapshot is not None:
+            self._live[index.snapshot.segment] -= 1
+        index.snapshot = location
+        if index.room_code is not None and index.room_code != record.key:
+            self._room_codes.pop(index.room_code, None)
+        index.room_code = record.key
+        self._room_codes[record.key] = record.game_id
+
+    def _apply_checkpoint(self, record: _Record, location: _Location) -> None:
+        index = self._games.get(record.game_id)
+        if index is None:
+            return  # the game was deleted before its checkpoint landed
+        through = _CHECKPOINT_PREFIX.unpack_from(record.data)
+        dropped = 0
+        for event in index.events:
+            if (event.segment, event.offset) > through:
+                break
+            self._live[event.segment] -= 1
+            dropped += 1
+        del index.events[:dropped]
+
+        if index.checkpoint is not None:
+            self._live[index.checkpoint.segment] -= 1
+        index.checkpoint = _Location(
+            location.segment,
+            location.offset + _CHECKPOINT_PREFIX.size,
+            location.length - _CHECKPOINT_PREFIX.size,
+        )
+        index.checkpoint_event_id = record.key
+        self._live[location.segment] = self._live.get(location.segment, 0) + 1
+
+    def _reclaim(self) -> None:
+        """Delete the oldest segments once none of their records are live.
+
+        Only a prefix of the log is ever removed, so a tombstone can never
+        be dropped while older records of the same game still exist.
+        """
+        while len(self._segments) > 1 and self._live.get(self._segments[0], 0) == 0:
+            segment = self._segments.pop(0)
+            self._live.pop(segment, None)
+            self._segment_path(segment).unlink(missing_ok=True)
+
+
+def _encode_record(record: _Record) -> bytes:
+    game_id = record.game_id.encode()
+    key = record.key.encode()
+    body = b"".join(
+        (_BODY_PREFIX.pack(record.kind, len(game_id), len(key)), game_id, key, record.data)
+    )
+    return _HEADER.pack(len(body), zlib.crc32(body)) + body
+
+
+def _decode_record(data: bytes, offset: int, segment: int) -> _Record | None:
+    """Decode the record at ``offset``, or return None if it is torn or corrupt."""
+    if offset + _HEADER.size > len(data):
+        return None
+    length, checksum = _HEADER.unpack_from(data, offset)
+    body_start = offset + _HEADER.size
+    body_end = body_start + length
+    if length < _BODY_PREFIX.size or body_end > len(data):
+        return None
+    body = data[body_start:body_end]
+    if zlib.crc32(body) != checksum:
+        return None
+    kind, game_id_len, key_len = _BODY_PREFIX.unpack_from(body)
+    game_id_end = _BODY_PREFIX.size + game_id_len
+    key_end = game_id_end + key_len
+    data_start = body_start + key_end
+    return _Record(
+        kind=_RecordKind(kind),
+        game_id=body[_BODY_PREFIX.size : game_id_end].decode(),
+        key=body[game_id_end:key_end].decode(),
+        data=body[key_end:],
+        location=_Location(segment, data_start, body_end - data_start),
+    )
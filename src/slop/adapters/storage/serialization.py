@@ -0,0 +1,77 @@
+"""Serialization helpers shared by storage adapters.
+
+Events are stored as JSON or, optionally, in the compact binary format;
+readers accept either, so a store can switch formats without migrating.
+Snapshots are stored as the JSON form of the ``Game`` dataclass tree.
+"""
+
+from collections.abc import Iterable
+
+from pydantic import TypeAdapter
+
+from slop.domain import binary_codec, event_codec
+from slop.domain.events import GameEvent
+from slop.domain.game import Game
+
+_GAME_ADAPTER: TypeAdapter[Game] = TypeAdapter(Game)
+
+
+def encode_stored_event(event: GameEvent, *, binary: bool = False) -> bytes:
+    """Serialize an event for storage.
+
+    Args:
+        event: The domain event to serialize
+        binary: Use the compact binary format instead of JSON
+
+    Returns:
+        The stored representation of the event
+    """
+    if binary:
+        return binary_codec.encode_event(event)
+    return event_codec.encode_event(event)
+
+
+def decode_stored_events(rows: Iterable[str | bytes]) -> list[GameEvent]:
+    """Deserialize stored events written in either format.
+
+    All-JSON input, the common case, is decoded in a single validation pass.
+
+    Args:
+        rows: Stored event records, in order
+
+    Returns:
+        The events in their original order
+    """
+    records = [row.encode() if isinstance(row, str) else row for row in rows]
+    if not any(binary_codec.is_binary_event(record) for record in records):
+        return event_codec.decode_event_rows(records)
+    return [
+        binary_codec.decode_event(record)
+        if binary_codec.is_binary_event(record)
+        else event_codec.decode_event(record)
+        for record in records
+    ]
+
+
+def encode_game(game: Game) -> bytes:
+    """Serialize a game snapshot to JSON.
+
+    Args:
+        game: The game state to serialize
+
+    Returns:
+        The JSON representation of the full game state
+    """
+    return _GAME_ADAPTER.dump_json(game)
+
+
+def decode_game(data: str | bytes) -> Game:
+    """Deserialize a game snapshot produced by ``encode_game``.
+
+    Args:
+        data: The JSON representation of the game state
+
+    Returns:
+        The reconstructed Game
+    """
+    return _GAME_ADAPTER.validate_json(data)
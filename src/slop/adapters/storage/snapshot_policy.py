@@ -0,0 +1,216 @@
+"""Write-behind snapshot policy around a StoragePort.
+
+The application saves a snapshot after every event, but the event log
+(plus its checkpoints) is the durable source of truth, so most of those
+full-state writes are redundant. ``SnapshotPolicyStorage`` keeps the
+latest requested snapshot of each game in memory and only writes it
+through when the policy says so:
+
+- after every ``every_events`` events of the game,
+- at most ``every_ms`` milliseconds after the first unwritten request,
+- and right away after a checkpoint event such as ``RoundCompleted``.
+
+Requests for the same game are coalesced: only the most recent state is
+ever written. Reads see pending snapshots, so callers observe their own
+writes.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+
+from slop.domain.events import GameEvent
+from slop.domain.game import Game
+from slop.ports.storage import Checkpoint, StoragePort
+
+
+@dataclass(frozen=True)
+class SnapshotPolicy:
+    """When pending snapshots are written to the underlying storage.
+
+    Attributes:
+        every_events: Write once this many events arrived since the last
+            write; None disables the count trigger
+        every_ms: Write at most this long after the first pending request;
+            None disables the timer
+        checkpoint_events: Event types whose following snapshot is written
+            immediately
+    """
+
+    every_events: int | None = 50
+    every_ms: float | None = 1000.0
+    checkpoint_events: frozenset[str] = field(
+        default_factory=lambda: frozenset({"RoundCompleted", "GameCompleted"})
+    )
+
+    def __post_init__(self) -> None:
+        """Validate the thresholds."""
+        if self.every_events is not None and self.every_events < 1:
+            raise ValueError("every_events must be at least 1")
+        if self.every_ms is not None and self.every_ms < 0:
+            raise ValueError("every_ms must not be negative")
+
+
+@dataclass
+class _GameState:
+    """Snapshot bookkeeping for one game."""
+
+    pending: Game | None = None
+    generation: int = 0  # bumped by every save_snapshot request
+    events_since_write: int = 0
+    checkpoint_seen: bool = False
+    timer: asyncio.TimerHandle | None = None
+
+
+class SnapshotPolicyStorage:
+    """StoragePort decorator that debounces and coalesces snapshot writes.
+
+    Events, checkpoints and deletes pass straight through. Pending
+    snapshots hold a reference to the caller's ``Game``, so a later write
+    always captures its latest state. Call ``flush()`` or ``close()``
+    before shutting down to write whatever is still pending.
+    """
+
+    def __init__(self, storage: StoragePort, policy: SnapshotPolicy | None = None) -> None:
+        """Wrap a storage adapter.
+
+        Args:
+            storage: The storage that receives the writes
+            policy: When to write snapshots; defaults to SnapshotPolicy()
+        """
+        self._storage = storage
+        self._policy = policy or SnapshotPolicy()
+        self._games: dict[str, _GameState] = {}
+        self._room_codes: dict[str, str] = {}  # room_code -> game_id, pending only
+        self._flushes: set[asyncio.Task[None]] = set()
+        self.snapshots_requested = 0
+        self.snapshots_written = 0
+
+    @property
+    def pending_count(self) -> int:
+        """Number of games with an unwritten snapshot."""
+        return sum(1 for state in self._games.values() if state.pending is not None)
+
+    async def save_event(self, event: GameEvent) -> None:
+        """Append an event and count it towards the game's next snapshot."""
+        await self._storage.save_event(event)
+        state = self._games.setdefault(event.game_id, _GameState())
+        state.events_since_write += 1
+        if event.event_type in self._policy.checkpoint_events:
+            state.checkpoint_seen = True
+
+    async def get_events(self, game_id: str) -> list[GameEvent]:
+        """Retrieve a game's events from the underlying storage."""
+        return await self._storage.get_events(game_id)
+
+    async def get_checkpoint(self, game_id: str) -> Checkpoint | None:
+        """Retrieve a game's checkpoint from the underlying storage."""
+        return await self._storage.get_checkpoint(game_id)
+
+    async def save_snapshot(self, game: Game) -> None:
+        """Record a snapshot and write it through if the policy says so."""
+        self.snapshots_requested += 1
+        state = self._games.setdefault(game.id, _GameState())
+        if state.pending is not None and state.pending.room_code != game.room_code:
+            self._room_codes.pop(state.pending.room_code, None)
+        state.pending = game
+        state.generation += 1
+        self._room_codes[game.room_code] = game.id
+
+        every_events = self._policy.every_events
+        if state.checkpoint_seen or (
+            every_events is not None and state.events_since_write >= every_events
+        ):
+            await self._flush_game(game.id)
+        elif state.timer is None and self._policy.every_ms is not None:
+            loop = asyncio.get_running_loop()
+            state.timer = loop.call_later(
+                self._policy.every_ms / 1000, self._schedule_flush, game.id
+            )
+
+    async def get_snapshot(self, game_id: str) -> Game | None:
+        """Retrieve the pending snapshot if any, else the stored one."""
+        state = self._games.get(game_id)
+        if state is not None and state.pending is not None:
+            return state.pending
+        return await self._storage.get_snapshot(game_id)
+
+    async def get_game_by_room_code(self, room_code: str) -> Game | None:
+        """Retrieve a game by room code, preferring a pending snapshot."""
+        game_id = self._room_codes.get(room_code)
+        if game_id is not None:
+            return await self.get_snapshot(game_id)
+        return await self._storage.get_game_by_room_code(room_code)
+
+    async def list_active_games(self) -> list[str]:
+        """List stored games plus games that only have a pending snapshot."""
+        stored = await self._storage.list_active_games()
+        pending = [
+            game_id
+            for game_id, state in self._games.items()
+            if state.pending is not None and game_id not in stored
+        ]
+        return stored + pending
+
+    async def delete_game(self, game_id: str) -> None:
+        """Drop any pending snapshot and delete the game."""
+        state = self._games.pop(game_id, None)
+        if state is not None:
+            if state.timer is not None:
+                state.timer.cancel()
+            if state.pending is not None:
+                self._room_codes.pop(state.pending.room_code, None)
+        await self._storage.delete_game(game_id)
+
+    async def flush(self) -> None:
+        """Write every pending snapshot now."""
+        await asyncio.gather(*(self._flush_game(game_id) for game_id in list(self._games)))
+        if self._flushes:
+            await asyncio.gather(*self._flushes)
+
+    async def close(self) -> None:
+        """Flush pending snapshots and forget per-game state."""
+        await self.flush()
+        self._games.clear()
+        self._room_codes.clear()
+
+    def _schedule_flush(self, game_id: str) -> None:
+        state = self._games.get(game_id)
+        if state is None:
+            return
+        state.timer = None
+        task = asyncio.create_task(self._flush_in_background(game_id))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush_in_background(self, game_id: str) -> None:
+        """Timer-driven flush; on failure, retry after another interval."""
+        try:
+            await self._flush_game(game_id)
+        except Exception:
+            state = self._games.get(game_id)
+            if state is not None and state.timer is None and self._policy.every_ms is not None:
+                loop = asyncio.get_running_loop()
+                state.timer = loop.call_later(
+                    self._policy.every_ms / 1000, self._schedule_flush, game_id
+                )
+
+    async def _flush_game(self, game_id: str) -> None:
+        state = self._games.get(game_id)
+        if state is None or state.pending is None:
+            return
+        game = state.pending
+        generation = state.generation
+        if state.timer is not None:
+            state.timer.cancel()
+            state.timer = None
+        state.events_since_write = 0
+        state.checkpoint_seen = False
+        # The snapshot stays pending (and readable) until the write lands.
+        await self._storage.save_snapshot(game)
+        self.snapshots_written += 1
+        # Unless a newer snapshot arrived meanwhile; callers usually re-save
+        # the same Game object, so compare generations rather than identity.
+        if state.generation == generation:
+            state.pending = None
+            if self._room_codes.get(game.room_code) == game_id:
+                del self._room_codes[game.room_code]
@@ -0,0 +1,354 @@
+"""SQLite storage adapter.
+
+Implements the StoragePort on a single SQLite database file in WAL mode.
+All writes go through one writer task that groups concurrent appends into
+a single transaction (group commit), so many rooms share one fsync.
+Reads are served from a small pool of read-only connections, which WAL
+allows to run alongside the writer.
+"""
+
+import asyncio
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+from slop.adapters.storage.compaction import (
+    CheckpointLocks,
+    is_checkpoint_event,
+    plan_compaction,
+)
+from slop.adapters.storage.group_commit import GroupCommitWriter
+from slop.adapters.storage.serialization import (
+    decode_game,
+    decode_stored_events,
+    encode_game,
+    encode_stored_event,
+)
+from slop.domain.events import GameEvent
+from slop.domain.game import Game
+from slop.ports.storage import Checkpoint
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY,
+    event_id TEXT NOT NULL UNIQUE,
+    game_id TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    event_data BLOB NOT NULL,
+    round_number INTEGER,
+    timestamp TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_game_seq ON events (game_id, seq);
+CREATE TABLE IF NOT EXISTS snapshots (
+    game_id TEXT PRIMARY KEY,
+    room_code TEXT NOT NULL,
+    current_state BLOB NOT NULL,
+    last_event_id INTEGER,
+    last_completed_round INTEGER
+);
+CREATE INDEX IF NOT EXISTS snapshots_room_code ON snapshots (room_code);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    game_id TEXT PRIMARY KEY,
+    event_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    round_number INTEGER,
+    state BLOB NOT NULL
+);
+"""
+
+# Statements are kept as module constants so sqlite3's per-connection
+# statement cache reuses the prepared form on every call.
+_INSERT_EVENT = """
+INSERT INTO events (event_id, game_id, event_type, event_data, round_number, timestamp)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+_UPSERT_SNAPSHOT = """
+INSERT INTO snapshots (game_id, room_code, current_state, last_event_id, last_completed_round)
+VALUES (
+    ?1, ?2, ?3,
+    COALESCE(
+        (SELECT MAX(seq) FROM events WHERE game_id = ?1),
+        (SELECT seq FROM checkpoints WHERE game_id = ?1)
+    ),
+    COALESCE(
+        (SELECT MAX(round_number) FROM events
+         WHERE game_id = ?1 AND event_type = 'RoundCompleted'),
+        (SELECT round_number FROM checkpoints WHERE game_id = ?1)
+    )
+)
+ON CONFLICT (game_id) DO UPDATE SET
+    room_code = excluded.room_code,
+    current_state = excluded.current_state,
+    last_event_id = excluded.last_event_id,
+    last_completed_round = excluded.last_completed_round
+"""
+# The WHERE clause keeps SQLite from parsing ON CONFLICT as a join constraint.
+_UPSERT_CHECKPOINT = """
+INSERT INTO checkpoints (game_id, event_id, seq, round_number, state)
+SELECT game_id, event_id, seq, round_number, ?2 FROM events WHERE event_id = ?1
+ON CONFLICT (game_id) DO UPDATE SET
+    event_id = excluded.event_id,
+    seq = excluded.seq,
+    round_number = excluded.round_number,
+    state = excluded.state
+"""
+_DELETE_CHECKPOINTED_EVENTS = """
+DELETE FROM events
+WHERE game_id = ?1 AND seq <= (SELECT seq FROM checkpoints WHERE game_id = ?1)
+"""
+_DELETE_EVENTS = "DELETE FROM events WHERE game_id = ?"
+_DELETE_SNAPSHOT = "DELETE FROM snapshots WHERE game_id = ?"
+_DELETE_CHECKPOINT = "DELETE FROM checkpoints WHERE game_id = ?"
+_SELECT_EVENTS = "SELECT event_data FROM events WHERE game_id = ? ORDER BY seq"
+_SELECT_SNAPSHOT = "SELECT current_state FROM snapshots WHERE game_id = ?"
+_SELECT_CHECKPOINT = "SELECT state, event_id FROM checkpoints WHERE game_id = ?"
+_SELECT_SNAPSHOT_BY_ROOM = "SELECT current_state FROM snapshots WHERE room_code = ?"
+_SELECT_GAME_IDS = """
+SELECT game_id FROM snapshots
+UNION SELECT game_id FROM checkpoints
+UNION SELECT game_id FROM events
+"""
+
+
+_Statements = list[tuple[str, tuple[Any, ...]]]
+
+
+class SQLiteStorageAdapter:
+    """StoragePort implementation backed by SQLite.
+
+    Use as an async context manager, or call ``open()`` and ``close()``
+    explicitly. ``save_event``, ``save_snapshot`` and ``delete_game``
+    resolve only after their transaction has been committed. Appending a
+    ``RoundCompleted`` also writes a checkpoint and deletes the events it
+    covers before ``save_event`` returns.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        read_pool_size: int = 4,
+        max_batch_size: int = 256,
+        synchronous: str = "FULL",
+        busy_timeout: float = 2.0,
+        binary_events: bool = False,
+        compact: bool = True,
+    ) -> None:
+        """Configure the adapter without touching the database.
+
+        Args:
+            path: Path to the database file (created if missing)
+            read_pool_size: Number of read-only connections
+            max_batch_size: Maximum writes grouped into one transaction
+            synchronous: SQLite synchronous level (FULL fsyncs every commit)
+            busy_timeout: Seconds to wait on a locked database
+            binary_events: Store events in the compact binary format
+            compact: Checkpoint and drop old events at each RoundCompleted
+        """
+        if read_pool_size < 1:
+            raise ValueError("Read pool size must be at least 1")
+        self._path = Path(path)
+        self._read_pool_size = read_pool_size
+        self._synchronous = synchronous
+        self._busy_timeout = busy_timeout
+        self._binary_events = binary_events
+        self._compact = compact
+        self._checkpoint_locks = CheckpointLocks()
+        self._writer: sqlite3.Connection | None = None
+        self._readers: asyncio.Queue[sqlite3.Connection] | None = None
+        self._reader_conns: list[sqlite3.Connection] = []
+        self._queries: set[asyncio.Future[list[Any]]] = set()
+        self._group_commit: GroupCommitWriter[_Statements] = GroupCommitWriter(
+            self._commit_batch, max_batch_size=max_batch_size
+        )
+
+    async def __aenter__(self) -> "SQLiteStorageAdapter":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    @property
+    def commit_count(self) -> int:
+        """Number of transactions committed by the writer task."""
+        return self._group_commit.commit_count
+
+    @property
+    def write_count(self) -> int:
+        """Number of writes committed by the writer task."""
+        return self._group_commit.write_count
+
+    async def open(self) -> None:
+        """Create the schema, open all connections and start the writer task."""
+        if self._group_commit.running:
+            raise RuntimeError("Storage is already open")
+        self._writer = await asyncio.to_thread(self._connect_writer)
+        self._reader_conns = [
+            await asyncio.to_thread(self._connect_reader) for _ in range(self._read_pool_size)
+        ]
+        self._readers = asyncio.Queue()
+        for conn in self._reader_conns:
+            self._readers.put_nowait(conn)
+        self._group_commit.start()
+
+    async def close(self) -> None:
+        """Flush pending writes and close all connections."""
+        if not self._group_commit.running:
+            return
+        await self._group_commit.stop()
+        if self._queries:
+            await asyncio.gather(*self._queries, return_exceptions=True)
+        for conn in self._reader_conns:
+            conn.close()
+        self._reader_conns = []
+        self._readers = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    async def save_event(self, event: GameEvent) -> None:
+        """Append an event and wait until its group commit is durable."""
+        params = (
+            event.event_id,
+            event.game_id,
+            event.event_type,
+            encode_stored_event(event, binary=self._binary_events),
+            getattr(event, "round_number", None),
+            event.timestamp.isoformat(),
+        )
+        await self._group_commit.submit([(_INSERT_EVENT, params)])
+        if self._compact and is_checkpoint_event(event):
+            await self._write_checkpoint(event)
+
+    async def get_events(self, game_id: str) -> list[GameEvent]:
+        """Retrieve a game's events since its checkpoint, in append order."""
+        rows = await self._read(_SELECT_EVENTS, (game_id,))
+        return decode_stored_events(row[0] for row in rows)
+
+    async def get_checkpoint(self, game_id: str) -> Checkpoint | None:
+        """Retrieve the latest RoundCompleted checkpoint of a game."""
+        rows = await self._read(_SELECT_CHECKPOINT, (game_id,))
+        return Checkpoint(decode_game(rows[0][0]), rows[0][1]) if rows else None
+
+    async def save_snapshot(self, game: Game) -> None:
+        """Replace the game's snapshot and wait until it is committed."""
+        await self._group_commit.submit(
+            [(_UPSERT_SNAPSHOT, (game.id, game.room_code, encode_game(game)))]
+        )
+
+    async def get_snapshot(self, game_id: str) -> Game | None:
+        """Retrieve the latest snapshot of a game."""
+        rows = await self._read(_SELECT_SNAPSHOT, (game_id,))
+        return decode_game(rows[0][0]) if rows else None
+
+    async def get_game_by_room_code(self, room_code: str) -> Game | None:
+        """Retrieve the snapshot of the game using this room code."""
+        rows = await self._read(_SELECT_SNAPSHOT_BY_ROOM, (room_code,))
+        return decode_game(rows[0][0]) if rows else None
+
+    async def list_active_games(self) -> list[str]:
+        """List games that have events, a snapshot or a checkpoint."""
+        rows = await self._read(_SELECT_GAME_IDS, ())
+        return [row[0] for row in rows]
+
+    async def delete_game(self, game_id: str) -> None:
+        """Delete a game's events, snapshot and checkpoint in one transaction."""
+        await self._group_commit.submit(
+            [
+                (_DELETE_EVENTS, (game_id,)),
+                (_DELETE_SNAPSHOT, (game_id,)),
+                (_DELETE_CHECKPOINT, (game_id,)),
+            ]
+        )
+        self._checkpoint_locks.discard(game_id)
+
+    async def _write_checkpoint(self, event: GameEvent) -> None:
+        """Replace the game's checkpoint and delete the events it covers."""
+        async with self._checkpoint_locks(event.game_id):
+            plan = await plan_compaction(self, event)
+            if plan is None:
+                return
+            await self._group_commit.submit(
+                [
+                    (_UPSERT_CHECKPOINT, (plan.event_id, encode_game(plan.game))),
+                    (_DELETE_CHECKPOINTED_EVENTS, (event.game_id,)),
+                ]
+            )
+
+    def _connect_writer(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._path,
+            timeout=self._busy_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self._synchronous}")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def _connect_reader(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            f"{self._path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            timeout=self._busy_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    async def _read(self, sql: str, params: tuple[Any, ...]) -> list[Any]:
+        readers = self._readers
+        if readers is None:
+            raise RuntimeError("Storage is not open")
+        conn = await readers.get()
+        # The query runs in its own task, so a cancelled caller does not
+        # return the connection while the worker thread is still using it.
+        query = asyncio.ensure_future(
+            asyncio.to_thread(lambda: conn.execute(sql, params).fetchall())
+        )
+        self._queries.add(query)
+        query.add_done_callback(lambda done: self._query_done(done, readers, conn))
+        return await asyncio.shield(query)
+
+    def _query_done(
+        self,
+        query: asyncio.Future[list[Any]],
+        readers: asyncio.Queue[sqlite3.Connection],
+        conn: sqlite3.Connection,
+    ) -> None:
+        self._queries.discard(query)
+        if not query.cancelled():
+            query.exception()  # a cancelled caller no longer retrieves it
+        readers.put_nowait(conn)
+
+    def _commit_batch(self, batch: list[_Statements]) -> list[Exception | None]:
+        """Run a batch in one transaction, isolating each op in a savepoint.
+
+        A failing op (e.g. a duplicate event ID) is rolled back on its own
+        and reported to its caller, without failing the rest of the batch.
+        """
+        assert self._writer is not None
+        conn = self._writer
+        errors: list[Exception | None] = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for statements in batch:
+                conn.execute("SAVEPOINT op")
+                try:
+                    for sql, params in statements:
+                        conn.execute(sql, params)
+                except sqlite3.Error as exc:
+                    conn.execute("ROLLBACK TO op")
+                    errors.append(exc)
+                else:
+                    errors.append(None)
+                conn.execute("RELEASE op")
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        return errors
@@ -3,3 +3,19 @@
 Implementations for real-time communication (Socket.io, etc.)
 that implement the RealtimePort interface.
 """
+
+from slop.adapters.websocket.fanout import Connection, EventEncoder, FanOut, Frame
+from slop.adapters.websocket.memory import InMemoryConnection, InMemoryRealtime
+from slop.adapters.websocket.queues import QueuedConnection, QueueStats, merge_key
+
+__all__ = [
+    "Connection",
+    "EventEncoder",
+    "FanOut",
+    "Frame",
+    "InMemoryConnection",
+    "InMemoryRealtime",
+    "QueuedConnection",
+    "QueueStats",
+    "merge_key",
+]
@@ -0,0 +1,158 @@
+"""Room fan-out of pre-serialized event frames.
+
+A broadcast serializes its event exactly once, into an immutable
+``Frame``, and hands that same frame to every connection in the room, so
+the serialization cost of a broadcast does not grow with the room. The
+``FanOut`` core keeps the room membership and a cached tuple of each
+room's connections; it is shared by the in-memory adapter and any
+transport adapter (e.g. Socket.IO), which only has to provide a
+``Connection`` that writes a frame to its socket. Frames are JSON by
+default; pass ``binary_codec.encode_event`` as the encoder for compact
+binary frames.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Protocol
+
+from slop.domain import event_codec
+from slop.domain.events import GameEvent
+
+type EventEncoder = Callable[[GameEvent], bytes]
+
+
+@dataclass(frozen=True, slots=True)
+class Frame:
+    """An event serialized once, ready to send to any number of sockets.
+
+    Attributes:
+        event: The event (immutable, shared with every holder of the frame)
+        data: The event's encoding (JSON unless another encoder was used)
+    """
+
+    event: GameEvent
+    data: bytes
+
+    @classmethod
+    def from_event(
+        cls, event: GameEvent, encode: EventEncoder = event_codec.encode_event
+    ) -> "Frame":
+        """Serialize an event into a frame.
+
+        Args:
+            event: The event to serialize
+            encode: Encodes the event; JSON by default
+        """
+        return cls(event, encode(event))
+
+    @property
+    def event_type(self) -> str:
+        """Type of the serialized event."""
+        return self.event.event_type
+
+    @property
+    def game_id(self) -> str:
+        """Game the event belongs to."""
+        return self.event.game_id
+
+
+class Connection(Protocol):
+    """One client connection, as seen by the fan-out."""
+
+    def send(self, frame: Frame) -> None:
+        """Hand a frame to the connection's transport without blocking."""
+        ...
+
+
+class FanOut:
+    """Room membership and frame delivery for a set of connections."""
+
+    def __init__(self, *, encode: EventEncoder = event_codec.encode_event) -> None:
+        """Create a fan-out with no connections.
+
+        Args:
+            encode: Encodes events into frames; JSON by default
+        """
+        self._encode = encode
+        self._connections: dict[str, Connection] = {}
+        self._rooms: dict[str, set[str]] = {}  # room code -> socket IDs
+        self._socket_rooms: dict[str, set[str]] = {}  # socket ID -> room codes
+        self._targets: dict[str, tuple[Connection, ...]] = {}  # room code -> connections
+
+    def frame(self, event: GameEvent) -> Frame:
+        """Serialize an event into a frame with this fan-out's encoder."""
+        return Frame.from_event(event, self._encode)
+
+    def __contains__(self, socket_id: object) -> bool:
+        """Return True if a socket is connected."""
+        return socket_id in self._connections
+
+    def connect(self, socket_id: str, connection: Connection) -> None:
+        """Register a connection, replacing any previous one for the socket."""
+        self._connections[socket_id] = connection
+        for room_code in self._socket_rooms.setdefault(socket_id, set()):
+            self._targets.pop(room_code, None)
+
+    def disconnect(self, socket_id: str) -> Connection | None:
+        """Remove a connection from every room and forget it.
+
+        Returns:
+            The removed connection, or None if the socket was not connected
+        """
+        for room_code in list(self._socket_rooms.get(socket_id, ())):
+            self.leave(socket_id, room_code)
+        self._socket_rooms.pop(socket_id, None)
+        return self._connections.pop(socket_id, None)
+
+    def join(self, socket_id: str, room_code: str) -> None:
+        """Add a connected socket to a room.
+
+        Raises:
+            ValueError: If the socket is not connected
+        """
+        if socket_id not in self._connections:
+            raise ValueError(f"Socket {socket_id} is not connected")
+        self._rooms.setdefault(room_code, set()).add(socket_id)
+        self._socket_rooms[socket_id].add(room_code)
+        self._targets.pop(room_code, None)
+
+    def leave(self, socket_id: str, room_code: str) -> None:
+        """Remove a socket from a room, if it is in it."""
+        members = self._rooms.get(room_code)
+        if members is None or socket_id not in members:
+            return
+        members.discard(socket_id)
+        if not members:
+            del self._rooms[room_code]
+        self._socket_rooms[socket_id].discard(room_code)
+        self._targets.pop(room_code, None)
+
+    def members(self, room_code: str) -> set[str]:
+        """Socket IDs currently in a room."""
+        return set(self._rooms.get(room_code, ()))
+
+    def broadcast(self, room_code: str, frame: Frame) -> int:
+        """Send one frame to every connection in a room.
+
+        Returns:
+            Number of connections the frame was handed to
+        """
+        targets = self._targets.get(room_code)
+        if targets is None:
+            targets = tuple(self._connections[s] for s in self._rooms.get(room_code, ()))
+            self._targets[room_code] = targets
+        for connection in targets:
+            connection.send(frame)
+        return len(targets)
+
+    def send(self, socket_id: str, frame: Frame) -> bool:
+        """Send a frame to one socket.
+
+        Returns:
+            True if the socket is connected
+        """
+        connection = self._connections.get(socket_id)
+        if connection is None:
+            return False
+        connection.send(frame)
+        return True
@@ -0,0 +1,91 @@
+"""In-memory reference implementation of RealtimePort.
+
+``InMemoryRealtime`` delivers frames to ``InMemoryConnection`` objects
+that simply record them, which makes it suitable for tests, local runs
+and benchmarks. It uses the same ``FanOut`` core a network transport
+would, so each broadcast serializes its event once whatever the room size.
+"""
+
+from slop.adapters.websocket.fanout import EventEncoder, FanOut, Frame
+from slop.domain import binary_codec, event_codec
+from slop.domain.events import GameEvent
+
+
+class InMemoryConnection:
+    """Connection recording every frame it is sent."""
+
+    def __init__(self) -> None:
+        """Create a connection with no frames."""
+        self.frames: list[Frame] = []
+
+    def send(self, frame: Frame) -> None:
+        """Record a frame."""
+        self.frames.append(frame)
+
+    def events(self) -> list[GameEvent]:
+        """Decode the recorded frames, whether JSON or binary."""
+        return [
+            binary_codec.decode_event(frame.data)
+            if binary_codec.is_binary_event(frame.data)
+            else event_codec.decode_event(frame.data)
+            for frame in self.frames
+        ]
+
+
+class InMemoryRealtime:
+    """RealtimePort delivering events to in-process connections."""
+
+    def __init__(self, fanout: FanOut | None = None, *, encode: EventEncoder | None = None) -> None:
+        """Create the adapter.
+
+        Args:
+            fanout: Fan-out core to deliver through (a new one by default)
+            encode: Encoder of the new fan-out's frames; JSON by default
+
+        Raises:
+            ValueError: If both ``fanout`` and ``encode`` are given
+        """
+        if fanout is not None and encode is not None:
+            raise ValueError("encode is set on the fanout, not alongside it")
+        self._fanout = fanout or FanOut(encode=encode or event_codec.encode_event)
+        self._frames_encoded = 0
+
+    @property
+    def fanout(self) -> FanOut:
+        """The fan-out core holding connections and rooms."""
+        return self._fanout
+
+    @property
+    def frames_encoded(self) -> int:
+        """Number of events serialized so far."""
+        return self._frames_encoded
+
+    def connect(self, socket_id: str) -> InMemoryConnection:
+        """Open a connection for a socket ID."""
+        connection = InMemoryConnection()
+        self._fanout.connect(socket_id, connection)
+        return connection
+
+    def disconnect(self, socket_id: str) -> None:
+        """Close a socket's connection and remove it from its rooms."""
+        self._fanout.disconnect(socket_id)
+
+    async def broadcast_to_room(self, room_code: str, event: GameEvent) -> None:
+        """Serialize an event once and send it to everyone in a room."""
+        self._fanout.broadcast(room_code, self._encode(event))
+
+    async def send_to_player(self, socket_id: str, event: GameEvent) -> None:
+        """Send an event to one socket; unknown sockets are ignored."""
+        self._fanout.send(socket_id, self._encode(event))
+
+    async def join_room(self, socket_id: str, room_code: str) -> None:
+        """Add a connected socket to a room."""
+        self._fanout.join(socket_id, room_code)
+
+    async def leave_room(self, socket_id: str, room_code: str) -> None:
+        """Remove a socket from a room."""
+        self._fanout.leave(socket_id, room_code)
+
+    def _encode(self, event: GameEvent) -> Frame:
+        self._frames_encoded += 1
+        return self._fanout.frame(event)
@@ -0,0 +1,249 @@
+"""Bounded per-connection send queues with coalescing backpressure.
+
+Handing a frame to a ``QueuedConnection`` never waits: the frame joins the
+connection's own queue, and a writer task sends queued frames to the
+socket one at a time. A slow client therefore only delays itself, never
+the broadcast to the rest of the room.
+
+Each queue is capped in messages and bytes. When a queue overflows, it is
+first compacted: runs of adjacent queued events that supersede each other
+are merged into one (score changes and streamed script updates of the same
+round are deltas, so they are combined). Only neighbours are merged, so
+compaction never reorders a delta past another event. A merged event keeps
+the newer event's ``event_id``: it covers everything up to that event. If
+the queue is still over its cap, the client has fallen too far behind: its
+queue is discarded, including the frame whose arrival overflowed it, and a
+full resync is requested through the ``on_resync`` callback instead. The
+callback runs inside that ``send`` call, so the snapshot it sends must be
+taken then or later, never from state captured before the dropped frame's
+event was applied. A single frame larger than the byte cap (such as a big
+resync snapshot) is still queued and sent as long as it is queued alone.
+"""
+
+import asyncio
+import itertools
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from slop.adapters.websocket.fanout import EventEncoder, Frame
+from slop.domain import event_codec
+from slop.domain.events import GameEvent, ScoresUpdated, ScriptStreamed
+
+
+def _merge_scores(older: GameEvent, newer: GameEvent) -> GameEvent:
+    assert isinstance(older, ScoresUpdated) and isinstance(newer, ScoresUpdated)
+    changes = dict(older.score_changes)
+    for team_id, points in newer.score_changes.items():
+        changes[team_id] = changes.get(team_id, 0) + points
+    return newer.model_copy(update={"score_changes": changes})
+
+
+def _merge_script_stream(older: GameEvent, newer: GameEvent) -> GameEvent:
+    assert isinstance(older, ScriptStreamed) and isinstance(newer, ScriptStreamed)
+    return newer.model_copy(
+        update={"roles": older.roles + newer.roles, "lines": older.lines + newer.lines}
+    )
+
+
+# Event types whose queued events for the same round can be merged into one.
+_MERGERS: dict[str, Callable[[GameEvent, GameEvent], GameEvent]] = {
+    "ScoresUpdated": _merge_scores,
+    "ScriptStreamed": _merge_script_stream,
+}
+
+
+def merge_key(event: GameEvent) -> tuple[str, str, int] | None:
+    """Return the key under which queued events can be merged, if any.
+
+    Events with the same key can be combined into one event carrying the
+    effect of both; events without a key are never merged or reordered.
+    """
+    if event.event_type not in _MERGERS:
+        return None
+    round_number: int = getattr(event, "round_number")
+    return (event.event_type, event.game_id, round_number)
+
+
+@dataclass(frozen=True)
+class QueueStats:
+    """Counters for one connection's send queue.
+
+    Attributes:
+        depth: Frames waiting to be written
+        queued_bytes: Bytes waiting to be written
+        max_depth: Largest depth seen
+        sent: Frames written to the socket
+        merged: Frames folded into a neighbouring frame during compaction
+        dropped: Frames discarded on resync, write failure or after close
+        resyncs: Full resyncs requested because the queue overflowed
+    """
+
+    depth: int
+    queued_bytes: int
+    max_depth: int
+    sent: int
+    merged: int
+    dropped: int
+    resyncs: int
+
+
+class QueuedConnection:
+    """Connection with a bounded queue drained by its own writer task."""
+
+    def __init__(
+        self,
+        write: Callable[[Frame], Awaitable[None]],
+        *,
+        max_messages: int = 256,
+        max_bytes: int = 1024 * 1024,
+        on_resync: Callable[[], None] | None = None,
+        encode: EventEncoder = event_codec.encode_event,
+    ) -> None:
+        """Create a connection; the writer starts with the first frame.
+
+        Args:
+            write: Writes one frame to the socket
+            max_messages: Maximum frames queued
+            max_bytes: Maximum bytes queued
+            on_resync: Called when the queue overflows and the client needs
+                a full state resync; every queued frame, including the one
+                just sent, has been dropped, so send a snapshot taken now
+            encode: Encodes merged frames; use the fan-out's encoder
+        """
+        if max_messages < 1:
+            raise ValueError("max_messages must be at least 1")
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self._write = write
+        self._max_messages = max_messages
+        self._max_bytes = max_bytes
+        self._on_resync = on_resync
+        self._encode = encode
+        self._queue: OrderedDict[int, Frame] = OrderedDict()
+        self._tokens = itertools.count()
+        self._bytes = 0
+        self._ready = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._writer: asyncio.Task[None] | None = None
+        self._writing = False  # a frame has left the queue but is not written yet
+        self._closed = False
+        self._max_depth = 0
+        self._sent = 0
+        self._merged = 0
+        self._dropped = 0
+        self._resyncs = 0
+
+    @property
+    def closed(self) -> bool:
+        """True once the connection is closed or a write has failed."""
+        return self._closed
+
+    @property
+    def stats(self) -> QueueStats:
+        """Current queue counters."""
+        return QueueStats(
+            depth=len(self._queue),
+            queued_bytes=self._bytes,
+            max_depth=self._max_depth,
+            sent=self._sent,
+            merged=self._merged,
+            dropped=self._dropped,
+            resyncs=self._resyncs,
+        )
+
+    def send(self, frame: Frame) -> None:
+        """Queue a frame without waiting, compacting or resyncing on overflow."""
+        if self._closed:
+            self._dropped += 1
+            return
+        self._queue[next(self._tokens)] = frame
+        self._bytes += len(frame.data)
+        if self._over_limit():
+            self._compact()
+            if self._over_limit():
+                self._resync()
+        self._max_depth = max(self._max_depth, len(self._queue))
+        if self._queue:
+            self._idle.clear()
+            self._ready.set()
+            if self._writer is None:
+                self._writer = asyncio.get_running_loop().create_task(self._drain())
+
+    async def flush(self) -> None:
+        """Wait until every queued frame has been written (or dropped).
+
+        A write already in progress is always waited for, even if the
+        rest of the queue was dropped meanwhile.
+        """
+        await self._idle.wait()
+
+    async def close(self) -> None:
+        """Stop the writer, dropping any frames still queued."""
+        self._closed = True
+        self._discard()
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.cancel()
+            await asyncio.gather(writer, return_exceptions=True)
+        self._writing = False
+        self._idle.set()
+
+    def _over_limit(self) -> bool:
+        if len(self._queue) > self._max_messages:
+            return True
+        # A frame over the byte cap on its own can never fit; send it alone.
+        return self._bytes > self._max_bytes and len(self._queue) > 1
+
+    def _compact(self) -> None:
+        """Merge runs of adjacent queued frames that share a merge key."""
+        compacted: OrderedDict[int, Frame] = OrderedDict()
+        last_token, last_key = -1, None  # the frame a same-key neighbour merges into
+        for token, frame in self._queue.items():
+            key = merge_key(frame.event)
+            if key is not None and key == last_key:
+                older = compacted[last_token]
+                merged = Frame.from_event(_MERGERS[key[0]](older.event, frame.event), self._encode)
+                compacted[last_token] = merged
+                self._bytes += len(merged.data) - len(older.data) - len(frame.data)
+                self._merged += 1
+                continue
+            compacted[token] = frame
+            last_token, last_key = token, key
+        self._queue = compacted
+
+    def _resync(self) -> None:
+        self._discard()
+        self._resyncs += 1
+        if self._on_resync is not None:
+            self._on_resync()
+
+    def _discard(self) -> None:
+        self._dropped += len(self._queue)
+        self._queue.clear()
+        self._bytes = 0
+        if not self._writing:
+            self._idle.set()  # else the writer sets it once its write ends
+
+    async def _drain(self) -> None:
+        while True:
+            if not self._queue:
+                self._ready.clear()
+                self._idle.set()
+                await self._ready.wait()
+                continue
+            _, frame = self._queue.popitem(last=False)
+            self._bytes -= len(frame.data)
+            self._writing = True
+            try:
+                await self._write(frame)
+            except Exception:
+                self._writing = False
+                self._closed = True
+                self._dropped += 1
+                self._discard()
+                self._writer = None
+                return
+            self._writing = False
+            self._sent += 1
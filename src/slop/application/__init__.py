@@ -3,3 +3,52 @@
 This layer orchestrates the domain logic and coordinates between
 ports and the domain layer.
 """
+
+from slop.application.content_filter import (
+    DEFAULT_BLOCKLISTS,
+    ContentFilter,
+    StreamScanner,
+    Violation,
+)
+from slop.application.recovery import RecoveredGame, RecoveryOrchestrator, RecoveryReport
+from slop.application.script_streaming import (
+    BlockedContentError,
+    ScriptStreamer,
+    StreamedScript,
+)
+from slop.application.snapshot_cache import (
+    SnapshotCache,
+    SnapshotCacheStats,
+    SnapshotFrame,
+    StateVersion,
+    etag_for,
+    etag_matches,
+)
+from slop.application.state_sync import CatchUp, StateSync, StateSyncStats, VersionedEvent
+from slop.application.warm_pool import PooledScript, WarmPool, WarmPoolStats
+
+__all__ = [
+    "BlockedContentError",
+    "CatchUp",
+    "DEFAULT_BLOCKLISTS",
+    "ContentFilter",
+    "PooledScript",
+    "RecoveredGame",
+    "RecoveryOrchestrator",
+    "RecoveryReport",
+    "ScriptStreamer",
+    "SnapshotCache",
+    "SnapshotCacheStats",
+    "SnapshotFrame",
+    "StateSync",
+    "StateSyncStats",
+    "StateVersion",
+    "StreamedScript",
+    "StreamScanner",
+    "VersionedEvent",
+    "Violation",
+    "WarmPool",
+    "WarmPoolStats",
+    "etag_for",
+    "etag_matches",
+]
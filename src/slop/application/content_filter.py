@@ -0,0 +1,244 @@
+"""Content filtering of generated scripts.
+
+Every generated (and regenerated) script is checked against the blocklist
+for the game's ``ContentTone`` before it is shown to players. The terms of
+each tone are compiled once into a single regular expression shaped like a
+trie (terms sharing a prefix share a branch), so the scan is one linear
+pass in the ``re`` engine, whatever the number of terms, rather than one
+pass per term. Extra regular expressions can be added per tone for
+patterns that a word list cannot express.
+
+Terms match whole words, case-insensitively, with any run of whitespace
+between the words of a phrase. ``ContentFilter.check_script`` scans the
+script body and every role's lines in one pass; ``ContentFilter.stream``
+scans a script as it is streamed, in arbitrary chunks.
+"""
+
+import bisect
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+from slop.domain.game import ContentTone
+from slop.domain.script import Script
+
+# Never allowed, whatever the tone. Deployments pass their own lists.
+_ALWAYS_BLOCKED: tuple[str, ...] = (
+    "kill yourself",
+    "kys",
+    "heil hitler",
+    "white power",
+)
+
+DEFAULT_BLOCKLISTS: Mapping[ContentTone, tuple[str, ...]] = {
+    ContentTone.FAMILY: _ALWAYS_BLOCKED
+    + (
+        "damn",
+        "goddamn",
+        "hell",
+        "crap",
+        "shit",
+        "bullshit",
+        "fuck",
+        "fucking",
+        "bitch",
+        "bastard",
+        "ass",
+        "asshole",
+        "piss",
+        "sexy",
+        "naked",
+        "porn",
+        "cocaine",
+        "heroin",
+        "meth",
+    ),
+    ContentTone.ADULT: _ALWAYS_BLOCKED,
+}
+
+type _Trie = dict[str, _Trie]
+
+# Between the fields of a script scanned in one pass; neither a word
+# character nor whitespace, so no match can span two fields.
+_SEPARATOR = "\x00"
+
+
+@dataclass(frozen=True, slots=True)
+class Violation:
+    """A blocked term or pattern found in a script.
+
+    Attributes:
+        text: The matched text
+        field: Where it was found: ``content`` or ``roles[i].lines[j]`` in
+            a script, ``text`` for scanned text, ``stream`` for streamed text
+        start: Offset of the match within that field (or the stream)
+    """
+
+    text: str
+    field: str
+    start: int
+
+
+def compile_terms(terms: Iterable[str], patterns: Iterable[str] = ()) -> re.Pattern[str] | None:
+    """Compile terms and regular expressions into one case-insensitive pattern.
+
+    Args:
+        terms: Words or phrases matched as whole words
+        patterns: Regular expressions matched as they are
+
+    Returns:
+        The compiled pattern, or None if there is nothing to match
+    """
+    trie: _Trie = {}
+    for term in terms:
+        words = term.casefold().split()
+        if not words:
+            continue
+        node = trie
+        for char in " ".join(words):
+            node = node.setdefault(char, {})
+        node[""] = {}
+    alternatives = []
+    if trie:
+        # Checking the first character up front lets the engine skip most
+        # positions without entering the trie; \b is faster than a
+        # lookbehind but only means "word start" before a word character.
+        start = r"\b" if all(char.isalnum() or char == "_" for char in trie) else r"(?<!\w)"
+        first = "".join(re.escape(char) for char in sorted(trie))
+        alternatives.append(f"{start}(?=[{first}]){_render(trie)}(?!\\w)")
+    alternatives += [f"(?:{pattern})" for pattern in patterns]
+    if not alternatives:
+        return None
+    return re.compile("|".join(alternatives), re.IGNORECASE)
+
+
+def _render(node: _Trie) -> str:
+    """Render a trie node as a regular expression."""
+    branches = [
+        (r"\s+" if char == " " else re.escape(char)) + _render(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+    if len(branches) == 1 and "" not in node:
+        return branches[0]
+    group = "(?:" + "|".join(branches) + ")"
+    return group + "?" if "" in node else group
+
+
+class ContentFilter:
+    """Checks script text against precompiled per-tone blocklists."""
+
+    def __init__(
+        self,
+        blocklists: Mapping[ContentTone, Iterable[str]] = DEFAULT_BLOCKLISTS,
+        patterns: Mapping[ContentTone, Iterable[str]] | None = None,
+        *,
+        max_match_length: int = 64,
+    ) -> None:
+        """Compile the blocklists.
+
+        Args:
+            blocklists: Blocked words and phrases, by tone
+            patterns: Blocked regular expressions, by tone
+            max_match_length: Longest text a match can span; streamed text
+                is scanned with this much overlap between chunks
+        """
+        patterns = patterns or {}
+        self._compiled = {
+            tone: compile_terms(blocklists.get(tone, ()), patterns.get(tone, ()))
+            for tone in ContentTone
+        }
+        terms = [term for tone_terms in blocklists.values() for term in tone_terms]
+        self._overlap = max([max_match_length, *(len(term) for term in terms)]) + 1
+
+    def scan(self, text: str, tone: ContentTone) -> list[Violation]:
+        """Return every blocked term or pattern in a piece of text."""
+        pattern = self._compiled[tone]
+        if pattern is None:
+            return []
+        return [Violation(m.group(), "text", m.start()) for m in pattern.finditer(text)]
+
+    def check_script(self, script: Script, tone: ContentTone) -> list[Violation]:
+        """Return every blocked term or pattern in a script.
+
+        The body and every role's lines are joined and scanned in one pass.
+        """
+        pattern = self._compiled[tone]
+        if pattern is None:
+            return []
+        fields = ["content"]
+        texts = [script.content]
+        for i, role in enumerate(script.roles):
+            for j, line in enumerate(role.lines):
+                fields.append(f"roles[{i}].lines[{j}]")
+                texts.append(line)
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + len(_SEPARATOR)
+
+        violations = []
+        for match in pattern.finditer(_SEPARATOR.join(texts)):
+            index = bisect.bisect_right(starts, match.start()) - 1
+            violations.append(
+                Violation(match.group(), fields[index], match.start() - starts[index])
+            )
+        return violations
+
+    def is_clean(self, script: Script, tone: ContentTone) -> bool:
+        """Return True if a script contains nothing blocked for the tone."""
+        pattern = self._compiled[tone]
+        if pattern is None:
+            return True
+        if pattern.search(script.content):
+            return False
+        return not any(pattern.search(line) for role in script.roles for line in role.lines)
+
+    def stream(self, tone: ContentTone) -> "StreamScanner":
+        """Return a scanner for a script streamed in chunks."""
+        return StreamScanner(self._compiled[tone], self._overlap)
+
+
+class StreamScanner:
+    """Scans streamed text chunk by chunk, including matches across chunks.
+
+    A match touching the end of the text seen so far is only reported once
+    the next chunk (or ``finish()``) shows where the word ends.
+    """
+
+    def __init__(self, pattern: re.Pattern[str] | None, overlap: int) -> None:
+        """Create a scanner; use ``ContentFilter.stream()`` instead."""
+        self._pattern = pattern
+        self._overlap = overlap
+        self._tail = ""
+        self._tail_start = 0  # stream offset of the tail
+        self._next_start = 0  # stream offset before which everything was reported
+
+    def feed(self, chunk: str) -> list[Violation]:
+        """Scan the next chunk, returning newly found violations."""
+        return self._scan(chunk, final=False)
+
+    def finish(self) -> list[Violation]:
+        """Report any violation at the very end of the stream."""
+        return self._scan("", final=True)
+
+    def _scan(self, chunk: str, *, final: bool) -> list[Violation]:
+        if self._pattern is None:
+            return []
+        buffer = self._tail + chunk
+        violations = []
+        for match in self._pattern.finditer(buffer):
+            start = self._tail_start + match.start()
+            if start < self._next_start or (match.start() == 0 and self._tail_start > 0):
+                continue  # already reported, or the word began before the tail
+            if match.end() == len(buffer) and not final:
+                break  # the word may continue in the next chunk
+            violations.append(Violation(match.group(), "stream", start))
+            self._next_start = self._tail_start + match.end()
+        keep = min(len(buffer), self._overlap)
+        self._tail_start += len(buffer) - keep
+        self._tail = buffer[len(buffer) - keep :]
+        return violations
@@ -0,0 +1,194 @@
+"""Crash recovery of active games at startup.
+
+Every game still in storage was in progress when the server stopped.
+The orchestrator rebuilds each one from its latest checkpoint plus the
+events after it, finds the round that was interrupted (if any), and hands
+back games ready to resume.
+Games are recovered concurrently with bounded parallelism; the replay
+itself can be moved to an executor such as a ``ProcessPoolExecutor`` so
+large games don't hold up the event loop.
+"""
+
+import asyncio
+import time
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+
+from slop.domain.events import GameEvent, RoundCompleted, RoundStarted
+from slop.domain.game import Game, GameStatus
+from slop.domain.projection import GameProjection
+from slop.ports.storage import Checkpoint, StoragePort
+
+
+@dataclass
+class RecoveredGame:
+    """A game rebuilt from storage.
+
+    Attributes:
+        game: The recovered game state
+        incomplete_round: Number of the round that was interrupted, if any
+        needs_script: True if the interrupted round never got its script
+        events_replayed: Number of events applied to rebuild the game
+        duration: Wall-clock seconds spent recovering this game
+    """
+
+    game: Game
+    incomplete_round: int | None
+    needs_script: bool
+    events_replayed: int
+    duration: float
+
+
+@dataclass
+class RecoveryReport:
+    """Outcome of recovering every active game.
+
+    Attributes:
+        recovered: Games that are ready to resume
+        failed: Errors for games that could not be recovered, by game ID
+        duration: Wall-clock seconds for the whole recovery
+    """
+
+    recovered: list[RecoveredGame] = field(default_factory=list)
+    failed: dict[str, Exception] = field(default_factory=dict)
+    duration: float = 0.0
+
+
+@dataclass
+class _ReplayResult:
+    game: Game
+    incomplete_round: int | None
+    needs_script: bool
+    events_replayed: int
+
+
+def _replay(base: Checkpoint | None, events: Sequence[GameEvent]) -> _ReplayResult:
+    """Rebuild a game from its checkpoint and the events after it.
+
+    Module-level so it can be shipped to a process pool.
+    """
+    if base is None:
+        projection = GameProjection()
+        projection.apply_all(events)
+    else:
+        projection = GameProjection.resume(
+            base.game,
+            events,
+            after_event_id=base.event_id if _contains(events, base.event_id) else None,
+        )
+
+    incomplete_round = None
+    for event in reversed(events):
+        if isinstance(event, RoundCompleted):
+            break
+        if isinstance(event, RoundStarted):
+            incomplete_round = event.round_number
+            break
+
+    return _ReplayResult(
+        game=projection.game,
+        incomplete_round=incomplete_round,
+        needs_script=projection.pending_round is not None,
+        events_replayed=projection.event_count,
+    )
+
+
+def _contains(events: Sequence[GameEvent], event_id: str) -> bool:
+    return any(event.event_id == event_id for event in events)
+
+
+class RecoveryOrchestrator:
+    """Recovers all active games from storage after a restart."""
+
+    def __init__(
+        self,
+        storage: StoragePort,
+        *,
+        max_concurrency: int = 8,
+        executor: Executor | None = None,
+    ) -> None:
+        """Create an orchestrator.
+
+        Args:
+            storage: Storage holding the games to recover
+            max_concurrency: Maximum number of games recovered at once
+            executor: Where to run event replay; None replays on the event loop
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._storage = storage
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._executor = executor
+
+    async def recover_all(self) -> RecoveryReport:
+        """Recover every active game.
+
+        A failure in one game is recorded in the report and does not stop
+        the others. Finished games are skipped.
+
+        Returns:
+            Recovered games and per-game failures
+        """
+        started = time.perf_counter()
+        game_ids = await self._storage.list_active_games()
+        results = await asyncio.gather(
+            *(self._recover_bounded(game_id) for game_id in game_ids),
+            return_exceptions=True,
+        )
+
+        report = RecoveryReport()
+        for game_id, result in zip(game_ids, results, strict=True):
+            if isinstance(result, Exception):
+                report.failed[game_id] = result
+            elif isinstance(result, RecoveredGame):
+                report.recovered.append(result)
+            elif isinstance(result, BaseException):
+                raise result
+        report.duration = time.perf_counter() - started
+        return report
+
+    async def recover_game(self, game_id: str) -> RecoveredGame | None:
+        """Recover a single game.
+
+        The checkpoint and event log are the source of truth; the snapshot
+        is only used for games that have neither.
+
+        Args:
+            game_id: The game's unique identifier
+
+        Returns:
+            The recovered game, or None if it is finished or not stored
+        """
+        started = time.perf_counter()
+        checkpoint = await self._storage.get_checkpoint(game_id)
+        events = await self._storage.get_events(game_id)
+        if checkpoint is not None or events:
+            result = await self._run_replay(checkpoint, events)
+        else:
+            snapshot = await self._storage.get_snapshot(game_id)
+            if snapshot is None:
+                return None
+            result = _ReplayResult(snapshot, None, False, 0)
+
+        if result.game.status == GameStatus.FINISHED:
+            return None
+        return RecoveredGame(
+            game=result.game,
+            incomplete_round=result.incomplete_round,
+            needs_script=result.needs_script,
+            events_replayed=result.events_replayed,
+            duration=time.perf_counter() - started,
+        )
+
+    async def _recover_bounded(self, game_id: str) -> RecoveredGame | None:
+        async with self._semaphore:
+            return await self.recover_game(game_id)
+
+    async def _run_replay(
+        self, checkpoint: Checkpoint | None, events: list[GameEvent]
+    ) -> _ReplayResult:
+        if self._executor is None:
+            return _replay(checkpoint, events)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _replay, checkpoint, events)
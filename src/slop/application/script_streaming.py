@@ -0,0 +1,184 @@
+"""Streaming a script to the acting team while it is generated.
+
+Without streaming, the acting team waits for the whole LLM call before
+seeing anything. ``ScriptStreamer`` reads the provider's stream, parses it
+incrementally and sends each batch of newly parsed roles and lines to the
+acting team's sockets as a ``ScriptStreamed`` event, so actors can start
+reading their first lines while the rest of the script is written. The
+complete ``Script`` is returned at the end, for the caller to record as
+``ScriptGenerated``.
+
+The whole stream must finish within a deadline. If a chunk scanner is
+given (such as ``ContentFilter.stream``), every chunk is scanned before
+the lines it completes are sent, and the stream stops at the first
+blocked term, so blocked text never reaches a player.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from slop.application.content_filter import StreamScanner, Violation
+from slop.domain.ai_personality import AIPersonality
+from slop.domain.events import ScriptStreamed
+from slop.domain.game import ContentTone
+from slop.domain.script import Script
+from slop.domain.script_stream import LineParsed, RoleParsed, ScriptStreamParser, ScriptUpdate
+from slop.ports.llm import LLMError, StreamingLLMPort
+from slop.ports.realtime import RealtimePort
+
+
+class BlockedContentError(LLMError):
+    """Raised when a streamed script contains blocked content."""
+
+    def __init__(self, violations: Sequence[Violation]) -> None:
+        """Create the error.
+
+        Args:
+            violations: The blocked terms found
+        """
+        terms = ", ".join(repr(violation.text) for violation in violations)
+        super().__init__(f"Streamed script contains blocked content: {terms}")
+        self.violations = list(violations)
+
+
+@dataclass
+class StreamedScript:
+    """A script generated by streaming.
+
+    Attributes:
+        script: The complete script
+        time_to_first_line: Seconds until the first line of dialogue was sent,
+            or None if the script had no dialogue
+        duration: Seconds until the stream ended
+        updates_sent: Number of ``ScriptStreamed`` events sent to each socket
+    """
+
+    script: Script
+    time_to_first_line: float | None
+    duration: float
+    updates_sent: int
+
+
+class ScriptStreamer:
+    """Streams generated scripts to the acting team as they are parsed."""
+
+    def __init__(
+        self,
+        llm: StreamingLLMPort,
+        realtime: RealtimePort,
+        *,
+        timeout: float = 15.0,
+        scanner: Callable[[ContentTone], StreamScanner] | None = None,
+    ) -> None:
+        """Create a streamer.
+
+        Args:
+            llm: Provider that streams script text
+            realtime: Connection to the players' devices
+            timeout: Seconds the whole stream may take
+            scanner: Returns a chunk scanner for a tone, e.g. ``ContentFilter.stream``
+        """
+        if timeout <= 0:
+            raise ValueError("timeout must be positive")
+        self._llm = llm
+        self._realtime = realtime
+        self._timeout = timeout
+        self._scanner = scanner
+
+    async def stream(
+        self,
+        *,
+        game_id: str,
+        round_number: int,
+        socket_ids: Sequence[str],
+        prompt: str,
+        personality: AIPersonality,
+        num_roles: int,
+        tone: ContentTone = ContentTone.FAMILY,
+    ) -> StreamedScript:
+        """Generate a script, sending its roles and lines as they arrive.
+
+        Args:
+            game_id: The game the round belongs to
+            round_number: The round the script is for
+            socket_ids: Sockets of the acting team
+            prompt: The acting team's prompt
+            personality: The AI personality to use
+            num_roles: Number of roles needed
+            tone: The game's content tone
+
+        Returns:
+            The complete script with timing information
+
+        Raises:
+            BlockedContentError: If the scanner finds blocked content
+            LLMError: If the provider fails, the stream exceeds the timeout
+                or the script declares no roles
+        """
+        started = time.perf_counter()
+        first_line: float | None = None
+        updates_sent = 0
+        parser = ScriptStreamParser()
+        scanner = self._scanner(tone) if self._scanner is not None else None
+
+        async def send(updates: list[ScriptUpdate]) -> None:
+            nonlocal first_line, updates_sent
+            if not updates:
+                return
+            event = _streamed_event(game_id, round_number, updates)
+            await asyncio.gather(
+                *(self._realtime.send_to_player(socket_id, event) for socket_id in socket_ids)
+            )
+            updates_sent += 1
+            if first_line is None and event.lines:
+                first_line = time.perf_counter() - started
+
+        stream = self._llm.stream_script(prompt, personality, num_roles, tone=tone)
+        try:
+            async with asyncio.timeout(self._timeout):
+                async for chunk in stream:
+                    # Scan before sending: the parser only completes lines
+                    # the scanner has already cleared.
+                    if scanner is not None:
+                        _raise_if_blocked(scanner.feed(chunk))
+                    await send(parser.feed(chunk))
+                if scanner is not None:
+                    _raise_if_blocked(scanner.finish())
+                await send(parser.finish())
+        except TimeoutError as exc:
+            raise LLMError(f"Script stream took longer than {self._timeout}s") from exc
+        finally:
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()  # stop the provider's generator early
+
+        try:
+            script = parser.to_script(personality.id)
+        except ValueError as exc:
+            raise LLMError(f"Streamed script is invalid: {exc}") from exc
+        return StreamedScript(
+            script=script,
+            time_to_first_line=first_line,
+            duration=time.perf_counter() - started,
+            updates_sent=updates_sent,
+        )
+
+
+def _raise_if_blocked(violations: list[Violation]) -> None:
+    if violations:
+        raise BlockedContentError(violations)
+
+
+def _streamed_event(game_id: str, round_number: int, updates: list[ScriptUpdate]) -> ScriptStreamed:
+    roles = []
+    lines = []
+    for update in updates:
+        if isinstance(update, RoleParsed):
+            roles.append(
+                {"index": update.index, "name": update.name, "description": update.description}
+            )
+        elif isinstance(update, LineParsed):
+            lines.append({"role_index": update.role_index, "text": update.text})
+    return ScriptStreamed(game_id=game_id, round_number=round_number, roles=roles, lines=lines)
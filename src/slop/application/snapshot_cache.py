@@ -0,0 +1,165 @@
+"""Serialized game snapshots cached by state version.
+
+Reconnecting clients, REST state reads and other snapshot consumers all
+need the same bytes until the game's next event. ``SnapshotCache`` keeps
+the latest serialized snapshot of each game together with the
+``StateVersion`` it was built at, and serializes again only when asked
+for a newer version. Each snapshot has an ETag derived from its version,
+so a polling client that sends ``If-None-Match`` with the current ETag
+can be answered with 304 Not Modified without serializing anything.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from slop.domain.game import Game
+
+
+@dataclass(frozen=True, slots=True)
+class StateVersion:
+    """A position in a game's version sequence.
+
+    Attributes:
+        epoch: Identifies the version sequence the number belongs to
+        version: Number of state events applied (0 before the first)
+    """
+
+    epoch: str
+    version: int
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotFrame:
+    """A game snapshot serialized once for every consumer.
+
+    Attributes:
+        game_id: The game the snapshot is of
+        version: The state version the snapshot reflects
+        data: JSON of the full game state
+        etag: Strong HTTP entity tag of the snapshot
+    """
+
+    game_id: str
+    version: StateVersion
+    data: bytes
+    etag: str
+
+
+@dataclass(frozen=True)
+class SnapshotCacheStats:
+    """Counters for the snapshot cache.
+
+    Attributes:
+        hits: Snapshots served without serializing
+        misses: Snapshots serialized
+        not_modified: Conditional reads answered with "not modified"
+        evictions: Games dropped to stay within ``max_games``
+        entries: Games with a cached snapshot
+    """
+
+    hits: int
+    misses: int
+    not_modified: int
+    evictions: int
+    entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of snapshot reads served without serializing."""
+        reads = self.hits + self.misses + self.not_modified
+        return (self.hits + self.not_modified) / reads if reads else 0.0
+
+
+def etag_for(game_id: str, version: StateVersion) -> str:
+    """Return the entity tag of a game's snapshot at a version."""
+    return f'"{game_id}.{version.epoch}.{version.version}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return True if an If-None-Match header value matches an entity tag.
+
+    Handles lists of tags, ``*`` and weak tags (``W/"..."``), using the
+    weak comparison HTTP prescribes for If-None-Match.
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class SnapshotCache:
+    """Latest serialized snapshot of each game, rebuilt lazily per version."""
+
+    def __init__(self, encode_game: Callable[[Game], bytes], *, max_games: int = 1024) -> None:
+        """Create an empty cache.
+
+        Args:
+            encode_game: Serializes a game snapshot
+            max_games: Maximum games with a cached snapshot
+        """
+        if max_games < 1:
+            raise ValueError("max_games must be at least 1")
+        self._encode_game = encode_game
+        self._max_games = max_games
+        self._frames: OrderedDict[str, SnapshotFrame] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._not_modified = 0
+        self._evictions = 0
+
+    @property
+    def stats(self) -> SnapshotCacheStats:
+        """Current cache counters."""
+        return SnapshotCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            not_modified=self._not_modified,
+            evictions=self._evictions,
+            entries=len(self._frames),
+        )
+
+    def get(self, game: Game, version: StateVersion) -> SnapshotFrame:
+        """Return the snapshot of a game at a version, serializing on a miss.
+
+        Args:
+            game: The game, in the state ``version`` describes
+            version: The game's current state version
+        """
+        frame = self._frames.get(game.id)
+        if frame is not None and frame.version == version:
+            self._hits += 1
+            self._frames.move_to_end(game.id)
+            return frame
+        self._misses += 1
+        frame = SnapshotFrame(game.id, version, self._encode_game(game), etag_for(game.id, version))
+        self._frames[game.id] = frame
+        self._frames.move_to_end(game.id)
+        while len(self._frames) > self._max_games:
+            self._frames.popitem(last=False)
+            self._evictions += 1
+        return frame
+
+    def get_if_none_match(
+        self, game: Game, version: StateVersion, if_none_match: str | None
+    ) -> SnapshotFrame | None:
+        """Return the snapshot, or None if the client's copy is current.
+
+        A None result means "304 Not Modified" and costs no serialization.
+
+        Args:
+            game: The game, in the state ``version`` describes
+            version: The game's current state version
+            if_none_match: The request's If-None-Match header, if any
+        """
+        if etag_matches(if_none_match, etag_for(game.id, version)):
+            self._not_modified += 1
+            return None
+        return self.get(game, version)
+
+    def invalidate(self, game_id: str) -> None:
+        """Drop a game's cached snapshot."""
+        self._frames.pop(game_id, None)
@@ -0,0 +1,218 @@
+"""Versioned game state for catching up reconnecting clients.
+
+Every state event recorded for a game gets the next version number of
+that game, and clients remember the last version they applied. When a
+client reconnects it reports that version, and ``StateSync.catch_up``
+sends it only the events it missed, each serialized once when it was
+recorded. A full snapshot is sent instead when the client is too far
+behind (more than ``max_events`` versions, or events no longer kept), or
+when its version belongs to an earlier epoch: versions restart from zero
+in a new ``StateSync`` (e.g. after a server restart), so each game's
+version sequence is tagged with a random epoch. Snapshots are serialized
+from the live game recorded with the latest event, through a
+``SnapshotCache``, so a reconnect storm after one event serializes the
+game only once.
+"""
+
+import uuid
+from collections import deque
+from dataclasses import dataclass
+
+from slop.application.snapshot_cache import SnapshotCache, SnapshotFrame, StateVersion
+from slop.domain import event_codec
+from slop.domain.events import GameEvent
+from slop.domain.game import Game
+from slop.ports.storage import StoragePort
+
+
+@dataclass(frozen=True, slots=True)
+class VersionedEvent:
+    """A recorded event with its version and serialized form.
+
+    Attributes:
+        version: The game's version after this event
+        event: The event
+        data: The event's JSON encoding
+    """
+
+    version: int
+    event: GameEvent
+    data: bytes
+
+
+@dataclass(frozen=True)
+class CatchUp:
+    """What a reconnecting client needs to reach the current version.
+
+    Attributes:
+        current: The version the client will be at afterwards
+        events: Events to apply, in order (empty if sending a snapshot)
+        snapshot: The full game state, if the client must reload
+    """
+
+    current: StateVersion
+    events: tuple[VersionedEvent, ...] = ()
+    snapshot: SnapshotFrame | None = None
+
+    @property
+    def is_snapshot(self) -> bool:
+        """True if the client must replace its state with the snapshot."""
+        return self.snapshot is not None
+
+
+@dataclass(frozen=True)
+class StateSyncStats:
+    """Counters for catch-up requests.
+
+    Attributes:
+        up_to_date: Requests from clients already at the current version
+        deltas: Requests answered with missed events
+        snapshots: Requests answered with a full snapshot
+    """
+
+    up_to_date: int
+    deltas: int
+    snapshots: int
+
+
+class _GameStream:
+    def __init__(self, game: Game, max_events: int) -> None:
+        self.epoch = uuid.uuid4().hex
+        self.version = 0
+        self.events: deque[VersionedEvent] = deque(maxlen=max_events)
+        self.game = game  # the live game, as of ``version``
+
+
+class StateSync:
+    """Per-game state versions and catch-up for reconnecting clients."""
+
+    def __init__(
+        self,
+        storage: StoragePort,
+        snapshots: SnapshotCache,
+        *,
+        max_events: int = 128,
+    ) -> None:
+        """Create the tracker.
+
+        Args:
+            storage: Source of a game's state before its first recorded event
+            snapshots: Cache of serialized snapshots, shared with other readers
+            max_events: Events kept per game; clients further behind get a snapshot
+        """
+        if max_events < 1:
+            raise ValueError("max_events must be at least 1")
+        self._storage = storage
+        self._snapshot_cache = snapshots
+        self._max_events = max_events
+        self._games: dict[str, _GameStream] = {}
+        self._up_to_date = 0
+        self._deltas = 0
+        self._snapshots = 0
+
+    @property
+    def stats(self) -> StateSyncStats:
+        """Current catch-up counters."""
+        return StateSyncStats(
+            up_to_date=self._up_to_date,
+            deltas=self._deltas,
+            snapshots=self._snapshots,
+        )
+
+    def current(self, game_id: str) -> StateVersion | None:
+        """The current version of a game, or None if it is not tracked yet."""
+        stream = self._games.get(game_id)
+        if stream is None:
+            return None
+        return StateVersion(stream.epoch, stream.version)
+
+    def record(self, event: GameEvent, game: Game) -> VersionedEvent:
+        """Assign the next version to a state event.
+
+        Call this right after applying the event to the game, without
+        awaiting anything in between, and send the returned version to
+        clients along with the event. Transient events (such as
+        ``ScriptStreamed``) are not recorded.
+
+        Args:
+            event: The event just applied
+            game: The game it was applied to
+        """
+        stream = self._games.get(event.game_id)
+        if stream is None:
+            stream = self._games[event.game_id] = _GameStream(game, self._max_events)
+        stream.version += 1
+        stream.game = game
+        versioned = VersionedEvent(stream.version, event, event_codec.encode_event(event))
+        stream.events.append(versioned)
+        return versioned
+
+    def forget(self, game_id: str) -> None:
+        """Drop a finished game's versions, events and cached snapshot."""
+        self._games.pop(game_id, None)
+        self._snapshot_cache.invalidate(game_id)
+
+    async def catch_up(self, game_id: str, since: StateVersion | None) -> CatchUp:
+        """Return what a client at ``since`` needs to reach the current version.
+
+        Args:
+            game_id: The game the client is reconnecting to
+            since: The last version the client applied, or None if it has no state
+
+        Returns:
+            The missed events, or a snapshot if the client is too far behind
+
+        Raises:
+            LookupError: If a snapshot is needed but the game is not stored
+        """
+        stream = self._games.get(game_id)
+        if (
+            stream is not None
+            and since is not None
+            and since.epoch == stream.epoch
+            and since.version <= stream.version
+        ):
+            missed = stream.version - since.version
+            if missed == 0:
+                self._up_to_date += 1
+                return CatchUp(StateVersion(stream.epoch, stream.version))
+            if missed <= len(stream.events):
+                self._deltas += 1
+                return CatchUp(
+                    StateVersion(stream.epoch, stream.version),
+                    events=tuple(stream.events)[-missed:],
+                )
+        self._snapshots += 1
+        frame = await self.snapshot(game_id)
+        assert frame is not None
+        return CatchUp(frame.version, snapshot=frame)
+
+    async def snapshot(
+        self, game_id: str, if_none_match: str | None = None
+    ) -> SnapshotFrame | None:
+        """Return the serialized snapshot of a game at its current version.
+
+        Every caller (reconnects, REST reads) shares the cached snapshot
+        until the game's next event.
+
+        Args:
+            game_id: The game to read
+            if_none_match: The request's If-None-Match header, if any
+
+        Returns:
+            The snapshot, or None if ``if_none_match`` names the current one
+
+        Raises:
+            LookupError: If the game is not stored
+        """
+        stream = self._games.get(game_id)
+        if stream is None:
+            game = await self._storage.get_snapshot(game_id)
+            if game is None:
+                raise LookupError(f"Game {game_id} has no snapshot")
+            stream = self._games.get(game_id)  # unless an event was recorded meanwhile
+            if stream is None:
+                stream = self._games[game_id] = _GameStream(game, self._max_events)
+        # No awaits from here on: the snapshot and version must match.
+        version = StateVersion(stream.epoch, stream.version)
+        return self._snapshot_cache.get_if_none_match(stream.game, version, if_none_match)
@@ -0,0 +1,343 @@
+"""Pre-generated scripts for the personalities in play.
+
+Players only submit prompts once a round starts, but which personalities
+are in play (``Team.assigned_personality``), the team sizes and the tone
+are known long before that. ``WarmPool`` uses that idle time to generate
+a few scripts per personality, team size and tone from stock prompts. When
+the live provider fails, or has not answered within a short fallback
+budget, ``generate`` starts the round from the pool instead of leaving
+the acting team waiting.
+
+Generation runs in a fixed number of background workers, stops once the
+generation budget is spent, and pooled scripts expire after a TTL. When
+the pool is full, the scripts of the least recently used key are evicted
+first.
+"""
+
+import asyncio
+import itertools
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+
+from slop.domain.ai_personality import AIPersonality
+from slop.domain.game import ContentTone, Game
+from slop.domain.script import Script
+from slop.ports.llm import LLMError, LLMPort
+
+DEFAULT_PROMPTS: tuple[str, ...] = (
+    "Detective solves mysterious art heist",
+    "Astronauts discover pizza on Mars",
+    "Wedding planner faces dragon problem",
+    "Robots open a tiny bakery",
+    "Pirates lose their treasure map",
+    "Grandma wins the dance battle",
+)
+
+type _PoolKey = tuple[str, int, ContentTone]  # personality ID, role count, tone
+
+
+@dataclass(frozen=True)
+class PooledScript:
+    """A script ready for a round.
+
+    Attributes:
+        prompt: The prompt the script was generated from; for a pooled
+            script this is a stock prompt, not the player's
+        script: The script
+        from_pool: True if the script came from the warm pool
+    """
+
+    prompt: str
+    script: Script
+    from_pool: bool
+
+
+@dataclass(frozen=True)
+class WarmPoolStats:
+    """Counters for the warm pool.
+
+    Attributes:
+        generated: Scripts generated in the background
+        failed: Background generations that failed
+        hits: Requests served from the pool
+        misses: Requests that found the pool empty
+        evictions: Scripts dropped because the pool was full or they expired
+        scripts: Scripts currently pooled
+        budget_remaining: Background generations left in the budget
+    """
+
+    generated: int
+    failed: int
+    hits: int
+    misses: int
+    evictions: int
+    scripts: int
+    budget_remaining: int
+
+
+@dataclass(slots=True)
+class _Pooled:
+    prompt: str
+    script: Script
+    expires_at: float
+
+
+class WarmPool:
+    """Background pre-generation of fallback scripts."""
+
+    def __init__(
+        self,
+        llm: LLMPort,
+        *,
+        prompts: Sequence[str] = DEFAULT_PROMPTS,
+        per_key: int = 2,
+        max_scripts: int = 64,
+        max_concurrency: int = 2,
+        budget: int = 200,
+        ttl: float = 60 * 60,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Configure the pool; call ``start()`` to begin generating.
+
+        Args:
+            llm: Provider used for background and live generation
+            prompts: Stock prompts that pooled scripts are generated from
+            per_key: Scripts to keep ready per personality, role count and tone
+            max_scripts: Maximum scripts pooled in total
+            max_concurrency: Number of concurrent background generations
+            budget: Maximum number of background generations, ever
+            ttl: Seconds a pooled script stays usable
+            clock: Monotonic clock used for expiry
+        """
+        if not prompts:
+            raise ValueError("prompts must not be empty")
+        for name, value in (
+            ("per_key", per_key),
+            ("max_scripts", max_scripts),
+            ("max_concurrency", max_concurrency),
+        ):
+            if value < 1:
+                raise ValueError(f"{name} must be at least 1")
+        if budget < 0:
+            raise ValueError("budget must not be negative")
+        self._llm = llm
+        self._prompts = tuple(prompts)
+        self._per_key = per_key
+        self._max_scripts = max_scripts
+        self._max_concurrency = max_concurrency
+        self._budget = budget
+        self._ttl = ttl
+        self._clock = clock
+        self._personalities: dict[str, AIPersonality] = {}
+        self._pools: OrderedDict[_PoolKey, deque[_Pooled]] = OrderedDict()
+        self._prompt_cycles: dict[_PoolKey, Iterator[str]] = {}
+        self._queue: asyncio.Queue[_PoolKey] = asyncio.Queue()
+        self._queued: set[_PoolKey] = set()
+        self._in_flight: dict[_PoolKey, int] = {}
+        self._workers: list[asyncio.Task[None]] = []
+        self._generated = 0
+        self._failed = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def stats(self) -> WarmPoolStats:
+        """Current pool counters."""
+        return WarmPoolStats(
+            generated=self._generated,
+            failed=self._failed,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            scripts=sum(len(pool) for pool in self._pools.values()),
+            budget_remaining=self._budget,
+        )
+
+    def start(self) -> None:
+        """Start the background workers."""
+        if self._workers:
+            raise RuntimeError("Warm pool is already running")
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self._max_concurrency)]
+
+    async def stop(self) -> None:
+        """Stop the background workers, abandoning generations in progress."""
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    async def join(self) -> None:
+        """Wait until every requested script has been generated or abandoned."""
+        await self._queue.join()
+
+    def prepare(self, game: Game, personalities: Mapping[str, AIPersonality]) -> int:
+        """Request scripts for every team in a game with a personality assigned.
+
+        Args:
+            game: The game whose teams will act
+            personalities: Known personalities, by ID
+
+        Returns:
+            Number of personality, team size and tone combinations requested
+        """
+        keys = set()
+        for team in game.teams:
+            personality = personalities.get(team.assigned_personality or "")
+            if personality is None:
+                continue
+            num_roles = max(len(team.player_ids), 1)
+            self.want(personality, num_roles, game.settings.content_tone)
+            keys.add((personality.id, num_roles))
+        return len(keys)
+
+    def want(self, personality: AIPersonality, num_roles: int, tone: ContentTone) -> None:
+        """Request that scripts for this combination be kept ready."""
+        self._personalities[personality.id] = personality
+        key = (personality.id, num_roles, tone)
+        pool = self._pools.setdefault(key, deque())
+        self._pools.move_to_end(key)
+        self._prompt_cycles.setdefault(key, itertools.cycle(self._prompts))
+        self._refill(key, pool)
+
+    def take(self, personality_id: str, num_roles: int, tone: ContentTone) -> PooledScript | None:
+        """Remove and return a pooled script, or None if none is ready."""
+        key = (personality_id, num_roles, tone)
+        pool = self._pools.get(key)
+        if pool is not None:
+            self._pools.move_to_end(key)
+            now = self._clock()
+            while pool:
+                pooled = pool.popleft()
+                if pooled.expires_at > now:
+                    self._hits += 1
+                    self._refill(key, pool)
+                    return PooledScript(pooled.prompt, pooled.script, from_pool=True)
+                self._evictions += 1
+            self._refill(key, pool)
+        self._misses += 1
+        return None
+
+    async def generate(
+        self,
+        prompt: str,
+        personality: AIPersonality,
+        num_roles: int,
+        *,
+        tone: ContentTone = ContentTone.FAMILY,
+        fallback_after: float = 1.5,
+        timeout: float = 10.0,
+    ) -> PooledScript:
+        """Generate a script live, falling back to the pool.
+
+        The live provider gets ``fallback_after`` seconds. If it has not
+        answered by then and a pooled script is ready, the round starts
+        with the pooled script at once (and the pool refills in the
+        background); otherwise the provider gets the rest of ``timeout``.
+
+        Args:
+            prompt: The player's prompt
+            personality: The AI personality to use
+            num_roles: Number of roles needed
+            tone: The game's content tone
+            fallback_after: Seconds to wait for the live provider before
+                using a ready pooled script
+            timeout: Seconds to wait for the live provider in total
+
+        Returns:
+            The live script, or a pooled one if the provider failed or was slow
+
+        Raises:
+            LLMError: If the provider failed or timed out and no pooled
+                script is ready
+        """
+        key = (personality.id, num_roles, tone)
+        live = asyncio.ensure_future(
+            self._llm.generate_script(prompt, personality, num_roles, tone=tone)
+        )
+        try:
+            await asyncio.wait({live}, timeout=min(fallback_after, timeout))
+            if not live.done() and self._has_ready(key):
+                pooled = self.take(*key)
+                assert pooled is not None
+                return pooled
+            if not live.done() and timeout > fallback_after:
+                await asyncio.wait({live}, timeout=timeout - fallback_after)
+            if live.done():
+                try:
+                    return PooledScript(prompt, live.result(), from_pool=False)
+                except LLMError:
+                    pooled = self.take(*key)
+                    if pooled is None:
+                        raise
+                    return pooled
+            pooled = self.take(*key)
+            if pooled is None:
+                raise LLMError(f"Script generation timed out after {timeout}s")
+            return pooled
+        finally:
+            if not live.done():
+                live.cancel()
+                await asyncio.gather(live, return_exceptions=True)
+
+    def _has_ready(self, key: _PoolKey) -> bool:
+        now = self._clock()
+        return any(pooled.expires_at > now for pooled in self._pools.get(key, ()))
+
+    def _refill(self, key: _PoolKey, pool: deque[_Pooled]) -> None:
+        missing = self._per_key - len(pool) - self._in_flight.get(key, 0)
+        if missing > 0 and key not in self._queued and self._budget > 0:
+            self._queued.add(key)
+            self._queue.put_nowait(key)
+
+    async def _work(self) -> None:
+        while True:
+            key = await self._queue.get()
+            self._queued.discard(key)
+            try:
+                await self._generate_one(key)
+            finally:
+                self._queue.task_done()
+
+    async def _generate_one(self, key: _PoolKey) -> None:
+        pool = self._pools.get(key)
+        if pool is None or self._budget <= 0:
+            return
+        if len(pool) + self._in_flight.get(key, 0) >= self._per_key:
+            return
+        personality_id, num_roles, tone = key
+        prompt = next(self._prompt_cycles[key])
+        self._budget -= 1
+        self._in_flight[key] = self._in_flight.get(key, 0) + 1
+        self._refill(key, pool)  # let another worker fill the next slot
+        try:
+            script = await self._llm.generate_script(
+                prompt, self._personalities[personality_id], num_roles, tone=tone
+            )
+        except Exception:
+            self._failed += 1
+            return
+        finally:
+            self._in_flight[key] -= 1
+            if not self._in_flight[key]:
+                del self._in_flight[key]
+        if self._pools.get(key) is not pool:
+            return  # evicted while generating
+        pool.append(_Pooled(prompt, script, self._clock() + self._ttl))
+        self._generated += 1
+        self._evict()
+
+    def _evict(self) -> None:
+        total = sum(len(pool) for pool in self._pools.values())
+        for key, pool in list(self._pools.items()):
+            if total <= self._max_scripts:
+                return
+            while pool and total > self._max_scripts:
+                pool.popleft()
+                total -= 1
+                self._evictions += 1
+            if not pool and not self._in_flight.get(key):
+                del self._pools[key]
+                del self._prompt_cycles[key]
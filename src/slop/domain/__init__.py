@@ -21,10 +21,12 @@ from slop.domain.events import (
     RoundStarted,
     ScoresUpdated,
     ScriptGenerated,
+    ScriptStreamed,
     TeamFormed,
 )
 from slop.domain.game import ContentTone, Game, GameSettings, GameStatus
 from slop.domain.player import Player
+from slop.domain.projection import GameProjection
 from slop.domain.round import Guess, RoleAssignment, Round
 from slop.domain.script import Role, Script
 from slop.domain.team import Team
@@ -36,6 +38,7 @@ __all__ = [
     "GameCompleted",
     "GameCreated",
     "GameEvent",
+    "GameProjection",
     "GameSettings",
     "GameStatus",
     "Guess",
@@ -57,6 +60,7 @@ __all__ = [
     "ScoresUpdated",
     "Script",
     "ScriptGenerated",
+    "ScriptStreamed",
     "Team",
     "TeamFormed",
 ]
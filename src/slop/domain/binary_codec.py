@@ -0,0 +1,395 @@
+"""Compact binary encoding for domain events.
+
+An optional alternative to JSON for storage records and realtime frames.
+Each event is written as:
+
+- one tag byte identifying the event class (its position in
+  ``EVENT_CLASSES``),
+- every other field in declaration order, without field names:
+    - timestamps as int64 microseconds since the Unix epoch (UTC)
+    - integers as zigzag varints
+    - strings as a varint length followed by UTF-8 bytes
+    - ids as interned references (see below)
+
+Id fields (names ending in ``_id``, ``submitted_by`` and score dictionary
+keys) are interned. The first occurrence of an id is written in full, as 16
+raw bytes if it is a canonical UUID string or as a string otherwise. Later
+occurrences are written as a varint index into the intern table.
+
+``encode_event`` starts a fresh intern table for every event, so each frame
+can be decoded on its own. That suits storage records and broadcast frames
+shared by many sockets. ``BinaryEventEncoder`` and ``BinaryEventDecoder``
+keep the table across calls and suit a single ordered stream, such as a
+batch from ``encode_events``.
+"""
+
+import json
+import struct
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from slop.domain.event_codec import EVENT_CLASSES
+from slop.domain.events import GameEvent
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+_INT64 = struct.Struct("<q")
+
+# Markers for interned id values.
+_ID_NONE = 0
+_ID_UUID = 1
+_ID_STRING = 2
+_ID_REF = 3
+
+
+class _Reader:
+    """Cursor over an encoded buffer."""
+
+    __slots__ = ("data", "pos")
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.pos = 0
+
+    def byte(self) -> int:
+        value = self.data[self.pos]
+        self.pos += 1
+        return value
+
+    def take(self, size: int) -> bytes:
+        end = self.pos + size
+        if end > len(self.data):
+            raise ValueError("Truncated binary event")
+        chunk = self.data[self.pos : end]
+        self.pos = end
+        return chunk
+
+
+def _write_varint(buf: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def _read_varint(reader: _Reader) -> int:
+    shift = 0
+    value = 0
+    while True:
+        byte = reader.byte()
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value
+        shift += 7
+
+
+def _write_int(buf: bytearray, value: int, ids: dict[str, int]) -> None:
+    _write_varint(buf, (value << 1) if value >= 0 else ((-value << 1) - 1))
+
+
+def _read_int(reader: _Reader, ids: list[str]) -> int:
+    raw = _read_varint(reader)
+    return (raw >> 1) if not raw & 1 else -((raw + 1) >> 1)
+
+
+def _write_str(buf: bytearray, value: str, ids: dict[str, int]) -> None:
+    encoded = value.encode()
+    _write_varint(buf, len(encoded))
+    buf += encoded
+
+
+def _read_str(reader: _Reader, ids: list[str]) -> str:
+    return reader.take(_read_varint(reader)).decode()
+
+
+def _write_id(buf: bytearray, value: str | None, ids: dict[str, int]) -> None:
+    if value is None:
+        buf.append(_ID_NONE)
+        return
+    index = ids.get(value)
+    if index is not None:
+        buf.append(_ID_REF)
+        _write_varint(buf, index)
+        return
+    ids[value] = len(ids)
+    uuid_bytes = _uuid_bytes(value)
+    if uuid_bytes is not None:
+        buf.append(_ID_UUID)
+        buf += uuid_bytes
+    else:
+        buf.append(_ID_STRING)
+        _write_str(buf, value, ids)
+
+
+def _read_id(reader: _Reader, ids: list[str]) -> str | None:
+    marker = reader.byte()
+    if marker == _ID_NONE:
+        return None
+    if marker == _ID_REF:
+        return ids[_read_varint(reader)]
+    if marker == _ID_UUID:
+        value = _format_uuid(reader.take(16))
+    elif marker == _ID_STRING:
+        value = _read_str(reader, ids)
+    else:
+        raise ValueError(f"Invalid id marker: {marker}")
+    ids.append(value)
+    return value
+
+
+def _uuid_bytes(value: str) -> bytes | None:
+    """Return the raw UUID bytes if ``value`` is a canonical UUID string."""
+    if len(value) != 36:
+        return None
+    try:
+        raw = bytes.fromhex(value.replace("-", ""))
+    except ValueError:
+        return None
+    return raw if len(raw) == 16 and _format_uuid(raw) == value else None
+
+
+def _format_uuid(raw: bytes) -> str:
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _write_datetime(buf: bytearray, value: datetime, ids: dict[str, int]) -> None:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    buf += _INT64.pack((value - _EPOCH) // _MICROSECOND)
+
+
+def _read_datetime(reader: _Reader, ids: list[str]) -> datetime:
+    (micros,) = _INT64.unpack(reader.take(_INT64.size))
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+def _write_scores(buf: bytearray, value: dict[str, int], ids: dict[str, int]) -> None:
+    _write_varint(buf, len(value))
+    for key, points in value.items():
+        _write_id(buf, key, ids)
+        _write_int(buf, points, ids)
+
+
+def _read_scores(reader: _Reader, ids: list[str]) -> dict[str, int]:
+    scores = {}
+    for _ in range(_read_varint(reader)):
+        key = _read_id(reader, ids)
+        assert key is not None
+        scores[key] = _read_int(reader, ids)
+    return scores
+
+
+def _write_json(buf: bytearray, value: Any, ids: dict[str, int]) -> None:
+    _write_str(buf, json.dumps(value, separators=(",", ":")), ids)
+
+
+def _read_json(reader: _Reader, ids: list[str]) -> Any:
+    return json.loads(_read_str(reader, ids))
+
+
+_Writer = Callable[[bytearray, Any, dict[str, int]], None]
+_ReaderFn = Callable[[_Reader, list[str]], Any]
+
+_CODECS_BY_ANNOTATION: list[tuple[Any, _Writer, _ReaderFn]] = [
+    (datetime, _write_datetime, _read_datetime),
+    (int, _write_int, _read_int),
+    (str, _write_str, _read_str),
+    (dict[str, int], _write_scores, _read_scores),
+    (list[dict[str, Any]], _write_json, _read_json),
+]
+
+
+def _is_id_field(name: str) -> bool:
+    return name.endswith("_id") or name == "submitted_by"
+
+
+def _field_codec(cls: type[GameEvent], name: str) -> tuple[_Writer, _ReaderFn]:
+    annotation = cls.model_fields[name].annotation
+    if _is_id_field(name) and annotation in (str, str | None):
+        return _write_id, _read_id
+    for candidate, writer, reader in _CODECS_BY_ANNOTATION:
+        if annotation == candidate:
+            return writer, reader
+    raise TypeError(f"No binary encoding for {cls.__name__}.{name}: {annotation}")
+
+
+def _build_plan(
+    cls: type[GameEvent],
+) -> tuple[list[tuple[str, _Writer]], list[tuple[str, _ReaderFn]]]:
+    writers = []
+    readers = []
+    for name in cls.model_fields:
+        if name == "event_type":
+            continue
+        writer, reader = _field_codec(cls, name)
+        writers.append((name, writer))
+        readers.append((name, reader))
+    return writers, readers
+
+
+_TAGS: dict[type[GameEvent], int] = {cls: tag for tag, cls in enumerate(EVENT_CLASSES)}
+_PLANS = [_build_plan(cls) for cls in EVENT_CLASSES]
+
+
+class BinaryEventEncoder:
+    """Encoder whose id intern table spans every event it encodes.
+
+    Frames must be decoded in the same order by a single
+    ``BinaryEventDecoder``.
+    """
+
+    def __init__(self) -> None:
+        """Create an encoder with an empty intern table."""
+        self._ids: dict[str, int] = {}
+
+    def encode(self, event: GameEvent) -> bytes:
+        """Encode one event as a binary frame.
+
+        Args:
+            event: The domain event to encode
+
+        Returns:
+            The encoded frame
+        """
+        buf = bytearray()
+        self.encode_into(buf, event)
+        return bytes(buf)
+
+    def encode_into(self, buf: bytearray, event: GameEvent) -> None:
+        """Append one encoded event to ``buf``.
+
+        Args:
+            buf: The buffer to append to
+            event: The domain event to encode
+
+        Raises:
+            TypeError: If the event class is not registered
+        """
+        tag = _TAGS.get(type(event))
+        if tag is None:
+            raise TypeError(f"Unregistered event class: {type(event).__name__}")
+        buf.append(tag)
+        values = event.__dict__
+        for name, writer in _PLANS[tag][0]:
+            writer(buf, values[name], self._ids)
+
+
+class BinaryEventDecoder:
+    """Decoder matching a ``BinaryEventEncoder`` stream."""
+
+    def __init__(self) -> None:
+        """Create a decoder with an empty intern table."""
+        self._ids: list[str] = []
+
+    def decode(self, data: bytes) -> GameEvent:
+        """Decode one binary frame.
+
+        Args:
+            data: A frame produced by the matching encoder
+
+        Returns:
+            The decoded event
+
+        Raises:
+            ValueError: If the frame is malformed or has trailing bytes
+        """
+        reader = _Reader(data)
+        event = self.decode_from(reader)
+        if reader.pos != len(data):
+            raise ValueError("Trailing bytes after binary event")
+        return event
+
+    def decode_from(self, reader: _Reader) -> GameEvent:
+        """Decode the next event from an open reader."""
+        try:
+            tag = reader.byte()
+            cls = EVENT_CLASSES[tag]
+        except IndexError as exc:
+            raise ValueError("Invalid or truncated binary event") from exc
+        values = {"event_type": cls.model_fields["event_type"].default}
+        try:
+            for name, read in _PLANS[tag][1]:
+                values[name] = read(reader, self._ids)
+        except IndexError as exc:
+            raise ValueError("Truncated binary event") from exc
+        return cls.model_validate(values)
+
+
+def encode_event(event: GameEvent) -> bytes:
+    """Encode a single, self-contained binary event frame.
+
+    Args:
+        event: The domain event to encode
+
+    Returns:
+        The encoded frame
+    """
+    return BinaryEventEncoder().encode(event)
+
+
+def decode_event(data: bytes) -> GameEvent:
+    """Decode a frame produced by ``encode_event``.
+
+    Args:
+        data: The encoded frame
+
+    Returns:
+        The decoded event
+
+    Raises:
+        ValueError: If the frame is malformed
+    """
+    return BinaryEventDecoder().decode(data)
+
+
+def encode_events(events: Iterable[GameEvent]) -> bytes:
+    """Encode a batch of events sharing one intern table.
+
+    Args:
+        events: The domain events to encode
+
+    Returns:
+        A varint count followed by the encoded events
+    """
+    items = list(events)
+    encoder = BinaryEventEncoder()
+    buf = bytearray()
+    _write_varint(buf, len(items))
+    for event in items:
+        encoder.encode_into(buf, event)
+    return bytes(buf)
+
+
+def decode_events(data: bytes) -> list[GameEvent]:
+    """Decode a batch produced by ``encode_events``.
+
+    Args:
+        data: The encoded batch
+
+    Returns:
+        The events in their original order
+
+    Raises:
+        ValueError: If the batch is malformed
+    """
+    reader = _Reader(data)
+    decoder = BinaryEventDecoder()
+    try:
+        count = _read_varint(reader)
+    except IndexError as exc:
+        raise ValueError("Truncated binary event batch") from exc
+    events = [decoder.decode_from(reader) for _ in range(count)]
+    if reader.pos != len(data):
+        raise ValueError("Trailing bytes after binary event batch")
+    return events
+
+
+def is_binary_event(data: bytes) -> bool:
+    """Whether ``data`` is a binary frame rather than a JSON document.
+
+    Tags are small integers, so they never collide with the ``{`` that
+    starts a JSON event.
+    """
+    return bool(data) and data[0] < len(EVENT_CLASSES)
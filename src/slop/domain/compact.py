@@ -0,0 +1,57 @@
+"""Helpers for keeping domain objects small in memory.
+
+A server holds every active game, and each game repeats the same ids many
+times: a team id appears on its members, on every round it acts in and on
+every guess and score it makes. Games decoded from storage get a fresh
+string for each occurrence; the domain models intern ids so that repeated
+values share one object. Decoded timestamps also get a ``tzinfo`` object
+each, which the models swap for the shared ``UTC``; that is a minor
+saving (about 0.7 of 28 KiB per game in ``benchmarks/bench_memory.py``).
+"""
+
+import sys
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+
+_ZERO = timedelta(0)
+
+
+def utc_now() -> datetime:
+    """Return the current time, using the shared ``UTC`` tzinfo."""
+    return datetime.now(UTC)
+
+
+def with_shared_utc(value: datetime) -> datetime:
+    """Return ``value`` with a zero-offset tzinfo replaced by the shared ``UTC``.
+
+    The instant is unchanged; naive and non-UTC datetimes are returned as is.
+    """
+    tzinfo = value.tzinfo
+    if tzinfo is None or tzinfo is UTC or value.utcoffset() != _ZERO:
+        return value
+    return value.replace(tzinfo=UTC)
+
+
+def intern_id(value: str) -> str:
+    """Return the interned copy of an id string."""
+    return sys.intern(value)
+
+
+def intern_optional_id(value: str | None) -> str | None:
+    """Return the interned copy of an id string, passing ``None`` through."""
+    return None if value is None else sys.intern(value)
+
+
+def intern_ids(values: Iterable[str]) -> list[str]:
+    """Return a list of the interned copies of id strings."""
+    return [sys.intern(value) for value in values]
+
+
+def intern_keys[V](mapping: dict[str, V]) -> None:
+    """Intern the keys of ``mapping`` in place, keeping their order.
+
+    The dict itself is kept, so callers holding it still share it.
+    """
+    items = [(sys.intern(key), value) for key, value in mapping.items()]
+    mapping.clear()
+    mapping.update(items)
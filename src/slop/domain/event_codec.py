@@ -0,0 +1,152 @@
+"""Event codec for decoding stored or transmitted events.
+
+All concrete event types form a single discriminated union on
+``event_type``, so Pydantic can pick the right subclass without trying
+each one in turn. Lists of events are decoded in a single validation pass.
+"""
+
+from collections.abc import Iterable
+from typing import Annotated, cast
+
+from pydantic import Field, TypeAdapter
+
+from slop.domain.events import (
+    GameCompleted,
+    GameCreated,
+    GameEvent,
+    GuessAccepted,
+    GuessSubmitted,
+    PersonalityAssigned,
+    PersonalityGuessSubmitted,
+    PlayerJoined,
+    PlayerJoinedTeam,
+    PlayerLeft,
+    PromptSubmitted,
+    RoleAssigned,
+    RoundCompleted,
+    RoundStarted,
+    ScoresUpdated,
+    ScriptGenerated,
+    ScriptStreamed,
+    TeamFormed,
+)
+
+# Positions double as binary codec tags: append new events, never reorder.
+EVENT_CLASSES: tuple[type[GameEvent], ...] = (
+    GameCreated,
+    PlayerJoined,
+    PlayerLeft,
+    TeamFormed,
+    PlayerJoinedTeam,
+    PersonalityAssigned,
+    RoundStarted,
+    PromptSubmitted,
+    ScriptGenerated,
+    RoleAssigned,
+    GuessSubmitted,
+    GuessAccepted,
+    PersonalityGuessSubmitted,
+    ScoresUpdated,
+    RoundCompleted,
+    GameCompleted,
+    ScriptStreamed,
+)
+
+EVENT_TYPES: dict[str, type[GameEvent]] = {
+    cls.model_fields["event_type"].default: cls for cls in EVENT_CLASSES
+}
+
+AnyGameEvent = Annotated[
+    GameCreated
+    | PlayerJoined
+    | PlayerLeft
+    | TeamFormed
+    | PlayerJoinedTeam
+    | PersonalityAssigned
+    | RoundStarted
+    | PromptSubmitted
+    | ScriptGenerated
+    | RoleAssigned
+    | GuessSubmitted
+    | GuessAccepted
+    | PersonalityGuessSubmitted
+    | ScoresUpdated
+    | RoundCompleted
+    | GameCompleted
+    | ScriptStreamed,
+    Field(discriminator="event_type"),
+]
+
+_EVENT_ADAPTER: TypeAdapter[AnyGameEvent] = TypeAdapter(AnyGameEvent)
+_EVENT_LIST_ADAPTER: TypeAdapter[list[AnyGameEvent]] = TypeAdapter(list[AnyGameEvent])
+
+
+def encode_event(event: GameEvent) -> bytes:
+    """Serialize an event to JSON.
+
+    Args:
+        event: The domain event to serialize
+
+    Returns:
+        The JSON representation of the event
+    """
+    return event.model_dump_json().encode()
+
+
+def encode_events(events: Iterable[GameEvent]) -> bytes:
+    """Serialize a sequence of events to a JSON array.
+
+    Args:
+        events: The domain events to serialize
+
+    Returns:
+        The JSON array of events
+    """
+    return b"[" + b",".join(encode_event(event) for event in events) + b"]"
+
+
+def decode_event(data: str | bytes) -> GameEvent:
+    """Deserialize a single event to its concrete subclass.
+
+    Args:
+        data: The JSON representation of one event
+
+    Returns:
+        An instance of the concrete GameEvent subclass
+
+    Raises:
+        pydantic.ValidationError: If the data is not a known, valid event
+    """
+    return _EVENT_ADAPTER.validate_json(data)
+
+
+def decode_events(data: str | bytes) -> list[GameEvent]:
+    """Deserialize a JSON array of events in one validation pass.
+
+    Args:
+        data: A JSON array of events, as produced by ``encode_events``
+
+    Returns:
+        The events in their original order
+
+    Raises:
+        pydantic.ValidationError: If any element is not a known, valid event
+    """
+    return cast(list[GameEvent], _EVENT_LIST_ADAPTER.validate_json(data))
+
+
+def decode_event_rows(rows: Iterable[str | bytes]) -> list[GameEvent]:
+    """Deserialize individually stored events in one validation pass.
+
+    Storage adapters keep one JSON document per event. Joining them into a
+    single array lets the whole game be validated by one call into
+    pydantic-core, instead of one call (and one Python round-trip) per event.
+
+    Args:
+        rows: JSON documents of single events, in order
+
+    Returns:
+        The events in their original order
+    """
+    parts = [row.encode() if isinstance(row, str) else row for row in rows]
+    return decode_events(b"[" + b",".join(parts) + b"]")
@@ -4,32 +4,34 @@ All game state changes are represented as immutable events that can be
 serialized, stored, and broadcast to clients.
 """
 
-from datetime import UTC, datetime
-from typing import Any
-from uuid import uuid4
+from datetime import datetime
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from slop.domain.ids import event_now, new_event_id
+
 
 class GameEvent(BaseModel):
     """Base class for all domain events.
 
     Events are immutable records of state changes in the game.
-    They form the append-only event log for event sourcing.
+    They form the append-only event log for event sourcing. IDs and
+    timestamps come from the providers in ``slop.domain.ids``.
     """
 
     model_config = ConfigDict(frozen=True)  # Make events immutable
 
-    event_id: str = Field(default_factory=lambda: str(uuid4()))
+    event_id: str = Field(default_factory=new_event_id)
     game_id: str
     event_type: str
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=event_now)
 
 
 class GameCreated(GameEvent):
     """Emitted when a new game is created."""
 
-    event_type: str = "GameCreated"
+    event_type: Literal["GameCreated"] = "GameCreated"
     room_code: str
     content_tone: str
     max_players: int
@@ -39,7 +41,7 @@ class GameCreated(GameEvent):
 class PlayerJoined(GameEvent):
     """Emitted when a player joins a game."""
 
-    event_type: str = "PlayerJoined"
+    event_type: Literal["PlayerJoined"] = "PlayerJoined"
     player_id: str
     player_name: str
     socket_id: str
@@ -48,14 +50,14 @@ class PlayerJoined(GameEvent):
 class PlayerLeft(GameEvent):
     """Emitted when a player leaves a game."""
 
-    event_type: str = "PlayerLeft"
+    event_type: Literal["PlayerLeft"] = "PlayerLeft"
     player_id: str
 
 
 class TeamFormed(GameEvent):
     """Emitted when a team is created."""
 
-    event_type: str = "TeamFormed"
+    event_type: Literal["TeamFormed"] = "TeamFormed"
     team_id: str
     team_name: str
     color: str
@@ -64,7 +66,7 @@ class TeamFormed(GameEvent):
 class PlayerJoinedTeam(GameEvent):
     """Emitted when a player joins a team."""
 
-    event_type: str = "PlayerJoinedTeam"
+    event_type: Literal["PlayerJoinedTeam"] = "PlayerJoinedTeam"
     player_id: str
     team_id: str
 
@@ -72,7 +74,7 @@ class PlayerJoinedTeam(GameEvent):
 class PersonalityAssigned(GameEvent):
     """Emitted when a team is assigned an AI personality."""
 
-    event_type: str = "PersonalityAssigned"
+    event_type: Literal["PersonalityAssigned"] = "PersonalityAssigned"
     team_id: str
     personality_id: str
     assigned_by_team_id: str
@@ -81,7 +83,7 @@ class PersonalityAssigned(GameEvent):
 class RoundStarted(GameEvent):
     """Emitted when a new round begins."""
 
-    event_type: str = "RoundStarted"
+    event_type: Literal["RoundStarted"] = "RoundStarted"
     round_number: int
     acting_team_id: str
 
@@ -89,7 +91,7 @@ class RoundStarted(GameEvent):
 class PromptSubmitted(GameEvent):
     """Emitted when a prompt is submitted for a round."""
 
-    event_type: str = "PromptSubmitted"
+    event_type: Literal["PromptSubmitted"] = "PromptSubmitted"
     round_number: int
     prompt: str
     submitted_by: str  # player_id
@@ -98,7 +100,7 @@ class PromptSubmitted(GameEvent):
 class ScriptGenerated(GameEvent):
     """Emitted when an AI script is generated."""
 
-    event_type: str = "ScriptGenerated"
+    event_type: Literal["ScriptGenerated"] = "ScriptGenerated"
     round_number: int
     script_content: str
     personality_id: str
@@ -107,10 +109,24 @@ class ScriptGenerated(GameEvent):
     estimated_duration: int
 
 
+class ScriptStreamed(GameEvent):
+    """Emitted while a script is generated, with the roles and lines parsed so far.
+
+    Sent to the acting team only, so actors can start reading before the
+    script is complete. It is not stored: ``ScriptGenerated`` carries the
+    finished script.
+    """
+
+    event_type: Literal["ScriptStreamed"] = "ScriptStreamed"
+    round_number: int
+    roles: list[dict[str, Any]]  # New roles: index, name, description
+    lines: list[dict[str, Any]]  # New lines: role_index, text
+
+
 class RoleAssigned(GameEvent):
     """Emitted when a role is assigned to a player."""
 
-    event_type: str = "RoleAssigned"
+    event_type: Literal["RoleAssigned"] = "RoleAssigned"
     round_number: int
     player_id: str
     role_name: str
@@ -120,7 +136,7 @@ class RoleAssigned(GameEvent):
 class GuessSubmitted(GameEvent):
     """Emitted when a team submits a guess for the prompt."""
 
-    event_type: str = "GuessSubmitted"
+    event_type: Literal["GuessSubmitted"] = "GuessSubmitted"
     round_number: int
     team_id: str
     guess: str
@@ -129,7 +145,7 @@ class GuessSubmitted(GameEvent):
 class GuessAccepted(GameEvent):
     """Emitted when a guess is accepted as correct."""
 
-    event_type: str = "GuessAccepted"
+    event_type: Literal["GuessAccepted"] = "GuessAccepted"
     round_number: int
     team_id: str
 
@@ -137,7 +153,7 @@ class GuessAccepted(GameEvent):
 class PersonalityGuessSubmitted(GameEvent):
     """Emitted when the acting team guesses the AI personality."""
 
-    event_type: str = "PersonalityGuessSubmitted"
+    event_type: Literal["PersonalityGuessSubmitted"] = "PersonalityGuessSubmitted"
     round_number: int
     personality_guess: str
 
@@ -145,7 +161,7 @@ class PersonalityGuessSubmitted(GameEvent):
 class ScoresUpdated(GameEvent):
     """Emitted when scores are calculated and updated."""
 
-    event_type: str = "ScoresUpdated"
+    event_type: Literal["ScoresUpdated"] = "ScoresUpdated"
     round_number: int
     score_changes: dict[str, int]  # team_id -> points awarded
 
@@ -156,7 +172,7 @@ class RoundCompleted(GameEvent):
     This event serves as a checkpoint for crash recovery.
     """
 
-    event_type: str = "RoundCompleted"
+    event_type: Literal["RoundCompleted"] = "RoundCompleted"
     round_number: int
     final_scores: dict[str, int]  # team_id -> total score
 
@@ -164,6 +180,6 @@ class RoundCompleted(GameEvent):
 class GameCompleted(GameEvent):
     """Emitted when the game ends."""
 
-    event_type: str = "GameCompleted"
+    event_type: Literal["GameCompleted"] = "GameCompleted"
     final_scores: dict[str, int]  # team_id -> final score
     winner_team_id: str | None
@@ -1,12 +1,15 @@
 """Game and GameSettings domain models."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import datetime
 from enum import Enum
 
+from slop.domain.compact import intern_id, utc_now, with_shared_utc
 from slop.domain.player import Player
 from slop.domain.round import Round
 from slop.domain.team import Team
+from slop.domain.tracked import DerivedIndex, TrackedList
 
 
 class GameStatus(Enum):
@@ -32,6 +35,7 @@ class GameSettings:
     rounds_per_team: int = 3
     guess_timer_seconds: int = 60
     max_players_per_team: int = 3
+    max_players: int = 12
     content_tone: ContentTone = ContentTone.FAMILY
 
 
@@ -40,7 +44,10 @@ class Game:
     """Represents a complete game session.
 
     A game includes players, teams, rounds, and manages the overall
-    game state and progression.
+    game state and progression. Players and teams are also indexed by ID.
+    The methods below keep the indexes in step; ``players`` and ``teams``
+    are change-counting lists, so direct edits (or assigning a new list)
+    are detected and trigger a rebuild.
     """
 
     id: str
@@ -51,16 +58,36 @@ class Game:
     players: list[Player] = field(default_factory=list)
     rounds: list[Round] = field(default_factory=list)
     current_round: int = 0
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=utc_now)
 
     def __post_init__(self) -> None:
         """Validate game fields after initialization."""
         if not (4 <= len(self.room_code) <= 6):
             raise ValueError("Room code must be 4-6 characters")
+        self.id = intern_id(self.id)
+        self.created_at = with_shared_utc(self.created_at)
+        self.players = TrackedList(self.players)
+        self.teams = TrackedList(self.teams)
+        self._players_by_id: DerivedIndex[Player, dict[str, Player]] = DerivedIndex(_by_id)
+        self._teams_by_id: DerivedIndex[Team, dict[str, Team]] = DerivedIndex(_by_id)
+
+    def _tracked_players(self) -> TrackedList[Player]:
+        if not isinstance(self.players, TrackedList):  # a new list was assigned
+            self.players = TrackedList(self.players)
+        return self.players
+
+    def _tracked_teams(self) -> TrackedList[Team]:
+        if not isinstance(self.teams, TrackedList):
+            self.teams = TrackedList(self.teams)
+        return self.teams
 
     def add_player(self, player: Player) -> None:
         """Add a player to the game."""
-        self.players.append(player)
+        players = self._tracked_players()
+        index = self._players_by_id.get(players)
+        players.append(player)
+        index.setdefault(player.id, player)
+        self._players_by_id.synced(players)
 
     def remove_player(self, player_id: str) -> None:
         """Remove a player from the game.
@@ -72,7 +99,12 @@ class Game:
             ValueError: If player is not found
         """
         player = self.get_player(player_id)
-        self.players.remove(player)
+        players = self._tracked_players()
+        index = self._players_by_id.get(players)
+        has_duplicates = len(index) != len(players)  # the index is current here
+        _remove_identical(players, player)
+        _reindex(index, players, player_id, has_duplicates)
+        self._players_by_id.synced(players)
 
     def get_player(self, player_id: str) -> Player:
         """Get a player by ID.
@@ -86,19 +118,28 @@ class Game:
         Raises:
             ValueError: If player is not found
         """
-        for player in self.players:
-            if player.id == player_id:
-                return player
-        raise ValueError(f"Player {player_id} not found")
+        player = self._players_by_id.get(self._tracked_players()).get(player_id)
+        if player is None:
+            raise ValueError(f"Player {player_id} not found")
+        return player
 
     def add_team(self, team: Team) -> None:
         """Add a team to the game."""
-        self.teams.append(team)
+        teams = self._tracked_teams()
+        index = self._teams_by_id.get(teams)
+        teams.append(team)
+        index.setdefault(team.id, team)
+        self._teams_by_id.synced(teams)
 
     def remove_team(self, team_id: str) -> None:
         """Remove a team from the game."""
         team = self.get_team(team_id)
-        self.teams.remove(team)
+        teams = self._tracked_teams()
+        index = self._teams_by_id.get(teams)
+        has_duplicates = len(index) != len(teams)  # the index is current here
+        _remove_identical(teams, team)
+        _reindex(index, teams, team_id, has_duplicates)
+        self._teams_by_id.synced(teams)
 
     def get_team(self, team_id: str) -> Team:
         """Get a team by ID.
@@ -112,10 +153,10 @@ class Game:
         Raises:
             ValueError: If team is not found
         """
-        for team in self.teams:
-            if team.id == team_id:
-                return team
-        raise ValueError(f"Team {team_id} not found")
+        team = self._teams_by_id.get(self._tracked_teams()).get(team_id)
+        if team is None:
+            raise ValueError(f"Team {team_id} not found")
+        return team
 
     def start(self) -> None:
         """Start the game.
@@ -171,3 +212,28 @@ class Game:
 
         team_index = self.current_round % len(self.teams)
         return self.teams[team_index]
+
+
+def _by_id[T: (Player, Team)](items: Sequence[T]) -> dict[str, T]:
+    """Index items by ID; the first of several items with one ID wins."""
+    return {item.id: item for item in reversed(items)}
+
+
+def _reindex[T: (Player, Team)](
+    index: dict[str, T], items: Sequence[T], item_id: str, has_duplicates: bool
+) -> None:
+    """Point ``item_id`` at its next remaining duplicate, if any, or drop it."""
+    if has_duplicates:
+        for item in items:
+            if item.id == item_id:
+                index[item_id] = item
+                return
+    del index[item_id]
+
+
+def _remove_identical[T](items: list[T], item: T) -> None:
+    """Remove ``item`` by identity, skipping field-by-field dataclass equality."""
+    for position, candidate in enumerate(items):
+        if candidate is item:
+            del items[position]
+            return
@@ -0,0 +1,189 @@
+"""Event ID and clock providers.
+
+Every ``GameEvent`` takes its ``event_id`` and ``timestamp`` from the
+providers installed here. By default IDs are UUIDv7 strings from an
+in-process generator: a 48-bit millisecond timestamp followed by a
+counter seeded from a pseudo-random source, so IDs sort by creation time
+(and, within one process, strictly by creation order) and each one costs
+no OS randomness call. They keep the canonical UUID text form, so the
+binary codec still packs them into 16 bytes. A forked child reseeds
+its generators, so worker processes never repeat each other's IDs.
+
+Timestamps come from the system clock unless a ``TickClock`` is installed,
+in which case every event created within one tick shares one timestamp.
+Providers are installed per context (see ``event_stamps``), so one task
+can stamp its events without affecting the others.
+"""
+
+import os
+import random
+import threading
+import time
+import weakref
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+
+from slop.domain.compact import utc_now
+
+_COUNTER_BITS = 74  # rand_a (12 bits) and rand_b (62 bits) of RFC 9562 UUIDv7
+_COUNTER_MAX = (1 << _COUNTER_BITS) - 1
+_RAND_B_MASK = (1 << 62) - 1
+# Fresh counters start in the lower half, leaving room to increment.
+_COUNTER_SEED_BITS = _COUNTER_BITS - 1
+
+
+class MonotonicIdGenerator:
+    """Generates time-ordered UUIDv7 strings.
+
+    Within one millisecond the counter is incremented, so IDs from one
+    generator are strictly increasing even if the wall clock stalls or
+    steps backwards. A generator that owns its random source reseeds it
+    in a forked child; one given an ``rng`` leaves it alone.
+    """
+
+    def __init__(
+        self,
+        *,
+        clock_ms: Callable[[], int] = lambda: time.time_ns() // 1_000_000,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Create a generator.
+
+        Args:
+            clock_ms: Returns the current Unix time in milliseconds
+            rng: Source of the per-millisecond counter seeds
+        """
+        self._clock_ms = clock_ms
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._prefix = ""
+        self._counter = 0
+        if rng is None:
+            _forkable.add(self)
+
+    def __call__(self) -> str:
+        """Return a new ID."""
+        with self._lock:
+            now_ms = self._clock_ms()
+            if now_ms > self._last_ms:
+                self._start_millisecond(now_ms)
+            elif self._counter < _COUNTER_MAX:
+                self._counter += 1
+            else:
+                # Counter exhausted: borrow the next millisecond.
+                self._start_millisecond(self._last_ms + 1)
+            prefix, counter = self._prefix, self._counter
+
+        rand_b = counter & _RAND_B_MASK
+        return (
+            f"{prefix}-{0x7000 | (counter >> 62):04x}-{0x8000 | (rand_b >> 48):04x}"
+            f"-{rand_b & 0xFFFFFFFFFFFF:012x}"
+        )
+
+    def _start_millisecond(self, ms: int) -> None:
+        self._last_ms = ms
+        self._prefix = f"{ms >> 16:08x}-{ms & 0xFFFF:04x}"
+        self._counter = self._rng.getrandbits(_COUNTER_SEED_BITS)
+
+    def _after_fork(self) -> None:
+        """Diverge from the parent: fresh entropy and a fresh counter."""
+        self._lock = threading.Lock()  # another parent thread may have held it
+        self._rng.seed()
+        if self._last_ms >= 0:
+            # The parent continues this millisecond's counter; move past it.
+            self._start_millisecond(self._last_ms + 1)
+
+
+_forkable: weakref.WeakSet[MonotonicIdGenerator] = weakref.WeakSet()
+
+
+def _reseed_after_fork() -> None:
+    for generator in _forkable:
+        generator._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_after_fork)
+
+
+def id_timestamp(event_id: str) -> datetime:
+    """Return the creation time encoded in a UUIDv7 event ID.
+
+    Raises:
+        ValueError: If ``event_id`` is not a UUIDv7 string
+    """
+    h = event_id.replace("-", "")
+    if len(h) != 32 or h[12] != "7":
+        raise ValueError(f"Not a UUIDv7 event ID: {event_id}")
+    return datetime.fromtimestamp(int(h[:12], 16) / 1000, UTC)
+
+
+class TickClock:
+    """Clock that returns the time captured at the most recent tick.
+
+    Install one with ``event_stamps(now=clock.now)`` and call ``tick()``
+    once per command or event-loop iteration: every event created until
+    the next tick shares one timestamp instead of reading the clock.
+    """
+
+    def __init__(self, clock: Callable[[], datetime] = utc_now) -> None:
+        """Create a clock and take the first reading.
+
+        Args:
+            clock: The underlying clock read on each tick
+        """
+        self._clock = clock
+        self._now = clock()
+
+    def tick(self) -> datetime:
+        """Read the underlying clock and return the new time."""
+        self._now = self._clock()
+        return self._now
+
+    def now(self) -> datetime:
+        """Return the time of the last tick."""
+        return self._now
+
+
+_new_id: ContextVar[Callable[[], str]] = ContextVar("new_id", default=MonotonicIdGenerator())
+_now: ContextVar[Callable[[], datetime]] = ContextVar("now", default=utc_now)
+
+
+def new_event_id() -> str:
+    """Return an ID from the installed ID provider."""
+    return _new_id.get()()
+
+
+def event_now() -> datetime:
+    """Return the time from the installed clock."""
+    return _now.get()()
+
+
+@contextmanager
+def event_stamps(
+    *,
+    new_id: Callable[[], str] | None = None,
+    now: Callable[[], datetime] | None = None,
+) -> Iterator[None]:
+    """Install ID and clock providers for new events, restoring them on exit.
+
+    Providers are installed in the current context: they apply to the
+    calling task (or thread) and to tasks it creates inside the block,
+    not to tasks running concurrently.
+
+    Args:
+        new_id: Returns the ID for each new event
+        now: Returns the timestamp for each new event
+    """
+    id_token = None if new_id is None else _new_id.set(new_id)
+    now_token = None if now is None else _now.set(now)
+    try:
+        yield
+    finally:
+        if now_token is not None:
+            _now.reset(now_token)
+        if id_token is not None:
+            _new_id.reset(id_token)
@@ -1,10 +1,12 @@
 """Player domain model."""
 
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import datetime
 
+from slop.domain.compact import intern_id, intern_optional_id, utc_now, with_shared_utc
 
-@dataclass
+
+@dataclass(slots=True)
 class Player:
     """Represents a player in the game.
 
@@ -16,11 +18,17 @@ class Player:
     socket_id: str
     team_id: str | None = None
     is_creator: bool = False
-    joined_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    joined_at: datetime = field(default_factory=utc_now)
+
+    def __post_init__(self) -> None:
+        """Share repeated ids and the UTC tzinfo with the rest of the game."""
+        self.id = intern_id(self.id)
+        self.team_id = intern_optional_id(self.team_id)
+        self.joined_at = with_shared_utc(self.joined_at)
 
     def assign_to_team(self, team_id: str) -> None:
         """Assign player to a team."""
-        self.team_id = team_id
+        self.team_id = intern_id(team_id)
 
     def remove_from_team(self) -> None:
         """Remove player from their current team."""
@@ -0,0 +1,432 @@
+"""Event-sourced projection of a Game.
+
+Turns a stream of domain events into a ``Game`` by applying each event
+incrementally. Handlers are looked up in a table keyed by ``event_type``,
+so applying an event costs one dict lookup plus the handler itself.
+
+A projection can start from scratch (the first event must be
+``GameCreated``) or resume from a snapshot plus the events that follow it.
+A round only becomes part of the ``Game`` once its script exists, so a
+snapshot taken mid-round lacks the started round and its prompt.
+``resume`` recovers them from the events up to ``after_event_id``; a
+projection given only a snapshot and the events after it must start from
+a checkpoint snapshot (one taken at ``RoundCompleted``), and rejects
+events of a round started before the snapshot.
+"""
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from slop.domain.events import (
+    GameCompleted,
+    GameCreated,
+    GameEvent,
+    GuessAccepted,
+    GuessSubmitted,
+    PersonalityAssigned,
+    PersonalityGuessSubmitted,
+    PlayerJoined,
+    PlayerJoinedTeam,
+    PlayerLeft,
+    PromptSubmitted,
+    RoleAssigned,
+    RoundCompleted,
+    RoundStarted,
+    ScoresUpdated,
+    ScriptGenerated,
+    ScriptStreamed,
+    TeamFormed,
+)
+from slop.domain.game import ContentTone, Game, GameSettings, GameStatus
+from slop.domain.player import Player
+from slop.domain.round import Guess, Round
+from slop.domain.script import Role, Script
+from slop.domain.team import Team
+
+
+@dataclass
+class _PendingRound:
+    """A started round that has no script yet, so no Round object."""
+
+    round_id: str
+    round_number: int
+    acting_team_id: str
+    started_at: datetime
+    prompt: str = ""
+    submitted_by: str = ""
+
+
+_Handler = Callable[["GameProjection", Any], None]
+_HANDLERS: dict[str, _Handler] = {}
+
+
+def _handles[E: GameEvent](
+    event_class: type[E],
+) -> Callable[[Callable[["GameProjection", E], None]], Callable[["GameProjection", E], None]]:
+    """Register a projection handler for an event class."""
+
+    def register(
+        handler: Callable[["GameProjection", E], None],
+    ) -> Callable[["GameProjection", E], None]:
+        _HANDLERS[event_class.model_fields["event_type"].default] = handler
+        return handler
+
+    return register
+
+
+class GameProjection:
+    """Builds and incrementally updates a Game from its events."""
+
+    def __init__(self, game: Game | None = None, *, last_event_id: str | None = None) -> None:
+        """Create a projection, optionally starting from a snapshot.
+
+        Args:
+            game: Snapshot to continue from, or None to start from GameCreated
+            last_event_id: ID of the last event reflected in the snapshot
+        """
+        self._game = game
+        self._pending: _PendingRound | None = None
+        self._from_snapshot = game is not None
+        self.last_event_id = last_event_id
+        self.event_count = 0
+
+    @property
+    def game(self) -> Game:
+        """The projected game.
+
+        Raises:
+            ValueError: If no GameCreated event has been applied
+        """
+        if self._game is None:
+            raise ValueError("Game has not been created")
+        return self._game
+
+    @property
+    def has_game(self) -> bool:
+        """Whether a game exists yet (from a snapshot or GameCreated)."""
+        return self._game is not None
+
+    @property
+    def pending_round(self) -> int | None:
+        """Number of a started round that has no script yet, if any."""
+        return self._pending.round_number if self._pending else None
+
+    @classmethod
+    def replay(cls, events: Iterable[GameEvent]) -> Game:
+        """Build a game from its complete event stream.
+
+        Args:
+            events: All events of the game, starting with GameCreated
+
+        Returns:
+            The projected game
+        """
+        projection = cls()
+        projection.apply_all(events)
+        return projection.game
+
+    @classmethod
+    def resume(
+        cls,
+        snapshot: Game,
+        events: Iterable[GameEvent],
+        *,
+        after_event_id: str | None = None,
+    ) -> "GameProjection":
+        """Continue from a snapshot by applying the events that follow it.
+
+        Args:
+            snapshot: Game state as of ``after_event_id``
+            events: Events of the game; if ``after_event_id`` is given, every
+                event up to and including it is skipped (but a round still
+                in progress at that point is recovered from them)
+            after_event_id: ID of the last event reflected in the snapshot;
+                without it the snapshot must be a checkpoint snapshot
+
+        Returns:
+            A projection positioned after the last applied event; the
+            snapshot is updated in place
+
+        Raises:
+            ValueError: If ``after_event_id`` does not appear in ``events``
+        """
+        projection = cls(snapshot, last_event_id=after_event_id)
+        remaining = list(events)
+        if after_event_id is not None:
+            for index, event in enumerate(remaining):
+                if event.event_id == after_event_id:
+                    projection._pending = _pending_after(remaining[: index + 1])
+                    remaining = remaining[index + 1 :]
+                    break
+            else:
+                raise ValueError(f"Event {after_event_id} not found")
+        projection.apply_all(remaining)
+        return projection
+
+    def apply(self, event: GameEvent) -> None:
+        """Apply a single event.
+
+        Args:
+            event: The next event of this game
+
+        Raises:
+            ValueError: If the event is unknown, belongs to another game, or
+                is inconsistent with the current state
+        """
+        handler = _HANDLERS.get(event.event_type)
+        if handler is None:
+            raise ValueError(f"No projection for event type {event.event_type}")
+        if self._game is not None and event.game_id != self._game.id:
+            raise ValueError(f"Event {event.event_id} belongs to game {event.game_id}")
+        handler(self, event)
+        self.last_event_id = event.event_id
+        self.event_count += 1
+
+    def apply_all(self, events: Iterable[GameEvent]) -> None:
+        """Apply events in order."""
+        for event in events:
+            self.apply(event)
+
+    def _round(self, round_number: int) -> Round:
+        for round_obj in reversed(self.game.rounds):
+            if round_obj.round_number == round_number:
+                return round_obj
+        raise ValueError(f"Round {round_number} not found")
+
+    def _pending_round(self, round_number: int) -> _PendingRound:
+        pending = self._pending
+        if pending is None or pending.round_number != round_number:
+            if self._from_snapshot:
+                raise ValueError(
+                    f"Round {round_number} has not been started; if it started before "
+                    "the snapshot, resume from a checkpoint snapshot or pass after_event_id"
+                )
+            raise ValueError(f"Round {round_number} has not been started")
+        return pending
+
+
+def _pending_after(events: list[GameEvent]) -> _PendingRound | None:
+    """Return the round left without a script at the end of ``events``, if any.
+
+    Scans backwards, so only the events of the last round are looked at.
+    """
+    prompt: PromptSubmitted | None = None
+    for event in reversed(events):
+        if isinstance(event, ScriptGenerated | RoundCompleted | GameCompleted):
+            return None
+        if isinstance(event, PromptSubmitted):
+            prompt = prompt if prompt is not None else event
+        elif isinstance(event, RoundStarted):
+            pending = _PendingRound(
+                round_id=event.event_id,
+                round_number=event.round_number,
+                acting_team_id=event.acting_team_id,
+                started_at=event.timestamp,
+            )
+            if prompt is not None and prompt.round_number == event.round_number:
+                pending.prompt = prompt.prompt
+                pending.submitted_by = prompt.submitted_by
+            return pending
+    return None
+
+
+@_handles(GameCreated)
+def _game_created(projection: GameProjection, event: GameCreated) -> None:
+    if projection.has_game:
+        raise ValueError("Game has already been created")
+    settings = GameSettings(
+        rounds_per_team=event.rounds_per_team,
+        max_players=event.max_players,
+        content_tone=ContentTone(event.content_tone),
+    )
+    projection._game = Game(
+        id=event.game_id,
+        room_code=event.room_code,
+        settings=settings,
+        created_at=event.timestamp,
+    )
+
+
+@_handles(PlayerJoined)
+def _player_joined(projection: GameProjection, event: PlayerJoined) -> None:
+    game = projection.game
+    try:
+        game.get_player(event.player_id).update_socket_id(event.socket_id)
+    except ValueError:
+        game.add_player(
+            Player(
+                id=event.player_id,
+                name=event.player_name,
+                socket_id=event.socket_id,
+                joined_at=event.timestamp,
+            )
+        )
+
+
+@_handles(PlayerLeft)
+def _player_left(projection: GameProjection, event: PlayerLeft) -> None:
+    game = projection.game
+    player = game.get_player(event.player_id)
+    if player.team_id is not None:
+        game.get_team(player.team_id).remove_player(player.id)
+    game.remove_player(player.id)
+
+
+@_handles(TeamFormed)
+def _team_formed(projection: GameProjection, event: TeamFormed) -> None:
+    game = projection.game
+    game.add_team(
+        Team(
+            id=event.team_id,
+            name=event.team_name,
+            color=event.color,
+            max_players=game.settings.max_players_per_team,
+        )
+    )
+
+
+@_handles(PlayerJoinedTeam)
+def _player_joined_team(projection: GameProjection, event: PlayerJoinedTeam) -> None:
+    game = projection.game
+    player = game.get_player(event.player_id)
+    if player.team_id is not None:
+        game.get_team(player.team_id).remove_player(player.id)
+    game.get_team(event.team_id).add_player(player.id)
+    player.assign_to_team(event.team_id)
+
+
+@_handles(PersonalityAssigned)
+def _personality_assigned(projection: GameProjection, event: PersonalityAssigned) -> None:
+    game = projection.game
+    game.get_team(event.team_id).assign_personality(event.personality_id, event.assigned_by_team_id)
+    if game.status == GameStatus.LOBBY:
+        game.set_personality_selection_phase()
+
+
+@_handles(RoundStarted)
+def _round_started(projection: GameProjection, event: RoundStarted) -> None:
+    game = projection.game
+    game.status = GameStatus.PLAYING
+    game.current_round = event.round_number
+    projection._pending = _PendingRound(
+        round_id=event.event_id,
+        round_number=event.round_number,
+        acting_team_id=event.acting_team_id,
+        started_at=event.timestamp,
+    )
+
+
+@_handles(PromptSubmitted)
+def _prompt_submitted(projection: GameProjection, event: PromptSubmitted) -> None:
+    pending = projection._pending_round(event.round_number)
+    pending.prompt = event.prompt
+    pending.submitted_by = event.submitted_by
+
+
+@_handles(ScriptGenerated)
+def _script_generated(projection: GameProjection, event: ScriptGenerated) -> None:
+    pending = projection._pending_round(event.round_number)
+    script = Script(
+        content=event.script_content,
+        roles=[
+            Role(
+                name=role["name"],
+                description=role.get("description", ""),
+                lines=list(role.get("lines", [])),
+            )
+            for role in event.roles
+        ],
+        personality=event.personality_id,
+        estimated_duration=event.estimated_duration,
+        word_count=event.word_count,
+        generated_at=event.timestamp,
+    )
+    projection.game.rounds.append(
+        Round(
+            id=pending.round_id,
+            round_number=pending.round_number,
+            acting_team_id=pending.acting_team_id,
+            prompt=pending.prompt,
+            submitted_by=pending.submitted_by,
+            script=script,
+            role_assignments={},
+            timestamp=pending.started_at,
+        )
+    )
+    projection._pending = None
+
+
+@_handles(ScriptStreamed)
+def _script_streamed(projection: GameProjection, event: ScriptStreamed) -> None:
+    # Progress for the acting team only; the state comes from ScriptGenerated.
+    pass
+
+
+@_handles(RoleAssigned)
+def _role_assigned(projection: GameProjection, event: RoleAssigned) -> None:
+    round_obj = projection._round(event.round_number)
+    for index, role in enumerate(round_obj.script.roles):
+        if role.name == event.role_name:
+            round_obj.role_assignments[event.player_id] = index
+            return
+    raise ValueError(f"Role {event.role_name} not in round {event.round_number} script")
+
+
+@_handles(GuessSubmitted)
+def _guess_submitted(projection: GameProjection, event: GuessSubmitted) -> None:
+    round_obj = projection._round(event.round_number)
+    round_obj.add_guess(
+        Guess(team_id=event.team_id, guess=event.guess, timestamp=event.timestamp.timestamp())
+    )
+
+
+@_handles(GuessAccepted)
+def _guess_accepted(projection: GameProjection, event: GuessAccepted) -> None:
+    round_obj = projection._round(event.round_number)
+    for guess in reversed(round_obj.prompt_guesses):
+        if guess.team_id == event.team_id:
+            guess.accept()
+            break
+    round_obj.set_prompt_winner(event.team_id)
+
+
+@_handles(PersonalityGuessSubmitted)
+def _personality_guess_submitted(
+    projection: GameProjection, event: PersonalityGuessSubmitted
+) -> None:
+    round_obj = projection._round(event.round_number)
+    round_obj.set_personality_guess(event.personality_guess)
+    round_obj.check_personality_guess()
+
+
+@_handles(ScoresUpdated)
+def _scores_updated(projection: GameProjection, event: ScoresUpdated) -> None:
+    game = projection.game
+    round_obj = projection._round(event.round_number)
+    for team_id, points in event.score_changes.items():
+        round_obj.add_score_to_team(team_id, points)
+        game.get_team(team_id).add_score(points)
+
+
+@_handles(RoundCompleted)
+def _round_completed(projection: GameProjection, event: RoundCompleted) -> None:
+    game = projection.game
+    for team_id, total in event.final_scores.items():
+        game.get_team(team_id).score = total
+    game.current_round = event.round_number + 1
+    projection._pending = None
+
+
+@_handles(GameCompleted)
+def _game_completed(projection: GameProjection, event: GameCompleted) -> None:
+    game = projection.game
+    for team_id, total in event.final_scores.items():
+        game.get_team(team_id).score = total
+    game.finish()
+
+
+def handled_event_types() -> frozenset[str]:
+    """Event types the projection knows how to apply."""
+    return frozenset(_HANDLERS)
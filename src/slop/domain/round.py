@@ -1,12 +1,19 @@
 """Round and Guess domain models."""
 
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
-
+from datetime import datetime
+
+from slop.domain.compact import (
+    intern_id,
+    intern_keys,
+    intern_optional_id,
+    utc_now,
+    with_shared_utc,
+)
 from slop.domain.script import Role, Script
 
 
-@dataclass
+@dataclass(slots=True)
 class RoleAssignment:
     """Represents the assignment of a role to a player in a round.
 
@@ -17,8 +24,12 @@ class RoleAssignment:
     role_name: str
     character_description: str
 
+    def __post_init__(self) -> None:
+        """Share the player id with the rest of the game."""
+        self.player_id = intern_id(self.player_id)
+
 
-@dataclass
+@dataclass(slots=True)
 class Guess:
     """Represents a team's guess for the original prompt.
 
@@ -31,12 +42,16 @@ class Guess:
     timestamp: float
     accepted: bool = False
 
+    def __post_init__(self) -> None:
+        """Share the team id with the rest of the game."""
+        self.team_id = intern_id(self.team_id)
+
     def accept(self) -> None:
         """Mark this guess as accepted by the acting team."""
         self.accepted = True
 
 
-@dataclass
+@dataclass(slots=True)
 class Round:
     """Represents a single round of gameplay.
 
@@ -57,7 +72,16 @@ class Round:
     personality_guess: str | None = None
     personality_correct: bool = False
     round_score: dict[str, int] = field(default_factory=dict)  # team_id -> points
-    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = field(default_factory=utc_now)
+
+    def __post_init__(self) -> None:
+        """Share repeated ids and the UTC tzinfo with the rest of the game."""
+        self.acting_team_id = intern_id(self.acting_team_id)
+        self.submitted_by = intern_id(self.submitted_by)
+        intern_keys(self.role_assignments)
+        intern_keys(self.round_score)
+        self.prompt_winner_team_id = intern_optional_id(self.prompt_winner_team_id)
+        self.timestamp = with_shared_utc(self.timestamp)
 
     def add_guess(self, guess: Guess) -> None:
         """Add a prompt guess from a team."""
@@ -65,7 +89,7 @@ class Round:
 
     def set_prompt_winner(self, team_id: str) -> None:
         """Set which team won by guessing the prompt correctly."""
-        self.prompt_winner_team_id = team_id
+        self.prompt_winner_team_id = intern_id(team_id)
 
     def set_personality_guess(self, personality_id: str) -> None:
         """Set the acting team's guess for the AI personality."""
@@ -81,7 +105,7 @@ class Round:
     def add_score_to_team(self, team_id: str, points: int) -> None:
         """Add points to a specific team's score for this round."""
         if team_id not in self.round_score:
-            self.round_score[team_id] = 0
+            self.round_score[intern_id(team_id)] = 0
         self.round_score[team_id] += points
 
     def get_role_for_player(self, player_id: str) -> Role:
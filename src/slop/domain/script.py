@@ -1,10 +1,12 @@
 """Script and Role domain models."""
 
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import datetime
 
+from slop.domain.compact import utc_now, with_shared_utc
 
-@dataclass
+
+@dataclass(slots=True)
 class Role:
     """Represents a character role in a script.
 
@@ -16,7 +18,7 @@ class Role:
     lines: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Script:
     """Represents an AI-generated script for a performance.
 
@@ -29,12 +31,13 @@ class Script:
     personality: str
     estimated_duration: int = 0
     word_count: int = 0
-    generated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    generated_at: datetime = field(default_factory=utc_now)
 
     def __post_init__(self) -> None:
         """Validate and calculate derived fields after initialization."""
         if not self.roles:
             raise ValueError("Script must have at least one role")
+        self.generated_at = with_shared_utc(self.generated_at)
 
         # Auto-calculate word count if not provided
         if self.word_count == 0:
@@ -46,6 +49,17 @@ class Script:
             words_per_second = 150 / 60  # ~2.5 words per second
             self.estimated_duration = int(self.word_count / words_per_second)
 
+    def copy(self) -> "Script":
+        """Return a copy whose roles and lines can be changed independently."""
+        return Script(
+            content=self.content,
+            roles=[Role(role.name, role.description, list(role.lines)) for role in self.roles],
+            personality=self.personality,
+            estimated_duration=self.estimated_duration,
+            word_count=self.word_count,
+            generated_at=self.generated_at,
+        )
+
     def get_role_count(self) -> int:
         """Get the number of roles in this script."""
         return len(self.roles)
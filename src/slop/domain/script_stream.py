@@ -0,0 +1,145 @@
+"""Incremental parser for scripts streamed from an LLM.
+
+Providers are asked for scripts in a line-oriented text format, so that a
+script can be parsed while it is still being generated::
+
+    ROLE: Detective Sam | A weary private eye
+    ROLE: The Curator | Nervous and hiding something
+
+    DETECTIVE SAM: Nobody steals a Monet on my watch.
+    (The curator drops a paintbrush.)
+    THE CURATOR: I was just... dusting it.
+
+``ROLE:`` lines declare the cast, with an optional description after ``|``.
+Any other line is part of the script body; a body line starting with a
+declared role's name (in any case) followed by a colon is also a line of
+dialogue for that role. ``ScriptStreamParser`` accepts the text in
+arbitrary chunks and reports each role and line as soon as the newline
+ending it arrives.
+"""
+
+from dataclasses import dataclass
+
+from slop.domain.script import Role, Script
+
+_ROLE_PREFIX = "ROLE:"
+
+
+@dataclass(frozen=True, slots=True)
+class RoleParsed:
+    """A role declaration has been parsed.
+
+    Attributes:
+        index: Position of the role in the script
+        name: The character's name
+        description: The character's description (may be empty)
+    """
+
+    index: int
+    name: str
+    description: str
+
+
+@dataclass(frozen=True, slots=True)
+class LineParsed:
+    """A line of dialogue has been parsed.
+
+    Attributes:
+        role_index: Position of the speaking role
+        text: The line, without the speaker's name
+    """
+
+    role_index: int
+    text: str
+
+
+type ScriptUpdate = RoleParsed | LineParsed
+
+
+class ScriptStreamParser:
+    """Turns streamed script text into roles and lines as it arrives."""
+
+    def __init__(self) -> None:
+        """Create a parser with no input yet."""
+        self._pending = ""
+        self._body: list[str] = []
+        self._roles: list[Role] = []
+        self._role_index: dict[str, int] = {}  # casefolded name -> index
+        self._finished = False
+
+    @property
+    def roles(self) -> list[Role]:
+        """Roles parsed so far, with their lines so far."""
+        return self._roles
+
+    @property
+    def content(self) -> str:
+        """Script body parsed so far, without the role declarations."""
+        return "\n".join(self._body).strip()
+
+    def feed(self, chunk: str) -> list[ScriptUpdate]:
+        """Parse the complete lines a chunk finishes.
+
+        Args:
+            chunk: The next piece of streamed text
+
+        Returns:
+            Roles and lines completed by this chunk, in order
+
+        Raises:
+            ValueError: If the parser has already been finished
+        """
+        if self._finished:
+            raise ValueError("Parser is already finished")
+        if "\n" not in chunk:
+            self._pending += chunk
+            return []
+        *lines, self._pending = (self._pending + chunk).split("\n")
+        updates: list[ScriptUpdate] = []
+        for line in lines:
+            self._parse_line(line, updates)
+        return updates
+
+    def finish(self) -> list[ScriptUpdate]:
+        """Parse any final line left without a trailing newline."""
+        updates: list[ScriptUpdate] = []
+        if not self._finished:
+            self._finished = True
+            if self._pending:
+                self._parse_line(self._pending, updates)
+                self._pending = ""
+        return updates
+
+    def to_script(self, personality: str) -> Script:
+        """Build the complete script once the stream has ended.
+
+        Args:
+            personality: ID of the personality that generated the script
+
+        Raises:
+            ValueError: If the stream declared no roles
+        """
+        self.finish()
+        return Script(content=self.content, roles=self._roles, personality=personality)
+
+    def _parse_line(self, line: str, updates: list[ScriptUpdate]) -> None:
+        stripped = line.strip()
+        if stripped[: len(_ROLE_PREFIX)].upper() == _ROLE_PREFIX:
+            name, _, description = stripped[len(_ROLE_PREFIX) :].partition("|")
+            name = name.strip()
+            if name and name.casefold() not in self._role_index:
+                index = len(self._roles)
+                self._role_index[name.casefold()] = index
+                self._roles.append(Role(name=name, description=description.strip()))
+                updates.append(RoleParsed(index, name, description.strip()))
+            return
+
+        self._body.append(line.rstrip())
+        speaker, colon, text = stripped.partition(":")
+        if not colon:
+            return
+        role_index = self._role_index.get(speaker.strip().casefold())
+        text = text.strip()
+        if role_index is not None and text:
+            self._roles[role_index].lines.append(text)
+            updates.append(LineParsed(role_index, text))
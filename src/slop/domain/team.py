@@ -2,13 +2,34 @@
 
 from dataclasses import dataclass, field
 
+from slop.domain.compact import intern_id, intern_ids, intern_optional_id
+from slop.domain.tracked import DerivedIndex, TrackedList
 
-@dataclass
-class Team:
+
+class _MemberIndex:
+    """Team's membership set, kept in a slot so it is not a serialized field."""
+
+    __slots__ = ("_members",)
+
+    _members: DerivedIndex[str, set[str]]
+
+    def _member_set(self, player_ids: TrackedList[str]) -> set[str]:
+        # Copies and unpickled teams restore only the dataclass fields.
+        try:
+            members = self._members
+        except AttributeError:
+            members = self._members = DerivedIndex(set)
+        return members.get(player_ids)
+
+
+@dataclass(slots=True)
+class Team(_MemberIndex):
     """Represents a team in the game.
 
     Teams consist of players and compete to score points.
     Each team gets an AI personality assigned by another team.
+    ``player_ids`` is a change-counting list, so the membership set used
+    for lookups is rebuilt after direct edits.
     """
 
     id: str
@@ -20,6 +41,18 @@ class Team:
     personality_assigned_by: str | None = None
     max_players: int = 3
 
+    def __post_init__(self) -> None:
+        """Intern ids and index the initial members for O(1) membership checks."""
+        self.id = intern_id(self.id)
+        self.player_ids = TrackedList(intern_ids(self.player_ids))
+        self.personality_assigned_by = intern_optional_id(self.personality_assigned_by)
+        self._member_set(self.player_ids)
+
+    def _tracked_ids(self) -> TrackedList[str]:
+        if not isinstance(self.player_ids, TrackedList):  # a new list was assigned
+            self.player_ids = TrackedList(self.player_ids)
+        return self.player_ids
+
     def add_player(self, player_id: str) -> None:
         """Add a player to the team.
 
@@ -28,7 +61,12 @@ class Team:
         """
         if self.is_full():
             raise ValueError(f"Team is full (max {self.max_players} players)")
-        self.player_ids.append(player_id)
+        player_id = intern_id(player_id)
+        player_ids = self._tracked_ids()
+        members = self._member_set(player_ids)
+        player_ids.append(player_id)
+        members.add(player_id)
+        self._members.synced(player_ids)
 
     def remove_player(self, player_id: str) -> None:
         """Remove a player from the team.
@@ -36,9 +74,15 @@ class Team:
         Raises:
             ValueError: If player is not on the team.
         """
-        if player_id not in self.player_ids:
+        player_ids = self._tracked_ids()
+        members = self._member_set(player_ids)
+        if player_id not in members:
             raise ValueError(f"Player {player_id} not on team")
-        self.player_ids.remove(player_id)
+        has_duplicates = len(members) != len(player_ids)  # the set is current here
+        player_ids.remove(player_id)
+        if not has_duplicates or player_id not in player_ids:
+            members.discard(player_id)
+        self._members.synced(player_ids)
 
     def add_score(self, points: int) -> None:
         """Add points to team's total score."""
@@ -52,7 +96,7 @@ class Team:
             assigned_by: The team ID that assigned this personality
         """
         self.assigned_personality = personality_id
-        self.personality_assigned_by = assigned_by
+        self.personality_assigned_by = intern_id(assigned_by)
 
     def is_full(self) -> bool:
         """Check if team is at maximum capacity."""
@@ -0,0 +1,115 @@
+"""Lists that count their changes, and indexes derived from them.
+
+``Game`` and ``Team`` expose their players, teams and member ids as plain
+public lists but look them up through id-keyed indexes. A ``TrackedList``
+bumps its ``version`` on every change, so a ``DerivedIndex`` can tell
+exactly when it is stale, whether the list was changed through the model's
+methods or edited directly (appends, in-place replacement, sorting...).
+"""
+
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, SupportsIndex
+
+
+class TrackedList[T](list[T]):
+    """A list whose ``version`` changes whenever its contents do."""
+
+    __slots__ = ("version",)
+
+    def __init__(self, items: Iterable[T] = ()) -> None:
+        """Create a list holding ``items``."""
+        super().__init__(items)
+        self.version = 0
+
+    def __reduce__(self) -> tuple[type["TrackedList[T]"], tuple[list[T]]]:
+        """Pickle as the class plus its items; the version starts afresh."""
+        return type(self), (list(self),)
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        """Replace an item or slice."""
+        super().__setitem__(index, value)
+        self.version += 1
+
+    def __delitem__(self, index: SupportsIndex | slice) -> None:
+        """Delete an item or slice."""
+        super().__delitem__(index)
+        self.version += 1
+
+    def __iadd__(self, items: Iterable[T]) -> "TrackedList[T]":  # type: ignore[override, misc]
+        """Extend the list in place."""
+        super().__iadd__(items)
+        self.version += 1
+        return self
+
+    def __imul__(self, count: SupportsIndex) -> "TrackedList[T]":
+        """Repeat the list in place."""
+        super().__imul__(count)
+        self.version += 1
+        return self
+
+    def append(self, item: T) -> None:
+        """Append an item."""
+        super().append(item)
+        self.version += 1
+
+    def extend(self, items: Iterable[T]) -> None:
+        """Append several items."""
+        super().extend(items)
+        self.version += 1
+
+    def insert(self, index: SupportsIndex, item: T) -> None:
+        """Insert an item before ``index``."""
+        super().insert(index, item)
+        self.version += 1
+
+    def pop(self, index: SupportsIndex = -1) -> T:
+        """Remove and return an item."""
+        item = super().pop(index)
+        self.version += 1
+        return item
+
+    def remove(self, item: T) -> None:
+        """Remove the first item equal to ``item``."""
+        super().remove(item)
+        self.version += 1
+
+    def clear(self) -> None:
+        """Remove every item."""
+        super().clear()
+        self.version += 1
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        """Sort the list in place."""
+        super().sort(*args, **kwargs)
+        self.version += 1
+
+    def reverse(self) -> None:
+        """Reverse the list in place."""
+        super().reverse()
+        self.version += 1
+
+
+class DerivedIndex[T, I]:
+    """A structure built from a ``TrackedList`` and rebuilt when the list changes."""
+
+    __slots__ = ("_build", "_index", "_source", "_version")
+
+    def __init__(self, build: Callable[[Sequence[T]], I]) -> None:
+        """Create an index that ``build`` computes from the list's items."""
+        self._build = build
+        self._source: TrackedList[T] | None = None
+        self._version = -1
+        self._index: I | None = None
+
+    def get(self, items: TrackedList[T]) -> I:
+        """Return the index of ``items``, rebuilding it if the list changed."""
+        if items is not self._source or items.version != self._version:
+            self._index = self._build(items)
+            self._source = items
+            self._version = items.version
+        assert self._index is not None
+        return self._index
+
+    def synced(self, items: TrackedList[T]) -> None:
+        """Mark the index current after applying the list's latest change to it."""
+        self._version = items.version
@@ -3,12 +3,15 @@
 Ports define contracts between the domain and external systems.
 """
 
-from slop.ports.llm import LLMPort
+from slop.ports.llm import LLMError, LLMPort, StreamingLLMPort
 from slop.ports.realtime import RealtimePort
-from slop.ports.storage import StoragePort
+from slop.ports.storage import Checkpoint, StoragePort
 
 __all__ = [
+    "Checkpoint",
+    "LLMError",
     "LLMPort",
     "RealtimePort",
     "StoragePort",
+    "StreamingLLMPort",
 ]
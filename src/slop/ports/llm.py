@@ -4,12 +4,18 @@ This port defines the contract for AI language model providers
 that generate scripts based on prompts and personalities.
 """
 
+from collections.abc import AsyncIterator
 from typing import Protocol
 
 from slop.domain.ai_personality import AIPersonality
+from slop.domain.game import ContentTone
 from slop.domain.script import Script
 
 
+class LLMError(Exception):
+    """Raised when an LLM provider fails to produce a script."""
+
+
 class LLMPort(Protocol):
     """Interface for LLM providers that generate game scripts.
 
@@ -23,6 +29,8 @@ class LLMPort(Protocol):
         prompt: str,
         personality: AIPersonality,
         num_roles: int,
+        *,
+        tone: ContentTone = ContentTone.FAMILY,
     ) -> Script:
         """Generate a script based on the given prompt and parameters.
 
@@ -33,6 +41,7 @@ class LLMPort(Protocol):
             prompt: The 6-word user prompt to base the script on
             personality: The AI personality configuration to use
             num_roles: Number of character roles needed (matches team size)
+            tone: The game's content tone
 
         Returns:
             A Script object with roles, content, and metadata
@@ -41,3 +50,35 @@ class LLMPort(Protocol):
             LLMError: If script generation fails after retries
         """
         ...
+
+
+class StreamingLLMPort(LLMPort, Protocol):
+    """Interface for LLM providers that can stream a script as it is written.
+
+    The streamed text uses the line format parsed by
+    ``slop.domain.script_stream.ScriptStreamParser``.
+    """
+
+    def stream_script(
+        self,
+        prompt: str,
+        personality: AIPersonality,
+        num_roles: int,
+        *,
+        tone: ContentTone = ContentTone.FAMILY,
+    ) -> AsyncIterator[str]:
+        """Generate a script, yielding its text in chunks as they arrive.
+
+        Args:
+            prompt: The 6-word user prompt to base the script on
+            personality: The AI personality configuration to use
+            num_roles: Number of character roles needed (matches team size)
+            tone: The game's content tone
+
+        Returns:
+            An async iterator of text chunks, in order
+
+        Raises:
+            LLMError: If generation fails (possibly after some chunks)
+        """
+        ...
@@ -4,12 +4,25 @@ This port defines the contract for event sourcing persistence,
 including event log storage and materialized snapshots.
 """
 
+from dataclasses import dataclass
 from typing import Protocol
 
 from slop.domain.events import GameEvent
 from slop.domain.game import Game
 
 
+@dataclass(frozen=True)
+class Checkpoint:
+    """Game state as of a RoundCompleted event.
+
+    Events up to and including ``event_id`` have been compacted away;
+    the game is rebuilt from this state plus the events that follow.
+    """
+
+    game: Game
+    event_id: str
+
+
 class StoragePort(Protocol):
     """Interface for event sourcing storage.
 
@@ -29,9 +42,10 @@ class StoragePort(Protocol):
         ...
 
     async def get_events(self, game_id: str) -> list[GameEvent]:
-        """Retrieve all events for a game.
+        """Retrieve the events of a game since its latest checkpoint.
 
-        Used for event replay and crash recovery.
+        Used for event replay and crash recovery. Without a checkpoint,
+        this is every event of the game.
 
         Args:
             game_id: The game's unique identifier
@@ -41,6 +55,17 @@ class StoragePort(Protocol):
         """
         ...
 
+    async def get_checkpoint(self, game_id: str) -> Checkpoint | None:
+        """Retrieve the latest RoundCompleted checkpoint of a game.
+
+        Args:
+            game_id: The game's unique identifier
+
+        Returns:
+            The checkpoint if one has been written, None otherwise
+        """
+        ...
+
     async def save_snapshot(self, game: Game) -> None:
         """Save a materialized snapshot of current game state.
 
@@ -76,6 +101,17 @@ class StoragePort(Protocol):
         """
         ...
 
+    async def list_active_games(self) -> list[str]:
+        """List the games that still have stored state.
+
+        Completed games are deleted, so every game returned here was in
+        progress when the server stopped. Used for crash recovery.
+
+        Returns:
+            IDs of games with events or a snapshot
+        """
+        ...
+
     async def delete_game(self, game_id: str) -> None:
         """Delete a game and all its events.
 
@@ -0,0 +1 @@
+"""Adapter tests."""
@@ -0,0 +1 @@
+"""LLM adapter tests."""
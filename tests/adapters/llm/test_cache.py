@@ -0,0 +1,257 @@
+"""Tests for the caching LLM wrapper."""
+
+import dataclasses
+
+import pytest
+
+from slop.adapters.llm import CachingLLM, ScriptCacheKey, SQLiteScriptStore, StoredScript
+from slop.adapters.llm.cache import normalize_prompt
+from slop.domain import AIPersonality, ContentTone, Role, Script
+from slop.ports import LLMError
+
+NOIR = AIPersonality(id="noir", name="Noir", description="Hard-boiled", system_prompt="Be noir.")
+SITCOM = AIPersonality(id="sitcom", name="Sitcom", description="Laughs", system_prompt="Be funny.")
+
+
+class CountingLLM:
+    """Generates a trivial script and counts provider calls."""
+
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+
+    async def generate_script(self, prompt, personality, num_roles, *, tone=ContentTone.FAMILY):
+        """Return a script naming the request, or fail."""
+        self.calls += 1
+        if self.fail:
+            raise LLMError("provider down")
+        return Script(
+            content=f"{prompt} / {tone.value}",
+            roles=[Role(name=f"Role {i}", description="A role") for i in range(num_roles)],
+            personality=personality.id,
+        )
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        """Return the current fake time."""
+        return self.now
+
+
+def test_normalize_prompt():
+    """Test that case, punctuation, articles and conjunctions do not affect the key."""
+    assert normalize_prompt("The Detective solves an ART heist!") == "detective solves art heist"
+    assert normalize_prompt("detective, solves art-heist") == "detective solves art heist"
+
+
+def test_prompts_with_different_meanings_get_different_keys():
+    """Test that possessives, demonstratives and prepositions stay in the key."""
+    prompts = [
+        "her revenge on his boss",
+        "his revenge on her boss",
+        "this heist at my museum",
+        "that heist in your museum",
+    ]
+
+    keys = {ScriptCacheKey.for_request(p, NOIR, 3, ContentTone.FAMILY) for p in prompts}
+
+    assert len(keys) == len(prompts)
+
+
+@pytest.mark.asyncio
+async def test_similar_prompts_share_an_entry():
+    """Test that normalized-equal prompts are generated once."""
+    llm = CountingLLM()
+    cache = CachingLLM(llm)
+
+    first = await cache.generate_script("A detective solves the art heist", NOIR, 3)
+    second = await cache.generate_script("detective solves art heist!!", NOIR, 3)
+
+    assert llm.calls == 1
+    assert second == first
+    assert second is not first
+    assert cache.stats.hits == 1
+    assert cache.stats.hit_rate == 0.5
+
+
+@pytest.mark.asyncio
+async def test_key_includes_personality_roles_and_tone():
+    """Test that personality, role count and tone each get their own entry."""
+    llm = CountingLLM()
+    cache = CachingLLM(llm)
+
+    await cache.generate_script("heist", NOIR, 3)
+    await cache.generate_script("heist", SITCOM, 3)
+    await cache.generate_script("heist", NOIR, 2)
+    await cache.generate_script("heist", NOIR, 3, tone=ContentTone.ADULT)
+
+    assert llm.calls == 4
+    assert cache.stats.entries == 4
+
+
+@pytest.mark.asyncio
+async def test_editing_a_personality_prompt_retires_its_scripts():
+    """Test that a changed system prompt does not serve scripts cached under the old one."""
+    llm = CountingLLM()
+    cache = CachingLLM(llm)
+    edited = dataclasses.replace(NOIR, system_prompt="Be very noir.")
+
+    await cache.generate_script("heist", NOIR, 3)
+    await cache.generate_script("heist", edited, 3)
+    await cache.generate_script("heist", edited, 3)
+
+    assert llm.calls == 2
+    assert cache.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_script_cannot_be_changed_by_callers():
+    """Test that mutating a returned script does not affect later hits."""
+    cache = CachingLLM(CountingLLM())
+    script = await cache.generate_script("heist", NOIR, 1)
+
+    script.roles[0].lines.append("Improvised line")
+
+    assert (await cache.generate_script("heist", NOIR, 1)).roles[0].lines == []
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl():
+    """Test that an expired entry is regenerated."""
+    llm = CountingLLM()
+    clock = FakeClock()
+    cache = CachingLLM(llm, ttl=60, clock=clock)
+
+    await cache.generate_script("heist", NOIR, 3)
+    clock.now = 59
+    await cache.generate_script("heist", NOIR, 3)
+    clock.now = 61
+    await cache.generate_script("heist", NOIR, 3)
+
+    assert llm.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction():
+    """Test that the least recently used script is evicted first."""
+    llm = CountingLLM()
+    cache = CachingLLM(llm, max_entries=2)
+
+    await cache.generate_script("one", NOIR, 3)
+    await cache.generate_script("two", NOIR, 3)
+    await cache.generate_script("one", NOIR, 3)
+    await cache.generate_script("three", NOIR, 3)
+    await cache.generate_script("one", NOIR, 3)
+
+    assert llm.calls == 3
+    assert cache.stats.evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached():
+    """Test that a failed generation is retried on the next call."""
+    llm = CountingLLM(fail=True)
+    cache = CachingLLM(llm)
+
+    for _ in range(2):
+        with pytest.raises(LLMError):
+            await cache.generate_script("heist", NOIR, 3)
+
+    assert llm.calls == 2
+    assert cache.stats.entries == 0
+
+
+@pytest.mark.asyncio
+async def test_persistent_tier_survives_memory_loss(tmp_path):
+    """Test that a new cache is warmed from the persistent store."""
+    llm = CountingLLM()
+    store = SQLiteScriptStore(tmp_path / "scripts.db")
+    try:
+        await CachingLLM(llm, store=store).generate_script("heist", NOIR, 3)
+        cache = CachingLLM(llm, store=store)
+
+        script = await cache.generate_script("The heist", NOIR, 3)
+        await cache.generate_script("heist", NOIR, 3)
+    finally:
+        store.close()
+
+    assert llm.calls == 1
+    assert script.personality == "noir"
+    assert (cache.stats.store_hits, cache.stats.hits) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_persistent_entries_expire(tmp_path):
+    """Test that the store does not return expired scripts."""
+    clock = FakeClock()
+    store = SQLiteScriptStore(tmp_path / "scripts.db", clock=clock)
+    key = ScriptCacheKey.for_request("heist", NOIR, 3, ContentTone.FAMILY).as_string()
+    script = await CountingLLM().generate_script("heist", NOIR, 3)
+    try:
+        await store.put(key, script, ttl=10)
+        clock.now = 4
+        assert await store.get(key) == StoredScript(script, expires_in=6)
+        clock.now = 11
+        assert await store.get(key) is None
+    finally:
+        store.close()
+
+
+class BrokenStore:
+    """Script store whose reads and writes always fail."""
+
+    async def get(self, key):
+        """Fail to read."""
+        raise OSError("disk gone")
+
+    async def put(self, key, script, ttl):
+        """Fail to write."""
+        raise OSError("disk gone")
+
+
+@pytest.mark.asyncio
+async def test_store_failures_fall_back_to_the_provider(caplog):
+    """Test that a failing store neither fails requests nor loses generated scripts."""
+    llm = CountingLLM()
+    cache = CachingLLM(llm, store=BrokenStore())
+
+    first = await cache.generate_script("heist", NOIR, 3)
+    second = await cache.generate_script("heist", NOIR, 3)
+
+    assert first == second
+    assert llm.calls == 1
+    assert cache.stats.store_errors == 2
+    assert "Script store" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_store_hit_keeps_the_stored_expiry(tmp_path):
+    """Test that a script loaded from the store expires when its stored entry does."""
+    llm = CountingLLM()
+    wall, clock = FakeClock(), FakeClock()
+    store = SQLiteScriptStore(tmp_path / "scripts.db", clock=wall)
+    try:
+        await CachingLLM(llm, ttl=10, store=store, clock=clock).generate_script("heist", NOIR, 3)
+        wall.now = clock.now = 8
+        cache = CachingLLM(llm, ttl=10, store=store, clock=clock)
+        await cache.generate_script("heist", NOIR, 3)
+        wall.now = clock.now = 11
+        await cache.generate_script("heist", NOIR, 3)
+    finally:
+        store.close()
+
+    assert cache.stats.store_hits == 1
+    assert llm.calls == 2
+
+
+def test_rejects_invalid_limits():
+    """Test that non-positive limits are rejected."""
+    with pytest.raises(ValueError, match="max_entries"):
+        CachingLLM(CountingLLM(), max_entries=0)
+    with pytest.raises(ValueError, match="ttl"):
+        CachingLLM(CountingLLM(), ttl=0)
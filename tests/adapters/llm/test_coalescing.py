@@ -0,0 +1,143 @@
+"""Tests for single-flight coalescing of script generations."""
+
+import asyncio
+
+import pytest
+
+from slop.adapters.llm import CoalescingLLM
+from slop.domain import AIPersonality, ContentTone, Role, Script
+from slop.ports import LLMError
+
+NOIR = AIPersonality(id="noir", name="Noir", description="Hard-boiled", system_prompt="Be noir.")
+
+
+class GatedLLM:
+    """Blocks every generation until released, counting calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.cancelled = 0
+        self.release = asyncio.Event()
+        self.error = None
+
+    async def generate_script(self, prompt, personality, num_roles, *, tone=ContentTone.FAMILY):
+        """Wait for release, then return a script or raise the configured error."""
+        self.calls += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+        return Script(
+            content=prompt,
+            roles=[Role(name=f"Role {i}", description="A role") for i in range(num_roles)],
+            personality=personality.id,
+        )
+
+
+async def settle():
+    """Let pending tasks run up to their next wait."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_share_one_call():
+    """Test that concurrent identical requests make one upstream call."""
+    llm = GatedLLM()
+    coalescing = CoalescingLLM(llm)
+
+    waiters = [asyncio.create_task(coalescing.generate_script("heist", NOIR, 3)) for _ in range(5)]
+    await settle()
+    llm.release.set()
+    scripts = await asyncio.gather(*waiters)
+
+    assert llm.calls == 1
+    assert (coalescing.upstream_calls, coalescing.coalesced) == (1, 4)
+    assert all(script == scripts[0] for script in scripts)
+    assert len({id(script) for script in scripts}) == 5
+    assert coalescing.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_different_requests_are_not_shared():
+    """Test that any difference in the request gets its own call."""
+    llm = GatedLLM()
+    llm.release.set()
+    coalescing = CoalescingLLM(llm)
+
+    await asyncio.gather(
+        coalescing.generate_script("heist", NOIR, 3),
+        coalescing.generate_script("heist", NOIR, 2),
+        coalescing.generate_script("heist", NOIR, 3, tone=ContentTone.ADULT),
+        coalescing.generate_script("caper", NOIR, 3),
+    )
+
+    assert llm.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_error_is_shared():
+    """Test that every waiter receives the upstream error."""
+    llm = GatedLLM()
+    llm.error = LLMError("provider down")
+    coalescing = CoalescingLLM(llm)
+
+    waiters = [asyncio.create_task(coalescing.generate_script("heist", NOIR, 3)) for _ in range(3)]
+    await settle()
+    llm.release.set()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+
+    assert llm.calls == 1
+    assert all(isinstance(result, LLMError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_others():
+    """Test that one caller disconnecting leaves the shared call running."""
+    llm = GatedLLM()
+    coalescing = CoalescingLLM(llm)
+
+    leaving = asyncio.create_task(coalescing.generate_script("heist", NOIR, 3))
+    staying = asyncio.create_task(coalescing.generate_script("heist", NOIR, 3))
+    await settle()
+    leaving.cancel()
+    await settle()
+    llm.release.set()
+
+    assert (await staying).content == "heist"
+    assert leaving.cancelled()
+    assert llm.cancelled == 0
+
+
+@pytest.mark.asyncio
+async def test_call_is_cancelled_when_every_waiter_leaves():
+    """Test that the upstream call is cancelled once nobody is waiting."""
+    llm = GatedLLM()
+    coalescing = CoalescingLLM(llm)
+
+    waiter = asyncio.create_task(coalescing.generate_script("heist", NOIR, 3))
+    await settle()
+    waiter.cancel()
+    await settle()
+
+    assert llm.cancelled == 1
+    assert coalescing.in_flight == 0
+    llm.release.set()
+    assert (await coalescing.generate_script("heist", NOIR, 3)).content == "heist"
+    assert llm.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_completed_calls_are_not_reused():
+    """Test that a request after completion goes upstream again."""
+    llm = GatedLLM()
+    llm.release.set()
+    coalescing = CoalescingLLM(llm)
+
+    await coalescing.generate_script("heist", NOIR, 3)
+    await coalescing.generate_script("heist", NOIR, 3)
+
+    assert llm.calls == 2
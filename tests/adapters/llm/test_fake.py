@@ -0,0 +1,133 @@
+"""Tests for the deterministic fake LLM provider."""
+
+import dataclasses
+
+import pytest
+
+from slop.adapters.llm import INSTANT, FakeLLM, FakeLLMProfile, compile_prefix
+from slop.domain import AIPersonality, ContentTone
+from slop.domain.script_stream import ScriptStreamParser
+from slop.ports import LLMError
+
+NOIR = AIPersonality(id="noir", name="Noir", description="Hard-boiled", system_prompt="Be noir.")
+
+
+class RecordingSleep:
+    """Records requested sleeps instead of waiting."""
+
+    def __init__(self):
+        self.total = 0.0
+
+    async def __call__(self, seconds):
+        """Add the requested delay to the total."""
+        self.total += seconds
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("num_roles", [1, 3, 10])
+async def test_scripts_have_requested_roles_and_lines(num_roles):
+    """Test that every requested role exists and has dialogue."""
+    script = await FakeLLM(INSTANT).generate_script("Pirates lose their map", NOIR, num_roles)
+
+    assert len(script.roles) == num_roles
+    assert len({role.name for role in script.roles}) == num_roles
+    assert all(role.lines for role in script.roles)
+    assert script.personality == "noir"
+    assert "pirates lose their map" in script.content
+    assert 60 <= script.word_count <= 250
+
+
+@pytest.mark.asyncio
+async def test_same_request_same_script():
+    """Test that scripts depend only on the request."""
+    first = await FakeLLM(INSTANT, seed=1).generate_script("A heist", NOIR, 3)
+    second = await FakeLLM(INSTANT, seed=2).generate_script("A heist", NOIR, 3)
+    other = await FakeLLM(INSTANT).generate_script("A heist", NOIR, 3, tone=ContentTone.ADULT)
+
+    assert (first.content, first.roles) == (second.content, second.roles)
+    assert first.content != other.content
+
+
+@pytest.mark.asyncio
+async def test_prompts_are_assembled_from_templates():
+    """Test that requests go through the prompt templates and follow prompt edits."""
+    llm = FakeLLM(INSTANT)
+    first = await llm.generate_script("A heist", NOIR, 3)
+
+    assert llm.last_prompt.prefix == compile_prefix(NOIR, ContentTone.FAMILY)
+    assert llm.last_prompt.request.endswith("Prompt: A heist\n")
+    edited = dataclasses.replace(NOIR, system_prompt="Be very noir.")
+    assert (await llm.generate_script("A heist", edited, 3)).content != first.content
+
+
+@pytest.mark.asyncio
+async def test_stream_matches_generated_script():
+    """Test that the streamed chunks parse into the generated script."""
+    llm = FakeLLM(INSTANT)
+    parser = ScriptStreamParser()
+
+    chunks = [chunk async for chunk in llm.stream_script("A heist", NOIR, 2)]
+    for chunk in chunks:
+        parser.feed(chunk)
+
+    assert len(chunks) > 50
+    script = await llm.generate_script("A heist", NOIR, 2)
+    assert parser.to_script("noir").roles == script.roles
+
+
+@pytest.mark.asyncio
+async def test_latency_follows_profile():
+    """Test that delays model first-token latency plus the token rate."""
+    sleep = RecordingSleep()
+    profile = FakeLLMProfile(first_token_median=1.0, first_token_sigma=0.0, tokens_per_second=100)
+    llm = FakeLLM(profile, sleep=sleep, time_scale=0.5)
+
+    chunks = [chunk async for chunk in llm.stream_script("A heist", NOIR, 2)]
+
+    assert sleep.total == pytest.approx(0.5 * (1.0 + len(chunks) / 100))
+
+
+@pytest.mark.asyncio
+async def test_failures_follow_rates_and_seed():
+    """Test that error and timeout rates are applied reproducibly."""
+    profile = FakeLLMProfile(
+        first_token_median=0.0, first_token_sigma=0.0, error_rate=0.2, timeout_rate=0.1
+    )
+
+    async def outcomes(seed):
+        llm = FakeLLM(profile, seed=seed, sleep=RecordingSleep())
+        results = []
+        for _ in range(200):
+            try:
+                await llm.generate_script("A heist", NOIR, 2)
+                results.append("ok")
+            except LLMError as exc:
+                results.append(str(exc))
+        return results
+
+    first = await outcomes(7)
+
+    assert first == await outcomes(7)
+    assert 20 <= first.count("Fake provider error") <= 60
+    assert 5 <= first.count("Fake provider timed out") <= 40
+
+
+@pytest.mark.asyncio
+async def test_timeouts_hang_first():
+    """Test that a timed-out request waits hang_seconds before failing."""
+    sleep = RecordingSleep()
+    llm = FakeLLM(FakeLLMProfile(timeout_rate=1.0, hang_seconds=12.0), sleep=sleep)
+
+    with pytest.raises(LLMError, match="timed out"):
+        await llm.generate_script("A heist", NOIR, 2)
+
+    assert sleep.total == 12.0
+    assert llm.failures == 1
+
+
+def test_profile_rejects_invalid_rates():
+    """Test that impossible profiles are rejected."""
+    with pytest.raises(ValueError, match="sum"):
+        FakeLLMProfile(error_rate=0.7, timeout_rate=0.5)
+    with pytest.raises(ValueError, match="tokens_per_second"):
+        FakeLLMProfile(tokens_per_second=0)
@@ -0,0 +1,228 @@
+"""Tests for hedged script generation across providers."""
+
+import asyncio
+
+import pytest
+
+from slop.adapters.llm import BreakerState, CircuitBreaker, HedgingLLM, LatencyHistogram
+from slop.domain import AIPersonality, ContentTone, Role, Script
+from slop.ports import LLMError
+
+NOIR = AIPersonality(id="noir", name="Noir", description="Hard-boiled", system_prompt="Be noir.")
+
+
+class FakeProvider:
+    """Provider with injected latency and failures."""
+
+    def __init__(self, name, delay=0.0, fail=False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = 0
+
+    async def generate_script(self, prompt, personality, num_roles, *, tone=ContentTone.FAMILY):
+        """Return a script naming this provider after the injected delay."""
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise LLMError(f"{self.name} failed")
+        return Script(content=self.name, roles=[Role("A", "a")], personality=personality.id)
+
+
+def hedging(*providers, **options):
+    """Build a hedging composite over the fake providers."""
+    options.setdefault("default_hedge_delay", 0.02)
+    return HedgingLLM([(p.name, p) for p in providers], **options)
+
+
+async def generate(llm):
+    """Generate a script for a fixed request."""
+    return await llm.generate_script("heist", NOIR, 1)
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_needs_no_hedge():
+    """Test that a primary answering before the hedge delay is used alone."""
+    primary, backup = FakeProvider("primary"), FakeProvider("backup")
+    llm = hedging(primary, backup)
+
+    script = await generate(llm)
+
+    assert script.content == "primary"
+    assert (primary.calls, backup.calls, llm.hedges) == (1, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_loser_cancelled():
+    """Test that the backup is asked after the hedge delay and the loser cancelled."""
+    primary, backup = FakeProvider("primary", delay=1.0), FakeProvider("backup", delay=0.01)
+    llm = hedging(primary, backup)
+
+    script = await generate(llm)
+
+    assert script.content == "backup"
+    assert llm.hedges == 1
+    assert primary.cancelled == 1
+    stats = {s.name: s for s in llm.stats()}
+    assert (stats["backup"].wins, stats["primary"].cancelled) == (1, 1)
+    assert stats["primary"].breaker is BreakerState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_hedged_primary_can_still_win():
+    """Test that the primary wins if it answers before the backup."""
+    primary, backup = FakeProvider("primary", delay=0.04), FakeProvider("backup", delay=1.0)
+    llm = hedging(primary, backup)
+
+    script = await generate(llm)
+
+    assert script.content == "primary"
+    assert backup.cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_failure_hands_over_immediately():
+    """Test that a failing provider is replaced without waiting for the hedge delay."""
+    primary, backup = FakeProvider("primary", fail=True), FakeProvider("backup")
+    llm = hedging(primary, backup, default_hedge_delay=5.0)
+
+    script = await asyncio.wait_for(generate(llm), timeout=1.0)
+
+    assert script.content == "backup"
+    assert llm.hedges == 0
+
+
+@pytest.mark.asyncio
+async def test_all_failures_raise_llm_error():
+    """Test that every provider failing raises LLMError naming each one."""
+    llm = hedging(FakeProvider("a", fail=True), FakeProvider("b", fail=True))
+
+    with pytest.raises(LLMError, match="a failed.*b failed"):
+        await generate(llm)
+
+
+@pytest.mark.asyncio
+async def test_timeout_raises_and_cancels():
+    """Test that the overall timeout cancels outstanding requests."""
+    slow = FakeProvider("slow", delay=5.0)
+    llm = hedging(slow, timeout=0.05)
+
+    with pytest.raises(LLMError, match="No script"):
+        await generate(llm)
+
+    assert slow.cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_timeout_counts_as_failure():
+    """Test that requests still running at the timeout are failures, not cancellations."""
+    slow = FakeProvider("slow", delay=5.0)
+    llm = hedging(slow, timeout=0.05, failure_threshold=1)
+
+    with pytest.raises(LLMError, match="No script"):
+        await generate(llm)
+
+    stats = llm.stats()[0]
+    assert (stats.failures, stats.cancelled) == (1, 0)
+    assert stats.breaker is BreakerState.OPEN
+    assert stats.p50 is not None
+
+
+@pytest.mark.asyncio
+async def test_cancelled_loser_records_censored_latency():
+    """Test that a loser cancelled after its hedge delay still records how long it ran."""
+    primary, backup = FakeProvider("primary", delay=1.0), FakeProvider("backup", delay=0.01)
+    llm = hedging(primary, backup)
+
+    await generate(llm)
+
+    stats = {s.name: s for s in llm.stats()}
+    assert stats["primary"].p50 is not None
+    assert stats["primary"].p50 >= 0.02
+
+
+@pytest.mark.asyncio
+async def test_breaker_skips_failing_provider():
+    """Test that consecutive failures open the primary's breaker."""
+    primary, backup = FakeProvider("primary", fail=True), FakeProvider("backup")
+    llm = hedging(primary, backup, failure_threshold=2)
+
+    for _ in range(4):
+        await generate(llm)
+
+    assert primary.calls == 2
+    assert backup.calls == 4
+    assert llm.stats()[0].breaker is BreakerState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_hedge_delay_follows_observed_latency():
+    """Test that the hedge delay switches to the observed p90 once known."""
+    primary = FakeProvider("primary", delay=0.0)
+    llm = hedging(primary, FakeProvider("backup"), min_samples=5, default_hedge_delay=3.0)
+
+    assert llm.hedge_delay("primary") == 3.0
+    for _ in range(5):
+        await generate(llm)
+
+    assert llm.hedge_delay("primary") < 0.1
+
+
+def test_breaker_half_open_trial():
+    """Test that an open breaker allows one trial after the reset timeout."""
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=lambda: now[0])
+    breaker.record_failure()
+    breaker.record_failure()
+
+    assert not breaker.allow()
+    now[0] = 31
+    assert breaker.state is BreakerState.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state is BreakerState.OPEN
+    now[0] = 62
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state is BreakerState.CLOSED
+
+
+def test_breaker_trial_is_released_only_by_its_owner():
+    """Test that a request that did not claim the half-open trial cannot release it."""
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=lambda: now[0])
+    breaker.record_failure()
+    now[0] = 31
+    owner, other = object(), object()
+
+    assert breaker.allow(owner)
+    breaker.release(other)
+    assert not breaker.allow(other)
+    breaker.release(owner)
+    assert breaker.allow(other)
+
+
+def test_histogram_quantiles():
+    """Test that quantiles are within one bucket of the true value."""
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):
+        histogram.record(ms / 1000)
+
+    assert histogram.count == 100
+    assert 0.045 <= histogram.quantile(0.5) <= 0.056
+    assert 0.09 <= histogram.quantile(0.9) <= 0.1
+    assert LatencyHistogram().quantile(0.9) is None
+
+
+def test_rejects_invalid_providers():
+    """Test that empty or duplicate provider lists are rejected."""
+    with pytest.raises(ValueError, match="At least one"):
+        HedgingLLM([])
+    with pytest.raises(ValueError, match="unique"):
+        HedgingLLM([("a", FakeProvider("a")), ("a", FakeProvider("a"))])
@@ -0,0 +1,70 @@
+"""Tests for prompt assembly with precompiled prefixes."""
+
+import hashlib
+
+from slop.adapters.llm import PromptTemplates, compile_prefix
+from slop.domain import AIPersonality, ContentTone
+
+
+def noir(**overrides):
+    """Build a test personality."""
+    fields = {
+        "id": "noir",
+        "name": "Noir",
+        "description": "Hard-boiled",
+        "system_prompt": "You write hard-boiled noir.",
+        "example_script": "ROLE: Sam | A detective\n\nSAM: It was raining.",
+    }
+    return AIPersonality(**(fields | overrides))
+
+
+def test_prefix_is_identical_across_requests():
+    """Test that requests differing only in prompt and roles share a prefix."""
+    templates = PromptTemplates()
+
+    first = templates.assemble("Art heist", noir(), 2)
+    second = templates.assemble("Pizza on Mars", noir(), 4)
+
+    assert first.prefix is second.prefix
+    assert second.text.startswith(first.prefix.text)
+    assert second.request == "Number of roles: 4\nPrompt: Pizza on Mars\n"
+    assert len(templates) == 1
+
+
+def test_prefix_includes_personality_format_and_example():
+    """Test that the prefix holds the system prompt, script format and example."""
+    text = compile_prefix(noir(), ContentTone.FAMILY).text
+
+    assert text.startswith("You write hard-boiled noir.")
+    assert "ROLE: <character name>" in text
+    assert "SAM: It was raining." in text
+    assert "family friendly" in text
+
+
+def test_digest_is_stable_and_tone_specific():
+    """Test that digests are reproducible and differ between tones."""
+    family = compile_prefix(noir(), ContentTone.FAMILY)
+    adult = compile_prefix(noir(), ContentTone.ADULT)
+
+    assert family.digest == hashlib.sha256(family.text.encode()).hexdigest()
+    assert family == compile_prefix(noir(), ContentTone.FAMILY)
+    assert family.digest != adult.digest
+
+
+def test_prefix_is_recompiled_when_personality_changes():
+    """Test that an edited system prompt produces a new prefix."""
+    templates = PromptTemplates()
+    before = templates.prefix(noir(), ContentTone.FAMILY)
+
+    after = templates.prefix(noir(system_prompt="You write cosy mysteries."), ContentTone.FAMILY)
+
+    assert after.digest != before.digest
+    assert templates.digests() == {("noir", ContentTone.FAMILY): after.digest}
+
+
+def test_personality_without_example_script():
+    """Test that the example section is left out when there is no example."""
+    prefix = compile_prefix(noir(example_script=None), ContentTone.ADULT)
+
+    assert "Example script" not in prefix.text
+    assert prefix.text.endswith("\n\n")
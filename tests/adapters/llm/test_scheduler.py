@@ -0,0 +1,221 @@
+"""Tests for priority-aware LLM scheduling."""
+
+import asyncio
+
+import pytest
+
+from slop.adapters.llm import BudgetExceededError, LLMScheduler, Priority
+from slop.domain import AIPersonality, ContentTone, Role, Script
+from slop.ports import LLMError
+
+NOIR = AIPersonality(id="noir", name="Noir", description="Hard-boiled", system_prompt="Be noir.")
+
+
+class GatedLLM:
+    """Provider whose requests block until released, recording call order."""
+
+    def __init__(self):
+        self.started = []
+        self.gate = asyncio.Event()
+
+    async def generate_script(self, prompt, personality, num_roles, *, tone=ContentTone.FAMILY):
+        """Record the prompt, then return a script once the gate opens."""
+        self.started.append(prompt)
+        await self.gate.wait()
+        return Script(content=prompt, roles=[Role("A", "a")], personality=personality.id)
+
+
+def fixed(tokens):
+    """Return an estimator charging a fixed number of tokens."""
+    return lambda prompt, personality, num_roles: tokens
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        """Return the current time."""
+        return self.now
+
+
+async def settle():
+    """Let queued tasks run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_rejects_invalid_limits():
+    """Test that the concurrency settings are validated."""
+    with pytest.raises(ValueError, match="max_concurrency"):
+        LLMScheduler(GatedLLM(), max_concurrency=0)
+    with pytest.raises(ValueError, match="reserved_live_slots"):
+        LLMScheduler(GatedLLM(), max_concurrency=2, reserved_live_slots=2)
+
+
+@pytest.mark.asyncio
+async def test_live_requests_overtake_queued_background_work():
+    """Test that a live request is dispatched before earlier retries and warm-ups."""
+    llm = GatedLLM()
+    scheduler = LLMScheduler(llm, max_concurrency=1, reserved_live_slots=0)
+    warmup = scheduler.client(Priority.WARMUP)
+    tasks = [asyncio.create_task(warmup.generate_script("warm-1", NOIR, 1))]
+    await settle()
+    tasks.append(asyncio.create_task(warmup.generate_script("warm-2", NOIR, 1)))
+    tasks.append(
+        asyncio.create_task(scheduler.client(Priority.RETRY).generate_script("retry", NOIR, 1))
+    )
+    tasks.append(asyncio.create_task(scheduler.generate_script("live", NOIR, 1)))
+    await settle()
+
+    llm.gate.set()
+    await asyncio.gather(*tasks)
+
+    assert llm.started == ["warm-1", "live", "retry", "warm-2"]
+    assert scheduler.stats.dispatched == {Priority.LIVE: 1, Priority.RETRY: 1, Priority.WARMUP: 2}
+
+
+@pytest.mark.asyncio
+async def test_reserved_slot_is_kept_free_for_live_rounds():
+    """Test that background work cannot take the slots reserved for live requests."""
+    llm = GatedLLM()
+    scheduler = LLMScheduler(llm, max_concurrency=2, reserved_live_slots=1)
+    warmup = scheduler.client(Priority.WARMUP)
+    background = [
+        asyncio.create_task(warmup.generate_script(f"warm-{i}", NOIR, 1)) for i in range(2)
+    ]
+    await settle()
+    assert llm.started == ["warm-0"]
+
+    live = asyncio.create_task(scheduler.generate_script("live", NOIR, 1))
+    await settle()
+    assert llm.started == ["warm-0", "live"]
+    assert scheduler.stats.queued == 1
+
+    llm.gate.set()
+    await asyncio.gather(live, *background)
+    assert scheduler.stats.running == 0
+
+
+@pytest.mark.asyncio
+async def test_game_budget_rejects_requests_beyond_it():
+    """Test that a game cannot be charged more than its token budget."""
+    llm = GatedLLM()
+    llm.gate.set()
+    scheduler = LLMScheduler(llm, game_token_budget=1000, estimate=fixed(400))
+    client = scheduler.client(Priority.LIVE, game_id="game-1")
+
+    await client.generate_script("one", NOIR, 1)
+    await client.generate_script("two", NOIR, 1)
+    with pytest.raises(BudgetExceededError):
+        await client.generate_script("three", NOIR, 1)
+
+    await scheduler.client(Priority.LIVE, game_id="game-2").generate_script("other", NOIR, 1)
+    assert scheduler.game_tokens("game-1") == 800
+    assert scheduler.stats.rejected == 1
+
+
+@pytest.mark.asyncio
+async def test_spend_limit_is_enforced_per_period():
+    """Test that spend stops at the limit and resets when the period rolls over."""
+    llm = GatedLLM()
+    llm.gate.set()
+    clock = FakeClock()
+    scheduler = LLMScheduler(
+        llm,
+        cost_per_1k_tokens=1.0,
+        spend_limit=2.0,
+        spend_period=100.0,
+        estimate=fixed(1000),
+        clock=clock,
+    )
+
+    await scheduler.generate_script("one", NOIR, 1)
+    await scheduler.generate_script("two", NOIR, 1)
+    with pytest.raises(BudgetExceededError, match="Spend limit"):
+        await scheduler.generate_script("three", NOIR, 1)
+    assert isinstance(BudgetExceededError("x"), LLMError)
+
+    clock.now = 100.0
+    await scheduler.generate_script("four", NOIR, 1)
+    assert scheduler.stats.spend == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_token_rate_limit_holds_requests_until_the_window_frees(monkeypatch):
+    """Test that requests over the per-minute token limit wait rather than fail."""
+    monkeypatch.setattr("slop.adapters.llm.scheduler._WINDOW", 0.05)
+    llm = GatedLLM()
+    llm.gate.set()
+    scheduler = LLMScheduler(llm, tokens_per_minute=1000, estimate=fixed(600))
+
+    await scheduler.generate_script("one", NOIR, 1)
+    second = asyncio.create_task(scheduler.generate_script("two", NOIR, 1))
+    await settle()
+    assert llm.started == ["one"]
+    assert scheduler.stats.queued == 1
+
+    await asyncio.wait_for(second, 1.0)
+    assert llm.started == ["one", "two"]
+    assert scheduler.queue_time(Priority.LIVE).count == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_releases_its_place():
+    """Test that a caller cancelled while queued never reaches the provider."""
+    llm = GatedLLM()
+    scheduler = LLMScheduler(llm, max_concurrency=1, reserved_live_slots=0)
+    first = asyncio.create_task(scheduler.generate_script("first", NOIR, 1))
+    queued = asyncio.create_task(scheduler.generate_script("queued", NOIR, 1))
+    await settle()
+
+    queued.cancel()
+    await asyncio.gather(queued, return_exceptions=True)
+    llm.gate.set()
+    await first
+    await scheduler.generate_script("after", NOIR, 1)
+
+    assert llm.started == ["first", "after"]
+    assert scheduler.stats.running == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_rejected_for_budget_frees_no_slot():
+    """Test that a waiter rejected by a budget and then cancelled leaves the slot count alone."""
+    llm = GatedLLM()
+    scheduler = LLMScheduler(
+        llm, max_concurrency=1, reserved_live_slots=0, game_token_budget=1000, estimate=fixed(600)
+    )
+    first = asyncio.create_task(scheduler.generate_script("first", NOIR, 1))
+    game = scheduler.client(Priority.LIVE, game_id="game-1")
+    charged = asyncio.create_task(game.generate_script("charged", NOIR, 1))
+    rejected = asyncio.create_task(game.generate_script("rejected", NOIR, 1))
+    await settle()
+
+    first.cancel()
+    await settle()
+    assert llm.started == ["first", "charged"]
+    charged.cancel()  # finishing it dispatches, and rejects, the last request
+    await asyncio.sleep(0)
+    rejected.cancel()
+    await asyncio.gather(first, charged, rejected, return_exceptions=True)
+
+    assert rejected.cancelled()
+    assert scheduler.stats.running == 0
+    assert scheduler.stats.rejected == 1
+
+
+@pytest.mark.asyncio
+async def test_initial_spend_counts_towards_the_limit():
+    """Test that spend carried over from before a restart is enforced."""
+    llm = GatedLLM()
+    llm.gate.set()
+    scheduler = LLMScheduler(
+        llm, cost_per_1k_tokens=1.0, spend_limit=2.0, initial_spend=1.5, estimate=fixed(1000)
+    )
+
+    with pytest.raises(BudgetExceededError, match="Spend limit"):
+        await scheduler.generate_script("one", NOIR, 1)
+    assert scheduler.stats.spend == pytest.approx(1.5)
@@ -0,0 +1 @@
+"""Storage adapter tests."""
@@ -0,0 +1,181 @@
+"""Tests for the read-through LRU game cache."""
+
+import asyncio
+
+import pytest
+
+from slop.adapters.storage import CachingStorage, SQLiteStorageAdapter
+from slop.adapters.storage.cache import estimate_game_size
+from slop.domain import Game
+
+
+@pytest.fixture
+async def inner(tmp_path):
+    """Create an open SQLite storage adapter to wrap."""
+    async with SQLiteStorageAdapter(tmp_path / "slop.db") as adapter:
+        yield adapter
+
+
+class CountingStorage:
+    """Wraps storage and counts snapshot reads."""
+
+    def __init__(self, storage):
+        self._storage = storage
+        self.reads = 0
+
+    def __getattr__(self, name):
+        return getattr(self._storage, name)
+
+    async def get_snapshot(self, game_id):
+        """Count and delegate snapshot reads."""
+        self.reads += 1
+        await asyncio.sleep(0)
+        return await self._storage.get_snapshot(game_id)
+
+    async def get_game_by_room_code(self, room_code):
+        """Count and delegate room code lookups."""
+        self.reads += 1
+        return await self._storage.get_game_by_room_code(room_code)
+
+
+@pytest.mark.asyncio
+async def test_hot_games_are_served_from_memory(inner):
+    """Test that repeated lookups of a saved game never hit storage."""
+    counting = CountingStorage(inner)
+    cache = CachingStorage(counting)
+    game = Game(id="game-1", room_code="ABCD")
+
+    await cache.save_snapshot(game)
+    for _ in range(5):
+        assert await cache.get_snapshot("game-1") is game
+        assert await cache.get_game_by_room_code("ABCD") is game
+
+    assert counting.reads == 0
+    assert cache.stats.hits == 10
+    assert cache.stats.misses == 0
+    assert await inner.get_snapshot("game-1") == game
+
+
+@pytest.mark.asyncio
+async def test_miss_reads_through_once(inner):
+    """Test that a miss loads from storage and later lookups hit."""
+    await inner.save_snapshot(Game(id="game-1", room_code="ABCD"))
+    counting = CountingStorage(inner)
+    cache = CachingStorage(counting)
+
+    first = await cache.get_game_by_room_code("ABCD")
+    second = await cache.get_snapshot("game-1")
+
+    assert first is second
+    assert counting.reads == 1
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load(inner):
+    """Test that simultaneous misses for one game read storage once."""
+    await inner.save_snapshot(Game(id="game-1", room_code="ABCD"))
+    counting = CountingStorage(inner)
+    cache = CachingStorage(counting)
+
+    games = await asyncio.gather(*(cache.get_snapshot("game-1") for _ in range(10)))
+
+    assert counting.reads == 1
+    assert all(game is games[0] for game in games)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_strand_followers(inner):
+    """Test that cancelling the caller that started a load still serves the others."""
+    await inner.save_snapshot(Game(id="game-1", room_code="ABCD"))
+    counting = CountingStorage(inner)
+    cache = CachingStorage(counting)
+
+    leader = asyncio.create_task(cache.get_snapshot("game-1"))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(cache.get_snapshot("game-1"))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    game = await asyncio.wait_for(follower, 1.0)
+    assert leader.cancelled()
+    assert game.id == "game-1"
+    assert counting.reads == 1
+    assert await cache.get_snapshot("game-1") is game
+
+
+@pytest.mark.asyncio
+async def test_unknown_game_is_not_cached(inner):
+    """Test that missing games return None without a cache entry."""
+    cache = CachingStorage(inner)
+
+    assert await cache.get_snapshot("game-99") is None
+    assert await cache.get_game_by_room_code("NOPE") is None
+    assert cache.stats.entries == 0
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_by_count(inner):
+    """Test that the least recently used game is evicted first."""
+    cache = CachingStorage(inner, max_games=2)
+    for i in range(3):
+        if i == 2:
+            await cache.get_snapshot("game-0")
+        await cache.save_snapshot(Game(id=f"game-{i}", room_code=f"ROOM{i}"))
+
+    assert cache.stats.evictions == 1
+    assert cache.stats.entries == 2
+    hits = cache.stats.hits
+    await cache.get_snapshot("game-0")
+    await cache.get_game_by_room_code("ROOM2")
+    assert cache.stats.hits == hits + 2
+    await cache.get_game_by_room_code("ROOM1")
+    assert cache.stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_eviction_by_memory_cap(inner):
+    """Test that the memory cap bounds the estimated cache size."""
+    size = estimate_game_size(Game(id="game-0", room_code="ROOM0"))
+    cache = CachingStorage(inner, max_bytes=size * 3)
+
+    for i in range(10):
+        await cache.save_snapshot(Game(id=f"game-{i}", room_code=f"ROOM{i}"))
+
+    assert cache.stats.entries == 3
+    assert cache.stats.memory_bytes <= size * 3
+    assert cache.stats.evictions == 7
+
+
+@pytest.mark.asyncio
+async def test_delete_invalidates(inner):
+    """Test that deleting a game drops it from the cache and the room index."""
+    cache = CachingStorage(inner)
+    await cache.save_snapshot(Game(id="game-1", room_code="ABCD"))
+
+    await cache.delete_game("game-1")
+
+    assert cache.stats.entries == 0
+    assert await cache.get_snapshot("game-1") is None
+    assert await cache.get_game_by_room_code("ABCD") is None
+
+
+@pytest.mark.asyncio
+async def test_failed_write_invalidates(inner):
+    """Test that a failed write-through does not leave the game cached."""
+    cache = CachingStorage(inner)
+    await cache.save_snapshot(Game(id="game-1", room_code="ABCD"))
+    await inner.close()
+
+    with pytest.raises(RuntimeError):
+        await cache.save_snapshot(Game(id="game-1", room_code="ABCD"))
+
+    assert cache.stats.entries == 0
+
+
+def test_rejects_invalid_limits():
+    """Test that non-positive limits are rejected."""
+    with pytest.raises(ValueError, match="max_games"):
+        CachingStorage(object(), max_games=0)
+    with pytest.raises(ValueError, match="max_bytes"):
+        CachingStorage(object(), max_bytes=0)
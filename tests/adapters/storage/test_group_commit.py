@@ -0,0 +1,31 @@
+"""Tests for the group commit writer."""
+
+import asyncio
+
+import pytest
+
+from slop.adapters.storage.group_commit import GroupCommitWriter
+
+
+@pytest.mark.asyncio
+async def test_failing_on_commit_fails_its_batch_and_keeps_the_writer_running():
+    """Test that an on_commit error reaches the batch's callers and later writes still commit."""
+    committed = []
+
+    def on_commit(items, errors):
+        """Record the batch, failing for the poisoned item."""
+        if "bad" in items:
+            raise RuntimeError("index update failed")
+        committed.extend(items)
+
+    writer = GroupCommitWriter(lambda items: [None] * len(items), on_commit=on_commit)
+    writer.start()
+    try:
+        with pytest.raises(RuntimeError, match="index update failed"):
+            await asyncio.wait_for(writer.submit("bad"), 1.0)
+        await asyncio.wait_for(writer.submit("good"), 1.0)
+    finally:
+        await writer.stop()
+
+    assert committed == ["good"]
+    assert writer.commit_count == 2
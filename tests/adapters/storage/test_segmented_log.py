@@ -0,0 +1,325 @@
+"""Tests for the segmented log storage adapter."""
+
+import asyncio
+
+import pytest
+
+from slop.adapters.storage import SegmentedLogStorageAdapter
+from slop.domain import (
+    Game,
+    GameCreated,
+    GuessSubmitted,
+    PlayerJoined,
+    RoundCompleted,
+    RoundStarted,
+    ScriptGenerated,
+    TeamFormed,
+)
+
+
+def make_game_created(game_id="game-1", room_code="ABCD"):
+    """Create a GameCreated event for testing."""
+    return GameCreated(
+        game_id=game_id,
+        room_code=room_code,
+        content_tone="family",
+        max_players=12,
+        rounds_per_team=3,
+    )
+
+
+def make_guess(game_id="game-1", guess="a guess"):
+    """Create a GuessSubmitted event for testing."""
+    return GuessSubmitted(game_id=game_id, round_number=0, team_id="team-1", guess=guess)
+
+
+def make_round(game_id="game-1", round_number=0):
+    """Create the events of one completed round, including its lobby setup."""
+    events = []
+    if round_number == 0:
+        events += [
+            make_game_created(game_id),
+            TeamFormed(game_id=game_id, team_id="team-1", team_name="Red", color="#FF0000"),
+        ]
+    events += [
+        RoundStarted(game_id=game_id, round_number=round_number, acting_team_id="team-1"),
+        ScriptGenerated(
+            game_id=game_id,
+            round_number=round_number,
+            script_content="A: hi",
+            personality_id="noir",
+            roles=[{"name": "A", "description": "a", "lines": ["hi"]}],
+            word_count=2,
+            estimated_duration=1,
+        ),
+        RoundCompleted(game_id=game_id, round_number=round_number, final_scores={"team-1": 1}),
+    ]
+    return events
+
+
+@pytest.fixture
+async def storage(tmp_path):
+    """Create an open log storage adapter."""
+    async with SegmentedLogStorageAdapter(tmp_path / "log") as adapter:
+        yield adapter
+
+
+@pytest.mark.asyncio
+async def test_save_and_get_events(storage):
+    """Test that events round-trip as their concrete subclasses, in order."""
+    created = make_game_created()
+    joined = PlayerJoined(
+        game_id="game-1", player_id="player-1", player_name="Alice", socket_id="socket-1"
+    )
+
+    await storage.save_event(created)
+    await storage.save_event(joined)
+
+    assert await storage.get_events("game-1") == [created, joined]
+
+
+@pytest.mark.asyncio
+async def test_get_events_reads_only_requested_game(storage):
+    """Test that interleaved games are separated by the index."""
+    for i in range(5):
+        await storage.save_event(make_guess("game-1", f"one-{i}"))
+        await storage.save_event(make_guess("game-2", f"two-{i}"))
+
+    events = await storage.get_events("game-2")
+
+    assert [event.guess for event in events] == [f"two-{i}" for i in range(5)]
+    assert await storage.get_events("game-99") == []
+
+
+@pytest.mark.asyncio
+async def test_snapshot_round_trip_and_room_code(storage):
+    """Test that the latest snapshot wins and is reachable by room code."""
+    game = Game(id="game-1", room_code="WXYZ")
+    await storage.save_snapshot(game)
+    game.next_round()
+    await storage.save_snapshot(game)
+
+    by_id = await storage.get_snapshot("game-1")
+    by_room = await storage.get_game_by_room_code("WXYZ")
+
+    assert by_id == game
+    assert by_room == game
+    assert await storage.get_snapshot("game-99") is None
+    assert await storage.get_game_by_room_code("NOPE") is None
+
+
+@pytest.mark.asyncio
+async def test_delete_game(storage):
+    """Test that a tombstone hides the game's events and snapshot."""
+    await storage.save_event(make_game_created(room_code="TEST"))
+    await storage.save_snapshot(Game(id="game-1", room_code="TEST"))
+
+    await storage.delete_game("game-1")
+
+    assert await storage.get_events("game-1") == []
+    assert await storage.get_snapshot("game-1") is None
+    assert await storage.get_game_by_room_code("TEST") is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_saves_are_batched(storage):
+    """Test that concurrent appends share one fsync."""
+    await asyncio.gather(*(storage.save_event(make_guess(guess=f"g{i}")) for i in range(50)))
+
+    assert storage.write_count == 50
+    assert storage.commit_count < 50
+    assert len(await storage.get_events("game-1")) == 50
+
+
+@pytest.mark.asyncio
+async def test_rotates_segments(tmp_path):
+    """Test that the log rolls over to new segments at the size limit."""
+    async with SegmentedLogStorageAdapter(tmp_path / "log", segment_size=1024) as storage:
+        for i in range(30):
+            await storage.save_event(make_guess(guess=f"g{i}"))
+
+        assert storage.segment_count > 1
+        assert len(await storage.get_events("game-1")) == 30
+
+
+@pytest.mark.asyncio
+async def test_index_rebuilt_on_reopen(tmp_path):
+    """Test that reopening the log recovers events, snapshots and deletes."""
+    path = tmp_path / "log"
+    async with SegmentedLogStorageAdapter(path, segment_size=1024) as storage:
+        for i in range(20):
+            await storage.save_event(make_guess("game-1", f"g{i}"))
+        await storage.save_event(make_game_created("game-2", "WXYZ"))
+        await storage.save_snapshot(Game(id="game-1", room_code="ABCD"))
+        await storage.delete_game("game-2")
+
+    async with SegmentedLogStorageAdapter(path, segment_size=1024) as storage:
+        events = await storage.get_events("game-1")
+        assert [event.guess for event in events] == [f"g{i}" for i in range(20)]
+        assert await storage.get_game_by_room_code("ABCD") is not None
+        assert await storage.get_events("game-2") == []
+
+
+@pytest.mark.asyncio
+async def test_reopen_after_crash_before_reclaiming_a_dead_segment(tmp_path):
+    """Test that a dead first segment left by a crash does not hide later segments."""
+    dead = tmp_path / "dead"
+    async with SegmentedLogStorageAdapter(dead) as storage:
+        await storage.save_event(make_guess("game-a", "a"))
+        await storage.delete_game("game-a")
+
+    path = tmp_path / "log"
+    async with SegmentedLogStorageAdapter(path, segment_size=1024) as storage:
+        for i in range(15):
+            await storage.save_event(make_guess("game-b", f"b{i}"))
+        for i in range(15):
+            await storage.save_event(make_guess("game-c", f"c{i}"))
+        live_segments = storage.segment_count
+    assert live_segments > 2
+
+    # Lay the log out as if game A's segment was never unlinked: shift the
+    # live segments up by one and put A's segment first.
+    for segment in sorted(path.iterdir(), reverse=True):
+        segment.rename(path / f"{int(segment.stem) + 1:010d}{segment.suffix}")
+    (dead / "0000000000.seg").rename(path / "0000000000.seg")
+
+    async with SegmentedLogStorageAdapter(path, segment_size=1024) as storage:
+        b_events = await storage.get_events("game-b")
+        c_events = await storage.get_events("game-c")
+        assert [event.guess for event in b_events] == [f"b{i}" for i in range(15)]
+        assert [event.guess for event in c_events] == [f"c{i}" for i in range(15)]
+        assert await storage.get_events("game-a") == []
+        assert storage.segment_count == live_segments
+
+
+@pytest.mark.asyncio
+async def test_torn_tail_is_truncated(tmp_path):
+    """Test that a partially written final record is discarded on recovery."""
+    path = tmp_path / "log"
+    async with SegmentedLogStorageAdapter(path) as storage:
+        await storage.save_event(make_guess(guess="kept"))
+        await storage.save_event(make_guess(guess="torn"))
+
+    segment = next(path.iterdir())
+    data = segment.read_bytes()
+    segment.write_bytes(data[:-5])
+
+    async with SegmentedLogStorageAdapter(path) as storage:
+        events = await storage.get_events("game-1")
+        assert [event.guess for event in events] == ["kept"]
+        await storage.save_event(make_guess(guess="after"))
+        events = await storage.get_events("game-1")
+        assert [event.guess for event in events] == ["kept", "after"]
+
+
+@pytest.mark.asyncio
+async def test_failed_write_is_rolled_back(tmp_path):
+    """Test that a partly written batch leaves no bytes or index entries behind."""
+    path = tmp_path / "log"
+    async with SegmentedLogStorageAdapter(path, segment_size=1024) as storage:
+        for i in range(5):
+            await storage.save_event(make_guess(guess=f"g{i}"))
+        segments = storage.segment_count
+        write_active = storage._write_active
+
+        def fail_halfway(buffer):
+            """Write half of the buffer, then fail."""
+            write_active(buffer[: len(buffer) // 2])
+            raise OSError("disk full")
+
+        storage._write_active = fail_halfway
+        with pytest.raises(OSError, match="disk full"):
+            await storage.save_event(make_guess(guess="lost " * 100))
+        del storage._write_active
+        await storage.save_event(make_guess(guess="after"))
+
+        expected = [f"g{i}" for i in range(5)] + ["after"]
+        assert [event.guess for event in await storage.get_events("game-1")] == expected
+        assert storage.segment_count == segments
+
+    async with SegmentedLogStorageAdapter(path, segment_size=1024) as storage:
+        assert [event.guess for event in await storage.get_events("game-1")] == expected
+
+
+@pytest.mark.asyncio
+async def test_dead_segments_are_reclaimed(tmp_path):
+    """Test that segments holding only deleted data are removed."""
+    async with SegmentedLogStorageAdapter(tmp_path / "log", segment_size=1024) as storage:
+        for i in range(30):
+            await storage.save_event(make_guess("game-1", f"g{i}"))
+        peak = storage.segment_count
+
+        await storage.delete_game("game-1")
+
+        assert storage.segment_count < peak
+        assert storage.segment_count == len(list((tmp_path / "log").iterdir()))
+
+
+@pytest.mark.asyncio
+async def test_binary_events_round_trip(tmp_path):
+    """Test that binary-encoded events survive a reopen."""
+    path = tmp_path / "log"
+    events = [make_game_created(), make_guess(guess="binary")]
+    async with SegmentedLogStorageAdapter(path, binary_events=True) as storage:
+        for event in events:
+            await storage.save_event(event)
+
+    async with SegmentedLogStorageAdapter(path) as storage:
+        assert await storage.get_events("game-1") == events
+
+
+@pytest.mark.asyncio
+async def test_list_active_games(storage):
+    """Test that games with live records are listed until deleted."""
+    await storage.save_event(make_game_created("game-1", "ABCD"))
+    await storage.save_snapshot(Game(id="game-2", room_code="WXYZ"))
+    await storage.save_event(make_game_created("game-3", "EFGH"))
+    await storage.delete_game("game-3")
+
+    assert sorted(await storage.list_active_games()) == ["game-1", "game-2"]
+
+
+@pytest.mark.asyncio
+async def test_round_completed_writes_checkpoint(storage):
+    """Test that RoundCompleted replaces the events it covers with a checkpoint."""
+    events = make_round(round_number=0) + make_round(round_number=1)
+    for event in events:
+        await storage.save_event(event)
+    after = make_guess(guess="after")
+    await storage.save_event(after)
+
+    checkpoint = await storage.get_checkpoint("game-1")
+
+    assert await storage.get_events("game-1") == [after]
+    assert checkpoint.event_id == events[-1].event_id
+    assert [r.round_number for r in checkpoint.game.rounds] == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_survives_reopen(tmp_path):
+    """Test that compaction is replayed from the log on reopen."""
+    path = tmp_path / "log"
+    events = make_round()
+    async with SegmentedLogStorageAdapter(path) as storage:
+        for event in events:
+            await storage.save_event(event)
+        await storage.save_event(make_guess(guess="after"))
+
+    async with SegmentedLogStorageAdapter(path) as storage:
+        checkpoint = await storage.get_checkpoint("game-1")
+        assert checkpoint.event_id == events[-1].event_id
+        assert [event.guess for event in await storage.get_events("game-1")] == ["after"]
+
+
+@pytest.mark.asyncio
+async def test_compaction_bounds_log_size(tmp_path):
+    """Test that a long game keeps a constant number of live segments."""
+    async with SegmentedLogStorageAdapter(tmp_path / "log", segment_size=4096) as storage:
+        for round_number in range(60):
+            for event in make_round(round_number=round_number):
+                await storage.save_event(event)
+
+        assert storage.segment_count <= 3
+        assert await storage.get_events("game-1") == []
+        checkpoint = await storage.get_checkpoint("game-1")
+        assert len(checkpoint.game.rounds) == 60
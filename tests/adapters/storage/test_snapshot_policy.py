@@ -0,0 +1,202 @@
+"""Tests for the write-behind snapshot policy."""
+
+import asyncio
+
+import pytest
+
+from slop.adapters.storage import SnapshotPolicy, SnapshotPolicyStorage, SQLiteStorageAdapter
+from slop.domain import Game, GuessSubmitted, RoundCompleted
+
+
+def make_guess(game_id="game-1"):
+    """Create a GuessSubmitted event for testing."""
+    return GuessSubmitted(game_id=game_id, round_number=0, team_id="team-1", guess="a guess")
+
+
+@pytest.fixture
+async def inner(tmp_path):
+    """Create an open SQLite storage adapter to wrap."""
+    async with SQLiteStorageAdapter(tmp_path / "slop.db", compact=False) as adapter:
+        yield adapter
+
+
+def wrap(inner, **policy):
+    """Wrap storage with a policy that only fires on the given triggers."""
+    settings = {"every_events": None, "every_ms": None, "checkpoint_events": frozenset()}
+    settings.update(policy)
+    return SnapshotPolicyStorage(inner, SnapshotPolicy(**settings))
+
+
+@pytest.mark.asyncio
+async def test_snapshots_are_coalesced_until_flush(inner):
+    """Test that repeated snapshots of a game produce one write."""
+    storage = wrap(inner)
+    game = Game(id="game-1", room_code="ABCD")
+
+    for _ in range(10):
+        game.next_round()
+        await storage.save_snapshot(game)
+
+    assert await inner.get_snapshot("game-1") is None
+    assert storage.pending_count == 1
+    await storage.flush()
+    assert (await inner.get_snapshot("game-1")).current_round == 10
+    assert (storage.snapshots_requested, storage.snapshots_written) == (10, 1)
+
+
+@pytest.mark.asyncio
+async def test_reads_see_pending_snapshot(inner):
+    """Test that get_snapshot and room code lookups return unwritten state."""
+    storage = wrap(inner)
+    game = Game(id="game-1", room_code="ABCD")
+
+    await storage.save_snapshot(game)
+
+    assert await storage.get_snapshot("game-1") is game
+    assert await storage.get_game_by_room_code("ABCD") is game
+    assert await storage.list_active_games() == ["game-1"]
+
+
+class BlockedWrites:
+    """Storage whose snapshot writes wait until released."""
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.release = asyncio.Event()
+        self.writing = asyncio.Event()
+
+    def __getattr__(self, name):
+        """Delegate everything else to the wrapped storage."""
+        return getattr(self.inner, name)
+
+    async def save_snapshot(self, game):
+        """Signal the write, then wait for the release before storing."""
+        self.writing.set()
+        await self.release.wait()
+        await self.inner.save_snapshot(game)
+
+
+@pytest.mark.asyncio
+async def test_reads_see_snapshot_while_its_write_is_in_flight(inner):
+    """Test that a snapshot stays readable until its write completes."""
+    blocked = BlockedWrites(inner)
+    storage = wrap(blocked)
+    game = Game(id="game-1", room_code="ABCD")
+    await storage.save_snapshot(game)
+
+    flush = asyncio.create_task(storage.flush())
+    await blocked.writing.wait()
+    assert await storage.get_snapshot("game-1") is game
+    assert await storage.get_game_by_room_code("ABCD") is game
+
+    blocked.release.set()
+    await flush
+    assert storage.pending_count == 0
+    assert (await storage.get_game_by_room_code("ABCD")).id == "game-1"
+
+
+@pytest.mark.asyncio
+async def test_snapshot_saved_during_a_write_stays_pending(inner):
+    """Test that a newer snapshot requested mid-write is not cleared by that write."""
+    blocked = BlockedWrites(inner)
+    storage = wrap(blocked)
+    await storage.save_snapshot(Game(id="game-1", room_code="ABCD"))
+
+    flush = asyncio.create_task(storage.flush())
+    await blocked.writing.wait()
+    newer = Game(id="game-1", room_code="ABCD")
+    newer.next_round()
+    await storage.save_snapshot(newer)
+    blocked.release.set()
+    await flush
+
+    assert storage.pending_count == 1
+    assert await storage.get_snapshot("game-1") is newer
+    assert await storage.get_game_by_room_code("ABCD") is newer
+
+
+@pytest.mark.asyncio
+async def test_same_game_resaved_during_a_write_stays_pending(inner):
+    """Test that re-saving the mutated live game mid-write keeps it pending."""
+    blocked = BlockedWrites(inner)
+    storage = wrap(blocked)
+    game = Game(id="game-1", room_code="ABCD")
+    await storage.save_snapshot(game)
+
+    flush = asyncio.create_task(storage.flush())
+    await blocked.writing.wait()
+    game.next_round()
+    await storage.save_snapshot(game)
+    blocked.release.set()
+    await flush
+
+    assert storage.pending_count == 1
+    await storage.flush()
+    assert storage.snapshots_written == 2
+    assert (await inner.get_snapshot("game-1")).current_round == 1
+
+
+@pytest.mark.asyncio
+async def test_writes_every_n_events(inner):
+    """Test that the snapshot is written once N events have arrived."""
+    storage = wrap(inner, every_events=3)
+    game = Game(id="game-1", room_code="ABCD")
+
+    for _ in range(7):
+        await storage.save_event(make_guess())
+        await storage.save_snapshot(game)
+
+    assert storage.snapshots_written == 2
+    assert storage.pending_count == 1
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_event_writes_immediately(inner):
+    """Test that the snapshot following RoundCompleted is written through."""
+    storage = wrap(inner, checkpoint_events=frozenset({"RoundCompleted"}))
+    game = Game(id="game-1", room_code="ABCD")
+
+    await storage.save_event(make_guess())
+    await storage.save_snapshot(game)
+    assert storage.snapshots_written == 0
+
+    await storage.save_event(RoundCompleted(game_id="game-1", round_number=0, final_scores={}))
+    await storage.save_snapshot(game)
+
+    assert storage.snapshots_written == 1
+    assert storage.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_timer_writes_behind(inner):
+    """Test that a pending snapshot is written after every_ms."""
+    storage = wrap(inner, every_ms=10)
+    game = Game(id="game-1", room_code="ABCD")
+
+    await storage.save_snapshot(game)
+    await storage.save_snapshot(game)
+    await asyncio.sleep(0.05)
+
+    assert storage.snapshots_written == 1
+    assert await inner.get_snapshot("game-1") == game
+
+
+@pytest.mark.asyncio
+async def test_delete_discards_pending_snapshot(inner):
+    """Test that deleting a game cancels its pending write."""
+    storage = wrap(inner, every_ms=10)
+    await storage.save_snapshot(Game(id="game-1", room_code="ABCD"))
+
+    await storage.delete_game("game-1")
+    await asyncio.sleep(0.05)
+
+    assert storage.snapshots_written == 0
+    assert await storage.get_game_by_room_code("ABCD") is None
+
+
+def test_policy_rejects_invalid_thresholds():
+    """Test that non-positive thresholds are rejected."""
+    with pytest.raises(ValueError, match="every_events"):
+        SnapshotPolicy(every_events=0)
+    with pytest.raises(ValueError, match="every_ms"):
+        SnapshotPolicy(every_ms=-1)
@@ -0,0 +1,324 @@
+"""Tests for the SQLite storage adapter."""
+
+import asyncio
+import sqlite3
+import threading
+
+import pytest
+
+from slop.adapters.storage import SQLiteStorageAdapter
+from slop.domain import (
+    Game,
+    GameCreated,
+    Player,
+    PlayerJoined,
+    RoundCompleted,
+    RoundStarted,
+    ScriptGenerated,
+    Team,
+    TeamFormed,
+)
+
+
+def make_game_created(game_id="game-1", room_code="ABCD"):
+    """Create a GameCreated event for testing."""
+    return GameCreated(
+        game_id=game_id,
+        room_code=room_code,
+        content_tone="family",
+        max_players=12,
+        rounds_per_team=3,
+    )
+
+
+def make_player_joined(game_id="game-1", player_id="player-1"):
+    """Create a PlayerJoined event for testing."""
+    return PlayerJoined(
+        game_id=game_id,
+        player_id=player_id,
+        player_name="Alice",
+        socket_id="socket-1",
+    )
+
+
+def make_round(game_id="game-1", round_number=0):
+    """Create the events of one completed round, including its lobby setup."""
+    events = []
+    if round_number == 0:
+        events += [
+            make_game_created(game_id),
+            TeamFormed(game_id=game_id, team_id="team-1", team_name="Red", color="#FF0000"),
+        ]
+    events += [
+        RoundStarted(game_id=game_id, round_number=round_number, acting_team_id="team-1"),
+        ScriptGenerated(
+            game_id=game_id,
+            round_number=round_number,
+            script_content="A: hi",
+            personality_id="noir",
+            roles=[{"name": "A", "description": "a", "lines": ["hi"]}],
+            word_count=2,
+            estimated_duration=1,
+        ),
+        RoundCompleted(game_id=game_id, round_number=round_number, final_scores={"team-1": 1}),
+    ]
+    return events
+
+
+@pytest.fixture
+async def storage(tmp_path):
+    """Create an open SQLite storage adapter."""
+    async with SQLiteStorageAdapter(tmp_path / "slop.db") as adapter:
+        yield adapter
+
+
+@pytest.mark.asyncio
+async def test_save_and_get_events(storage):
+    """Test that events round-trip as their concrete subclasses, in order."""
+    created = make_game_created()
+    joined = make_player_joined()
+
+    await storage.save_event(created)
+    await storage.save_event(joined)
+    events = await storage.get_events("game-1")
+
+    assert events == [created, joined]
+    assert isinstance(events[1], PlayerJoined)
+
+
+@pytest.mark.asyncio
+async def test_get_events_only_returns_requested_game(storage):
+    """Test that events are partitioned by game."""
+    await storage.save_event(make_game_created("game-1", "ABCD"))
+    await storage.save_event(make_game_created("game-2", "WXYZ"))
+
+    events = await storage.get_events("game-2")
+
+    assert len(events) == 1
+    assert events[0].game_id == "game-2"
+
+
+@pytest.mark.asyncio
+async def test_get_events_unknown_game(storage):
+    """Test that an unknown game has no events."""
+    assert await storage.get_events("game-99") == []
+
+
+@pytest.mark.asyncio
+async def test_save_and_get_snapshot(storage):
+    """Test that snapshots round-trip the full game tree."""
+    game = Game(id="game-1", room_code="ABCD")
+    game.add_team(Team(id="team-1", name="Red Team", color="#FF0000"))
+    game.add_player(Player(id="player-1", name="Alice", socket_id="socket-1"))
+
+    await storage.save_snapshot(game)
+    retrieved = await storage.get_snapshot("game-1")
+
+    assert retrieved == game
+
+
+@pytest.mark.asyncio
+async def test_save_snapshot_replaces_previous(storage):
+    """Test that saving a snapshot overwrites the previous one."""
+    game = Game(id="game-1", room_code="ABCD")
+    await storage.save_snapshot(game)
+
+    game.next_round()
+    await storage.save_snapshot(game)
+    retrieved = await storage.get_snapshot("game-1")
+
+    assert retrieved is not None
+    assert retrieved.current_round == 1
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_not_found(storage):
+    """Test that a missing snapshot returns None."""
+    assert await storage.get_snapshot("game-99") is None
+
+
+@pytest.mark.asyncio
+async def test_get_game_by_room_code(storage):
+    """Test looking up a snapshot by room code."""
+    await storage.save_snapshot(Game(id="game-1", room_code="WXYZ"))
+
+    retrieved = await storage.get_game_by_room_code("WXYZ")
+
+    assert retrieved is not None
+    assert retrieved.id == "game-1"
+    assert await storage.get_game_by_room_code("NOPE") is None
+
+
+@pytest.mark.asyncio
+async def test_delete_game(storage):
+    """Test that deleting a game removes its events and snapshot."""
+    await storage.save_snapshot(Game(id="game-1", room_code="TEST"))
+    await storage.save_event(make_game_created(room_code="TEST"))
+
+    await storage.delete_game("game-1")
+
+    assert await storage.get_events("game-1") == []
+    assert await storage.get_snapshot("game-1") is None
+    assert await storage.get_game_by_room_code("TEST") is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_saves_are_group_committed(storage):
+    """Test that concurrent appends share transactions."""
+    events = [make_player_joined(player_id=f"player-{i}") for i in range(50)]
+
+    await asyncio.gather(*(storage.save_event(event) for event in events))
+
+    assert storage.write_count == 50
+    assert storage.commit_count < 50
+    assert len(await storage.get_events("game-1")) == 50
+
+
+@pytest.mark.asyncio
+async def test_failed_write_does_not_fail_batch(storage):
+    """Test that one bad write in a batch only fails its own caller."""
+    duplicate = make_game_created()
+    await storage.save_event(duplicate)
+
+    results = await asyncio.gather(
+        storage.save_event(duplicate),
+        storage.save_event(make_player_joined()),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], sqlite3.IntegrityError)
+    assert results[1] is None
+    assert len(await storage.get_events("game-1")) == 2
+
+
+@pytest.mark.asyncio
+async def test_data_survives_reopen(tmp_path):
+    """Test that committed writes are durable across adapter instances."""
+    path = tmp_path / "slop.db"
+    async with SQLiteStorageAdapter(path) as adapter:
+        await adapter.save_event(make_game_created())
+        await adapter.save_snapshot(Game(id="game-1", room_code="ABCD"))
+
+    async with SQLiteStorageAdapter(path) as adapter:
+        assert len(await adapter.get_events("game-1")) == 1
+        assert await adapter.get_snapshot("game-1") is not None
+
+
+@pytest.mark.asyncio
+async def test_uses_wal_mode(tmp_path):
+    """Test that the database is switched to WAL journaling."""
+    path = tmp_path / "slop.db"
+    async with SQLiteStorageAdapter(path):
+        pass
+
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+@pytest.mark.asyncio
+async def test_requires_open(tmp_path):
+    """Test that using the adapter before opening it fails clearly."""
+    adapter = SQLiteStorageAdapter(tmp_path / "slop.db")
+
+    with pytest.raises(RuntimeError, match="not open"):
+        await adapter.save_event(make_game_created())
+
+
+@pytest.mark.asyncio
+async def test_binary_events_round_trip(tmp_path):
+    """Test that binary-encoded events are readable alongside JSON ones."""
+    path = tmp_path / "slop.db"
+    created = make_game_created()
+    joined = make_player_joined()
+    async with SQLiteStorageAdapter(path) as adapter:
+        await adapter.save_event(created)
+
+    async with SQLiteStorageAdapter(path, binary_events=True) as adapter:
+        await adapter.save_event(joined)
+
+        assert await adapter.get_events("game-1") == [created, joined]
+
+
+@pytest.mark.asyncio
+async def test_list_active_games(storage):
+    """Test that games with events or a snapshot are listed until deleted."""
+    await storage.save_event(make_game_created("game-1", "ABCD"))
+    await storage.save_snapshot(Game(id="game-2", room_code="WXYZ"))
+    await storage.save_event(make_game_created("game-3", "EFGH"))
+    await storage.delete_game("game-3")
+
+    assert sorted(await storage.list_active_games()) == ["game-1", "game-2"]
+
+
+@pytest.mark.asyncio
+async def test_round_completed_writes_checkpoint(storage):
+    """Test that RoundCompleted replaces the events it covers with a checkpoint."""
+    events = make_round(round_number=0) + make_round(round_number=1)
+    for event in events:
+        await storage.save_event(event)
+    after = make_player_joined()
+    await storage.save_event(after)
+
+    checkpoint = await storage.get_checkpoint("game-1")
+
+    assert await storage.get_events("game-1") == [after]
+    assert checkpoint.event_id == events[-1].event_id
+    assert [r.round_number for r in checkpoint.game.rounds] == [0, 1]
+    assert checkpoint.game.current_round == 2
+
+
+@pytest.mark.asyncio
+async def test_compaction_can_be_disabled(tmp_path):
+    """Test that compact=False keeps the full event log."""
+    events = make_round()
+    async with SQLiteStorageAdapter(tmp_path / "slop.db", compact=False) as adapter:
+        for event in events:
+            await adapter.save_event(event)
+
+        assert await adapter.get_events("game-1") == events
+        assert await adapter.get_checkpoint("game-1") is None
+
+
+@pytest.mark.asyncio
+async def test_delete_game_removes_checkpoint(storage):
+    """Test that deleting a game also drops its checkpoint."""
+    for event in make_round():
+        await storage.save_event(event)
+
+    await storage.delete_game("game-1")
+
+    assert await storage.get_checkpoint("game-1") is None
+    assert await storage.list_active_games() == []
+
+
+class SlowConnection:
+    """Reader connection whose queries wait until released."""
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def execute(self, *args):
+        """Signal the query, then run it once released."""
+        self.started.set()
+        self.release.wait(5)
+        return self.inner.execute(*args)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_read_keeps_its_connection_until_the_query_ends(tmp_path):
+    """Test that a cancelled reader's connection returns to the pool only after its thread."""
+    async with SQLiteStorageAdapter(tmp_path / "slop.db", read_pool_size=1) as storage:
+        slow = SlowConnection(storage._readers.get_nowait())
+        storage._readers.put_nowait(slow)
+        read = asyncio.create_task(storage.get_events("game-1"))
+        await asyncio.to_thread(slow.started.wait, 5)
+
+        read.cancel()
+        await asyncio.gather(read, return_exceptions=True)
+        assert read.cancelled()
+        assert storage._readers.qsize() == 0
+
+        slow.release.set()
+        await asyncio.wait_for(storage._readers.get(), 5)
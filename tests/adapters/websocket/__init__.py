@@ -0,0 +1 @@
+"""WebSocket adapter tests."""
@@ -0,0 +1,95 @@
+"""Tests for the room fan-out core."""
+
+import pytest
+
+from slop.adapters.websocket import FanOut, Frame, InMemoryConnection
+from slop.domain import PlayerLeft, event_codec
+
+
+def frame(n=0):
+    """Build a frame for a test event."""
+    return Frame.from_event(PlayerLeft(game_id="game-1", player_id=f"player-{n}"))
+
+
+def connected(fanout, *socket_ids):
+    """Connect in-memory connections for the socket IDs."""
+    connections = {}
+    for socket_id in socket_ids:
+        connections[socket_id] = InMemoryConnection()
+        fanout.connect(socket_id, connections[socket_id])
+    return connections
+
+
+def test_frame_holds_the_event_encoding():
+    """Test that a frame carries the event's type, game and JSON encoding."""
+    event = PlayerLeft(game_id="game-1", player_id="player-1")
+
+    encoded = Frame.from_event(event)
+
+    assert (encoded.event_type, encoded.game_id) == ("PlayerLeft", "game-1")
+    assert event_codec.decode_event(encoded.data) == event
+
+
+def test_broadcast_hands_the_same_frame_to_every_member():
+    """Test that a broadcast reaches exactly the room's members, sharing one buffer."""
+    fanout = FanOut()
+    connections = connected(fanout, "a", "b", "c")
+    fanout.join("a", "ROOM")
+    fanout.join("b", "ROOM")
+    sent = frame()
+
+    assert fanout.broadcast("ROOM", sent) == 2
+
+    assert connections["a"].frames[0] is sent
+    assert connections["b"].frames[0] is sent
+    assert connections["c"].frames == []
+
+
+def test_membership_changes_update_broadcast_targets():
+    """Test that joins, leaves and disconnects are reflected in later broadcasts."""
+    fanout = FanOut()
+    connections = connected(fanout, "a", "b")
+    fanout.join("a", "ROOM")
+    fanout.broadcast("ROOM", frame(1))
+    fanout.join("b", "ROOM")
+    fanout.broadcast("ROOM", frame(2))
+    fanout.leave("a", "ROOM")
+    fanout.broadcast("ROOM", frame(3))
+    fanout.disconnect("b")
+
+    assert fanout.broadcast("ROOM", frame(4)) == 0
+    assert len(connections["a"].frames) == 2
+    assert len(connections["b"].frames) == 2
+    assert fanout.members("ROOM") == set()
+    assert "b" not in fanout
+
+
+def test_reconnect_replaces_the_connection_in_its_rooms():
+    """Test that connecting a socket again sends its room traffic to the new connection."""
+    fanout = FanOut()
+    old = connected(fanout, "a")["a"]
+    fanout.join("a", "ROOM")
+    fanout.broadcast("ROOM", frame(1))
+
+    new = InMemoryConnection()
+    fanout.connect("a", new)
+    fanout.broadcast("ROOM", frame(2))
+
+    assert len(old.frames) == 1
+    assert len(new.frames) == 1
+
+
+def test_join_requires_a_connection():
+    """Test that an unknown socket cannot join a room."""
+    with pytest.raises(ValueError, match="not connected"):
+        FanOut().join("ghost", "ROOM")
+
+
+def test_send_to_unknown_socket_is_reported():
+    """Test that sending to a socket that is not connected returns False."""
+    fanout = FanOut()
+    connection = connected(fanout, "a")["a"]
+
+    assert fanout.send("a", frame())
+    assert not fanout.send("ghost", frame())
+    assert len(connection.frames) == 1
@@ -0,0 +1,69 @@
+"""Tests for the in-memory realtime adapter."""
+
+import pytest
+
+from slop.adapters.websocket import FanOut, InMemoryRealtime
+from slop.domain import PlayerLeft, ScoresUpdated, binary_codec
+
+
+@pytest.mark.asyncio
+async def test_broadcast_serializes_once_for_the_whole_room():
+    """Test that a broadcast encodes the event once and every member decodes it."""
+    realtime = InMemoryRealtime()
+    connections = [realtime.connect(f"sid-{i}") for i in range(18)]
+    for i in range(18):
+        await realtime.join_room(f"sid-{i}", "ROOM")
+    event = ScoresUpdated(game_id="game-1", round_number=1, score_changes={"team-1": 3})
+
+    await realtime.broadcast_to_room("ROOM", event)
+
+    assert realtime.frames_encoded == 1
+    assert all(connection.events() == [event] for connection in connections)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_uses_the_configured_encoder():
+    """Test that a binary encoder produces one shared binary frame per broadcast."""
+    realtime = InMemoryRealtime(encode=binary_codec.encode_event)
+    connections = [realtime.connect(f"sid-{i}") for i in range(3)]
+    for i in range(3):
+        await realtime.join_room(f"sid-{i}", "ROOM")
+    event = ScoresUpdated(game_id="game-1", round_number=1, score_changes={"team-1": 3})
+
+    await realtime.broadcast_to_room("ROOM", event)
+
+    frame = connections[0].frames[0]
+    assert binary_codec.is_binary_event(frame.data)
+    assert all(connection.frames[0] is frame for connection in connections)
+    assert all(connection.events() == [event] for connection in connections)
+    with pytest.raises(ValueError, match="encode"):
+        InMemoryRealtime(FanOut(), encode=binary_codec.encode_event)
+
+
+@pytest.mark.asyncio
+async def test_send_to_player_reaches_only_that_socket():
+    """Test that a direct send goes to one socket and unknown sockets are ignored."""
+    realtime = InMemoryRealtime()
+    target, other = realtime.connect("sid-1"), realtime.connect("sid-2")
+    event = PlayerLeft(game_id="game-1", player_id="player-1")
+
+    await realtime.send_to_player("sid-1", event)
+    await realtime.send_to_player("ghost", event)
+
+    assert target.events() == [event]
+    assert other.frames == []
+
+
+@pytest.mark.asyncio
+async def test_left_and_disconnected_sockets_stop_receiving():
+    """Test that leaving a room or disconnecting stops broadcasts to a socket."""
+    realtime = InMemoryRealtime()
+    leaver, dropped, stayer = (realtime.connect(s) for s in ("sid-1", "sid-2", "sid-3"))
+    for socket_id in ("sid-1", "sid-2", "sid-3"):
+        await realtime.join_room(socket_id, "ROOM")
+
+    await realtime.leave_room("sid-1", "ROOM")
+    realtime.disconnect("sid-2")
+    await realtime.broadcast_to_room("ROOM", PlayerLeft(game_id="game-1", player_id="p"))
+
+    assert (len(leaver.frames), len(dropped.frames), len(stayer.frames)) == (0, 0, 1)
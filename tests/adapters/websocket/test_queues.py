@@ -0,0 +1,246 @@
+"""Tests for bounded per-connection send queues."""
+
+import asyncio
+
+import pytest
+
+from slop.adapters.websocket import FanOut, Frame, QueuedConnection, merge_key
+from slop.domain import PlayerLeft, ScoresUpdated, ScriptStreamed, binary_codec
+
+
+class Socket:
+    """Fake socket whose writes can be held back."""
+
+    def __init__(self, blocked=False):
+        self.written = []
+        self.frames = []
+        self.open = asyncio.Event()
+        if not blocked:
+            self.open.set()
+
+    async def write(self, frame):
+        """Record a frame once the socket accepts writes."""
+        await self.open.wait()
+        self.written.append(frame.event)
+        self.frames.append(frame)
+
+
+def scores(round_number, **changes):
+    """Build a frame for a ScoresUpdated event."""
+    event = ScoresUpdated(game_id="game-1", round_number=round_number, score_changes=changes)
+    return Frame.from_event(event)
+
+
+def left(n):
+    """Build a frame for a PlayerLeft event."""
+    return Frame.from_event(PlayerLeft(game_id="game-1", player_id=f"player-{n}"))
+
+
+def test_rejects_invalid_limits():
+    """Test that queue caps are validated."""
+    with pytest.raises(ValueError, match="max_messages"):
+        QueuedConnection(Socket().write, max_messages=0)
+    with pytest.raises(ValueError, match="max_bytes"):
+        QueuedConnection(Socket().write, max_bytes=0)
+
+
+def test_merge_key_covers_per_round_deltas():
+    """Test that score and script-stream deltas of a round share a key."""
+    streamed = ScriptStreamed(game_id="game-1", round_number=2, roles=[], lines=[])
+
+    assert merge_key(scores(1, a=1).event) == ("ScoresUpdated", "game-1", 1)
+    assert merge_key(streamed) == ("ScriptStreamed", "game-1", 2)
+    assert merge_key(left(1).event) is None
+
+
+@pytest.mark.asyncio
+async def test_frames_are_written_in_order():
+    """Test that queued frames reach the socket in the order they were sent."""
+    socket = Socket()
+    connection = QueuedConnection(socket.write)
+    frames = [left(i) for i in range(5)]
+
+    for frame in frames:
+        connection.send(frame)
+    await connection.flush()
+
+    assert socket.written == [frame.event for frame in frames]
+    assert connection.stats.sent == 5
+    assert connection.stats.depth == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_connection_does_not_stall_the_room():
+    """Test that a blocked socket leaves broadcasts to the others unaffected."""
+    fanout = FanOut()
+    slow, fast = Socket(blocked=True), Socket()
+    slow_connection = QueuedConnection(slow.write)
+    fast_connection = QueuedConnection(fast.write)
+    for socket_id, connection in (("slow", slow_connection), ("fast", fast_connection)):
+        fanout.connect(socket_id, connection)
+        fanout.join(socket_id, "ROOM")
+
+    for i in range(3):
+        fanout.broadcast("ROOM", left(i))
+    await asyncio.wait_for(fast_connection.flush(), 1.0)
+
+    assert len(fast.written) == 3
+    assert slow.written == []
+    assert slow_connection.stats.depth == 2  # one frame is being written
+    slow.open.set()
+    await slow_connection.flush()
+    assert len(slow.written) == 3
+
+
+@pytest.mark.asyncio
+async def test_overflow_merges_superseded_score_updates():
+    """Test that an overflowing queue folds score deltas of a round together."""
+    socket = Socket(blocked=True)
+    resyncs = []
+    connection = QueuedConnection(socket.write, max_messages=3, on_resync=lambda: resyncs.append(1))
+    connection.send(left(0))  # taken by the writer at once
+    await asyncio.sleep(0)
+
+    connection.send(scores(1, a=1, b=2))
+    connection.send(scores(1, a=3))
+    connection.send(left(1))
+    connection.send(scores(2, b=5))
+
+    assert connection.stats.depth == 3
+    assert connection.stats.merged == 1
+    assert resyncs == []
+    socket.open.set()
+    await connection.flush()
+    events = socket.written[1:]
+    assert [e.event_type for e in events] == ["ScoresUpdated", "PlayerLeft", "ScoresUpdated"]
+    assert events[0].score_changes == {"a": 4, "b": 2}
+    assert events[2].round_number == 2
+
+
+@pytest.mark.asyncio
+async def test_merged_frames_use_the_connection_encoder():
+    """Test that compaction re-encodes merged events with the configured encoder."""
+    socket = Socket(blocked=True)
+    connection = QueuedConnection(socket.write, max_messages=1, encode=binary_codec.encode_event)
+    connection.send(left(0))  # taken by the writer at once
+    await asyncio.sleep(0)
+
+    connection.send(scores(1, a=1))
+    connection.send(scores(1, a=2))
+    socket.open.set()
+    await connection.flush()
+
+    assert connection.stats.merged == 1
+    assert socket.frames[-1].event.score_changes == {"a": 3}
+    assert binary_codec.decode_event(socket.frames[-1].data) == socket.frames[-1].event
+
+
+@pytest.mark.asyncio
+async def test_compaction_does_not_reorder_past_other_events():
+    """Test that deltas separated by another event are not merged across it."""
+    socket = Socket(blocked=True)
+    resyncs = []
+    connection = QueuedConnection(socket.write, max_messages=2, on_resync=lambda: resyncs.append(1))
+    connection.send(left(0))  # taken by the writer at once
+    await asyncio.sleep(0)
+
+    connection.send(scores(1, a=1))
+    connection.send(left(1))
+    connection.send(scores(1, a=3))
+
+    assert connection.stats.merged == 0
+    assert resyncs == [1]
+    await connection.close()
+
+
+@pytest.mark.asyncio
+async def test_client_too_far_behind_is_resynced():
+    """Test that a queue that cannot be compacted is dropped and a resync requested."""
+    socket = Socket(blocked=True)
+    resyncs = []
+    connection = QueuedConnection(socket.write, max_messages=2, on_resync=lambda: resyncs.append(1))
+
+    connection.send(left(0))  # taken by the writer at once
+    await asyncio.sleep(0)
+    for i in range(1, 4):
+        connection.send(left(i))
+
+    stats = connection.stats
+    assert resyncs == [1]
+    assert (stats.resyncs, stats.dropped) == (1, 3)
+    assert stats.depth == 0
+    connection.send(left(9))  # the resync itself is queued normally
+    socket.open.set()
+    await connection.flush()
+    assert [e.player_id for e in socket.written] == ["player-0", "player-9"]
+
+
+@pytest.mark.asyncio
+async def test_flush_after_resync_waits_for_the_write_in_flight():
+    """Test that dropping the queue does not let flush skip the frame being written."""
+    socket = Socket(blocked=True)
+    connection = QueuedConnection(socket.write, max_messages=1)
+    connection.send(left(0))  # taken by the writer at once
+    await asyncio.sleep(0)
+    connection.send(left(1))
+    connection.send(left(2))
+    assert connection.stats.resyncs == 1
+
+    flush = asyncio.create_task(connection.flush())
+    await asyncio.sleep(0.01)
+    assert not flush.done()
+
+    socket.open.set()
+    await asyncio.wait_for(flush, 1.0)
+    assert [e.player_id for e in socket.written] == ["player-0"]
+
+
+@pytest.mark.asyncio
+async def test_byte_cap_triggers_resync():
+    """Test that the byte cap is enforced as well as the message cap."""
+    connection = QueuedConnection(Socket(blocked=True).write, max_bytes=len(left(0).data) * 2)
+
+    for i in range(4):
+        connection.send(left(i))
+
+    assert connection.stats.resyncs == 1
+    await connection.close()
+
+
+@pytest.mark.asyncio
+async def test_frame_over_the_byte_cap_is_sent_alone():
+    """Test that a frame larger than the byte cap is sent rather than resynced."""
+    socket = Socket()
+    resyncs = []
+    big = scores(1, **{f"team-{i}": i for i in range(50)})
+    connection = QueuedConnection(
+        socket.write, max_bytes=len(big.data) // 2, on_resync=lambda: resyncs.append(1)
+    )
+
+    connection.send(big)
+    await connection.flush()
+    connection.send(big)
+    await connection.flush()
+
+    assert resyncs == []
+    assert connection.stats.sent == 2
+    assert socket.written == [big.event, big.event]
+
+
+@pytest.mark.asyncio
+async def test_failed_write_closes_the_connection():
+    """Test that a write error closes the connection and later frames are dropped."""
+
+    async def broken(frame):
+        """Fail every write."""
+        raise ConnectionResetError
+
+    connection = QueuedConnection(broken)
+    connection.send(left(0))
+    connection.send(left(1))
+    await connection.flush()
+    connection.send(left(2))
+
+    assert connection.closed
+    assert connection.stats.dropped == 3
+    assert connection.stats.sent == 0
@@ -0,0 +1,108 @@
+"""Tests for the content filter."""
+
+import pytest
+
+from slop.application import ContentFilter, Violation
+from slop.domain import ContentTone, Role, Script
+
+
+def script(content, *lines):
+    """Build a one-role script with the given body and lines."""
+    return Script(content=content, roles=[Role("Sam", "A detective", list(lines))], personality="p")
+
+
+@pytest.fixture
+def content_filter():
+    """Return a filter with small, tone-specific blocklists."""
+    return ContentFilter(
+        {
+            ContentTone.FAMILY: ["darn", "darned", "gosh darn it", "heck"],
+            ContentTone.ADULT: ["heck"],
+        },
+        {ContentTone.FAMILY: [r"\d{3}-\d{4}"]},
+    )
+
+
+def test_matches_whole_words_case_insensitively(content_filter):
+    """Test that terms match whole words in any case, but not inside other words."""
+    violations = content_filter.scan("Darn! What the HECK. Darned checkers.", ContentTone.FAMILY)
+
+    assert [v.text for v in violations] == ["Darn", "HECK", "Darned"]
+    assert content_filter.scan("Checkered darnings", ContentTone.FAMILY) == []
+
+
+def test_phrases_allow_any_whitespace(content_filter):
+    """Test that the words of a phrase may be separated by any whitespace."""
+    violations = content_filter.scan("Oh gosh\n  darn it.", ContentTone.FAMILY)
+
+    assert violations == [Violation("gosh\n  darn it", "text", 3)]
+
+
+def test_tone_selects_the_blocklist(content_filter):
+    """Test that each tone uses only its own terms and patterns."""
+    text = "Darn, call 555-1234, heck"
+
+    assert [v.text for v in content_filter.scan(text, ContentTone.FAMILY)] == [
+        "Darn",
+        "555-1234",
+        "heck",
+    ]
+    assert [v.text for v in content_filter.scan(text, ContentTone.ADULT)] == ["heck"]
+
+
+def test_check_script_reports_field_and_offset(content_filter):
+    """Test that violations in the body and in role lines are located."""
+    checked = script("Clean intro. Heck.", "All fine.", "Well darn")
+
+    assert content_filter.check_script(checked, ContentTone.FAMILY) == [
+        Violation("Heck", "content", 13),
+        Violation("darn", "roles[0].lines[1]", 5),
+    ]
+    assert not content_filter.is_clean(checked, ContentTone.FAMILY)
+    assert content_filter.is_clean(script("All fine.", "Still fine."), ContentTone.FAMILY)
+
+
+def test_phrase_cannot_span_two_fields(content_filter):
+    """Test that a phrase split across the body and a line is not matched."""
+    checked = script("He said gosh", "darn it")
+
+    assert [v.text for v in content_filter.check_script(checked, ContentTone.FAMILY)] == ["darn"]
+
+
+def test_stream_finds_terms_split_across_chunks(content_filter):
+    """Test that streamed text is matched across chunk boundaries, once each."""
+    scanner = content_filter.stream(ContentTone.FAMILY)
+    chunks = ["SAM: Oh go", "sh da", "rn it! ", "That he", "ck", "ler is darne", "d"]
+
+    violations = [v for chunk in chunks for v in scanner.feed(chunk)] + scanner.finish()
+
+    text = "".join(chunks)
+    assert violations == [
+        Violation("gosh darn it", "stream", text.index("gosh")),
+        Violation("darned", "stream", text.index("darned")),
+    ]
+
+
+def test_stream_matches_whole_text_scan_for_long_input():
+    """Test that scanning in small chunks finds exactly what a single scan finds."""
+    content_filter = ContentFilter(max_match_length=8)
+    text = "Well damn, the hell-hound said hello to the class. " * 20 + "damn"
+    scanner = content_filter.stream(ContentTone.FAMILY)
+
+    streamed = [v for i in range(0, len(text), 7) for v in scanner.feed(text[i : i + 7])]
+    streamed += scanner.finish()
+
+    expected = [
+        Violation(v.text, "stream", v.start) for v in content_filter.scan(text, ContentTone.FAMILY)
+    ]
+    assert streamed == expected
+    assert len(expected) == 41
+
+
+def test_empty_blocklist_allows_everything():
+    """Test that a tone with nothing blocked never reports violations."""
+    content_filter = ContentFilter({ContentTone.FAMILY: ["heck"]})
+
+    assert content_filter.scan("heck", ContentTone.ADULT) == []
+    assert content_filter.is_clean(script("heck"), ContentTone.ADULT)
+    assert content_filter.stream(ContentTone.ADULT).feed("heck") == []
@@ -0,0 +1,233 @@
+"""Tests for crash recovery of active games."""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from slop.adapters.storage import SQLiteStorageAdapter
+from slop.application import RecoveryOrchestrator
+from slop.domain import (
+    Game,
+    GameCompleted,
+    GameCreated,
+    GameStatus,
+    PlayerJoined,
+    PlayerJoinedTeam,
+    PromptSubmitted,
+    RoundCompleted,
+    RoundStarted,
+    ScriptGenerated,
+    TeamFormed,
+)
+
+
+def make_lobby(game_id, room_code):
+    """Create the events of a lobby with one team of one player."""
+    return [
+        GameCreated(
+            game_id=game_id,
+            room_code=room_code,
+            content_tone="family",
+            max_players=12,
+            rounds_per_team=3,
+        ),
+        TeamFormed(game_id=game_id, team_id="team-1", team_name="Red", color="#FF0000"),
+        PlayerJoined(game_id=game_id, player_id="player-1", player_name="A", socket_id="s1"),
+        PlayerJoinedTeam(game_id=game_id, player_id="player-1", team_id="team-1"),
+    ]
+
+
+def make_round(game_id, round_number, *, script=True, completed=True):
+    """Create the events of one round, optionally cut short."""
+    events = [
+        RoundStarted(game_id=game_id, round_number=round_number, acting_team_id="team-1"),
+        PromptSubmitted(
+            game_id=game_id, round_number=round_number, prompt="p", submitted_by="player-1"
+        ),
+    ]
+    if script:
+        events.append(
+            ScriptGenerated(
+                game_id=game_id,
+                round_number=round_number,
+                script_content="A: hi",
+                personality_id="noir",
+                roles=[{"name": "A", "description": "a", "lines": ["hi"]}],
+                word_count=2,
+                estimated_duration=1,
+            )
+        )
+    if completed:
+        events.append(
+            RoundCompleted(game_id=game_id, round_number=round_number, final_scores={"team-1": 1})
+        )
+    return events
+
+
+@pytest.fixture
+async def storage(tmp_path):
+    """Create an open SQLite storage adapter."""
+    async with SQLiteStorageAdapter(tmp_path / "slop.db") as adapter:
+        yield adapter
+
+
+async def save_all(storage, events):
+    """Persist events in order."""
+    for event in events:
+        await storage.save_event(event)
+
+
+@pytest.mark.asyncio
+async def test_recovers_every_active_game(storage):
+    """Test that all stored games are recovered with per-game timings."""
+    for i in range(5):
+        await save_all(storage, [*make_lobby(f"game-{i}", f"ROOM{i}"), *make_round(f"game-{i}", 0)])
+
+    report = await RecoveryOrchestrator(storage).recover_all()
+
+    assert sorted(r.game.id for r in report.recovered) == [f"game-{i}" for i in range(5)]
+    assert report.failed == {}
+    for recovered in report.recovered:
+        assert recovered.game.current_round == 1
+        assert recovered.incomplete_round is None
+        assert [r.round_number for r in recovered.game.rounds] == [0]
+        assert recovered.duration > 0
+    assert report.duration >= max(r.duration for r in report.recovered)
+
+
+@pytest.mark.asyncio
+async def test_incomplete_round_without_script(storage):
+    """Test that a round interrupted before its script is flagged for regeneration."""
+    events = [*make_lobby("game-1", "ABCD"), *make_round("game-1", 0)]
+    events += make_round("game-1", 1, script=False, completed=False)
+    await save_all(storage, events)
+
+    recovered = await RecoveryOrchestrator(storage).recover_game("game-1")
+
+    assert recovered.incomplete_round == 1
+    assert recovered.needs_script
+    assert [r.round_number for r in recovered.game.rounds] == [0]
+    assert recovered.game.current_round == 1
+
+
+@pytest.mark.asyncio
+async def test_incomplete_round_with_script(storage):
+    """Test that a round interrupted after its script resumes in place."""
+    events = [*make_lobby("game-1", "ABCD"), *make_round("game-1", 0, completed=False)]
+    await save_all(storage, events)
+
+    recovered = await RecoveryOrchestrator(storage).recover_game("game-1")
+
+    assert recovered.incomplete_round == 0
+    assert not recovered.needs_script
+    assert recovered.game.rounds[0].round_number == 0
+
+
+@pytest.mark.asyncio
+async def test_resumes_from_checkpoint(storage):
+    """Test that only events after the last RoundCompleted are replayed."""
+    events = [*make_lobby("game-1", "ABCD"), *make_round("game-1", 0)]
+    events += make_round("game-1", 1, completed=False)
+    await save_all(storage, events)
+
+    recovered = await RecoveryOrchestrator(storage).recover_game("game-1")
+
+    assert recovered.events_replayed == 3
+    assert [r.round_number for r in recovered.game.rounds] == [0, 1]
+    assert recovered.incomplete_round == 1
+
+
+@pytest.mark.asyncio
+async def test_replays_full_log_without_compaction(tmp_path):
+    """Test that recovery also works from an uncompacted log."""
+    events = [*make_lobby("game-1", "ABCD"), *make_round("game-1", 0)]
+    async with SQLiteStorageAdapter(tmp_path / "slop.db", compact=False) as storage:
+        await save_all(storage, events)
+
+        recovered = await RecoveryOrchestrator(storage).recover_game("game-1")
+
+    assert recovered.events_replayed == len(events)
+    assert recovered.game.current_round == 1
+
+
+@pytest.mark.asyncio
+async def test_finished_games_are_skipped(storage):
+    """Test that a completed but undeleted game is not resumed."""
+    events = [*make_lobby("game-1", "ABCD"), *make_round("game-1", 0)]
+    events.append(GameCompleted(game_id="game-1", final_scores={"team-1": 1}, winner_team_id=None))
+    await save_all(storage, events)
+
+    report = await RecoveryOrchestrator(storage).recover_all()
+
+    assert report.recovered == []
+    assert report.failed == {}
+
+
+@pytest.mark.asyncio
+async def test_snapshot_only_game(storage):
+    """Test that a game without events is recovered from its snapshot."""
+    game = Game(id="game-1", room_code="ABCD", status=GameStatus.PLAYING)
+    await storage.save_snapshot(game)
+
+    recovered = await RecoveryOrchestrator(storage).recover_game("game-1")
+
+    assert recovered.game == game
+    assert recovered.events_replayed == 0
+
+
+@pytest.mark.asyncio
+async def test_failure_is_isolated(storage):
+    """Test that one unrecoverable game does not stop the others."""
+    await save_all(storage, make_lobby("game-1", "ABCD"))
+    await save_all(storage, make_lobby("game-2", "WXYZ")[1:])
+
+    report = await RecoveryOrchestrator(storage).recover_all()
+
+    assert [r.game.id for r in report.recovered] == ["game-1"]
+    assert isinstance(report.failed["game-2"], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_parallelism_is_bounded(storage):
+    """Test that no more than max_concurrency games load at once."""
+    for i in range(10):
+        await save_all(storage, make_lobby(f"game-{i}", f"ROOM{i}"))
+    active = 0
+    peak = 0
+    get_events = storage.get_events
+
+    async def tracking_get_events(game_id):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        try:
+            return await get_events(game_id)
+        finally:
+            active -= 1
+
+    storage.get_events = tracking_get_events
+    report = await RecoveryOrchestrator(storage, max_concurrency=3).recover_all()
+
+    assert len(report.recovered) == 10
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_replay_in_process_pool(storage):
+    """Test that replay can run in a process pool."""
+    await save_all(storage, [*make_lobby("game-1", "ABCD"), *make_round("game-1", 0)])
+
+    spawn = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as executor:
+        report = await RecoveryOrchestrator(storage, executor=executor).recover_all()
+
+    assert report.recovered[0].game.get_player("player-1").team_id == "team-1"
+
+
+def test_rejects_zero_concurrency():
+    """Test that max_concurrency must be positive."""
+    with pytest.raises(ValueError, match="at least 1"):
+        RecoveryOrchestrator(object(), max_concurrency=0)
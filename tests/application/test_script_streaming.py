@@ -0,0 +1,130 @@
+"""Tests for streaming scripts to the acting team."""
+
+import asyncio
+
+import pytest
+
+from slop.application import DEFAULT_BLOCKLISTS, BlockedContentError, ContentFilter, ScriptStreamer
+from slop.domain import AIPersonality, ContentTone, ScriptStreamed
+from slop.ports import LLMError
+
+NOIR = AIPersonality(id="noir", name="Noir", description="Hard-boiled", system_prompt="Be noir.")
+
+
+class ChunkedLLM:
+    """Streams fixed text in small chunks."""
+
+    def __init__(self, text, chunk_size=8, fail_after=None, delay=0.0):
+        self.text = text
+        self.chunk_size = chunk_size
+        self.fail_after = fail_after
+        self.delay = delay
+        self.closed = False
+
+    async def stream_script(self, prompt, personality, num_roles, *, tone=ContentTone.FAMILY):
+        """Yield the text in chunks, optionally slowly or failing part-way."""
+        try:
+            for i, start in enumerate(range(0, len(self.text), self.chunk_size)):
+                if i == self.fail_after:
+                    raise LLMError("connection reset")
+                await asyncio.sleep(self.delay)
+                yield self.text[start : start + self.chunk_size]
+        finally:
+            self.closed = True
+
+
+class RecordingRealtime:
+    """Records events sent to each socket."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_to_player(self, socket_id, event):
+        """Record a direct message."""
+        self.sent.append((socket_id, event))
+
+
+SCRIPT = "ROLE: Sam | A detective\nROLE: Vic | A curator\nSAM: Hands up.\nVIC: Never!\n"
+
+
+async def stream(llm, realtime, sockets=("s1", "s2"), **options):
+    """Stream a script for round 0 of game-1 to the given sockets."""
+    return await ScriptStreamer(llm, realtime, **options).stream(
+        game_id="game-1",
+        round_number=0,
+        socket_ids=list(sockets),
+        prompt="A heist",
+        personality=NOIR,
+        num_roles=2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_lines_reach_every_actor_as_they_are_parsed():
+    """Test that roles and lines are sent incrementally to each socket."""
+    realtime = RecordingRealtime()
+
+    result = await stream(ChunkedLLM(SCRIPT), realtime)
+
+    s1_events = [event for socket_id, event in realtime.sent if socket_id == "s1"]
+    assert len(s1_events) == result.updates_sent > 1
+    assert all(isinstance(event, ScriptStreamed) for event in s1_events)
+    assert [role["name"] for event in s1_events for role in event.roles] == ["Sam", "Vic"]
+    assert [line["text"] for event in s1_events for line in event.lines] == [
+        "Hands up.",
+        "Never!",
+    ]
+    assert len(realtime.sent) == 2 * result.updates_sent
+
+
+@pytest.mark.asyncio
+async def test_returns_complete_script_with_timings():
+    """Test that the finished script and timings are returned."""
+    result = await stream(ChunkedLLM(SCRIPT), RecordingRealtime())
+
+    assert [role.lines for role in result.script.roles] == [["Hands up."], ["Never!"]]
+    assert result.script.personality == "noir"
+    assert result.time_to_first_line is not None
+    assert result.time_to_first_line <= result.duration
+
+
+@pytest.mark.asyncio
+async def test_provider_failure_propagates():
+    """Test that an error mid-stream reaches the caller."""
+    with pytest.raises(LLMError, match="connection reset"):
+        await stream(ChunkedLLM(SCRIPT, fail_after=3), RecordingRealtime())
+
+
+@pytest.mark.asyncio
+async def test_stream_without_roles_is_an_llm_error():
+    """Test that an unparseable script is reported as an LLM error."""
+    with pytest.raises(LLMError, match="invalid"):
+        await stream(ChunkedLLM("Just prose, no cast.\n"), RecordingRealtime())
+
+
+@pytest.mark.asyncio
+async def test_blocked_content_stops_the_stream_before_it_is_sent():
+    """Test that a scanned chunk with a blocked term ends the stream unsent."""
+    realtime = RecordingRealtime()
+    llm = ChunkedLLM(SCRIPT + "SAM: Oh da", chunk_size=len(SCRIPT) + 10)
+    llm.text += "mn it.\nVIC: Bye.\n"
+
+    with pytest.raises(BlockedContentError, match="damn") as raised:
+        await stream(llm, realtime, scanner=ContentFilter(DEFAULT_BLOCKLISTS).stream)
+
+    assert [v.text for v in raised.value.violations] == ["damn"]
+    sent = [line["text"] for _, event in realtime.sent for line in event.lines]
+    assert "Never!" in sent
+    assert not any("damn" in text for text in sent)
+    assert llm.closed
+
+
+@pytest.mark.asyncio
+async def test_slow_stream_times_out():
+    """Test that a stream exceeding the deadline fails as an LLM error."""
+    llm = ChunkedLLM(SCRIPT, delay=0.05)
+
+    with pytest.raises(LLMError, match="longer than"):
+        await stream(llm, RecordingRealtime(), timeout=0.02)
+
+    assert llm.closed
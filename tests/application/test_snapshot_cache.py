@@ -0,0 +1,153 @@
+"""Tests for the serialized snapshot cache."""
+
+import pytest
+
+from slop.adapters.storage.serialization import decode_game, encode_game
+from slop.application import SnapshotCache, StateSync, StateVersion, etag_for, etag_matches
+from slop.domain import GameCreated, GameProjection, PlayerJoined
+
+
+class CountingEncoder:
+    """Snapshot encoder counting how often it runs."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, game):
+        """Serialize a game."""
+        self.calls += 1
+        return encode_game(game)
+
+
+class SnapshotStore:
+    """Storage stand-in serving stored game snapshots."""
+
+    def __init__(self, games=None):
+        self.games = games or {}
+
+    async def get_snapshot(self, game_id):
+        """Return the stored game, if any."""
+        return self.games.get(game_id)
+
+
+def make_game(game_id="game-1"):
+    """Build a game through its projection."""
+    return GameProjection.replay(
+        [
+            GameCreated(
+                game_id=game_id,
+                room_code="ABCD",
+                content_tone="family",
+                max_players=18,
+                rounds_per_team=2,
+            )
+        ]
+    )
+
+
+def version(n, epoch="e1"):
+    """Build a state version."""
+    return StateVersion(epoch, n)
+
+
+def test_rejects_invalid_size():
+    """Test that the cache must hold at least one game."""
+    with pytest.raises(ValueError, match="max_games"):
+        SnapshotCache(encode_game, max_games=0)
+
+
+def test_same_version_is_serialized_once():
+    """Test that every read at one version shares a single serialization."""
+    encoder = CountingEncoder()
+    cache = SnapshotCache(encoder)
+    game = make_game()
+
+    frames = [cache.get(game, version(1)) for _ in range(50)]
+
+    assert encoder.calls == 1
+    assert all(frame is frames[0] for frame in frames)
+    assert decode_game(frames[0].data).id == "game-1"
+    assert frames[0].etag == etag_for("game-1", version(1))
+    assert cache.stats.hits == 49
+
+
+def test_new_version_rebuilds_lazily():
+    """Test that a newer version is serialized on its first read only."""
+    encoder = CountingEncoder()
+    cache = SnapshotCache(encoder)
+    game = make_game()
+    first = cache.get(game, version(1))
+
+    game.room_code = "WXYZ"
+    assert encoder.calls == 1
+    second = cache.get(game, version(2))
+
+    assert encoder.calls == 2
+    assert second.etag != first.etag
+    assert decode_game(second.data).room_code == "WXYZ"
+
+
+def test_matching_if_none_match_skips_serialization():
+    """Test that a client holding the current ETag gets "not modified" for free."""
+    encoder = CountingEncoder()
+    cache = SnapshotCache(encoder)
+    game = make_game()
+    etag = etag_for(game.id, version(3))
+
+    assert cache.get_if_none_match(game, version(3), etag) is None
+    assert encoder.calls == 0
+    assert cache.get_if_none_match(game, version(4), etag) is not None
+    assert (cache.stats.not_modified, cache.stats.misses) == (1, 1)
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_etag_matching_follows_if_none_match_rules():
+    """Test that tag lists, weak tags and the wildcard are understood."""
+    etag = etag_for("game-1", version(7))
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+    assert etag != etag_for("game-1", version(7, epoch="e2"))
+
+
+def test_least_recently_used_game_is_evicted():
+    """Test that the cache keeps at most max_games snapshots."""
+    cache = SnapshotCache(encode_game, max_games=2)
+    games = [make_game(f"game-{i}") for i in range(3)]
+    cache.get(games[0], version(1))
+    cache.get(games[1], version(1))
+    cache.get(games[0], version(1))
+
+    cache.get(games[2], version(1))
+
+    assert cache.stats.evictions == 1
+    assert cache.stats.entries == 2
+    cache.get(games[0], version(1))
+    assert cache.stats.misses == 3
+
+
+@pytest.mark.asyncio
+async def test_reconnect_burst_and_polling_share_one_serialization():
+    """Test that catch-ups and REST reads after an event serialize the game once."""
+    encoder = CountingEncoder()
+    sync = StateSync(SnapshotStore(), SnapshotCache(encoder))
+    projection = GameProjection()
+    created = GameCreated(
+        game_id="game-1", room_code="ABCD", content_tone="family", max_players=18, rounds_per_team=2
+    )
+    projection.apply(created)
+    sync.record(created, projection.game)
+    joined = PlayerJoined(game_id="game-1", player_id="p1", player_name="P", socket_id="s1")
+    projection.apply(joined)
+    sync.record(joined, projection.game)
+
+    for _ in range(20):
+        assert (await sync.catch_up("game-1", None)).is_snapshot
+    polled = await sync.snapshot("game-1")
+
+    assert encoder.calls == 1
+    assert await sync.snapshot("game-1", if_none_match=polled.etag) is None
+    assert polled.version == sync.current("game-1")
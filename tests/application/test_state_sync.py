@@ -0,0 +1,138 @@
+"""Tests for versioned state catch-up."""
+
+import pytest
+
+from slop.adapters.storage.serialization import decode_game, encode_game
+from slop.application import SnapshotCache, StateSync, StateVersion
+from slop.domain import GameCreated, GameProjection, PlayerJoined, event_codec
+
+
+class SnapshotStore:
+    """Storage stand-in serving stored game snapshots."""
+
+    def __init__(self, games=None):
+        self.games = games or {}
+
+    async def get_snapshot(self, game_id):
+        """Return the stored game, if any."""
+        return self.games.get(game_id)
+
+
+class LiveGame:
+    """A game driven through a projection and recorded in a StateSync."""
+
+    def __init__(self, sync, game_id="game-1"):
+        self.sync = sync
+        self.game_id = game_id
+        self.projection = GameProjection()
+        self.players = 0
+        self.apply(
+            GameCreated(
+                game_id=game_id,
+                room_code="ABCD",
+                content_tone="family",
+                max_players=18,
+                rounds_per_team=2,
+            )
+        )
+
+    def apply(self, event):
+        """Apply an event and record it."""
+        self.projection.apply(event)
+        return self.sync.record(event, self.projection.game)
+
+    def join(self):
+        """Add a player."""
+        self.players += 1
+        name = f"player-{self.players}"
+        return self.apply(
+            PlayerJoined(game_id=self.game_id, player_id=name, player_name=name, socket_id=name)
+        )
+
+
+def test_rejects_invalid_history():
+    """Test that the retained history must hold at least one event."""
+    with pytest.raises(ValueError, match="max_events"):
+        StateSync(SnapshotStore(), SnapshotCache(encode_game), max_events=0)
+
+
+def test_versions_increase_per_game():
+    """Test that each game's recorded events get consecutive versions."""
+    sync = StateSync(SnapshotStore(), SnapshotCache(encode_game))
+    first = LiveGame(sync, "game-1")
+    LiveGame(sync, "game-2")
+
+    versioned = first.join()
+
+    assert versioned.version == 2
+    assert event_codec.decode_event(versioned.data) == versioned.event
+    assert sync.current("game-1").version == 2
+    assert sync.current("game-2").version == 1
+    assert sync.current("game-1").epoch != sync.current("game-2").epoch
+
+
+@pytest.mark.asyncio
+async def test_client_gets_only_missed_events():
+    """Test that a client a few versions behind receives just those events."""
+    sync = StateSync(SnapshotStore(), SnapshotCache(encode_game))
+    game = LiveGame(sync)
+    seen = sync.current("game-1")
+    missed = [game.join(), game.join()]
+
+    catch_up = await sync.catch_up("game-1", seen)
+
+    assert not catch_up.is_snapshot
+    assert catch_up.events == tuple(missed)
+    assert catch_up.current == StateVersion(seen.epoch, 3)
+    assert (await sync.catch_up("game-1", catch_up.current)).events == ()
+    assert (sync.stats.deltas, sync.stats.up_to_date) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_large_gap_falls_back_to_a_cached_snapshot():
+    """Test that clients too far behind get one shared serialized snapshot."""
+    snapshots = SnapshotCache(encode_game)
+    sync = StateSync(SnapshotStore(), snapshots, max_events=2)
+    game = LiveGame(sync)
+    seen = sync.current("game-1")
+    for _ in range(3):
+        game.join()
+
+    results = [await sync.catch_up("game-1", seen) for _ in range(10)]
+
+    assert all(r.is_snapshot and r.snapshot is results[0].snapshot for r in results)
+    assert len(decode_game(results[0].snapshot.data).players) == 3
+    assert snapshots.stats.misses == 1
+    game.join()
+    assert len(decode_game((await sync.catch_up("game-1", None)).snapshot.data).players) == 4
+    assert snapshots.stats.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_version_from_another_epoch_gets_a_snapshot():
+    """Test that versions from before a restart are not trusted."""
+    before = StateSync(SnapshotStore(), SnapshotCache(encode_game))
+    game = LiveGame(before)
+    game.join()
+    stale = before.current("game-1")
+
+    after = StateSync(SnapshotStore({"game-1": game.projection.game}), SnapshotCache(encode_game))
+    catch_up = await after.catch_up("game-1", stale)
+
+    assert catch_up.is_snapshot
+    assert catch_up.current.version == 0
+    assert catch_up.current.epoch != stale.epoch
+    assert len(decode_game(catch_up.snapshot.data).players) == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_game_cannot_be_caught_up():
+    """Test that a snapshot request for a game that is not stored fails."""
+    sync = StateSync(SnapshotStore(), SnapshotCache(encode_game))
+
+    with pytest.raises(LookupError):
+        await sync.catch_up("missing", None)
+    with pytest.raises(LookupError):
+        await sync.snapshot("missing")
+    assert sync.current("missing") is None
+    assert sync._games == {}
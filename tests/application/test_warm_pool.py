@@ -0,0 +1,255 @@
+"""Tests for the warm pool of pre-generated scripts."""
+
+import asyncio
+
+import pytest
+
+from slop.application import WarmPool
+from slop.domain import AIPersonality, ContentTone, Game, Role, Script, Team
+from slop.ports import LLMError
+
+NOIR = AIPersonality(id="noir", name="Noir", description="Hard-boiled", system_prompt="Be noir.")
+SITCOM = AIPersonality(id="sitcom", name="Sitcom", description="Laughs", system_prompt="Be funny.")
+
+
+class ScriptedLLM:
+    """Generates scripts, optionally slow or failing, and counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.delay = 0.0
+        self.fail = False
+
+    async def generate_script(self, prompt, personality, num_roles, *, tone=ContentTone.FAMILY):
+        """Return a script for the prompt after the configured delay."""
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise LLMError("provider down")
+        return Script(
+            content=prompt,
+            roles=[Role(name=f"Role {i}", description="A role") for i in range(num_roles)],
+            personality=personality.id,
+        )
+
+
+@pytest.fixture
+async def llm():
+    """Create a fast, healthy fake provider."""
+    return ScriptedLLM()
+
+
+@pytest.fixture
+async def pool(llm):
+    """Create a running warm pool over the fake provider."""
+    warm_pool = WarmPool(llm, prompts=["One", "Two", "Three"], per_key=2)
+    warm_pool.start()
+    yield warm_pool
+    await warm_pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_wanted_scripts_are_generated_in_background(pool, llm):
+    """Test that requesting a combination fills its pool."""
+    pool.want(NOIR, 3, ContentTone.FAMILY)
+    await pool.join()
+
+    assert llm.calls == 2
+    assert pool.stats.scripts == 2
+    first = pool.take("noir", 3, ContentTone.FAMILY)
+    assert first.from_pool
+    assert first.prompt == "One"
+    assert len(first.script.roles) == 3
+
+
+@pytest.mark.asyncio
+async def test_take_refills(pool, llm):
+    """Test that taking a script queues its replacement."""
+    pool.want(NOIR, 3, ContentTone.FAMILY)
+    await pool.join()
+
+    pool.take("noir", 3, ContentTone.FAMILY)
+    await pool.join()
+
+    assert llm.calls == 3
+    assert pool.stats.scripts == 2
+
+
+@pytest.mark.asyncio
+async def test_take_from_empty_pool_misses(pool):
+    """Test that an unknown combination returns None."""
+    assert pool.take("noir", 3, ContentTone.ADULT) is None
+    assert pool.stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_prepare_uses_team_personalities_and_sizes(pool):
+    """Test that a game's teams determine what is pre-generated."""
+    game = Game(id="game-1", room_code="ABCD")
+    game.add_team(Team(id="t1", name="Red", color="#F00", player_ids=["a", "b"]))
+    game.add_team(Team(id="t2", name="Blue", color="#00F", player_ids=["c"]))
+    game.add_team(Team(id="t3", name="Green", color="#0F0", player_ids=["d"]))
+    game.teams[0].assign_personality("noir", "t2")
+    game.teams[1].assign_personality("sitcom", "t1")
+
+    requested = pool.prepare(game, {"noir": NOIR, "sitcom": SITCOM})
+    await pool.join()
+
+    assert requested == 2
+    assert pool.take("noir", 2, ContentTone.FAMILY) is not None
+    assert pool.take("sitcom", 1, ContentTone.FAMILY) is not None
+
+
+@pytest.mark.asyncio
+async def test_budget_caps_background_generation(llm):
+    """Test that no more than the budget is spent in the background."""
+    pool = WarmPool(llm, per_key=5, budget=3)
+    pool.start()
+    try:
+        pool.want(NOIR, 3, ContentTone.FAMILY)
+        pool.want(SITCOM, 3, ContentTone.FAMILY)
+        await pool.join()
+    finally:
+        await pool.stop()
+
+    assert llm.calls == 3
+    assert pool.stats.budget_remaining == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_size_is_bounded(llm):
+    """Test that the least recently wanted scripts are evicted first."""
+    pool = WarmPool(llm, per_key=2, max_scripts=2)
+    pool.start()
+    try:
+        pool.want(NOIR, 3, ContentTone.FAMILY)
+        await pool.join()
+        pool.want(SITCOM, 3, ContentTone.FAMILY)
+        await pool.join()
+    finally:
+        await pool.stop()
+
+    assert pool.stats.scripts == 2
+    assert pool.stats.evictions == 2
+    assert pool.take("sitcom", 3, ContentTone.FAMILY) is not None
+
+
+@pytest.mark.asyncio
+async def test_expired_scripts_are_not_served(llm):
+    """Test that pooled scripts past their TTL are dropped."""
+    now = [0.0]
+    pool = WarmPool(llm, per_key=1, ttl=10, clock=lambda: now[0])
+    pool.start()
+    try:
+        pool.want(NOIR, 3, ContentTone.FAMILY)
+        await pool.join()
+        now[0] = 11
+        assert pool.take("noir", 3, ContentTone.FAMILY) is None
+    finally:
+        await pool.stop()
+
+    assert pool.stats.evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_generate_prefers_live_script(pool):
+    """Test that a healthy provider answers with the player's prompt."""
+    pool.want(NOIR, 3, ContentTone.FAMILY)
+    await pool.join()
+
+    result = await pool.generate("A heist", NOIR, 3)
+
+    assert not result.from_pool
+    assert result.script.content == "A heist"
+
+
+@pytest.mark.asyncio
+async def test_generate_falls_back_when_provider_fails(pool, llm):
+    """Test that a failing provider is replaced by a pooled script."""
+    pool.want(NOIR, 3, ContentTone.FAMILY)
+    await pool.join()
+    llm.fail = True
+
+    result = await pool.generate("A heist", NOIR, 3)
+
+    assert result.from_pool
+    assert result.prompt == "One"
+
+
+@pytest.mark.asyncio
+async def test_generate_falls_back_when_provider_is_slow(pool, llm):
+    """Test that a timed-out provider is replaced by a pooled script."""
+    pool.want(NOIR, 3, ContentTone.FAMILY)
+    await pool.join()
+    llm.delay = 1.0
+
+    result = await pool.generate("A heist", NOIR, 3, timeout=0.01)
+
+    assert result.from_pool
+
+
+@pytest.mark.asyncio
+async def test_generate_serves_pool_without_waiting_for_the_timeout(pool, llm):
+    """Test that a ready pooled script is served after the fallback budget, not the timeout."""
+    pool.want(NOIR, 3, ContentTone.FAMILY)
+    await pool.join()
+    llm.delay = 5.0
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    result = await pool.generate("A heist", NOIR, 3, fallback_after=0.01, timeout=5.0)
+
+    assert result.from_pool
+    assert loop.time() - started < 1.0
+    await asyncio.sleep(0)
+    assert llm.calls == 4  # two pooled, the abandoned live call and a refill
+
+
+@pytest.mark.asyncio
+async def test_generate_keeps_waiting_for_live_script_when_pool_is_empty(pool, llm):
+    """Test that the provider gets the full timeout when no pooled script is ready."""
+    llm.delay = 0.05
+
+    result = await pool.generate("A heist", NOIR, 3, fallback_after=0.01, timeout=1.0)
+
+    assert not result.from_pool
+    assert result.script.content == "A heist"
+
+
+@pytest.mark.asyncio
+async def test_finished_work_leaves_no_bookkeeping(llm):
+    """Test that per-key bookkeeping is dropped once generations finish or keys are evicted."""
+    pool = WarmPool(llm, per_key=1, max_scripts=1)
+    pool.start()
+    try:
+        pool.want(NOIR, 3, ContentTone.FAMILY)
+        await pool.join()
+        pool.want(SITCOM, 2, ContentTone.FAMILY)
+        await pool.join()
+    finally:
+        await pool.stop()
+
+    assert pool._in_flight == {}
+    assert set(pool._prompt_cycles) == {("sitcom", 2, ContentTone.FAMILY)}
+
+
+@pytest.mark.asyncio
+async def test_generate_raises_without_fallback(pool, llm):
+    """Test that failures surface as LLMError when the pool is empty."""
+    llm.delay = 1.0
+    with pytest.raises(LLMError, match="timed out"):
+        await pool.generate("A heist", NOIR, 3, timeout=0.01)
+    llm.delay = 0.0
+    llm.fail = True
+    with pytest.raises(LLMError, match="provider down"):
+        await pool.generate("A heist", NOIR, 3)
+
+
+def test_rejects_invalid_settings():
+    """Test that invalid limits are rejected."""
+    with pytest.raises(ValueError, match="per_key"):
+        WarmPool(object(), per_key=0)
+    with pytest.raises(ValueError, match="budget"):
+        WarmPool(object(), budget=-1)
+    with pytest.raises(ValueError, match="prompts"):
+        WarmPool(object(), prompts=[])
@@ -0,0 +1,199 @@
+"""Tests for the compact binary event encoding."""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from slop.domain import (
+    GameCompleted,
+    GameCreated,
+    GuessAccepted,
+    GuessSubmitted,
+    PersonalityAssigned,
+    PersonalityGuessSubmitted,
+    PlayerJoined,
+    PlayerJoinedTeam,
+    PlayerLeft,
+    PromptSubmitted,
+    RoleAssigned,
+    RoundCompleted,
+    RoundStarted,
+    ScoresUpdated,
+    ScriptGenerated,
+    ScriptStreamed,
+    TeamFormed,
+)
+from slop.domain.binary_codec import (
+    BinaryEventDecoder,
+    BinaryEventEncoder,
+    decode_event,
+    decode_events,
+    encode_event,
+    encode_events,
+    is_binary_event,
+)
+from slop.domain.event_codec import EVENT_CLASSES
+
+GAME_ID = str(uuid4())
+
+
+@pytest.fixture
+def all_events():
+    """Create one event of every type."""
+    return [
+        GameCreated(
+            game_id=GAME_ID,
+            room_code="ABCD",
+            content_tone="family",
+            max_players=12,
+            rounds_per_team=3,
+        ),
+        PlayerJoined(
+            game_id=GAME_ID, player_id="player-1", player_name="Zoë", socket_id="socket-1"
+        ),
+        PlayerLeft(game_id=GAME_ID, player_id="player-1"),
+        TeamFormed(game_id=GAME_ID, team_id="team-1", team_name="Red Team", color="#FF0000"),
+        PlayerJoinedTeam(game_id=GAME_ID, player_id="player-1", team_id="team-1"),
+        PersonalityAssigned(
+            game_id=GAME_ID,
+            team_id="team-1",
+            personality_id="noir",
+            assigned_by_team_id="team-2",
+        ),
+        RoundStarted(game_id=GAME_ID, round_number=0, acting_team_id="team-1"),
+        PromptSubmitted(
+            game_id=GAME_ID,
+            round_number=0,
+            prompt="Detective solves mysterious art heist",
+            submitted_by="player-1",
+        ),
+        ScriptGenerated(
+            game_id=GAME_ID,
+            round_number=0,
+            script_content="It was a dark and stormy night.",
+            personality_id="noir",
+            roles=[{"name": "Detective", "description": "Tired", "lines": ["Again?"]}],
+            word_count=7,
+            estimated_duration=3,
+        ),
+        RoleAssigned(
+            game_id=GAME_ID,
+            round_number=0,
+            player_id="player-1",
+            role_name="Detective",
+            character_description="Tired",
+        ),
+        GuessSubmitted(game_id=GAME_ID, round_number=0, team_id="team-2", guess="art heist"),
+        GuessAccepted(game_id=GAME_ID, round_number=0, team_id="team-2"),
+        PersonalityGuessSubmitted(game_id=GAME_ID, round_number=0, personality_guess="noir"),
+        ScoresUpdated(game_id=GAME_ID, round_number=0, score_changes={"team-1": 2, "team-2": -1}),
+        RoundCompleted(game_id=GAME_ID, round_number=0, final_scores={"team-1": 2}),
+        GameCompleted(game_id=GAME_ID, final_scores={"team-1": 2}, winner_team_id=None),
+        ScriptStreamed(
+            game_id=GAME_ID,
+            round_number=0,
+            roles=[{"index": 0, "name": "Detective", "description": "Tired"}],
+            lines=[{"role_index": 0, "text": "Again?"}],
+        ),
+    ]
+
+
+def test_fixture_covers_every_event_class(all_events):
+    """Test that the round-trip fixture exercises every registered event."""
+    assert {type(event) for event in all_events} == set(EVENT_CLASSES)
+
+
+def test_round_trip_every_event(all_events):
+    """Test that every event type survives an encode/decode round trip."""
+    for event in all_events:
+        decoded = decode_event(encode_event(event))
+
+        assert type(decoded) is type(event)
+        assert decoded == event
+
+
+def test_frames_are_smaller_than_json(all_events):
+    """Test that binary frames are smaller than the JSON encoding."""
+    for event in all_events:
+        assert len(encode_event(event)) < len(event.model_dump_json())
+
+
+def test_frame_starts_with_tag_byte(all_events):
+    """Test that the first byte identifies the event class."""
+    for event in all_events:
+        frame = encode_event(event)
+
+        assert EVENT_CLASSES[frame[0]] is type(event)
+        assert is_binary_event(frame)
+    assert not is_binary_event(all_events[0].model_dump_json().encode())
+
+
+def test_uuid_ids_are_stored_as_raw_bytes():
+    """Test that canonical UUID ids cost 16 bytes, not 36."""
+    uuid_event = PlayerLeft(game_id=str(uuid4()), player_id="p")
+    text_event = PlayerLeft(game_id="x" * 36, player_id="p", event_id=uuid_event.event_id)
+
+    assert len(encode_event(text_event)) - len(encode_event(uuid_event)) == 36 + 1 - 16
+
+
+def test_non_canonical_uuid_is_preserved():
+    """Test that an uppercase UUID is kept verbatim rather than normalized."""
+    event = PlayerLeft(game_id=str(uuid4()).upper(), player_id="p")
+
+    assert decode_event(encode_event(event)).game_id == event.game_id
+
+
+def test_repeated_ids_are_interned():
+    """Test that an id repeated within a frame is written once."""
+    event = ScoresUpdated(
+        game_id="team-long-identifier",
+        round_number=0,
+        score_changes={"team-long-identifier": 1},
+    )
+
+    frame = encode_event(event)
+
+    assert frame.count(b"team-long-identifier") == 1
+    assert decode_event(frame) == event
+
+
+def test_naive_timestamp_is_treated_as_utc():
+    """Test that naive timestamps are encoded as UTC."""
+    event = PlayerLeft(game_id="game-1", player_id="p", timestamp=datetime(2025, 1, 1, 12))
+
+    decoded = decode_event(encode_event(event))
+
+    assert decoded.timestamp == datetime(2025, 1, 1, 12, tzinfo=UTC)
+
+
+def test_stream_encoder_shares_intern_table(all_events):
+    """Test that a stream encoder interns ids across frames."""
+    encoder = BinaryEventEncoder()
+    decoder = BinaryEventDecoder()
+
+    frames = [encoder.encode(event) for event in all_events]
+
+    assert sum(map(len, frames)) < sum(len(encode_event(event)) for event in all_events)
+    assert [decoder.decode(frame) for frame in frames] == all_events
+
+
+def test_batch_round_trip(all_events):
+    """Test that a batch of events round-trips in order."""
+    assert decode_events(encode_events(all_events)) == all_events
+    assert decode_events(encode_events([])) == []
+
+
+def test_truncated_frame_is_rejected(all_events):
+    """Test that truncated input raises ValueError."""
+    frame = encode_event(all_events[-1])
+
+    for size in (0, 1, len(frame) // 2, len(frame) - 1):
+        with pytest.raises(ValueError):
+            decode_event(frame[:size])
+
+
+def test_trailing_bytes_are_rejected(all_events):
+    """Test that extra bytes after a frame raise ValueError."""
+    with pytest.raises(ValueError, match="Trailing bytes"):
+        decode_event(encode_event(all_events[0]) + b"\x00")
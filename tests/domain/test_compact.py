@@ -0,0 +1,133 @@
+"""Tests for the memory-compacting helpers and their use in the domain models."""
+
+import pickle
+import sys
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from slop.adapters.storage.serialization import decode_game, encode_game
+from slop.domain import Game, Guess, Player, Role, RoleAssignment, Round, Script, Team
+from slop.domain.compact import intern_keys, with_shared_utc
+
+
+def fresh(value):
+    """Return an equal string that is a distinct object."""
+    return "".join(list(value))
+
+
+def make_game():
+    """Create a game with a team, a player and a played round."""
+    game = Game(id="game-1", room_code="ABCD")
+    game.add_team(Team(id=fresh("team-1"), name="Red", color="#FF0000"))
+    game.add_player(Player(id=fresh("player-1"), name="Alice", socket_id="s1"))
+    game.get_player("player-1").assign_to_team(fresh("team-1"))
+    game.get_team("team-1").add_player(fresh("player-1"))
+    round_obj = Round(
+        id="round-1",
+        round_number=0,
+        acting_team_id=fresh("team-1"),
+        prompt="A heist",
+        submitted_by=fresh("player-1"),
+        script=Script(
+            content="Lines", roles=[Role(name="Thief", description="Sly")], personality="noir"
+        ),
+        role_assignments={fresh("player-1"): 0},
+    )
+    round_obj.add_guess(Guess(team_id=fresh("team-1"), guess="A robbery", timestamp=1.0))
+    round_obj.add_score_to_team(fresh("team-1"), 2)
+    game.rounds.append(round_obj)
+    return game
+
+
+def assert_ids_shared(game):
+    """Assert that every occurrence of the team and player ids is one object."""
+    team = game.teams[0]
+    player = game.players[0]
+    round_obj = game.rounds[0]
+    assert player.team_id is team.id
+    assert round_obj.acting_team_id is team.id
+    assert round_obj.prompt_guesses[0].team_id is team.id
+    assert next(iter(round_obj.round_score)) is team.id
+    assert team.player_ids[0] is player.id
+    assert round_obj.submitted_by is player.id
+    assert next(iter(round_obj.role_assignments)) is player.id
+
+
+@pytest.mark.parametrize("cls", [Player, Team, Round, Guess, RoleAssignment, Script, Role])
+def test_domain_models_have_no_instance_dict(cls):
+    """Test that the per-object models are slotted."""
+    assert "__slots__" in vars(cls)
+    assert "__dict__" not in dir(cls)
+
+
+def test_repeated_ids_are_shared():
+    """Test that equal ids held by different objects are the same string."""
+    assert_ids_shared(make_game())
+
+
+def test_decoded_game_shares_ids_and_utc():
+    """Test that a decoded game interns ids and uses the shared UTC tzinfo."""
+    game = decode_game(encode_game(make_game()))
+
+    assert_ids_shared(game)
+    assert game.created_at.tzinfo is UTC
+    assert game.players[0].joined_at.tzinfo is UTC
+    assert game.rounds[0].timestamp.tzinfo is UTC
+    assert game.rounds[0].script.generated_at.tzinfo is UTC
+
+
+def test_with_shared_utc_keeps_the_instant():
+    """Test that only zero-offset tzinfos are replaced."""
+    utc_like = datetime(2025, 1, 1, 12, tzinfo=timezone(timedelta(0)))
+    offset = datetime(2025, 1, 1, 12, tzinfo=timezone(timedelta(hours=2)))
+    naive = datetime(2025, 1, 1, 12)
+
+    assert with_shared_utc(utc_like) == utc_like
+    assert with_shared_utc(utc_like).tzinfo is UTC
+    assert with_shared_utc(offset) is offset
+    assert with_shared_utc(naive) is naive
+
+
+def test_intern_keys_in_place():
+    """Test that interning keys keeps the mapping, its contents and their order."""
+    mapping = {fresh("team-2"): 1, fresh("team-1"): 3}
+
+    intern_keys(mapping)
+
+    assert list(mapping.items()) == [("team-2", 1), ("team-1", 3)]
+    assert next(iter(mapping)) is sys.intern("team-2")
+
+
+def test_round_keeps_the_callers_dicts():
+    """Test that a round shares, rather than copies, the dicts it is given."""
+    script = Script(content="A: hi", roles=[Role(name="A", description="a")], personality="noir")
+    assignments = {fresh("player-1"): 0}
+    scores = {}
+    round_obj = Round(
+        id="round-1",
+        round_number=0,
+        acting_team_id="team-1",
+        prompt="A heist",
+        submitted_by="player-1",
+        script=script,
+        role_assignments=assignments,
+        round_score=scores,
+    )
+
+    assignments["player-2"] = 1
+    scores["team-1"] = 5
+
+    assert round_obj.role_assignments is assignments
+    assert round_obj.round_score == {"team-1": 5}
+
+
+def test_slotted_models_pickle():
+    """Test that a game with slotted members survives pickling."""
+    game = make_game()
+
+    restored = pickle.loads(pickle.dumps(game))
+
+    assert restored == game
+    restored.get_team("team-1").remove_player("player-1")
+    assert restored.get_team("team-1").player_ids == []
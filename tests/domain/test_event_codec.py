@@ -0,0 +1,98 @@
+"""Tests for the event codec."""
+
+import pytest
+from pydantic import ValidationError
+
+from slop.domain import (
+    GameCreated,
+    GameEvent,
+    GuessSubmitted,
+    PlayerJoined,
+    ScoresUpdated,
+    ScriptGenerated,
+)
+from slop.domain.event_codec import (
+    EVENT_CLASSES,
+    EVENT_TYPES,
+    decode_event,
+    decode_event_rows,
+    decode_events,
+    encode_event,
+    encode_events,
+)
+
+
+@pytest.fixture
+def sample_events():
+    """Create a mixed list of events for testing."""
+    return [
+        GameCreated(
+            game_id="game-1",
+            room_code="ABCD",
+            content_tone="family",
+            max_players=12,
+            rounds_per_team=3,
+        ),
+        PlayerJoined(
+            game_id="game-1", player_id="player-1", player_name="Alice", socket_id="socket-1"
+        ),
+        ScriptGenerated(
+            game_id="game-1",
+            round_number=0,
+            script_content="Once upon a time...",
+            personality_id="dramatic",
+            roles=[{"name": "Hero", "description": "Brave", "lines": ["Onward!"]}],
+            word_count=4,
+            estimated_duration=2,
+        ),
+        ScoresUpdated(game_id="game-1", round_number=0, score_changes={"team-1": 3}),
+    ]
+
+
+def test_registry_covers_every_event_class():
+    """Test that every GameEvent subclass is registered by its event type."""
+    assert set(EVENT_CLASSES) == set(GameEvent.__subclasses__())
+    assert EVENT_TYPES["GuessSubmitted"] is GuessSubmitted
+    assert len(EVENT_TYPES) == len(EVENT_CLASSES)
+
+
+def test_decode_event_returns_concrete_subclass(sample_events):
+    """Test that a single event decodes to its own subclass."""
+    for event in sample_events:
+        decoded = decode_event(encode_event(event))
+
+        assert type(decoded) is type(event)
+        assert decoded == event
+
+
+def test_decode_events_round_trip(sample_events):
+    """Test that a JSON array of events round-trips in order."""
+    decoded = decode_events(encode_events(sample_events))
+
+    assert decoded == sample_events
+    assert [type(event) for event in decoded] == [type(event) for event in sample_events]
+
+
+def test_decode_event_rows(sample_events):
+    """Test that separately stored events decode as one batch."""
+    rows = [encode_event(event) for event in sample_events]
+    rows[0] = rows[0].decode()
+
+    assert decode_event_rows(rows) == sample_events
+    assert decode_event_rows([]) == []
+
+
+def test_decode_unknown_event_type():
+    """Test that an unknown event type is rejected."""
+    data = b'{"game_id": "game-1", "event_type": "Nope", "timestamp": "2025-01-01T00:00:00Z"}'
+
+    with pytest.raises(ValidationError):
+        decode_event(data)
+
+
+def test_decode_rejects_invalid_payload():
+    """Test that a known event type with missing fields is rejected."""
+    data = b'[{"game_id": "game-1", "event_type": "PlayerLeft"}]'
+
+    with pytest.raises(ValidationError):
+        decode_events(data)
@@ -28,6 +28,7 @@ def test_game_settings_creation():
     assert settings.rounds_per_team == 3
     assert settings.guess_timer_seconds == 60
     assert settings.max_players_per_team == 3
+    assert settings.max_players == 12
     assert settings.content_tone == ContentTone.FAMILY
 
 
@@ -278,3 +279,82 @@ def test_game_validate_room_code():
 
     with pytest.raises(ValueError, match="Room code must be"):
         Game(id="game-4", room_code="ABCDEFGH")  # Too long
+
+
+def test_game_index_tracks_add_and_remove():
+    """Test that ID lookups stay consistent across adds and removes."""
+    game = Game(id="game-1", room_code="TEST")
+    for i in range(5):
+        game.add_player(Player(id=f"player-{i}", name=f"P{i}", socket_id=f"s{i}"))
+
+    game.remove_player("player-2")
+    game.add_player(Player(id="player-2", name="Back", socket_id="s9"))
+
+    assert [p.id for p in game.players] == [
+        "player-0",
+        "player-1",
+        "player-3",
+        "player-4",
+        "player-2",
+    ]
+    assert game.get_player("player-2").name == "Back"
+
+
+def test_game_index_sees_direct_list_changes():
+    """Test that players and teams appended to the lists directly are found."""
+    game = Game(
+        id="game-1",
+        room_code="TEST",
+        players=[Player(id="player-1", name="Alice", socket_id="socket-1")],
+    )
+    game.teams.append(Team(id="team-1", name="Red Team", color="#FF0000"))
+
+    assert game.get_player("player-1").name == "Alice"
+    assert game.get_team("team-1").name == "Red Team"
+
+
+def test_game_index_sees_in_place_replacement():
+    """Test that replacing list items in place, or the whole list, refreshes lookups."""
+    game = Game(id="game-1", room_code="TEST")
+    game.add_player(Player(id="player-1", name="Alice", socket_id="socket-1"))
+    game.add_team(Team(id="team-1", name="Red Team", color="#FF0000"))
+    game.get_player("player-1")
+
+    game.players[0] = Player(id="player-2", name="Bob", socket_id="socket-2")
+    game.teams = [Team(id="team-2", name="Blue Team", color="#0000FF")]
+
+    assert game.get_player("player-2").name == "Bob"
+    assert game.get_team("team-2").name == "Blue Team"
+    with pytest.raises(ValueError):
+        game.get_player("player-1")
+    game.remove_player("player-2")
+    game.remove_team("team-2")
+    assert game.players == []
+    assert game.teams == []
+
+
+def test_game_duplicate_ids_resolve_to_the_first():
+    """Test that with a duplicated ID, lookups find the first and then the next one."""
+    game = Game(id="game-1", room_code="TEST")
+    game.add_player(Player(id="player-1", name="Alice", socket_id="socket-1"))
+    game.add_player(Player(id="player-1", name="Again", socket_id="socket-2"))
+
+    assert game.get_player("player-1").name == "Alice"
+    game.remove_player("player-1")
+    assert game.get_player("player-1").name == "Again"
+
+
+def test_game_remove_updates_index():
+    """Test that removed players and teams can no longer be looked up."""
+    game = Game(id="game-1", room_code="TEST")
+    first = Player(id="player-1", name="Alice", socket_id="socket-1")
+    game.add_player(first)
+    game.add_team(Team(id="team-1", name="Red Team", color="#FF0000"))
+
+    game.remove_team("team-1")
+    game.remove_player("player-1")
+
+    assert game.players == []
+    assert game.teams == []
+    with pytest.raises(ValueError):
+        game.get_player("player-1")
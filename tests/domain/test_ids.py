@@ -0,0 +1,137 @@
+"""Tests for event ID and clock providers."""
+
+import asyncio
+import os
+import random
+from datetime import UTC, datetime
+from uuid import UUID
+
+import pytest
+
+from slop.domain import PlayerLeft
+from slop.domain.ids import (
+    MonotonicIdGenerator,
+    TickClock,
+    event_now,
+    event_stamps,
+    id_timestamp,
+    new_event_id,
+)
+
+
+def test_ids_are_uuid7():
+    """Test that generated IDs are canonical UUIDv7 strings."""
+    event_id = MonotonicIdGenerator()()
+
+    parsed = UUID(event_id)
+
+    assert str(parsed) == event_id
+    assert parsed.version == 7
+    assert parsed.variant == "specified in RFC 4122"
+
+
+def test_ids_increase_within_a_millisecond():
+    """Test that IDs generated in one millisecond keep their creation order."""
+    generator = MonotonicIdGenerator(clock_ms=lambda: 1_700_000_000_000)
+
+    ids = [generator() for _ in range(1000)]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == 1000
+
+
+def test_ids_increase_when_clock_steps_back():
+    """Test that a backwards clock step does not reorder IDs."""
+    times = iter([2_000, 1_000, 3_000])
+    generator = MonotonicIdGenerator(clock_ms=lambda: next(times))
+
+    ids = [generator() for _ in range(3)]
+
+    assert ids == sorted(ids)
+    assert id_timestamp(ids[1]) == id_timestamp(ids[0])
+
+
+def test_ids_sort_by_time():
+    """Test that later milliseconds sort after earlier ones."""
+    times = iter([1_000, 1_001])
+    generator = MonotonicIdGenerator(clock_ms=lambda: next(times), rng=random.Random(0))
+
+    first, second = generator(), generator()
+
+    assert first < second
+    assert id_timestamp(second) == datetime.fromtimestamp(1.001, UTC)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_forked_children_do_not_repeat_ids():
+    """Test that forked processes generate different IDs from the same generator state."""
+    generator = MonotonicIdGenerator(clock_ms=lambda: 1_700_000_000_000)
+    generator()
+    ids = []
+    for _ in range(2):
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.write(write, generator().encode())
+            finally:
+                os._exit(0)
+        os.close(write)
+        ids.append(os.read(read, 64).decode())
+        os.close(read)
+        os.waitpid(pid, 0)
+    ids.append(generator())
+
+    assert len(set(ids)) == 3
+
+
+def test_tick_clock_holds_time_until_tick():
+    """Test that the tick clock only advances when ticked."""
+    readings = iter([datetime(2025, 1, 1, tzinfo=UTC), datetime(2025, 1, 2, tzinfo=UTC)])
+    clock = TickClock(lambda: next(readings))
+
+    assert clock.now() == clock.now() == datetime(2025, 1, 1, tzinfo=UTC)
+    assert clock.tick() == datetime(2025, 1, 2, tzinfo=UTC)
+    assert clock.now() == datetime(2025, 1, 2, tzinfo=UTC)
+
+
+def test_events_use_installed_providers():
+    """Test that events take IDs and timestamps from the installed providers."""
+    when = datetime(2025, 1, 1, tzinfo=UTC)
+
+    with event_stamps(new_id=lambda: "event-1", now=lambda: when):
+        event = PlayerLeft(game_id="game-1", player_id="player-1")
+
+    assert (event.event_id, event.timestamp) == ("event-1", when)
+    assert new_event_id() != "event-1"
+    assert event_now() != when
+
+
+@pytest.mark.asyncio
+async def test_installed_providers_are_local_to_the_task():
+    """Test that providers installed by one task do not stamp another task's events."""
+    installed = asyncio.Event()
+    done = asyncio.Event()
+
+    async def stamped():
+        with event_stamps(new_id=lambda: "event-1"):
+            installed.set()
+            await done.wait()
+            return PlayerLeft(game_id="game-1", player_id="player-1").event_id
+
+    task = asyncio.create_task(stamped())
+    await installed.wait()
+    other = PlayerLeft(game_id="game-1", player_id="player-2").event_id
+    done.set()
+
+    assert await task == "event-1"
+    assert other != "event-1"
+
+
+def test_default_event_ids_sort_in_creation_order():
+    """Test that events created one after another have increasing IDs."""
+    events = [PlayerLeft(game_id="game-1", player_id="player-1") for _ in range(100)]
+
+    ids = [event.event_id for event in events]
+
+    assert ids == sorted(ids)
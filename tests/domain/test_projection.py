@@ -0,0 +1,267 @@
+"""Tests for the event-sourced game projection."""
+
+import pytest
+
+from slop.domain import (
+    GameCompleted,
+    GameCreated,
+    GameProjection,
+    GameStatus,
+    GuessAccepted,
+    GuessSubmitted,
+    PersonalityAssigned,
+    PersonalityGuessSubmitted,
+    PlayerJoined,
+    PlayerJoinedTeam,
+    PlayerLeft,
+    PromptSubmitted,
+    RoleAssigned,
+    RoundCompleted,
+    RoundStarted,
+    ScoresUpdated,
+    ScriptGenerated,
+    TeamFormed,
+)
+from slop.domain.event_codec import EVENT_TYPES
+from slop.domain.projection import handled_event_types
+
+GAME_ID = "game-1"
+
+
+def make_lobby_events():
+    """Create the events of a lobby with two teams of two players."""
+    events = [
+        GameCreated(
+            game_id=GAME_ID,
+            room_code="ABCD",
+            content_tone="adult",
+            max_players=12,
+            rounds_per_team=1,
+        ),
+        TeamFormed(game_id=GAME_ID, team_id="team-1", team_name="Red", color="#FF0000"),
+        TeamFormed(game_id=GAME_ID, team_id="team-2", team_name="Blue", color="#0000FF"),
+    ]
+    for i in range(4):
+        player_id = f"player-{i}"
+        events.append(
+            PlayerJoined(
+                game_id=GAME_ID, player_id=player_id, player_name=f"P{i}", socket_id=f"s{i}"
+            )
+        )
+        events.append(
+            PlayerJoinedTeam(game_id=GAME_ID, player_id=player_id, team_id=f"team-{i % 2 + 1}")
+        )
+    events += [
+        PersonalityAssigned(
+            game_id=GAME_ID,
+            team_id="team-1",
+            personality_id="noir",
+            assigned_by_team_id="team-2",
+        ),
+        PersonalityAssigned(
+            game_id=GAME_ID,
+            team_id="team-2",
+            personality_id="pirate",
+            assigned_by_team_id="team-1",
+        ),
+    ]
+    return events
+
+
+def make_round_events(round_number, acting_team_id, guessing_team_id, personality):
+    """Create the events of one complete round."""
+    return [
+        RoundStarted(game_id=GAME_ID, round_number=round_number, acting_team_id=acting_team_id),
+        PromptSubmitted(
+            game_id=GAME_ID,
+            round_number=round_number,
+            prompt=f"prompt {round_number}",
+            submitted_by="player-0",
+        ),
+        ScriptGenerated(
+            game_id=GAME_ID,
+            round_number=round_number,
+            script_content="HERO: Hello.",
+            personality_id=personality,
+            roles=[{"name": "Hero", "description": "Brave", "lines": ["Hello."]}],
+            word_count=2,
+            estimated_duration=1,
+        ),
+        RoleAssigned(
+            game_id=GAME_ID,
+            round_number=round_number,
+            player_id="player-1",
+            role_name="Hero",
+            character_description="Brave",
+        ),
+        GuessSubmitted(
+            game_id=GAME_ID, round_number=round_number, team_id=guessing_team_id, guess="nope"
+        ),
+        GuessSubmitted(
+            game_id=GAME_ID, round_number=round_number, team_id=guessing_team_id, guess="yes"
+        ),
+        GuessAccepted(game_id=GAME_ID, round_number=round_number, team_id=guessing_team_id),
+        PersonalityGuessSubmitted(
+            game_id=GAME_ID, round_number=round_number, personality_guess=personality
+        ),
+        ScoresUpdated(
+            game_id=GAME_ID,
+            round_number=round_number,
+            score_changes={guessing_team_id: 2, acting_team_id: 1},
+        ),
+        RoundCompleted(
+            game_id=GAME_ID,
+            round_number=round_number,
+            final_scores={"team-1": 3 * (round_number + 1), "team-2": 3 * (round_number + 1)},
+        ),
+    ]
+
+
+def make_game_events():
+    """Create the events of a complete two-round game."""
+    return [
+        *make_lobby_events(),
+        *make_round_events(0, "team-1", "team-2", "noir"),
+        *make_round_events(1, "team-2", "team-1", "pirate"),
+        GameCompleted(
+            game_id=GAME_ID, final_scores={"team-1": 6, "team-2": 6}, winner_team_id=None
+        ),
+    ]
+
+
+def test_every_event_type_has_a_handler():
+    """Test that the dispatch table covers every registered event type."""
+    assert handled_event_types() == set(EVENT_TYPES)
+
+
+def test_replay_lobby():
+    """Test that lobby events build teams, players and personalities."""
+    game = GameProjection.replay(make_lobby_events())
+
+    assert game.id == GAME_ID
+    assert game.settings.content_tone.value == "adult"
+    assert game.settings.max_players == 12
+    assert game.settings.max_players_per_team == 3
+    assert game.get_team("team-1").max_players == 3
+    assert game.status == GameStatus.PERSONALITY_SELECTION
+    assert game.get_team("team-1").player_ids == ["player-0", "player-2"]
+    assert game.get_player("player-3").team_id == "team-2"
+    assert game.get_team("team-2").assigned_personality == "pirate"
+
+
+def test_replay_full_game():
+    """Test that a complete game is rebuilt with rounds, guesses and scores."""
+    game = GameProjection.replay(make_game_events())
+
+    assert game.status == GameStatus.FINISHED
+    assert game.current_round == 2
+    assert [r.round_number for r in game.rounds] == [0, 1]
+    first = game.rounds[0]
+    assert first.prompt == "prompt 0"
+    assert first.script.roles[0].name == "Hero"
+    assert first.get_role_for_player("player-1").name == "Hero"
+    assert [g.accepted for g in first.prompt_guesses] == [False, True]
+    assert first.prompt_winner_team_id == "team-2"
+    assert first.personality_correct
+    assert first.round_score == {"team-2": 2, "team-1": 1}
+    assert game.get_team("team-1").score == 6
+
+
+def test_round_id_is_round_started_event_id():
+    """Test that the projected round id is stable across replays."""
+    events = make_game_events()
+    round_started = next(e for e in events if isinstance(e, RoundStarted))
+
+    assert GameProjection.replay(events).rounds[0].id == round_started.event_id
+    assert GameProjection.replay(events) == GameProjection.replay(events)
+
+
+def test_resume_matches_full_replay():
+    """Test that snapshot plus tail events equals a full replay."""
+    events = make_game_events()
+    checkpoint = next(
+        i for i, e in enumerate(events) if isinstance(e, RoundCompleted) and e.round_number == 0
+    )
+    snapshot = GameProjection.replay(events[: checkpoint + 1])
+
+    projection = GameProjection.resume(snapshot, events, after_event_id=events[checkpoint].event_id)
+
+    assert projection.game == GameProjection.replay(events)
+    assert projection.last_event_id == events[-1].event_id
+    assert projection.event_count == len(events) - checkpoint - 1
+
+
+def test_resume_from_mid_round_snapshot_recovers_the_started_round():
+    """Test that a snapshot taken between RoundStarted and ScriptGenerated resumes."""
+    events = make_game_events()
+    prompt = next(
+        i for i, e in enumerate(events) if isinstance(e, PromptSubmitted) and e.round_number == 1
+    )
+    snapshot = GameProjection.replay(events[: prompt + 1])
+
+    projection = GameProjection.resume(snapshot, events, after_event_id=events[prompt].event_id)
+
+    assert projection.game == GameProjection.replay(events)
+    assert projection.game.rounds[1].prompt == "prompt 1"
+
+
+def test_resume_mid_round_without_its_events_fails_clearly():
+    """Test that a mid-round snapshot without the events before it is rejected."""
+    events = make_game_events()
+    prompt = next(
+        i for i, e in enumerate(events) if isinstance(e, PromptSubmitted) and e.round_number == 1
+    )
+    snapshot = GameProjection.replay(events[: prompt + 1])
+
+    with pytest.raises(ValueError, match="checkpoint snapshot"):
+        GameProjection.resume(snapshot, events[prompt + 1 :])
+
+
+def test_resume_with_unknown_event_id_fails():
+    """Test that resuming after a missing event is rejected."""
+    snapshot = GameProjection.replay(make_lobby_events())
+
+    with pytest.raises(ValueError, match="not found"):
+        GameProjection.resume(snapshot, make_lobby_events(), after_event_id="missing")
+
+
+def test_player_left_removes_team_membership():
+    """Test that a departing player is removed from their team."""
+    events = [*make_lobby_events(), PlayerLeft(game_id=GAME_ID, player_id="player-0")]
+
+    game = GameProjection.replay(events)
+
+    assert "player-0" not in game.get_team("team-1").player_ids
+    assert all(p.id != "player-0" for p in game.players)
+
+
+def test_rejoin_updates_socket():
+    """Test that a repeated PlayerJoined is treated as a reconnect."""
+    rejoin = PlayerJoined(game_id=GAME_ID, player_id="player-0", player_name="P0", socket_id="new")
+
+    game = GameProjection.replay([*make_lobby_events(), rejoin])
+
+    assert len(game.players) == 4
+    assert game.get_player("player-0").socket_id == "new"
+
+
+def test_script_without_round_started_fails():
+    """Test that a script for a round that never started is rejected."""
+    script = make_round_events(0, "team-1", "team-2", "noir")[2]
+
+    with pytest.raises(ValueError, match="has not been started"):
+        GameProjection.replay([*make_lobby_events(), script])
+
+
+def test_event_from_other_game_fails():
+    """Test that events of another game are rejected."""
+    stray = PlayerLeft(game_id="game-2", player_id="player-0")
+
+    with pytest.raises(ValueError, match="belongs to game"):
+        GameProjection.replay([*make_lobby_events(), stray])
+
+
+def test_events_before_game_created_fail():
+    """Test that a stream must start with GameCreated."""
+    with pytest.raises(ValueError, match="has not been created"):
+        GameProjection.replay(make_lobby_events()[1:])
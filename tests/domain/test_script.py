@@ -111,3 +111,18 @@ def test_script_get_role_count():
     script = Script(content="Test", roles=roles, personality="test")
 
     assert script.get_role_count() == 3
+
+
+def test_script_copy_is_independent():
+    """Test that changing a copied script's roles leaves the original alone."""
+    script = Script(
+        content="Test", roles=[Role(name="A", description="First", lines=["Hi"])], personality="t"
+    )
+
+    clone = script.copy()
+    clone.roles[0].lines.append("Bye")
+    clone.roles.append(Role(name="B", description="Second"))
+
+    assert clone != script
+    assert script.roles == [Role(name="A", description="First", lines=["Hi"])]
+    assert script.copy() == script
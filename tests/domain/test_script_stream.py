@@ -0,0 +1,88 @@
+"""Tests for the incremental script stream parser."""
+
+import pytest
+
+from slop.domain.script_stream import LineParsed, RoleParsed, ScriptStreamParser
+
+SCRIPT = """ROLE: Detective Sam | A weary private eye
+ROLE: The Curator | Nervous
+
+DETECTIVE SAM: Nobody steals a Monet on my watch.
+(The curator drops a paintbrush.)
+The Curator: I was just... dusting it.
+Narrator: Unknown speakers stay in the body only.
+"""
+
+
+def parse_in_chunks(text, size):
+    """Feed text to a new parser in fixed-size chunks, collecting updates."""
+    parser = ScriptStreamParser()
+    updates = []
+    for start in range(0, len(text), size):
+        updates += parser.feed(text[start : start + size])
+    updates += parser.finish()
+    return parser, updates
+
+
+def test_parses_roles_and_lines():
+    """Test that roles and dialogue are reported in order."""
+    _, updates = parse_in_chunks(SCRIPT, len(SCRIPT))
+
+    assert updates == [
+        RoleParsed(0, "Detective Sam", "A weary private eye"),
+        RoleParsed(1, "The Curator", "Nervous"),
+        LineParsed(0, "Nobody steals a Monet on my watch."),
+        LineParsed(1, "I was just... dusting it."),
+    ]
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 64])
+def test_chunk_boundaries_do_not_matter(size):
+    """Test that any chunking yields the same updates and script."""
+    whole, expected = parse_in_chunks(SCRIPT, len(SCRIPT))
+    parser, updates = parse_in_chunks(SCRIPT, size)
+
+    assert updates == expected
+    assert parser.content == whole.content
+    assert parser.roles == whole.roles
+
+
+def test_lines_are_reported_once_complete():
+    """Test that a line is only reported once its newline arrives."""
+    parser = ScriptStreamParser()
+
+    assert parser.feed("ROLE: Sam\nSAM: Hel") == [RoleParsed(0, "Sam", "")]
+    assert parser.feed("lo there") == []
+    assert parser.feed("\n") == [LineParsed(0, "Hello there")]
+
+
+def test_final_line_without_newline_is_parsed_on_finish():
+    """Test that finish() flushes a trailing partial line."""
+    parser = ScriptStreamParser()
+    parser.feed("ROLE: Sam\nSam: Bye")
+
+    assert parser.finish() == [LineParsed(0, "Bye")]
+    with pytest.raises(ValueError, match="finished"):
+        parser.feed("more")
+
+
+def test_to_script_builds_complete_script():
+    """Test that the finished script has the body, roles and lines."""
+    parser, _ = parse_in_chunks(SCRIPT, 5)
+
+    script = parser.to_script("noir")
+
+    assert script.content.startswith("DETECTIVE SAM: Nobody")
+    assert "ROLE:" not in script.content
+    assert [role.name for role in script.roles] == ["Detective Sam", "The Curator"]
+    assert script.roles[1].lines == ["I was just... dusting it."]
+    assert script.personality == "noir"
+
+
+def test_script_without_roles_is_invalid():
+    """Test that a stream with no role declarations cannot become a script."""
+    parser = ScriptStreamParser()
+    parser.feed("Just some text\n")
+
+    with pytest.raises(ValueError, match="at least one role"):
+        parser.to_script("noir")
@@ -1,5 +1,7 @@
 """Tests for Team domain model."""
 
+import copy
+
 import pytest
 
 from slop.domain import Team
@@ -129,3 +131,46 @@ def test_team_is_full():
     team.add_player("player-3")
 
     assert team.is_full()
+
+
+def test_team_membership_tracks_changes():
+    """Test that membership checks follow adds, removes and direct edits."""
+    team = Team(id="team-1", name="Teal Team", color="#008080", max_players=10)
+    team.add_player("player-1")
+    team.add_player("player-2")
+    team.remove_player("player-1")
+    team.player_ids.append("player-3")
+
+    team.remove_player("player-3")
+
+    assert team.player_ids == ["player-2"]
+    with pytest.raises(ValueError, match="not on team"):
+        team.remove_player("player-1")
+
+
+def test_team_membership_sees_in_place_replacement():
+    """Test that replacing member ids in place, or the whole list, refreshes membership."""
+    team = Team(id="team-1", name="Teal Team", color="#008080", max_players=10)
+    team.add_player("player-1")
+    team.add_player("player-2")
+
+    team.player_ids[0] = "player-3"
+    team.remove_player("player-3")
+    team.player_ids = ["player-4", "player-5"]
+    team.remove_player("player-5")
+
+    assert team.player_ids == ["player-4"]
+    with pytest.raises(ValueError, match="not on team"):
+        team.remove_player("player-1")
+
+
+def test_team_copy_rebuilds_membership():
+    """Test that a copied team, which lacks the membership set, still works."""
+    team = Team(id="team-1", name="Teal Team", color="#008080")
+    team.add_player("player-1")
+
+    clone = copy.deepcopy(team)
+    clone.remove_player("player-1")
+
+    assert clone.player_ids == []
+    assert team.player_ids == ["player-1"]
@@ -4,8 +4,8 @@ from typing import Protocol
 
 import pytest
 
-from slop.domain import AIPersonality, Role, Script
-from slop.ports import LLMPort
+from slop.domain import AIPersonality, ContentTone, Role, Script
+from slop.ports import LLMError, LLMPort
 
 
 def test_llm_port_is_protocol():
@@ -26,6 +26,8 @@ class MockLLMAdapter:
         prompt: str,
         personality: AIPersonality,
         num_roles: int,
+        *,
+        tone: ContentTone = ContentTone.FAMILY,
     ) -> Script:
         """Mock implementation of script generation."""
         roles = [
@@ -68,3 +70,9 @@ async def test_llm_port_generate_script():
     assert script.personality == "dramatic"
     assert script.word_count > 0
     assert script.estimated_duration > 0
+
+
+def test_llm_error_is_exception():
+    """Test that LLMError can be raised and caught as an Exception."""
+    with pytest.raises(Exception, match="provider down"):
+        raise LLMError("provider down")
@@ -6,7 +6,7 @@ import pytest
 
 from slop.domain import Game, GameCreated, PlayerJoined
 from slop.domain.events import GameEvent
-from slop.ports import StoragePort
+from slop.ports import Checkpoint, StoragePort
 
 
 def test_storage_port_is_protocol():
@@ -18,9 +18,11 @@ def test_storage_port_has_required_methods():
     """Test that StoragePort defines all required methods for event sourcing."""
     assert hasattr(StoragePort, "save_event")
     assert hasattr(StoragePort, "get_events")
+    assert hasattr(StoragePort, "get_checkpoint")
     assert hasattr(StoragePort, "save_snapshot")
     assert hasattr(StoragePort, "get_snapshot")
     assert hasattr(StoragePort, "get_game_by_room_code")
+    assert hasattr(StoragePort, "list_active_games")
     assert hasattr(StoragePort, "delete_game")
 
 
@@ -42,6 +44,10 @@ class MockEventSourcedStorageAdapter:
         """Mock get events implementation."""
         return self._events.get(game_id, [])
 
+    async def get_checkpoint(self, game_id: str) -> Checkpoint | None:
+        """Mock get checkpoint implementation."""
+        return None
+
     async def save_snapshot(self, game: Game) -> None:
         """Mock save snapshot implementation."""
         self._snapshots[game.id] = game
@@ -58,6 +64,10 @@ class MockEventSourcedStorageAdapter:
             return self._snapshots.get(game_id)
         return None
 
+    async def list_active_games(self) -> list[str]:
+        """Mock list active games implementation."""
+        return list(self._events.keys() | self._snapshots.keys())
+
     async def delete_game(self, game_id: str) -> None:
         """Mock delete game implementation."""
         if game_id in self._events: